@@ -4,16 +4,21 @@ from __future__ import annotations
 
 __all__ = [
     "BaseExporter",
+    "ClickHouseArrowExporter",
     "CsvExporter",
     "InMemoryExporter",
+    "IpcExporter",
     "ParquetExporter",
+    "ParquetPartitionExporter",
     "TransformExporter",
     "is_exporter_config",
     "setup_exporter",
 ]
 
 from grizz.exporter.base import BaseExporter, is_exporter_config, setup_exporter
+from grizz.exporter.clickhouse import ClickHouseArrowExporter
 from grizz.exporter.csv import CsvExporter
 from grizz.exporter.in_memory import InMemoryExporter
-from grizz.exporter.parquet import ParquetExporter
+from grizz.exporter.ipc import IpcExporter
+from grizz.exporter.parquet import ParquetExporter, ParquetPartitionExporter
 from grizz.exporter.transform import TransformExporter
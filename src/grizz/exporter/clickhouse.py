@@ -0,0 +1,304 @@
+r"""Contain the implementation of a ClickHouse DataFrame exporter."""
+
+from __future__ import annotations
+
+__all__ = ["ClickHouseArrowExporter", "insert_batches"]
+
+import logging
+import queue
+import time
+import uuid
+from typing import TYPE_CHECKING, Any
+
+from coola import objects_are_equal
+from iden.utils.time import timeblock
+
+from grizz.exporter.base import BaseExporter
+from grizz.utils.concurrency import map_in_threads
+from grizz.utils.factory import setup_object
+from grizz.utils.format import str_kwargs
+from grizz.utils.imports import (
+    check_clickhouse_connect,
+    check_pyarrow,
+    is_clickhouse_connect_available,
+    is_pyarrow_available,
+)
+
+if is_clickhouse_connect_available():  # pragma: no cover
+    from clickhouse_connect.driver.exceptions import OperationalError
+if is_pyarrow_available():  # pragma: no cover
+    import pyarrow as pa
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    import polars as pl
+
+    if is_clickhouse_connect_available():
+        import clickhouse_connect
+
+logger = logging.getLogger(__name__)
+
+
+class ClickHouseArrowExporter(BaseExporter):
+    r"""Implement a ClickHouse DataFrame exporter that uses Arrow.
+
+    The DataFrame is inserted in a table as a sequence of Arrow
+    record batches with ``insert_arrow``. Each batch is a separate
+    insert query, so a batch that fails can be retried without
+    inserting the whole DataFrame again. The batches can be inserted
+    concurrently over a pool of clients. Only the batches that fail
+    because of a connection error or a timeout are retried, and each
+    batch is inserted with its own ``insert_deduplication_token``, so
+    a batch that was inserted before the error is not inserted twice
+    by the retry. The deduplication requires a ``Replicated*MergeTree``
+    table, or the ``non_replicated_deduplication_window`` setting for
+    the other ``MergeTree`` tables. Note that the batches are not
+    inserted in a transaction, so the rows of the successful batches
+    are kept in the table if another batch fails.
+
+    This exporter requires ``clickhouse_connect`` and ``pyarrow``.
+
+    Args:
+        table: The name of the table to insert the data into.
+        client: The ClickHouse client or its configuration, or a
+            sequence of clients or configurations to insert the
+            batches concurrently. A client runs one query at a time.
+            Please check the documentation of
+            ``clickhouse_connect.get_client`` to get more information.
+        batch_size: The maximum number of rows in each batch.
+        max_workers: The maximum number of batches to insert
+            concurrently. If ``None``, it is the number of clients.
+            It cannot be greater than the number of clients.
+        max_retries: The maximum number of times a batch is inserted
+            again after a connection error or a timeout.
+        retry_delay: The time in seconds to wait before the first
+            retry. The time is doubled after each retry.
+        deduplication_prefix: The prefix of the deduplication tokens
+            of the batches. The token of a batch is the prefix
+            followed by the index of the batch. If ``None``, a random
+            prefix is generated for each export. Using the same
+            prefix to export the same DataFrame again only inserts
+            the batches that were not inserted.
+        **kwargs: Additional keyword arguments for
+            ``clickhouse_connect.driver.Client.insert_arrow``,
+            for example ``database`` or ``settings``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.exporter import ClickHouseArrowExporter
+    >>> import clickhouse_connect
+    >>> client = clickhouse_connect.get_client()  # doctest: +SKIP
+    >>> exporter = ClickHouseArrowExporter(
+    ...     table="target.dataset", client=client, batch_size=10_000, max_retries=3
+    ... )  # doctest: +SKIP
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["a", "b", "c", "d", "e"],
+    ...     }
+    ... )
+    >>> exporter.export(frame)  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        table: str,
+        client: (
+            clickhouse_connect.driver.Client
+            | dict
+            | Sequence[clickhouse_connect.driver.Client | dict]
+        ),
+        batch_size: int = 100_000,
+        max_workers: int | None = None,
+        max_retries: int = 0,
+        retry_delay: float = 1.0,
+        deduplication_prefix: str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        check_clickhouse_connect()
+        check_pyarrow()
+        self._table = str(table)
+        clients = client if isinstance(client, (list, tuple)) else [client]
+        if not clients:
+            msg = "'client' must contain at least one client"
+            raise ValueError(msg)
+        self._clients: tuple[clickhouse_connect.driver.Client, ...] = tuple(
+            setup_object(client) for client in clients
+        )
+        if batch_size < 1:
+            msg = f"batch_size must be greater than 0 (received: {batch_size})"
+            raise ValueError(msg)
+        self._batch_size = batch_size
+        if max_workers is not None and max_workers < 1:
+            msg = f"max_workers must be greater than 0 (received: {max_workers})"
+            raise ValueError(msg)
+        self._max_workers = min(max_workers or len(self._clients), len(self._clients))
+        if max_retries < 0:
+            msg = f"max_retries must be greater or equal to 0 (received: {max_retries})"
+            raise ValueError(msg)
+        self._max_retries = max_retries
+        self._retry_delay = retry_delay
+        self._deduplication_prefix = deduplication_prefix
+        self._kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(table={self._table}, batch_size={self._batch_size:,}, "
+            f"max_workers={self._max_workers}, max_retries={self._max_retries}"
+            f"{str_kwargs(self._kwargs)})"
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            self._table == other._table
+            and objects_are_equal(self._clients, other._clients, equal_nan=equal_nan)
+            and self._batch_size == other._batch_size
+            and self._max_workers == other._max_workers
+            and self._max_retries == other._max_retries
+            and self._retry_delay == other._retry_delay
+            and self._deduplication_prefix == other._deduplication_prefix
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+        )
+
+    def export(self, frame: pl.DataFrame) -> None:
+        logger.info(
+            f"Exporting the DataFrame of shape={frame.shape} to ClickHouse table {self._table} ..."
+        )
+        with timeblock("DataFrame export time: {time}"):
+            num_rows = self.insert(frame.to_arrow().to_batches(max_chunksize=self._batch_size))
+        logger.info(f"DataFrame exported | {num_rows:,} rows inserted in {self._table}")
+
+    def insert(self, batches: Iterable[pa.RecordBatch | pa.Table]) -> int:
+        r"""Insert a stream of Arrow batches in the table.
+
+        Args:
+            batches: The batches to insert. Each batch is inserted
+                with a separate query.
+
+        Returns:
+            The number of inserted rows.
+        """
+        return insert_batches(
+            batches,
+            table=self._table,
+            clients=self._clients[: self._max_workers],
+            max_retries=self._max_retries,
+            retry_delay=self._retry_delay,
+            deduplication_prefix=self._deduplication_prefix,
+            **self._kwargs,
+        )
+
+
+def insert_batches(
+    batches: Iterable[pa.RecordBatch | pa.Table],
+    table: str,
+    clients: Sequence[clickhouse_connect.driver.Client],
+    max_retries: int = 0,
+    retry_delay: float = 1.0,
+    deduplication_prefix: str | None = None,
+    **kwargs: Any,
+) -> int:
+    r"""Insert a stream of Arrow batches in a ClickHouse table.
+
+    The batches are inserted concurrently with one thread per client.
+    The next batch of the stream is only read when a client is
+    available, so only a few batches are in memory at a time.
+    Only the connection errors and the timeouts are retried. Each
+    batch is inserted with the ``insert_deduplication_token``
+    setting, so a retry does not insert a batch twice if the first
+    attempt was inserted before the error.
+
+    Args:
+        batches: The batches to insert. Each batch is inserted with
+            a separate query.
+        table: The name of the table to insert the data into.
+        clients: The ClickHouse clients. A client runs one query at
+            a time.
+        max_retries: The maximum number of times a batch is inserted
+            again after a connection error or a timeout.
+        retry_delay: The time in seconds to wait before the first
+            retry. The time is doubled after each retry.
+        deduplication_prefix: The prefix of the deduplication tokens
+            of the batches. The token of a batch is the prefix
+            followed by the index of the batch. If ``None``, a random
+            prefix is generated.
+        **kwargs: Additional keyword arguments for
+            ``clickhouse_connect.driver.Client.insert_arrow``.
+
+    Returns:
+        The number of inserted rows.
+
+    Raises:
+        Exception: the exception raised when inserting a batch, if it
+            is not a connection error or a timeout, or if the batch
+            still fails after ``max_retries`` retries.
+    """
+    retryable_errors = _get_retryable_errors()
+    deduplication_prefix = deduplication_prefix or uuid.uuid4().hex
+    settings = kwargs.pop("settings", None) or {}
+    available = queue.SimpleQueue()
+    for client in clients:
+        available.put(client)
+
+    def insert(index: int, batch: pa.RecordBatch | pa.Table) -> int:
+        if isinstance(batch, pa.RecordBatch):
+            batch = pa.Table.from_batches([batch])
+        # The token does not change between the attempts, so the server
+        # ignores the retry of a batch that was already inserted.
+        batch_settings = settings | {
+            "insert_deduplication_token": f"{deduplication_prefix}-{index}"
+        }
+        client = available.get()
+        try:
+            for attempt in range(max_retries + 1):
+                try:
+                    client.insert_arrow(
+                        table=table, arrow_table=batch, settings=batch_settings, **kwargs
+                    )
+                    break
+                except retryable_errors:
+                    if attempt == max_retries:
+                        raise
+                    delay = retry_delay * 2**attempt
+                    logger.warning(
+                        f"Failed to insert the batch {index:,} in {table}. "
+                        f"Retrying in {delay:.2f} seconds ({attempt + 1}/{max_retries})...",
+                        exc_info=True,
+                    )
+                    time.sleep(delay)
+        finally:
+            available.put(client)
+        return batch.num_rows
+
+    # Empty batches are skipped because an insert query without data is useless.
+    batches = (batch for batch in batches if batch.num_rows > 0)
+    num_rows = num_batches = 0
+    for batch_rows in map_in_threads(
+        lambda item: insert(*item), enumerate(batches), max_workers=len(clients)
+    ):
+        num_rows += batch_rows
+        num_batches += 1
+    logger.info(f"Inserted {num_rows:,} rows in {num_batches:,} batches in {table}")
+    return num_rows
+
+
+def _get_retryable_errors() -> tuple[type[Exception], ...]:
+    r"""Get the errors raised when the connection to the server fails.
+
+    Returns:
+        The errors of the inserts that can be retried.
+    """
+    errors = (ConnectionError, TimeoutError)
+    if is_clickhouse_connect_available():
+        # The connection errors and the timeouts of the HTTP requests.
+        errors += (OperationalError,)
+    return errors
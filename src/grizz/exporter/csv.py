@@ -11,7 +11,7 @@ from coola import objects_are_equal
 
 from grizz.exporter.base import BaseExporter
 from grizz.utils.format import str_kwargs
-from grizz.utils.path import human_file_size, sanitize_path
+from grizz.utils.path import atomic_path, human_file_size, sanitize_path
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -66,6 +66,6 @@ class CsvExporter(BaseExporter):
 
     def export(self, frame: pl.DataFrame) -> None:
         logger.info(f"Exporting the DataFrame of shape={frame.shape} to CSV file {self._path} ...")
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        frame.write_csv(self._path, **self._kwargs)
+        with atomic_path(self._path) as tmp_path:
+            frame.write_csv(tmp_path, **self._kwargs)
         logger.info(f"DataFrame exported | size={human_file_size(self._path)}")
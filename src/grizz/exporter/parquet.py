@@ -2,7 +2,7 @@ r"""Contain the implementation of a parquet DataFrame exporter."""
 
 from __future__ import annotations
 
-__all__ = ["ParquetExporter"]
+__all__ = ["ParquetExporter", "ParquetPartitionExporter"]
 
 import logging
 from typing import TYPE_CHECKING, Any
@@ -10,10 +10,18 @@ from typing import TYPE_CHECKING, Any
 from coola import objects_are_equal
 
 from grizz.exporter.base import BaseExporter
+from grizz.utils.concurrency import map_in_threads
 from grizz.utils.format import str_kwargs
-from grizz.utils.path import human_file_size, sanitize_path
+from grizz.utils.hive import get_partition_dir
+from grizz.utils.path import (
+    atomic_path,
+    find_parquet_files,
+    human_file_size,
+    sanitize_path,
+)
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
     from pathlib import Path
 
     import polars as pl
@@ -68,6 +76,133 @@ class ParquetExporter(BaseExporter):
         logger.info(
             f"Exporting the DataFrame of shape={frame.shape} to parquet file {self._path} ..."
         )
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        frame.write_parquet(self._path, **self._kwargs)
+        with atomic_path(self._path) as tmp_path:
+            frame.write_parquet(tmp_path, **self._kwargs)
         logger.info(f"DataFrame exported | size={human_file_size(self._path)}")
+
+
+class ParquetPartitionExporter(BaseExporter):
+    r"""Implement a DataFrame exporter that writes a hive-partitioned
+    parquet dataset.
+
+    The DataFrame is partitioned by the values of one or more
+    columns, and each partition is written in its own directory,
+    for example ``<path>/col1=a/col2=1/part-00000.parquet``.
+    The partition columns are not stored in the files because their
+    values are encoded in the directory names, so a reader can skip
+    the partitions that do not match a filter, for example
+    ``polars.scan_parquet(path, hive_partitioning=True)``.
+    The partitions are written concurrently, and the dataset is
+    written to a temporary directory and then renamed, so a
+    partially written dataset is never read.
+
+    Args:
+        path: The path to the directory of the dataset. The previous
+            dataset is replaced.
+        partition_by: The columns used to partition the DataFrame.
+        max_workers: The maximum number of partitions to write
+            concurrently.
+        max_rows_per_file: The maximum number of rows in each file.
+            If a partition has more rows, it is split in several
+            files. If ``None``, each partition is written in a single
+            file.
+        **kwargs: Additional keyword arguments for
+            ``polars.DataFrame.write_parquet``, for example
+            ``row_group_size`` or ``compression``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.exporter import ParquetPartitionExporter
+    >>> exporter = ParquetPartitionExporter(path="/path/to/dataset", partition_by=["col3"])
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["a", "b", "a", "b", "a"],
+    ...     }
+    ... )
+    >>> exporter.export(frame)  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        partition_by: Sequence[str],
+        max_workers: int = 1,
+        max_rows_per_file: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._path = sanitize_path(path)
+        self._partition_by = tuple(partition_by)
+        if not self._partition_by:
+            msg = "partition_by must contain at least one column"
+            raise ValueError(msg)
+        if max_workers < 1:
+            msg = f"max_workers must be greater than 0 (received: {max_workers})"
+            raise ValueError(msg)
+        self._max_workers = max_workers
+        if max_rows_per_file is not None and max_rows_per_file < 1:
+            msg = f"max_rows_per_file must be greater than 0 (received: {max_rows_per_file})"
+            raise ValueError(msg)
+        self._max_rows_per_file = max_rows_per_file
+        self._kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, partition_by={self._partition_by}, "
+            f"max_workers={self._max_workers}, max_rows_per_file={self._max_rows_per_file}"
+            f"{str_kwargs(self._kwargs)})"
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            self._path == other._path
+            and self._partition_by == other._partition_by
+            and self._max_workers == other._max_workers
+            and self._max_rows_per_file == other._max_rows_per_file
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+        )
+
+    def export(self, frame: pl.DataFrame) -> None:
+        logger.info(
+            f"Exporting the DataFrame of shape={frame.shape} to the parquet dataset "
+            f"{self._path} partitioned by {self._partition_by} ..."
+        )
+        partitions = frame.partition_by(self._partition_by, as_dict=True, include_key=False)
+        with atomic_path(self._path) as tmp_path:
+            tmp_path.mkdir()
+            writes = map_in_threads(
+                lambda item: self._write_partition(tmp_path, *item),
+                partitions.items(),
+                max_workers=min(self._max_workers, len(partitions)),
+            )
+            for _ in writes:
+                pass
+        logger.info(
+            f"DataFrame exported | {len(partitions):,} partitions  "
+            f"{len(find_parquet_files(self._path)):,} files"
+        )
+
+    def _write_partition(self, path: Path, keys: tuple, frame: pl.DataFrame) -> None:
+        r"""Write the files of a partition.
+
+        Args:
+            path: The path to the directory of the dataset.
+            keys: The values of the partition columns.
+            frame: The rows of the partition, without the partition
+                columns.
+        """
+        path = path.joinpath(get_partition_dir(dict(zip(self._partition_by, keys))))
+        path.mkdir(parents=True, exist_ok=True)
+        size = self._max_rows_per_file or frame.shape[0]
+        for index, offset in enumerate(range(0, frame.shape[0], size)):
+            frame.slice(offset, size).write_parquet(
+                path.joinpath(f"part-{index:05d}.parquet"), **self._kwargs
+            )
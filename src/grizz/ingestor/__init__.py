@@ -6,10 +6,15 @@ __all__ = [
     "BaseIngestor",
     "CacheIngestor",
     "ClickHouseArrowIngestor",
+    "ClickHouseSyncIngestor",
     "CsvFileIngestor",
     "CsvIngestor",
     "Ingestor",
+    "IpcFileIngestor",
+    "IpcIngestor",
     "JoinIngestor",
+    "ParquetDatasetIngestor",
+    "ParquetDirectoryIngestor",
     "ParquetFileIngestor",
     "ParquetIngestor",
     "TransformIngestor",
@@ -19,9 +24,15 @@ __all__ = [
 
 from grizz.ingestor.base import BaseIngestor, is_ingestor_config, setup_ingestor
 from grizz.ingestor.cache import CacheIngestor
-from grizz.ingestor.clickhouse import ClickHouseArrowIngestor
+from grizz.ingestor.clickhouse import ClickHouseArrowIngestor, ClickHouseSyncIngestor
 from grizz.ingestor.csv import CsvFileIngestor, CsvIngestor
+from grizz.ingestor.ipc import IpcFileIngestor, IpcIngestor
 from grizz.ingestor.join import JoinIngestor
-from grizz.ingestor.parquet import ParquetFileIngestor, ParquetIngestor
+from grizz.ingestor.parquet import (
+    ParquetDatasetIngestor,
+    ParquetDirectoryIngestor,
+    ParquetFileIngestor,
+    ParquetIngestor,
+)
 from grizz.ingestor.transform import TransformIngestor
 from grizz.ingestor.vanilla import Ingestor
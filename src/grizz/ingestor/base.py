@@ -15,6 +15,8 @@ from objectory import AbstractFactory
 from objectory.utils import is_object_config
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import polars as pl
     from coola.equality import EqualityConfig
 
@@ -86,6 +88,63 @@ class BaseIngestor(ABC, metaclass=AbstractFactory):
         ```
         """
 
+    def select_columns(self, columns: Sequence[str]) -> BaseIngestor | None:  # noqa: ARG002
+        r"""Get an ingestor that only ingests some columns.
+
+        The columns that are not in the data are ignored. This
+        method is used to avoid reading the columns that are not
+        used after the ingestion.
+
+        Args:
+            columns: The columns to ingest.
+
+        Returns:
+            A new ingestor that only ingests the columns, or ``None``
+                if the ingestor cannot select the columns.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from grizz.ingestor import ParquetIngestor
+        >>> ingestor = ParquetIngestor("/path/to/frame.parquet")
+        >>> ingestor.select_columns(["col1", "col3"])  # doctest: +SKIP
+        ParquetIngestor(source=/path/to/frame.parquet, selected_columns=('col1', 'col3'))
+
+        ```
+        """
+        return None
+
+    def filter_rows(self, predicate: pl.Expr) -> BaseIngestor | None:  # noqa: ARG002
+        r"""Get an ingestor that only ingests the rows matching a
+        predicate.
+
+        This method is used to filter the rows when the data is read,
+        so the rows that are removed after the ingestion are not
+        loaded in memory.
+
+        Args:
+            predicate: The predicate of the rows to ingest.
+
+        Returns:
+            A new ingestor that only ingests the rows matching the
+                predicate, or ``None`` if the ingestor cannot filter
+                the rows.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.ingestor import ParquetIngestor
+        >>> ingestor = ParquetIngestor("/path/to/frame.parquet")
+        >>> ingestor = ingestor.filter_rows(pl.col("col1") > 2)
+        >>> frame = ingestor.ingest()  # doctest: +SKIP
+
+        ```
+        """
+        return None
+
 
 def is_ingestor_config(config: dict) -> bool:
     r"""Indicate if the input configuration is a configuration for a
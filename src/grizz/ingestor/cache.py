@@ -6,6 +6,8 @@ from __future__ import annotations
 __all__ = ["CacheIngestor"]
 
 import logging
+import time
+from contextlib import suppress
 from typing import TYPE_CHECKING, Any
 
 from coola.utils import repr_indent, repr_mapping
@@ -13,8 +15,14 @@ from coola.utils import repr_indent, repr_mapping
 from grizz.exceptions import DataNotFoundError
 from grizz.exporter.base import BaseExporter, setup_exporter
 from grizz.ingestor.base import BaseIngestor, setup_ingestor
+from grizz.utils.lock import FileLock
+from grizz.utils.path import atomic_path, sanitize_path
+from grizz.utils.profiling import profile_block
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from pathlib import Path
+
     import polars as pl
 
 logger = logging.getLogger(__name__)
@@ -29,6 +37,12 @@ class CacheIngestor(BaseIngestor):
     it falls back to the slow ingestor, then exports the DataFrame
     for ingestion by the fast ingestor during the next cycle.
 
+    If ``path`` is set, the cached data can be invalidated after a
+    time-to-live or when the fingerprint of the source changes, and
+    an inter-process file lock ensures that only one process
+    refreshes the cached data while the other processes wait for it
+    or read the stale data.
+
     Args:
         fast_ingestor: The fast DataFrame ingestor or its
             configuration.
@@ -39,6 +53,23 @@ class CacheIngestor(BaseIngestor):
             output of the slower DataFrame ingestor, allowing it to
             be ingested by the faster DataFrame ingestor during the
             next ingestion cycle.
+        path: The path to the data written by the exporter. It is
+            required to use ``ttl``, ``fingerprint``, and the file
+            lock. The lock file is ``<path>.lock``.
+        ttl: The time-to-live of the cached data in seconds. The
+            cached data is refreshed if it was modified more than
+            ``ttl`` seconds ago. If ``None``, the cached data never
+            expires.
+        fingerprint: A function that returns a fingerprint of the
+            source data, for example the last update time of a
+            table. The cached data is refreshed if the fingerprint
+            is different from the fingerprint stored when the cached
+            data was written, in ``<path>.fingerprint``.
+        lock_timeout: The maximum time in seconds to wait for the
+            file lock. If ``None``, wait until the lock is acquired.
+        serve_stale: If ``True`` and another process is refreshing
+            the cached data, the stale cached data is ingested
+            instead of waiting for the refresh.
 
     Example usage:
 
@@ -91,22 +122,40 @@ class CacheIngestor(BaseIngestor):
         fast_ingestor: BaseIngestor | dict,
         slow_ingestor: BaseIngestor | dict,
         exporter: BaseExporter | dict,
+        path: Path | str | None = None,
+        ttl: float | None = None,
+        fingerprint: Callable[[], str] | None = None,
+        lock_timeout: float | None = None,
+        serve_stale: bool = False,
     ) -> None:
         self._fast_ingestor = setup_ingestor(fast_ingestor)
         self._slow_ingestor = setup_ingestor(slow_ingestor)
         self._exporter = setup_exporter(exporter)
 
+        self._path = None if path is None else sanitize_path(path)
+        if self._path is None and (ttl is not None or fingerprint is not None):
+            msg = "path is required to use ttl or fingerprint"
+            raise ValueError(msg)
+        self._ttl = ttl
+        self._fingerprint = fingerprint
+        self._lock_timeout = lock_timeout
+        self._serve_stale = serve_stale
+
     def __repr__(self) -> str:
-        args = repr_indent(
-            repr_mapping(
-                {
-                    "fast_ingestor": self._fast_ingestor,
-                    "slow_ingestor": self._slow_ingestor,
-                    "exporter": self._exporter,
-                }
-            )
-        )
-        return f"{self.__class__.__qualname__}(\n  {args}\n)"
+        args = {
+            "fast_ingestor": self._fast_ingestor,
+            "slow_ingestor": self._slow_ingestor,
+            "exporter": self._exporter,
+        }
+        if self._path is not None:
+            args |= {
+                "path": self._path,
+                "ttl": self._ttl,
+                "fingerprint": self._fingerprint,
+                "lock_timeout": self._lock_timeout,
+                "serve_stale": self._serve_stale,
+            }
+        return f"{self.__class__.__qualname__}(\n  {repr_indent(repr_mapping(args))}\n)"
 
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if not isinstance(other, self.__class__):
@@ -115,15 +164,105 @@ class CacheIngestor(BaseIngestor):
             self._fast_ingestor.equal(other._fast_ingestor, equal_nan=equal_nan)
             and self._slow_ingestor.equal(other._slow_ingestor, equal_nan=equal_nan)
             and self._exporter.equal(other._exporter, equal_nan=equal_nan)
+            and self._path == other._path
+            and self._ttl == other._ttl
+            and self._fingerprint == other._fingerprint
+            and self._lock_timeout == other._lock_timeout
+            and self._serve_stale == other._serve_stale
         )
 
     def ingest(self) -> pl.DataFrame:
+        with profile_block(f"{self.__class__.__qualname__}.ingest", category="ingest") as record:
+            frame = self._ingest()
+            if record is not None:
+                record.set_output(frame)
+        return frame
+
+    def _ingest(self) -> pl.DataFrame:
+        r"""Ingest the DataFrame from the cached data if it is valid,
+        otherwise from the slow ingestor.
+
+        Returns:
+            The ingested DataFrame.
+        """
+        fingerprint = None if self._fingerprint is None else str(self._fingerprint())
+        if self._is_valid(fingerprint):
+            with suppress(DataNotFoundError):
+                logger.info("Ingesting data with the fast ingestor...")
+                return self._fast_ingestor.ingest()
+        if self._path is None:
+            return self._refresh(fingerprint)
+
+        lock = FileLock(self._path.with_name(f"{self._path.name}.lock"), timeout=self._lock_timeout)
+        if self._serve_stale and not lock.acquire(blocking=False):
+            with suppress(DataNotFoundError):
+                logger.info(
+                    "Another process is refreshing the data. "
+                    "Ingesting the stale data with the fast ingestor..."
+                )
+                return self._fast_ingestor.ingest()
+        if not lock.is_locked:
+            logger.info(f"Waiting for the lock {self._path.name}.lock ...")
+            lock.acquire()
         try:
-            logger.info("Ingesting data with the fast ingestor...")
-            frame = self._fast_ingestor.ingest()
-        except DataNotFoundError:
-            logger.info("Ingesting data with the slow ingestor...")
-            frame = self._slow_ingestor.ingest()
-            logger.info("Exporting the data...")
-            self._exporter.export(frame)
+            # Another process may have refreshed the data while this process was waiting.
+            if self._is_valid(fingerprint):
+                with suppress(DataNotFoundError):
+                    logger.info("Ingesting data with the fast ingestor...")
+                    return self._fast_ingestor.ingest()
+            return self._refresh(fingerprint)
+        finally:
+            lock.release()
+
+    def _is_valid(self, fingerprint: str | None) -> bool:
+        r"""Indicate if the cached data is valid.
+
+        Args:
+            fingerprint: The current fingerprint of the source data,
+                or ``None`` if there is no fingerprint.
+
+        Returns:
+            ``True`` if the cached data exists and is valid,
+                otherwise ``False``. If ``path`` is not set, the
+                cached data is always assumed to be valid.
+        """
+        if self._path is None:
+            return True
+        if not self._path.exists():
+            return False
+        if self._ttl is not None and time.time() - self._path.stat().st_mtime > self._ttl:
+            logger.info(f"The cached data expired (ttl={self._ttl:,} seconds)")
+            return False
+        if fingerprint is not None:
+            path = self._get_fingerprint_path()
+            if not path.is_file() or path.read_text() != fingerprint:
+                logger.info("The fingerprint of the source data changed")
+                return False
+        return True
+
+    def _refresh(self, fingerprint: str | None) -> pl.DataFrame:
+        r"""Ingest the DataFrame with the slow ingestor and export it.
+
+        Args:
+            fingerprint: The current fingerprint of the source data,
+                or ``None`` if there is no fingerprint.
+
+        Returns:
+            The ingested DataFrame.
+        """
+        logger.info("Ingesting data with the slow ingestor...")
+        frame = self._slow_ingestor.ingest()
+        logger.info("Exporting the data...")
+        self._exporter.export(frame)
+        if fingerprint is not None:
+            with atomic_path(self._get_fingerprint_path()) as tmp_path:
+                tmp_path.write_text(fingerprint)
         return frame
+
+    def _get_fingerprint_path(self) -> Path:
+        r"""Get the path to the fingerprint of the cached data.
+
+        Returns:
+            The path to the fingerprint file.
+        """
+        return self._path.with_name(f"{self._path.name}.fingerprint")
@@ -2,9 +2,15 @@ r"""Contain the implementation of a ClickHouse ingestor."""
 
 from __future__ import annotations
 
-__all__ = ["ClickHouseArrowIngestor"]
+__all__ = [
+    "ClickHouseArrowIngestor",
+    "ClickHouseSyncIngestor",
+    "make_key_partitions",
+    "make_time_partitions",
+]
 
 import logging
+import queue
 from typing import TYPE_CHECKING, Any
 
 import polars as pl
@@ -12,11 +18,25 @@ from coola import objects_are_equal
 from iden.utils.time import timeblock
 
 from grizz.ingestor.base import BaseIngestor
+from grizz.utils.arrow import write_frames
+from grizz.utils.concurrency import map_in_threads
 from grizz.utils.factory import setup_object
 from grizz.utils.format import human_byte
-from grizz.utils.imports import check_clickhouse_connect, check_pyarrow
+from grizz.utils.imports import (
+    check_clickhouse_connect,
+    check_pyarrow,
+    is_pyarrow_available,
+)
+from grizz.utils.lock import FileLock
+from grizz.utils.path import atomic_path, sanitize_path
+
+if is_pyarrow_available():  # pragma: no cover
+    import pyarrow as pa
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from pathlib import Path
+
     from grizz.utils.imports import is_clickhouse_connect_available
 
     if is_clickhouse_connect_available():
@@ -31,11 +51,34 @@ class ClickHouseArrowIngestor(BaseIngestor):
 
     This ingestor requires ``clickhouse_connect`` and ``pyarrow``.
 
+    ``ingest`` loads the full result of the query in memory. For
+    large results, ``iter_batches`` streams the result as a sequence
+    of DataFrames, and ``ingest_to_file`` writes the stream to a
+    parquet or Arrow IPC file. In both cases, only one batch is in
+    memory at a time.
+
+    The query can be split in partitions, for example time ranges
+    (see ``make_time_partitions``) or key ranges
+    (see ``make_key_partitions``). Each partition is a dictionary of
+    query parameters that are bound to the placeholders of the query
+    by the server, for example
+    ``WHERE ts >= {start:DateTime} AND ts < {end:DateTime}``.
+    The sub-queries are run concurrently over the pool of clients,
+    and the results are concatenated in the order of the partitions.
+
     Args:
         query: The query to get the data.
-        client: The ClickHouse client or its configuration.
-            Please check the documentation of
-            ``clickhouse_connect.get_client`` to get more information.
+        client: The ClickHouse client or its configuration, or a
+            sequence of clients or configurations to run the
+            sub-queries of the partitions concurrently. A client
+            runs one query at a time. Please check the documentation
+            of ``clickhouse_connect.get_client`` to get more
+            information.
+        partitions: The query parameters of each partition.
+            If ``None``, the query is not partitioned.
+        max_workers: The maximum number of sub-queries to run
+            concurrently. If ``None``, it is the number of clients.
+            It cannot be greater than the number of clients.
 
     Example usage:
 
@@ -46,15 +89,52 @@ class ClickHouseArrowIngestor(BaseIngestor):
     >>> client = clickhouse_connect.get_client()  # doctest: +SKIP
     >>> ingestor = ClickHouseArrowIngestor(query="", client=client)  # doctest: +SKIP
     >>> frame = ingestor.ingest()  # doctest: +SKIP
+    >>> for batch in ingestor.iter_batches():  # doctest: +SKIP
+    ...     print(batch.shape)
+    ...
+    >>> ingestor.ingest_to_file("/path/to/data.parquet")  # doctest: +SKIP
+    >>> from datetime import datetime, timedelta
+    >>> from grizz.ingestor.clickhouse import make_time_partitions
+    >>> start, end = datetime(2024, 1, 1), datetime(2024, 7, 1)
+    >>> partitions = make_time_partitions(start, end, step=timedelta(days=7))
+    >>> query = "SELECT * FROM source.dataset WHERE ts >= {start:DateTime} AND ts < {end:DateTime}"
+    >>> clients = [clickhouse_connect.get_client() for _ in range(4)]  # doctest: +SKIP
+    >>> ingestor = ClickHouseArrowIngestor(query, clients, partitions)  # doctest: +SKIP
+    >>> frame = ingestor.ingest()  # doctest: +SKIP
 
     ```
     """
 
-    def __init__(self, query: str, client: clickhouse_connect.driver.Client | dict) -> None:
+    def __init__(
+        self,
+        query: str,
+        client: (
+            clickhouse_connect.driver.Client
+            | dict
+            | Sequence[clickhouse_connect.driver.Client | dict]
+        ),
+        partitions: Sequence[dict[str, Any]] | None = None,
+        max_workers: int | None = None,
+    ) -> None:
         check_clickhouse_connect()
         check_pyarrow()
         self._query = str(query)
-        self._client: clickhouse_connect.driver.Client = setup_object(client)
+        clients = client if isinstance(client, (list, tuple)) else [client]
+        if not clients:
+            msg = "'client' must contain at least one client"
+            raise ValueError(msg)
+        self._clients: tuple[clickhouse_connect.driver.Client, ...] = tuple(
+            setup_object(client) for client in clients
+        )
+        self._client = self._clients[0]
+        self._partitions = None if partitions is None else tuple(partitions)
+        if self._partitions is not None and not self._partitions:
+            msg = "'partitions' must contain at least one partition"
+            raise ValueError(msg)
+        if max_workers is not None and max_workers < 1:
+            msg = f"max_workers must be greater than 0 (received: {max_workers})"
+            raise ValueError(msg)
+        self._max_workers = min(max_workers or len(self._clients), len(self._clients))
 
     def __repr__(self) -> str:
         return f"{self.__class__.__qualname__}()"
@@ -62,8 +142,11 @@ class ClickHouseArrowIngestor(BaseIngestor):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        return self._query == other._query and objects_are_equal(
-            self._client, other._client, equal_nan=equal_nan
+        return (
+            self._query == other._query
+            and objects_are_equal(self._clients, other._clients, equal_nan=equal_nan)
+            and objects_are_equal(self._partitions, other._partitions, equal_nan=equal_nan)
+            and self._max_workers == other._max_workers
         )
 
     def ingest(self) -> pl.DataFrame:
@@ -74,7 +157,10 @@ class ClickHouseArrowIngestor(BaseIngestor):
             "---------------------------------------------------------------------------------\n\n"
         )
         with timeblock("DataFrame ingestion time: {time}"):
-            data = self._client.query_arrow(query=self._query)
+            if self._partitions is None:
+                data = self._client.query_arrow(query=self._query)
+            else:
+                data = self._query_partitions()
             frame = pl.from_arrow(data)
             frame = frame.select(sorted(frame.columns))
             logger.info(
@@ -83,3 +169,372 @@ class ClickHouseArrowIngestor(BaseIngestor):
             )
         logger.info(f"number of unique column names: {len(set(frame.columns)):,}")
         return frame
+
+    def iter_batches(self) -> Iterator[pl.DataFrame]:
+        r"""Iterate over the result of the query as a stream of
+        DataFrames.
+
+        The result is streamed with ``query_arrow_stream``, so only
+        one batch is in memory at a time. The size of the batches is
+        controlled by the server, usually one batch per block.
+        If the query is partitioned, the partitions are streamed
+        one after the other with the first client.
+
+        Returns:
+            An iterator over the DataFrame batches. The columns of
+                each batch are sorted by name.
+        """
+        logger.info(f"Streaming data from ClickHouse... \n\nquery:\n{self._query}\n")
+        num_rows = num_batches = 0
+        for kwargs in self._get_query_kwargs():
+            with self._client.query_arrow_stream(query=self._query, **kwargs) as stream:
+                for batch in stream:
+                    frame = pl.from_arrow(batch)
+                    num_rows += frame.shape[0]
+                    num_batches += 1
+                    yield frame.select(sorted(frame.columns))
+        logger.info(f"Streamed {num_rows:,} rows in {num_batches:,} batches")
+
+    def ingest_to_file(self, path: Path | str, **kwargs: Any) -> int:
+        r"""Stream the result of the query to a parquet or Arrow IPC
+        file.
+
+        The file format is inferred from the file extension
+        (see ``grizz.utils.arrow.write_frames``).
+
+        Args:
+            path: The path to the file.
+            **kwargs: Additional keyword arguments for
+                ``grizz.utils.arrow.write_frames``.
+
+        Returns:
+            The number of written rows.
+        """
+        with timeblock("ClickHouse streaming time: {time}"):
+            return write_frames(self.iter_batches(), path, **kwargs)
+
+    def _get_query_kwargs(self) -> list[dict[str, Any]]:
+        r"""Get the keyword arguments of the query of each partition.
+
+        Returns:
+            The keyword arguments of each query.
+        """
+        if self._partitions is None:
+            return [{}]
+        return [{"parameters": parameters} for parameters in self._partitions]
+
+    def _query_partitions(self) -> pa.Table:
+        r"""Run the sub-queries of the partitions concurrently.
+
+        Returns:
+            The concatenated results of the sub-queries, in the order
+                of the partitions.
+        """
+        logger.info(
+            f"Running {len(self._partitions):,} sub-queries with "
+            f"{self._max_workers} concurrent clients..."
+        )
+        clients = queue.SimpleQueue()
+        for client in self._clients[: self._max_workers]:
+            clients.put(client)
+
+        def query(parameters: dict[str, Any]) -> pa.Table:
+            client = clients.get()
+            try:
+                return client.query_arrow(query=self._query, parameters=parameters)
+            finally:
+                clients.put(client)
+
+        tables = map_in_threads(query, self._partitions, max_workers=self._max_workers)
+        return pa.concat_tables(list(tables))
+
+
+class ClickHouseSyncIngestor(BaseIngestor):
+    r"""Implement an ingestor that keeps a local mirror of the result
+    of a ClickHouse query, and only downloads the new rows.
+
+    The rows must have a monotonic column, for example a timestamp or
+    an auto-incremented id. The largest value of this column in the
+    mirror is the watermark. On each ``sync``, only the rows whose
+    value is greater than the watermark are downloaded and appended
+    to the mirror, then the new watermark is stored. The query must
+    filter the rows with the ``watermark`` query parameter, for
+    example ``WHERE ts > {watermark:DateTime64(3)}``.
+    The query parameter is bound by the server, so its type is
+    defined in the query.
+
+    The mirror is a directory of parquet or Arrow IPC files. Each
+    ``sync`` streams the new rows to a new file
+    (see ``ClickHouseArrowIngestor.ingest_to_file``), so the
+    previous files are never rewritten. The watermark and the number
+    of files are stored in ``<path>.watermark`` once the new file is
+    written, so a file left by an interrupted ``sync`` is ignored and
+    removed by the next ``sync``. An inter-process file lock
+    (``<path>.lock``) ensures that only one process updates the
+    mirror at a time.
+
+    Note that a row is missed if it is inserted after a ``sync`` with
+    a value lower than or equal to the watermark, for example a late
+    event with the same timestamp as the last downloaded row.
+
+    This ingestor requires ``clickhouse_connect`` and ``pyarrow``.
+
+    Args:
+        query: The query to get the data. It must use the
+            ``watermark`` query parameter to filter the new rows.
+        client: The ClickHouse client or its configuration.
+            Please check the documentation of
+            ``clickhouse_connect.get_client`` to get more information.
+        path: The path to the directory of the mirror.
+        column: The name of the monotonic column.
+        initial_watermark: The watermark used when the mirror is
+            empty, for example ``0`` or ``datetime(1970, 1, 1)``.
+        file_format: The file format of the mirror: ``'parquet'``
+            or ``'ipc'``.
+        lock_timeout: The maximum time in seconds to wait for the
+            file lock. If ``None``, wait until the lock is acquired.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import datetime
+    >>> from grizz.ingestor import ClickHouseSyncIngestor
+    >>> import clickhouse_connect
+    >>> client = clickhouse_connect.get_client()  # doctest: +SKIP
+    >>> ingestor = ClickHouseSyncIngestor(
+    ...     query="SELECT * FROM source.dataset WHERE ts > {watermark:DateTime64(3)}",
+    ...     client=client,
+    ...     path="/path/to/mirror",
+    ...     column="ts",
+    ...     initial_watermark=datetime(1970, 1, 1),
+    ... )  # doctest: +SKIP
+    >>> frame = ingestor.ingest()  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        query: str,
+        client: clickhouse_connect.driver.Client | dict,
+        path: Path | str,
+        column: str,
+        initial_watermark: Any,
+        file_format: str = "parquet",
+        lock_timeout: float | None = None,
+    ) -> None:
+        check_clickhouse_connect()
+        check_pyarrow()
+        self._query = str(query)
+        self._client: clickhouse_connect.driver.Client = setup_object(client)
+        self._path = sanitize_path(path)
+        self._column = str(column)
+        self._initial_watermark = initial_watermark
+        if file_format not in ("ipc", "parquet"):
+            msg = f"Incorrect file format: '{file_format}'. The valid formats are: 'ipc', 'parquet'"
+            raise ValueError(msg)
+        self._file_format = file_format
+        self._lock_timeout = lock_timeout
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, column={self._column}, "
+            f"file_format={self._file_format})"
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            self._query == other._query
+            and objects_are_equal(self._client, other._client, equal_nan=equal_nan)
+            and self._path == other._path
+            and self._column == other._column
+            and objects_are_equal(
+                self._initial_watermark, other._initial_watermark, equal_nan=equal_nan
+            )
+            and self._file_format == other._file_format
+            and self._lock_timeout == other._lock_timeout
+        )
+
+    def ingest(self) -> pl.DataFrame:
+        self.sync()
+        num_files, _ = self._load_state()
+        files = [self._get_file_path(index) for index in range(num_files)]
+        logger.info(f"Ingesting data from {num_files:,} files in {self._path}...")
+        with timeblock("DataFrame ingestion time: {time}"):
+            if not files:
+                return pl.DataFrame()
+            scan = pl.scan_parquet if self._file_format == "parquet" else pl.scan_ipc
+            frame = scan(files).collect()
+            logger.info(
+                f"DataFrame ingested | shape={frame.shape}  "
+                f"estimated size={human_byte(frame.estimated_size())}"
+            )
+        return frame
+
+    def sync(self) -> int:
+        r"""Download the new rows and append them to the mirror.
+
+        Returns:
+            The number of new rows.
+        """
+        lock = FileLock(self._path.with_name(f"{self._path.name}.lock"), timeout=self._lock_timeout)
+        with lock:
+            num_files, watermark = self._load_state()
+            self._remove_uncommitted_files(num_files)
+            logger.info(f"Syncing the rows with {self._column} > {watermark}...")
+            path = self._get_file_path(num_files)
+            ingestor = ClickHouseArrowIngestor(
+                query=self._query, client=self._client, partitions=[{"watermark": watermark}]
+            )
+            num_rows = ingestor.ingest_to_file(path, file_format=self._file_format)
+            if num_rows == 0:
+                path.unlink(missing_ok=True)
+                logger.info("No new rows")
+                return 0
+            scan = pl.scan_parquet if self._file_format == "parquet" else pl.scan_ipc
+            state = scan(path).select(
+                pl.lit(num_files + 1, dtype=pl.Int64).alias("num_files"),
+                pl.col(self._column).max().alias("watermark"),
+            )
+            self._save_state(state.collect())
+            logger.info(f"Synced {num_rows:,} new rows | watermark={self.get_watermark()}")
+        return num_rows
+
+    def get_watermark(self) -> Any:
+        r"""Get the current watermark of the mirror.
+
+        Returns:
+            The largest value of the monotonic column in the mirror,
+                or the initial watermark if the mirror is empty.
+        """
+        return self._load_state()[1]
+
+    def _load_state(self) -> tuple[int, Any]:
+        r"""Load the number of files and the watermark of the mirror.
+
+        Returns:
+            A tuple with the number of committed files and the
+                watermark.
+        """
+        path = self._get_state_path()
+        if not path.is_file():
+            return 0, self._initial_watermark
+        state = pl.read_ipc(path, memory_map=False)
+        return state["num_files"].item(), state["watermark"].item()
+
+    def _save_state(self, state: pl.DataFrame) -> None:
+        r"""Save the number of files and the watermark of the mirror.
+
+        Args:
+            state: A DataFrame with one row and the columns
+                ``'num_files'`` and ``'watermark'``.
+        """
+        with atomic_path(self._get_state_path()) as tmp_path:
+            state.write_ipc(tmp_path)
+
+    def _remove_uncommitted_files(self, num_files: int) -> None:
+        r"""Remove the files written by an interrupted sync.
+
+        Args:
+            num_files: The number of committed files.
+        """
+        index = num_files
+        while (path := self._get_file_path(index)).exists():
+            logger.info(f"Removing the uncommitted file {path}")
+            path.unlink()
+            index += 1
+
+    def _get_file_path(self, index: int) -> Path:
+        r"""Get the path to a file of the mirror.
+
+        Args:
+            index: The index of the file.
+
+        Returns:
+            The path to the file.
+        """
+        suffix = ".parquet" if self._file_format == "parquet" else ".arrow"
+        return self._path.joinpath(f"part-{index:06d}{suffix}")
+
+    def _get_state_path(self) -> Path:
+        r"""Get the path to the watermark of the mirror.
+
+        Returns:
+            The path to the watermark file.
+        """
+        return self._path.with_name(f"{self._path.name}.watermark")
+
+
+def make_time_partitions(start: Any, end: Any, step: Any) -> list[dict[str, Any]]:
+    r"""Make partitions that split a time range in consecutive
+    intervals.
+
+    Args:
+        start: The start of the time range (included).
+        end: The end of the time range (excluded).
+        step: The duration of each interval, for example a
+            ``datetime.timedelta``. The last interval can be shorter.
+
+    Returns:
+        The partitions. Each partition is a dictionary with the
+            ``'start'`` (included) and ``'end'`` (excluded) of the
+            interval.
+
+    Raises:
+        ValueError: if ``step`` is not positive.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import date, timedelta
+    >>> from grizz.ingestor.clickhouse import make_time_partitions
+    >>> partitions = make_time_partitions(
+    ...     date(2024, 1, 1), date(2024, 1, 10), step=timedelta(days=4)
+    ... )
+    >>> for partition in partitions:
+    ...     print(partition["start"], partition["end"])
+    ...
+    2024-01-01 2024-01-05
+    2024-01-05 2024-01-09
+    2024-01-09 2024-01-10
+
+    ```
+    """
+    if not start + step > start:
+        msg = f"step must be positive (received: {step})"
+        raise ValueError(msg)
+    partitions = []
+    while start < end:
+        stop = min(start + step, end)
+        partitions.append({"start": start, "end": stop})
+        start = stop
+    return partitions
+
+
+def make_key_partitions(boundaries: Sequence[Any]) -> list[dict[str, Any]]:
+    r"""Make partitions that split a key range in consecutive
+    intervals.
+
+    Args:
+        boundaries: The sorted boundaries of the intervals.
+
+    Returns:
+        The partitions. Each partition is a dictionary with the
+            ``'start'`` (included) and ``'end'`` (excluded) of the
+            interval.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.ingestor.clickhouse import make_key_partitions
+    >>> make_key_partitions([0, 100, 200, 300])
+    [{'start': 0, 'end': 100}, {'start': 100, 'end': 200}, {'start': 200, 'end': 300}]
+
+    ```
+    """
+    return [{"start": start, "end": end} for start, end in zip(boundaries[:-1], boundaries[1:])]
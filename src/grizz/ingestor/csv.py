@@ -4,19 +4,27 @@ from __future__ import annotations
 
 __all__ = ["CsvFileIngestor", "CsvIngestor"]
 
+import copy
 import logging
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 import polars as pl
 from coola import objects_are_equal
 
 from grizz.ingestor.base import BaseIngestor
-from grizz.ingestor.utils import check_data_file
+from grizz.ingestor.utils import (
+    check_data_file,
+    find_available_columns,
+    is_scan_compatible,
+    predicates_are_equal,
+    scan_filtered,
+)
 from grizz.utils.format import str_kwargs
 from grizz.utils.path import human_file_size, sanitize_path
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Sequence
 
     from grizz.ingestor.parquet import FileSource
 
@@ -47,23 +55,73 @@ class CsvIngestor(BaseIngestor):
     def __init__(self, source: FileSource, **kwargs: Any) -> None:
         self._source = source
         self._kwargs = kwargs
+        self._columns = None
+        self._predicate = None
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}(source={self._source}{str_kwargs(self._kwargs)})"
+        args = str_kwargs(self._kwargs)
+        if self._columns is not None:
+            args += f", selected_columns={self._columns}"
+        if self._predicate is not None:
+            args += f", predicate={self._predicate}"
+        return f"{self.__class__.__qualname__}(source={self._source}{args})"
 
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        return self._source == other._source and objects_are_equal(
-            self._kwargs, other._kwargs, equal_nan=equal_nan
+        return (
+            self._source == other._source
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+            and self._columns == other._columns
+            and predicates_are_equal(self._predicate, other._predicate)
         )
 
     def ingest(self) -> pl.DataFrame:
         logger.info(f"Ingesting CSV data from {self._source}...")
-        frame = pl.read_csv(self._source, **self._kwargs)
+        kwargs = self._get_read_kwargs()
+        if self._predicate is None:
+            frame = pl.read_csv(self._source, **kwargs)
+        else:
+            frame = scan_filtered(pl.scan_csv, self._source, self._predicate, **kwargs).collect()
         logger.info(f"DataFrame ingested | schema={frame.collect_schema()}")
         return frame
 
+    def select_columns(self, columns: Sequence[str]) -> CsvIngestor | None:
+        if (
+            "columns" in self._kwargs
+            or "new_columns" in self._kwargs
+            or not isinstance(self._source, (str, Path))
+        ):
+            return None
+        ingestor = copy.copy(self)
+        ingestor._columns = tuple(columns)
+        return ingestor
+
+    def filter_rows(self, predicate: pl.Expr) -> CsvIngestor | None:
+        if "new_columns" in self._kwargs or not isinstance(self._source, (str, Path)):
+            return None
+        if not is_scan_compatible(pl.scan_csv, self._kwargs):
+            return None
+        ingestor = copy.copy(self)
+        ingestor._predicate = predicate if self._predicate is None else self._predicate & predicate
+        return ingestor
+
+    def _get_read_kwargs(self) -> dict[str, Any]:
+        r"""Get the keyword arguments of ``polars.read_csv`` with the
+        selected columns that are in the header.
+
+        Returns:
+            The keyword arguments.
+        """
+        if self._columns is None:
+            return self._kwargs
+        columns = find_available_columns(
+            self._columns, pl.read_csv(self._source, **(self._kwargs | {"n_rows": 0})).columns
+        )
+        if not columns:
+            return self._kwargs
+        return self._kwargs | {"columns": columns}
+
 
 class CsvFileIngestor(CsvIngestor):
     r"""Implement a CSV file ingestor.
@@ -93,3 +151,7 @@ class CsvFileIngestor(CsvIngestor):
         check_data_file(self._source)
         logger.info(f"Ingesting CSV file {self._source} | size={human_file_size(self._source)}")
         return super().ingest()
+
+    def select_columns(self, columns: Sequence[str]) -> CsvIngestor | None:
+        check_data_file(self._source)
+        return super().select_columns(columns)
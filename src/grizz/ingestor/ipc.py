@@ -0,0 +1,166 @@
+r"""Contain the implementation of Arrow IPC ingestors."""
+
+from __future__ import annotations
+
+__all__ = ["IpcFileIngestor", "IpcIngestor"]
+
+import copy
+import logging
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+from coola import objects_are_equal
+from iden.utils.time import timeblock
+
+from grizz.ingestor.base import BaseIngestor
+from grizz.ingestor.utils import (
+    check_data_file,
+    find_available_columns,
+    is_scan_compatible,
+    predicates_are_equal,
+    scan_filtered,
+)
+from grizz.utils.format import human_byte, str_kwargs
+from grizz.utils.path import human_file_size, sanitize_path
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    from grizz.ingestor.parquet import FileSource
+
+logger = logging.getLogger(__name__)
+
+
+class IpcIngestor(BaseIngestor):
+    r"""Implement an Arrow IPC (Feather v2) ingestor.
+
+    By default, ``polars.read_ipc`` memory-maps uncompressed files, so
+    ingesting them is close to zero-copy. It is a good format for
+    intermediate data or the fast ingestor of a ``CacheIngestor``.
+
+    Args:
+        source: The source to the Arrow IPC data to ingest.
+        **kwargs: Additional keyword arguments for
+            ``polars.read_ipc``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.ingestor import IpcIngestor
+    >>> ingestor = IpcIngestor(source="/path/to/frame.arrow")
+    >>> ingestor
+    IpcIngestor(source=/path/to/frame.arrow)
+    >>> frame = ingestor.ingest()  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(self, source: FileSource, **kwargs: Any) -> None:
+        self._source = source
+        self._kwargs = kwargs
+        self._columns = None
+        self._predicate = None
+
+    def __repr__(self) -> str:
+        args = str_kwargs(self._kwargs)
+        if self._columns is not None:
+            args += f", selected_columns={self._columns}"
+        if self._predicate is not None:
+            args += f", predicate={self._predicate}"
+        return f"{self.__class__.__qualname__}(source={self._source}{args})"
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            self._source == other._source
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+            and self._columns == other._columns
+            and predicates_are_equal(self._predicate, other._predicate)
+        )
+
+    def ingest(self) -> pl.DataFrame:
+        logger.info(f"Ingesting Arrow IPC data from {self._source}...")
+        kwargs = self._get_read_kwargs()
+        with timeblock("DataFrame ingestion time: {time}"):
+            if self._predicate is None:
+                frame = pl.read_ipc(self._source, **kwargs)
+            else:
+                frame = scan_filtered(
+                    pl.scan_ipc, self._source, self._predicate, **kwargs
+                ).collect()
+            logger.info(
+                f"DataFrame ingested | shape={frame.shape}  "
+                f"estimated size={human_byte(frame.estimated_size())}"
+            )
+        return frame
+
+    def select_columns(self, columns: Sequence[str]) -> IpcIngestor | None:
+        if "columns" in self._kwargs or not isinstance(self._source, (str, Path)):
+            return None
+        ingestor = copy.copy(self)
+        ingestor._columns = tuple(columns)
+        return ingestor
+
+    def filter_rows(self, predicate: pl.Expr) -> IpcIngestor | None:
+        if not isinstance(self._source, (str, Path)):
+            return None
+        if not is_scan_compatible(pl.scan_ipc, self._kwargs):
+            return None
+        ingestor = copy.copy(self)
+        ingestor._predicate = predicate if self._predicate is None else self._predicate & predicate
+        return ingestor
+
+    def _get_read_kwargs(self) -> dict[str, Any]:
+        r"""Get the keyword arguments of ``polars.read_ipc`` with the
+        selected columns that are in the file.
+
+        Returns:
+            The keyword arguments.
+        """
+        if self._columns is None:
+            return self._kwargs
+        columns = find_available_columns(
+            self._columns, pl.scan_ipc(self._source).collect_schema().names()
+        )
+        if not columns:
+            return self._kwargs
+        return self._kwargs | {"columns": columns}
+
+
+class IpcFileIngestor(IpcIngestor):
+    r"""Implement an Arrow IPC (Feather v2) file ingestor.
+
+    Args:
+        path: The path to the Arrow IPC file to ingest.
+        **kwargs: Additional keyword arguments for
+            ``polars.read_ipc``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.ingestor import IpcFileIngestor
+    >>> ingestor = IpcFileIngestor(path="/path/to/frame.arrow")
+    >>> ingestor
+    IpcFileIngestor(source=/path/to/frame.arrow)
+    >>> frame = ingestor.ingest()  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(self, path: Path | str, **kwargs: Any) -> None:
+        super().__init__(source=sanitize_path(path), **kwargs)
+
+    def ingest(self) -> pl.DataFrame:
+        check_data_file(self._source)
+        logger.info(
+            f"Ingesting Arrow IPC file {self._source} | size={human_file_size(self._source)}"
+        )
+        return super().ingest()
+
+    def select_columns(self, columns: Sequence[str]) -> IpcIngestor | None:
+        check_data_file(self._source)
+        return super().select_columns(columns)
@@ -1,9 +1,12 @@
-r"""Contain the implementation of parquet ingestors."""
+r"""Contain the implementation of an ingestor that joins the output of
+multiple ingestors."""
 
 from __future__ import annotations
 
 __all__ = ["JoinIngestor"]
 
+import functools
+import itertools
 import logging
 from typing import TYPE_CHECKING, Any
 
@@ -13,10 +16,12 @@ from coola.utils.format import repr_mapping, repr_mapping_line
 from iden.utils.time import timeblock
 
 from grizz.ingestor.base import BaseIngestor, setup_ingestor
+from grizz.ingestor.utils import check_key_filter, get_inner_join_keys, make_key_filter
+from grizz.utils.concurrency import map_in_threads
 from grizz.utils.format import human_byte
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Iterator, Sequence
 
     import polars as pl
 
@@ -29,6 +34,27 @@ class JoinIngestor(BaseIngestor):
 
     Args:
         ingestors: The list of ingestors.
+        max_workers: The maximum number of threads used to run the
+            ingestors concurrently. If ``1``, the ingestors are run
+            sequentially. The ingestors are independent, so running
+            them concurrently is useful when they are I/O-bound, for
+            example when they read files or query a database.
+            The DataFrames are always joined in the order of the
+            ingestors, so the output does not depend on this value.
+        key_filter: The method used to filter the join keys before
+            an inner join. If ``'is_in'`` or ``'range'``, the first
+            ingestor is run, and the other ingestors only ingest the
+            rows whose keys can match one of its keys
+            (see ``grizz.ingestor.utils.make_key_filter``). The
+            filter is pushed to the ingestors with
+            ``BaseIngestor.filter_rows``, so the rows that do not
+            match are not loaded in memory. The ingestors that
+            cannot filter the rows are filtered after the
+            ingestion, which only makes the join cheaper. The first
+            ingestor should ingest the smallest DataFrame.
+            If ``None``, the DataFrames are not filtered. The
+            DataFrames are not filtered for other join types or if
+            the join does not use ``on`` with column names.
         **kwargs: Additional keyword arguments for
             ``polars.DataFrame.join``.
 
@@ -71,6 +97,8 @@ class JoinIngestor(BaseIngestor):
         (0): Ingestor(shape=(5, 3))
         (1): Ingestor(shape=(4, 2))
         (2): Ingestor(shape=(5, 3))
+      (max_workers): 1
+      (key_filter): None
       (kwargs): on='col', how='inner'
     )
     >>> frame = ingestor.ingest()
@@ -90,11 +118,23 @@ class JoinIngestor(BaseIngestor):
     ```
     """
 
-    def __init__(self, ingestors: Sequence[BaseIngestor | dict], **kwargs: Any) -> None:
+    def __init__(
+        self,
+        ingestors: Sequence[BaseIngestor | dict],
+        max_workers: int = 1,
+        key_filter: str | None = None,
+        **kwargs: Any,
+    ) -> None:
         if len(ingestors) < 1:
             msg = "'ingestors' must contain at least one ingestor"
             raise ValueError(msg)
         self._ingestors = tuple(setup_ingestor(ingestor) for ingestor in ingestors)
+        if max_workers < 1:
+            msg = f"max_workers must be greater than 0 (received: {max_workers})"
+            raise ValueError(msg)
+        self._max_workers = max_workers
+        check_key_filter(key_filter)
+        self._key_filter = key_filter
         self._kwargs = kwargs
 
     def __repr__(self) -> str:
@@ -102,6 +142,8 @@ class JoinIngestor(BaseIngestor):
             repr_mapping(
                 {
                     "ingestors": "\n" + repr_sequence(self._ingestors),
+                    "max_workers": self._max_workers,
+                    "key_filter": self._key_filter,
                     "kwargs": repr_mapping_line(self._kwargs),
                 }
             )
@@ -111,9 +153,12 @@ class JoinIngestor(BaseIngestor):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        return objects_are_equal(
-            self._ingestors, other._ingestors, equal_nan=equal_nan
-        ) and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+        return (
+            objects_are_equal(self._ingestors, other._ingestors, equal_nan=equal_nan)
+            and self._max_workers == other._max_workers
+            and self._key_filter == other._key_filter
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+        )
 
     def ingest(self) -> pl.DataFrame:
         logger.info("Joining DataFrames...")
@@ -126,8 +171,75 @@ class JoinIngestor(BaseIngestor):
         return frame
 
     def _ingest(self) -> pl.DataFrame:
-        out = self._ingestors[0].ingest()
-        for ingestor in self._ingestors[1:]:
-            frame = ingestor.ingest()
+        on = None if self._key_filter is None else get_inner_join_keys(**self._kwargs)
+        if on is None or len(self._ingestors) < 2:
+            frames = self._ingest_frames([ingestor.ingest for ingestor in self._ingestors])
+        else:
+            frames = self._ingest_filtered_frames(on)
+        # The DataFrames are joined as soon as they are ingested, so only
+        # the joined DataFrame and the next DataFrame are in memory when
+        # the ingestors run sequentially.
+        out = next(frames)
+        for frame in frames:
             out = out.join(frame, **self._kwargs)
         return out
+
+    def _ingest_frames(
+        self, ingest_fns: Sequence[Callable[[], pl.DataFrame]]
+    ) -> Iterator[pl.DataFrame]:
+        r"""Ingest some DataFrames.
+
+        Args:
+            ingest_fns: The functions that ingest the DataFrames.
+
+        Returns:
+            An iterator over the DataFrames, in the same order as the
+                functions. If the functions run sequentially, each
+                DataFrame is only ingested when it is requested.
+        """
+        max_workers = min(self._max_workers, len(ingest_fns))
+        if max_workers > 1:
+            logger.info(f"Ingesting {len(ingest_fns):,} DataFrames with {max_workers} threads...")
+        return map_in_threads(lambda ingest: ingest(), ingest_fns, max_workers=max_workers)
+
+    def _ingest_filtered_frames(self, on: Sequence[str]) -> Iterator[pl.DataFrame]:
+        r"""Ingest the DataFrames of all the ingestors, and keep only
+        the rows whose keys can match a key of the first DataFrame.
+
+        Args:
+            on: The key columns of the inner join.
+
+        Returns:
+            An iterator over the DataFrames, in the same order as the
+                ingestors.
+        """
+        first = self._ingestors[0].ingest()
+        expr = make_key_filter(first, on=on, key_filter=self._key_filter)
+        ingest_fns, num_pushed = [], 0
+        for ingestor in self._ingestors[1:]:
+            filtered = ingestor.filter_rows(expr)
+            if filtered is None:
+                # The ingestor cannot filter the rows, so the DataFrame
+                # is filtered after the ingestion.
+                ingest_fns.append(functools.partial(_ingest_and_filter, ingestor, expr))
+            else:
+                ingest_fns.append(filtered.ingest)
+                num_pushed += 1
+        logger.info(
+            f"Filtering the join keys with {self._key_filter!r} | "
+            f"pushed to {num_pushed:,}/{len(ingest_fns):,} ingestors"
+        )
+        return itertools.chain([first], self._ingest_frames(ingest_fns))
+
+
+def _ingest_and_filter(ingestor: BaseIngestor, predicate: pl.Expr) -> pl.DataFrame:
+    r"""Ingest a DataFrame and keep only the rows matching a predicate.
+
+    Args:
+        ingestor: The ingestor.
+        predicate: The predicate of the rows to keep.
+
+    Returns:
+        The filtered DataFrame.
+    """
+    return ingestor.ingest().filter(predicate)
@@ -2,20 +2,42 @@ r"""Contain the implementation of parquet ingestors."""
 
 from __future__ import annotations
 
-__all__ = ["ParquetFileIngestor", "ParquetIngestor"]
+__all__ = [
+    "ParquetDatasetIngestor",
+    "ParquetDirectoryIngestor",
+    "ParquetFileIngestor",
+    "ParquetIngestor",
+]
 
+import copy
+import functools
 import logging
 from pathlib import Path
-from typing import IO, Any, Union
+from typing import IO, TYPE_CHECKING, Any, Union
 
 import polars as pl
 from coola import objects_are_equal
 from iden.utils.time import timeblock
 
 from grizz.ingestor.base import BaseIngestor
-from grizz.ingestor.utils import check_data_file
+from grizz.ingestor.utils import (
+    check_concat_how,
+    check_data_dir,
+    check_data_file,
+    find_available_columns,
+    get_file_paths,
+    is_scan_compatible,
+    predicates_are_equal,
+    scan_filtered,
+)
+from grizz.utils.concurrency import map_in_threads
 from grizz.utils.format import human_byte, str_kwargs
-from grizz.utils.path import human_file_size, sanitize_path
+from grizz.utils.hive import scan_partitioned_parquet
+from grizz.utils.parquet import ParquetIndex
+from grizz.utils.path import find_parquet_files, human_file_size, sanitize_path
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
 
 FileSource = Union[
     str,
@@ -36,6 +58,11 @@ class ParquetIngestor(BaseIngestor):
 
     Args:
         source: The source to the parquet data to ingest.
+        index_path: The path to the JSON file of the index of the
+            parquet footers (see ``grizz.utils.parquet.ParquetIndex``).
+            If it is set, the columns selected by ``select_columns``
+            are compared with the schema stored in the index instead
+            of the schema in the footer of the file.
         **kwargs: Additional keyword arguments for
             ``polars.read_parquet``.
 
@@ -52,36 +79,114 @@ class ParquetIngestor(BaseIngestor):
     ```
     """
 
-    def __init__(self, source: FileSource, **kwargs: Any) -> None:
+    def __init__(
+        self, source: FileSource, index_path: Path | str | None = None, **kwargs: Any
+    ) -> None:
         self._source = source
+        self._index_path = None if index_path is None else sanitize_path(index_path)
         self._kwargs = kwargs
+        self._columns = None
+        self._predicate = None
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}(source={self._source}{str_kwargs(self._kwargs)})"
+        args = str_kwargs(self._kwargs)
+        if self._index_path is not None:
+            args = f", index_path={self._index_path}{args}"
+        if self._columns is not None:
+            args += f", selected_columns={self._columns}"
+        if self._predicate is not None:
+            args += f", predicate={self._predicate}"
+        return f"{self.__class__.__qualname__}(source={self._source}{args})"
 
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        return self._source == other._source and objects_are_equal(
-            self._kwargs, other._kwargs, equal_nan=equal_nan
+        return (
+            self._source == other._source
+            and self._index_path == other._index_path
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+            and self._columns == other._columns
+            and predicates_are_equal(self._predicate, other._predicate)
         )
 
     def ingest(self) -> pl.DataFrame:
         logger.info(f"Ingesting parquet data from {self._source}...")
+        kwargs = self._get_read_kwargs()
         with timeblock("DataFrame ingestion time: {time}"):
-            frame = pl.read_parquet(self._source, **self._kwargs)
+            if self._predicate is None:
+                frame = pl.read_parquet(self._source, **kwargs)
+            else:
+                frame = scan_filtered(
+                    pl.scan_parquet, self._source, self._predicate, **kwargs
+                ).collect()
             logger.info(
                 f"DataFrame ingested | shape={frame.shape}  "
                 f"estimated size={human_byte(frame.estimated_size())}"
             )
         return frame
 
+    def select_columns(self, columns: Sequence[str]) -> ParquetIngestor | None:
+        if "columns" in self._kwargs or not isinstance(self._source, (str, Path)):
+            return None
+        ingestor = copy.copy(self)
+        ingestor._columns = tuple(columns)
+        return ingestor
+
+    def filter_rows(self, predicate: pl.Expr) -> ParquetIngestor | None:
+        if not isinstance(self._source, (str, Path)):
+            return None
+        if not is_scan_compatible(pl.scan_parquet, self._kwargs):
+            return None
+        ingestor = copy.copy(self)
+        ingestor._predicate = predicate if self._predicate is None else self._predicate & predicate
+        return ingestor
+
+    def _get_read_kwargs(self) -> dict[str, Any]:
+        r"""Get the keyword arguments used to read the data.
+
+        The selected columns are compared with the columns of the
+        data when the data is ingested, so the data is not read when
+        the ingestion is planned. The columns that are not in the
+        data are ignored, and all the columns are read if none of the
+        selected columns is in the data.
+
+        Returns:
+            The keyword arguments.
+        """
+        if self._columns is None:
+            return self._kwargs
+        columns = find_available_columns(self._columns, self._get_column_names())
+        if not columns:
+            return self._kwargs
+        return self._kwargs | {"columns": columns}
+
+    def _get_column_names(self) -> list[str]:
+        r"""Get the column names of the data.
+
+        The column names are read from the index if ``index_path``
+        is set and the source is a path or a list of paths to files.
+        As in ``polars.read_parquet``, the schema of the first file
+        is used.
+
+        Returns:
+            The column names.
+        """
+        paths = None if self._index_path is None else get_file_paths(self._source)
+        if not paths:
+            return pl.scan_parquet(self._source).collect_schema().names()
+        index = ParquetIndex(self._index_path)
+        schema = index.get(paths[0])["schema"]
+        index.save()
+        return list(schema)
+
 
 class ParquetFileIngestor(ParquetIngestor):
     r"""Implement a parquet file ingestor.
 
     Args:
         path: The path to the parquet file to ingest.
+        index_path: The path to the JSON file of the index of the
+            parquet footers. See ``ParquetIngestor``.
         **kwargs: Additional keyword arguments for
             ``polars.read_parquet``.
 
@@ -98,10 +203,240 @@ class ParquetFileIngestor(ParquetIngestor):
     ```
     """
 
-    def __init__(self, path: Path | str, **kwargs: Any) -> None:
-        super().__init__(source=sanitize_path(path), **kwargs)
+    def __init__(
+        self, path: Path | str, index_path: Path | str | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(source=sanitize_path(path), index_path=index_path, **kwargs)
 
     def ingest(self) -> pl.DataFrame:
         check_data_file(self._source)
         logger.info(f"Ingesting parquet file {self._source} | size={human_file_size(self._source)}")
         return super().ingest()
+
+    def select_columns(self, columns: Sequence[str]) -> ParquetIngestor | None:
+        check_data_file(self._source)
+        return super().select_columns(columns)
+
+
+class ParquetDatasetIngestor(BaseIngestor):
+    r"""Implement an ingestor for a hive-partitioned parquet dataset.
+
+    The dataset is a directory with one sub-directory per partition,
+    for example ``<path>/country=FR/day=2024-01-01/part-00000.parquet``.
+    The partition filters are applied to the directory names, so
+    only the directories of the matching partitions are listed and
+    only their files are opened
+    (see ``grizz.utils.hive.find_partition_files``).
+    The partition keys are added as columns.
+
+    Args:
+        path: The path to the root directory of the dataset.
+        filters: The filters of the partition keys. Each filter can
+            be a dictionary with the optional ``'start'`` (included)
+            and ``'end'`` (excluded) of a range, a list of accepted
+            values, or a single accepted value. If ``None``, all the
+            partitions are ingested.
+        cache_path: The path to the JSON file used to cache the
+            directory listings between runs. A cached listing is
+            reused while the modification time and the number of
+            hard links of its directory do not change. On
+            filesystems with a coarse modification time (e.g. NFS,
+            FUSE or FAT), a file added in the same tick as the
+            cached listing may be missed until its directory is
+            modified again. If ``None``, the listings are not cached.
+        hive_schema: The data types of the partition keys. The
+            partition keys without data type are strings.
+        column_filters: The filters of the columns of the files,
+            with the same format as ``filters``. The rows that do not
+            match are removed, and the files whose column statistics
+            show that they do not contain any matching row are not
+            opened. If ``None``, the rows are not filtered.
+        index_path: The path to the JSON file of the index of the
+            parquet footers and statistics
+            (see ``grizz.utils.parquet.ParquetIndex``). It is
+            required to use ``column_filters``.
+        **kwargs: Additional keyword arguments for
+            ``polars.scan_parquet``.
+
+    Raises:
+        ValueError: if ``column_filters`` is set without
+            ``index_path``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import date
+    >>> import polars as pl
+    >>> from grizz.ingestor import ParquetDatasetIngestor
+    >>> ingestor = ParquetDatasetIngestor(
+    ...     path="/path/to/dataset",
+    ...     filters={
+    ...         "day": {"start": date(2024, 1, 1), "end": date(2024, 1, 8)},
+    ...         "country": ["FR"],
+    ...     },
+    ...     hive_schema={"day": pl.Date},
+    ... )
+    >>> frame = ingestor.ingest()  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        filters: dict[str, Any] | None = None,
+        cache_path: Path | str | None = None,
+        hive_schema: dict[str, pl.DataType] | None = None,
+        column_filters: dict[str, Any] | None = None,
+        index_path: Path | str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._path = sanitize_path(path)
+        self._filters = filters
+        self._cache_path = None if cache_path is None else sanitize_path(cache_path)
+        self._hive_schema = hive_schema
+        if column_filters and index_path is None:
+            msg = "index_path is required to use column_filters"
+            raise ValueError(msg)
+        self._column_filters = column_filters
+        self._index_path = None if index_path is None else sanitize_path(index_path)
+        self._kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, filters={self._filters}, "
+            f"column_filters={self._column_filters}{str_kwargs(self._kwargs)})"
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            self._path == other._path
+            and objects_are_equal(self._filters, other._filters, equal_nan=equal_nan)
+            and self._cache_path == other._cache_path
+            and objects_are_equal(self._hive_schema, other._hive_schema, equal_nan=equal_nan)
+            and objects_are_equal(self._column_filters, other._column_filters, equal_nan=equal_nan)
+            and self._index_path == other._index_path
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+        )
+
+    def ingest(self) -> pl.DataFrame:
+        logger.info(f"Ingesting the parquet dataset {self._path} | filters={self._filters}")
+        with timeblock("DataFrame ingestion time: {time}"):
+            frame = scan_partitioned_parquet(
+                self._path,
+                filters=self._filters,
+                cache_path=self._cache_path,
+                hive_schema=self._hive_schema,
+                column_filters=self._column_filters,
+                index_path=self._index_path,
+                **self._kwargs,
+            ).collect()
+            logger.info(
+                f"DataFrame ingested | shape={frame.shape}  "
+                f"estimated size={human_byte(frame.estimated_size())}"
+            )
+        return frame
+
+
+class ParquetDirectoryIngestor(BaseIngestor):
+    r"""Implement an ingestor for a directory of parquet files.
+
+    The files are read concurrently, then concatenated in the order
+    of their paths. The schemas of the files do not need to be the
+    same. By default, the columns that are missing in a file are
+    filled with nulls, and the columns with different data types are
+    cast to their supertype. The DataFrames are concatenated without
+    rechunking, so the chunks of the files are not copied.
+
+    Args:
+        path: The path to the directory with the parquet files.
+        recursive: Indicate if the parquet files in the
+            sub-directories are also ingested.
+        how: The method used to concatenate the DataFrames of the
+            files. ``'vertical'`` requires the same schema for all
+            the files, ``'vertical_relaxed'`` also casts the columns
+            to their supertype, ``'diagonal'`` fills the missing
+            columns with nulls, and ``'diagonal_relaxed'`` does both.
+        max_workers: The maximum number of files to read
+            concurrently.
+        **kwargs: Additional keyword arguments for
+            ``polars.read_parquet``.
+
+    Raises:
+        ValueError: if ``how`` or ``max_workers`` is not valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.ingestor import ParquetDirectoryIngestor
+    >>> ingestor = ParquetDirectoryIngestor(path="/path/to/dir", max_workers=4)
+    >>> ingestor
+    ParquetDirectoryIngestor(path=/path/to/dir, recursive=True, how=diagonal_relaxed, max_workers=4)
+    >>> frame = ingestor.ingest()  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        recursive: bool = True,
+        how: str = "diagonal_relaxed",
+        max_workers: int = 1,
+        **kwargs: Any,
+    ) -> None:
+        self._path = sanitize_path(path)
+        self._recursive = bool(recursive)
+        check_concat_how(how)
+        self._how = how
+        if max_workers < 1:
+            msg = f"max_workers must be greater than 0 (received: {max_workers})"
+            raise ValueError(msg)
+        self._max_workers = max_workers
+        self._kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, recursive={self._recursive}, "
+            f"how={self._how}, max_workers={self._max_workers}{str_kwargs(self._kwargs)})"
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            self._path == other._path
+            and self._recursive == other._recursive
+            and self._how == other._how
+            and self._max_workers == other._max_workers
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+        )
+
+    def ingest(self) -> pl.DataFrame:
+        check_data_dir(self._path)
+        files = sorted(find_parquet_files(self._path, recursive=self._recursive))
+        logger.info(f"Ingesting {len(files):,} parquet files from {self._path}...")
+        with timeblock("DataFrame ingestion time: {time}"):
+            frames = self._read_files(files)
+            frame = pl.concat(frames, how=self._how, rechunk=False) if frames else pl.DataFrame()
+            logger.info(
+                f"DataFrame ingested | shape={frame.shape}  "
+                f"estimated size={human_byte(frame.estimated_size())}"
+            )
+        return frame
+
+    def _read_files(self, files: list[Path]) -> list[pl.DataFrame]:
+        r"""Read the parquet files.
+
+        Args:
+            files: The paths to the parquet files.
+
+        Returns:
+            The DataFrames, in the same order as the files.
+        """
+        read = functools.partial(pl.read_parquet, **self._kwargs)
+        return list(map_in_threads(read, files, max_workers=min(self._max_workers, len(files))))
@@ -12,6 +12,7 @@ from coola.utils import repr_indent, repr_mapping
 
 from grizz.ingestor.base import BaseIngestor, setup_ingestor
 from grizz.transformer.base import BaseTransformer, setup_transformer
+from grizz.utils.profiling import profile_block
 
 if TYPE_CHECKING:
     import polars as pl
@@ -26,6 +27,18 @@ class TransformIngestor(BaseIngestor):
         ingestor: The base ingestor.
         transformer: The ``polars.DataFrame`` transformer or
             its configuration.
+        prune_columns: If ``True``, only the columns required by the
+            transformer are ingested (see
+            ``BaseTransformer.find_required_columns``), if the
+            ingestor can select the columns (see
+            ``BaseIngestor.select_columns``). The columns can only be
+            pruned if the transformer selects its output columns,
+            for example with ``ColumnSelection``.
+        pushdown_filters: If ``True``, the rows that are removed by
+            the first transformers (see
+            ``BaseTransformer.get_row_filter``) are filtered when the
+            data is read, if the ingestor can filter the rows (see
+            ``BaseIngestor.filter_rows``).
 
     Example usage:
 
@@ -69,9 +82,17 @@ class TransformIngestor(BaseIngestor):
     ```
     """
 
-    def __init__(self, ingestor: BaseIngestor | dict, transformer: BaseTransformer | dict) -> None:
+    def __init__(
+        self,
+        ingestor: BaseIngestor | dict,
+        transformer: BaseTransformer | dict,
+        prune_columns: bool = False,
+        pushdown_filters: bool = False,
+    ) -> None:
         self._ingestor = setup_ingestor(ingestor)
         self._transformer = setup_transformer(transformer)
+        self._prune_columns = bool(prune_columns)
+        self._pushdown_filters = bool(pushdown_filters)
 
     def __repr__(self) -> str:
         args = repr_indent(
@@ -82,10 +103,88 @@ class TransformIngestor(BaseIngestor):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        return self._ingestor.equal(
-            other._ingestor, equal_nan=equal_nan
-        ) and self._transformer.equal(other._transformer, equal_nan=equal_nan)
+        return (
+            self._prune_columns == other._prune_columns
+            and self._pushdown_filters == other._pushdown_filters
+            and self._ingestor.equal(other._ingestor, equal_nan=equal_nan)
+            and self._transformer.equal(other._transformer, equal_nan=equal_nan)
+        )
 
     def ingest(self) -> pl.DataFrame:
-        frame = self._ingestor.ingest()
-        return self._transformer.transform(frame)
+        with profile_block(f"{self.__class__.__qualname__}.ingest", category="ingest") as record:
+            ingestor = self._get_ingestor()
+            with profile_block(
+                f"{self._ingestor.__class__.__qualname__}.ingest", category="ingest"
+            ) as ingest_record:
+                frame = ingestor.ingest()
+                if ingest_record is not None:
+                    ingest_record.set_output(frame)
+            out = self._transformer.transform(frame)
+            if record is not None:
+                record.set_output(out)
+        return out
+
+    def _get_ingestor(self) -> BaseIngestor:
+        r"""Get the ingestor that only ingests the columns and rows
+        required by the transformer.
+
+        Returns:
+            The ingestor. It is the base ingestor if the columns and
+                rows are not pruned or cannot be pruned.
+        """
+        ingestor = self._ingestor
+        if self._prune_columns:
+            ingestor = self._select_columns(ingestor)
+        if self._pushdown_filters:
+            ingestor = self._filter_rows(ingestor)
+        return ingestor
+
+    def _select_columns(self, ingestor: BaseIngestor) -> BaseIngestor:
+        r"""Get the ingestor that only ingests the columns required by
+        the transformer.
+
+        Args:
+            ingestor: The ingestor to prune.
+
+        Returns:
+            The ingestor. It is the input ingestor if the columns
+                cannot be pruned.
+        """
+        columns = self._transformer.find_required_columns()
+        if columns is None:
+            logger.info("Cannot prune the columns because all the columns may be required")
+            return ingestor
+        selected = ingestor.select_columns(columns)
+        if selected is None:
+            logger.info(
+                f"Cannot prune the columns because {ingestor.__class__.__qualname__} "
+                "cannot select the columns"
+            )
+            return ingestor
+        logger.info(f"Ingesting only the {len(columns):,} columns required by the transformer")
+        return selected
+
+    def _filter_rows(self, ingestor: BaseIngestor) -> BaseIngestor:
+        r"""Get the ingestor that only ingests the rows required by the
+        transformer.
+
+        Args:
+            ingestor: The ingestor to prune.
+
+        Returns:
+            The ingestor. It is the input ingestor if the rows cannot
+                be filtered.
+        """
+        predicate = self._transformer.get_row_filter()
+        if predicate is None:
+            logger.info("Cannot filter the rows because all the rows may be required")
+            return ingestor
+        filtered = ingestor.filter_rows(predicate)
+        if filtered is None:
+            logger.info(
+                f"Cannot filter the rows because {ingestor.__class__.__qualname__} "
+                "cannot filter the rows"
+            )
+            return ingestor
+        logger.info("Ingesting only the rows required by the transformer")
+        return filtered
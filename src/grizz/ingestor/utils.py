@@ -2,15 +2,80 @@ r"""Contain utility functions to ingest DataFrames."""
 
 from __future__ import annotations
 
-__all__ = ["check_data_file"]
+__all__ = [
+    "check_concat_how",
+    "check_data_dir",
+    "check_data_file",
+    "check_key_filter",
+    "find_available_columns",
+    "get_file_paths",
+    "get_inner_join_keys",
+    "is_scan_compatible",
+    "make_key_filter",
+    "predicates_are_equal",
+    "scan_filtered",
+]
 
 
-from typing import TYPE_CHECKING
+import inspect
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
 
 from grizz.exceptions import DataNotFoundError
+from grizz.utils.path import sanitize_path
 
 if TYPE_CHECKING:
-    from pathlib import Path
+    from collections.abc import Callable, Mapping, Sequence
+
+CONCAT_HOWS = ("diagonal", "diagonal_relaxed", "vertical", "vertical_relaxed")
+KEY_FILTERS = ("is_in", "range")
+
+
+def check_concat_how(how: str) -> None:
+    r"""Check the method used to concatenate DataFrames with different
+    schemas.
+
+    Args:
+        how: The method used to concatenate the DataFrames.
+
+    Raises:
+        ValueError: if ``how`` is not a valid method.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.ingestor.utils import check_concat_how
+    >>> check_concat_how("diagonal_relaxed")
+
+    ```
+    """
+    if how not in CONCAT_HOWS:
+        msg = f"Incorrect how: {how}. The valid values are: {', '.join(map(repr, CONCAT_HOWS))}"
+        raise ValueError(msg)
+
+
+def check_data_dir(path: Path) -> None:
+    r"""Check if the directory containing data exists or not.
+
+    Raises:
+        DataNotFoundError: if the directory does not exist.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from pathlib import Path
+    >>> from grizz.ingestor.utils import check_data_dir
+    >>> check_data_dir(Path("/path/to/dataset"))  # doctest: +SKIP
+
+    ```
+    """
+    if not path.is_dir():
+        msg = f"Data directory does not exist: {path}"
+        raise DataNotFoundError(msg)
 
 
 def check_data_file(path: Path) -> None:
@@ -32,3 +97,310 @@ def check_data_file(path: Path) -> None:
     if not path.is_file():
         msg = f"Data file does not exist: {path}"
         raise DataNotFoundError(msg)
+
+
+def check_key_filter(key_filter: str | None) -> None:
+    r"""Check the method used to filter the join keys.
+
+    Args:
+        key_filter: The method used to filter the join keys.
+
+    Raises:
+        ValueError: if ``key_filter`` is not a valid method.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.ingestor.utils import check_key_filter
+    >>> check_key_filter("is_in")
+
+    ```
+    """
+    if key_filter is not None and key_filter not in KEY_FILTERS:
+        msg = (
+            f"Incorrect key_filter: {key_filter}. The valid values are: "
+            f"None, {', '.join(map(repr, KEY_FILTERS))}"
+        )
+        raise ValueError(msg)
+
+
+def find_available_columns(columns: Sequence[str], available: Sequence[str]) -> list[str]:
+    r"""Find the columns that are available in the data.
+
+    Args:
+        columns: The requested columns.
+        available: The columns of the data.
+
+    Returns:
+        The requested columns that are available, in the order of
+            the columns of the data.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.ingestor.utils import find_available_columns
+    >>> find_available_columns(["col3", "col1", "col4"], ["col1", "col2", "col3"])
+    ['col1', 'col3']
+
+    ```
+    """
+    selected = set(columns)
+    return [col for col in available if col in selected]
+
+
+def get_file_paths(source: Any) -> list[Path] | None:
+    r"""Get the paths to the files of a data source.
+
+    Args:
+        source: The data source, for example a path or a list of
+            paths.
+
+    Returns:
+        The paths to the files, or ``None`` if the source is not a
+            path or a list of paths to existing files (e.g. bytes,
+            a file object, a glob pattern, or a directory).
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.ingestor.utils import get_file_paths
+    >>> get_file_paths(b"data")
+
+    ```
+    """
+    sources = source if isinstance(source, list) else [source]
+    if not all(isinstance(src, (str, Path)) for src in sources):
+        return None
+    paths = [sanitize_path(src) for src in sources]
+    if not all(path.is_file() for path in paths):
+        return None
+    return paths
+
+
+def get_inner_join_keys(**kwargs: Any) -> list[str] | None:
+    r"""Get the key columns of an inner join.
+
+    Args:
+        **kwargs: The keyword arguments of the join.
+
+    Returns:
+        The key columns if the join is an inner join on the same
+            column names for all the DataFrames, otherwise ``None``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.ingestor.utils import get_inner_join_keys
+    >>> get_inner_join_keys(on="col")
+    ['col']
+    >>> get_inner_join_keys(on=["col1", "col2"], how="inner")
+    ['col1', 'col2']
+    >>> get_inner_join_keys(on="col", how="left")
+
+    ```
+    """
+    if kwargs.get("how", "inner") != "inner" or "left_on" in kwargs or "right_on" in kwargs:
+        return None
+    on = kwargs.get("on")
+    on = [on] if isinstance(on, str) else on
+    if not isinstance(on, (list, tuple)) or not on or not all(isinstance(col, str) for col in on):
+        return None
+    return list(on)
+
+
+def is_scan_compatible(scan: Callable[..., pl.LazyFrame], kwargs: Mapping[str, Any]) -> bool:
+    r"""Indicate if the keyword arguments of a read function (e.g.
+    ``polars.read_parquet``) give the same data with the associated
+    scan function (e.g. ``polars.scan_parquet``) and
+    ``scan_filtered``.
+
+    The ``columns`` argument is only compatible if it contains column
+    names. The ``n_rows`` argument is not compatible because the
+    number of rows would be limited before filtering the rows.
+
+    Args:
+        scan: The scan function.
+        kwargs: The keyword arguments of the read function.
+
+    Returns:
+        ``True`` if the keyword arguments are compatible with the
+            scan function, otherwise ``False``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.ingestor.utils import is_scan_compatible
+    >>> is_scan_compatible(pl.scan_parquet, {"columns": ["col1", "col2"]})
+    True
+    >>> is_scan_compatible(pl.scan_parquet, {"use_pyarrow": True})
+    False
+
+    ```
+    """
+    parameters = inspect.signature(scan).parameters
+    for key, value in kwargs.items():
+        if key == "columns":
+            if not all(isinstance(col, str) for col in value):
+                return False
+        elif key == "n_rows" or key not in parameters:
+            return False
+    return True
+
+
+def make_key_filter(
+    frame: pl.DataFrame | pl.LazyFrame, on: Sequence[str], key_filter: str = "is_in"
+) -> pl.Expr:
+    r"""Make an expression that keeps the rows whose keys can match a
+    key of a given DataFrame in an inner join.
+
+    The expression is used to filter the other DataFrames of an inner
+    join before the join. Filtering a scan (e.g. ``scan_parquet``)
+    with this expression pushes the predicate to the reader, which
+    can skip row groups that do not contain any key. The rows with a
+    null key are removed because they do not match in a join.
+
+    Args:
+        frame: The DataFrame with the keys, usually the smallest
+            DataFrame of the join.
+        on: The key columns.
+        key_filter: The method used to filter the keys.
+            If ``'is_in'``, the rows are kept if each key is in the
+            distinct values of the key column of ``frame``.
+            If ``'range'``, the rows are kept if each key is between
+            the minimum and maximum values of the key column of
+            ``frame``. It is less selective than ``'is_in'``
+            but cheaper to compute and evaluate.
+
+    Returns:
+        The filter expression.
+
+    Raises:
+        ValueError: if ``key_filter`` is not a valid method.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.ingestor.utils import make_key_filter
+    >>> keys = pl.DataFrame({"col": [2, 4]})
+    >>> frame = pl.DataFrame({"col": [1, 2, 3, 4, 5], "val": ["a", "b", "c", "d", "e"]})
+    >>> frame.filter(make_key_filter(keys, on=["col"]))
+    shape: (2, 2)
+    ┌─────┬─────┐
+    │ col ┆ val │
+    │ --- ┆ --- │
+    │ i64 ┆ str │
+    ╞═════╪═════╡
+    │ 2   ┆ b   │
+    │ 4   ┆ d   │
+    └─────┴─────┘
+    >>> frame.filter(make_key_filter(keys, on=["col"], key_filter="range"))
+    shape: (3, 2)
+    ┌─────┬─────┐
+    │ col ┆ val │
+    │ --- ┆ --- │
+    │ i64 ┆ str │
+    ╞═════╪═════╡
+    │ 2   ┆ b   │
+    │ 3   ┆ c   │
+    │ 4   ┆ d   │
+    └─────┴─────┘
+
+    ```
+    """
+    check_key_filter(key_filter)
+    frame = frame.lazy()
+    if key_filter == "range":
+        bounds = frame.select(
+            [pl.col(col).min().alias(f"min_{i}") for i, col in enumerate(on)]
+            + [pl.col(col).max().alias(f"max_{i}") for i, col in enumerate(on)]
+        ).collect()
+        exprs = []
+        for i, col in enumerate(on):
+            low, high = bounds.item(0, f"min_{i}"), bounds.item(0, f"max_{i}")
+            if low is None:
+                return pl.lit(False)
+            exprs.append(pl.col(col).is_between(low, high))
+        return pl.all_horizontal(exprs)
+
+    keys = frame.select(on).collect()
+    return pl.all_horizontal([pl.col(col).is_in(keys[col].drop_nulls().unique()) for col in on])
+
+
+def predicates_are_equal(predicate1: pl.Expr | None, predicate2: pl.Expr | None) -> bool:
+    r"""Indicate if two optional predicates are equal.
+
+    Args:
+        predicate1: The first predicate.
+        predicate2: The second predicate.
+
+    Returns:
+        ``True`` if both predicates are ``None`` or if they are the
+            same expression, otherwise ``False``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.ingestor.utils import predicates_are_equal
+    >>> predicates_are_equal(pl.col("col1") > 2, pl.col("col1") > 2)
+    True
+    >>> predicates_are_equal(pl.col("col1") > 2, None)
+    False
+    >>> predicates_are_equal(None, None)
+    True
+
+    ```
+    """
+    if predicate1 is None or predicate2 is None:
+        return predicate1 is None and predicate2 is None
+    return predicate1.meta.eq(predicate2)
+
+
+def scan_filtered(
+    scan: Callable[..., pl.LazyFrame], source: Any, predicate: pl.Expr, **kwargs: Any
+) -> pl.LazyFrame:
+    r"""Scan some data and only keep the rows matching a predicate.
+
+    The predicate is pushed down to the reader by ``polars``, so the
+    rows that do not match are not loaded in memory and the reader
+    can skip the data that cannot match, for example the parquet row
+    groups whose statistics do not match.
+
+    Args:
+        scan: The scan function, for example ``polars.scan_parquet``.
+        source: The source of the data to scan.
+        predicate: The predicate of the rows to keep.
+        **kwargs: The keyword arguments of the associated read
+            function. They must be compatible with the scan function
+            (see ``is_scan_compatible``).
+
+    Returns:
+        The LazyFrame with the rows matching the predicate.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.ingestor.utils import scan_filtered
+    >>> frame = scan_filtered(
+    ...     pl.scan_parquet, "/path/to/frame.parquet", pl.col("col1") > 2, columns=["col2"]
+    ... )
+    >>> frame.collect()  # doctest: +SKIP
+
+    ```
+    """
+    columns = kwargs.pop("columns", None)
+    frame = scan(source, **kwargs).filter(predicate)
+    if columns is not None:
+        frame = frame.select(columns)
+    return frame
@@ -4,12 +4,17 @@ from __future__ import annotations
 
 __all__ = [
     "BaseExporter",
+    "ClickHouseArrowExporter",
     "CsvExporter",
+    "IpcExporter",
     "ParquetExporter",
+    "ParquetPartitionExporter",
     "is_exporter_config",
     "setup_exporter",
 ]
 
 from grizz.lazy.exporter.base import BaseExporter, is_exporter_config, setup_exporter
+from grizz.lazy.exporter.clickhouse import ClickHouseArrowExporter
 from grizz.lazy.exporter.csv import CsvExporter
-from grizz.lazy.exporter.parquet import ParquetExporter
+from grizz.lazy.exporter.ipc import IpcExporter
+from grizz.lazy.exporter.parquet import ParquetExporter, ParquetPartitionExporter
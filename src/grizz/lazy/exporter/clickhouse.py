@@ -0,0 +1,144 @@
+r"""Contain the implementation of a ClickHouse LazyFrame exporter."""
+
+from __future__ import annotations
+
+__all__ = ["ClickHouseArrowExporter"]
+
+import logging
+import tempfile
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from iden.utils.time import timeblock
+
+from grizz.exporter.clickhouse import ClickHouseArrowExporter as DataFrameExporter
+from grizz.lazy.exporter.base import BaseExporter
+from grizz.utils.imports import is_pyarrow_available
+
+if is_pyarrow_available():  # pragma: no cover
+    import pyarrow as pa
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import polars as pl
+
+    from grizz.utils.imports import is_clickhouse_connect_available
+
+    if is_clickhouse_connect_available():
+        import clickhouse_connect
+
+logger = logging.getLogger(__name__)
+
+
+class ClickHouseArrowExporter(BaseExporter):
+    r"""Implement a ClickHouse LazyFrame exporter that uses Arrow.
+
+    The LazyFrame is first written to a temporary uncompressed Arrow
+    IPC file with ``polars.LazyFrame.sink_ipc``, so the query can run
+    with the streaming engine. The file is then memory-mapped and
+    inserted in the table as a sequence of Arrow record batches
+    (see ``grizz.exporter.ClickHouseArrowExporter``), so the data
+    does not need to fit in memory.
+
+    This exporter requires ``clickhouse_connect`` and ``pyarrow``.
+
+    Args:
+        table: The name of the table to insert the data into.
+        client: The ClickHouse client or its configuration, or a
+            sequence of clients or configurations to insert the
+            batches concurrently. A client runs one query at a time.
+            Please check the documentation of
+            ``clickhouse_connect.get_client`` to get more information.
+        batch_size: The maximum number of rows in each batch.
+        max_workers: The maximum number of batches to insert
+            concurrently. If ``None``, it is the number of clients.
+            It cannot be greater than the number of clients.
+        max_retries: The maximum number of times a batch is inserted
+            again after a connection error or a timeout.
+        retry_delay: The time in seconds to wait before the first
+            retry. The time is doubled after each retry.
+        deduplication_prefix: The prefix of the deduplication tokens
+            of the batches. If ``None``, a random prefix is generated
+            for each export.
+        tmp_dir: The directory of the temporary file. If ``None``,
+            the default temporary directory is used.
+        **kwargs: Additional keyword arguments for
+            ``clickhouse_connect.driver.Client.insert_arrow``,
+            for example ``database`` or ``settings``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.lazy.exporter import ClickHouseArrowExporter
+    >>> import clickhouse_connect
+    >>> client = clickhouse_connect.get_client()  # doctest: +SKIP
+    >>> exporter = ClickHouseArrowExporter(
+    ...     table="target.dataset", client=client, batch_size=10_000, max_retries=3
+    ... )  # doctest: +SKIP
+    >>> frame = pl.LazyFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["a", "b", "c", "d", "e"],
+    ...     }
+    ... )
+    >>> exporter.export(frame)  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        table: str,
+        client: (
+            clickhouse_connect.driver.Client
+            | dict
+            | Sequence[clickhouse_connect.driver.Client | dict]
+        ),
+        batch_size: int = 100_000,
+        max_workers: int | None = None,
+        max_retries: int = 0,
+        retry_delay: float = 1.0,
+        deduplication_prefix: str | None = None,
+        tmp_dir: Path | str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._exporter = DataFrameExporter(
+            table=table,
+            client=client,
+            batch_size=batch_size,
+            max_workers=max_workers,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            deduplication_prefix=deduplication_prefix,
+            **kwargs,
+        )
+        self._table = str(table)
+        self._batch_size = batch_size
+        self._tmp_dir = tmp_dir
+
+    def __repr__(self) -> str:
+        return repr(self._exporter)
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self._tmp_dir == other._tmp_dir and self._exporter.equal(
+            other._exporter, equal_nan=equal_nan
+        )
+
+    def export(self, frame: pl.LazyFrame) -> None:
+        logger.info(f"Exporting the LazyFrame to ClickHouse table {self._table} ...")
+        with (
+            timeblock("LazyFrame export time: {time}"),
+            tempfile.TemporaryDirectory(dir=self._tmp_dir) as tmp_dir,
+        ):
+            path = Path(tmp_dir).joinpath("frame.arrow")
+            frame.sink_ipc(path, compression=None)
+            with pa.memory_map(str(path)) as source:
+                data = pa.ipc.open_file(source).read_all()
+                num_rows = self._exporter.insert(data.to_batches(max_chunksize=self._batch_size))
+        logger.info(f"LazyFrame exported | {num_rows:,} rows inserted in {self._table}")
@@ -11,7 +11,7 @@ from coola import objects_are_equal
 
 from grizz.lazy.exporter.base import BaseExporter
 from grizz.utils.format import str_kwargs
-from grizz.utils.path import human_file_size, sanitize_path
+from grizz.utils.path import atomic_path, human_file_size, sanitize_path
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -66,6 +66,6 @@ class CsvExporter(BaseExporter):
 
     def export(self, frame: pl.LazyFrame) -> None:
         logger.info(f"Exporting the LazyFrame  to CSV file {self._path} ...")
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        frame.sink_csv(self._path, **self._kwargs)
+        with atomic_path(self._path) as tmp_path:
+            frame.sink_csv(tmp_path, **self._kwargs)
         logger.info(f"LazyFrame exported | size={human_file_size(self._path)}")
@@ -2,21 +2,29 @@ r"""Contain the implementation of a parquet LazyFrame exporter."""
 
 from __future__ import annotations
 
-__all__ = ["ParquetExporter"]
+__all__ = ["ParquetExporter", "ParquetPartitionExporter"]
 
 import logging
+import tempfile
+from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
+import polars as pl
 from coola import objects_are_equal
 
 from grizz.lazy.exporter.base import BaseExporter
+from grizz.utils.concurrency import map_in_threads
 from grizz.utils.format import str_kwargs
-from grizz.utils.path import human_file_size, sanitize_path
+from grizz.utils.hive import get_partition_dir
+from grizz.utils.path import (
+    atomic_path,
+    find_parquet_files,
+    human_file_size,
+    sanitize_path,
+)
 
 if TYPE_CHECKING:
-    from pathlib import Path
-
-    import polars as pl
+    from collections.abc import Sequence
 
 logger = logging.getLogger(__name__)
 
@@ -66,6 +74,177 @@ class ParquetExporter(BaseExporter):
 
     def export(self, frame: pl.LazyFrame) -> None:
         logger.info(f"Exporting the LazyFrame to parquet file {self._path} ...")
-        self._path.parent.mkdir(parents=True, exist_ok=True)
-        frame.sink_parquet(self._path, **self._kwargs)
+        with atomic_path(self._path) as tmp_path:
+            frame.sink_parquet(tmp_path, **self._kwargs)
         logger.info(f"LazyFrame exported | size={human_file_size(self._path)}")
+
+
+class ParquetPartitionExporter(BaseExporter):
+    r"""Implement a LazyFrame exporter that writes a hive-partitioned
+    parquet dataset.
+
+    The LazyFrame is partitioned by the values of one or more
+    columns, and each partition is written in its own directory,
+    for example ``<path>/col1=a/col2=1/part-00000.parquet``.
+    The partition columns are not stored in the files because their
+    values are encoded in the directory names, so a reader can skip
+    the partitions that do not match a filter, for example
+    ``polars.scan_parquet(path, hive_partitioning=True)``.
+
+    The LazyFrame is computed once, sorted by partition, and written
+    to a temporary uncompressed Arrow IPC file with
+    ``polars.LazyFrame.sink_ipc``. The file is memory-mapped, so each
+    partition is a zero-copy slice of contiguous rows that is written
+    with ``polars.LazyFrame.sink_parquet``, and the file is read only
+    once whatever the number of partitions. The partitions are
+    written concurrently, and the dataset is written to a temporary
+    directory and then renamed, so a partially written dataset is
+    never read.
+
+    Args:
+        path: The path to the directory of the dataset. The previous
+            dataset is replaced.
+        partition_by: The columns used to partition the LazyFrame.
+        max_workers: The maximum number of partitions to write
+            concurrently.
+        max_rows_per_file: The maximum number of rows in each file.
+            If a partition has more rows, it is split in several
+            files. If ``None``, each partition is written in a single
+            file.
+        **kwargs: Additional keyword arguments for
+            ``polars.LazyFrame.sink_parquet``, for example
+            ``row_group_size`` or ``compression``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.lazy.exporter import ParquetPartitionExporter
+    >>> exporter = ParquetPartitionExporter(path="/path/to/dataset", partition_by=["col3"])
+    >>> frame = pl.LazyFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["a", "b", "a", "b", "a"],
+    ...     }
+    ... )
+    >>> exporter.export(frame)  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        partition_by: Sequence[str],
+        max_workers: int = 1,
+        max_rows_per_file: int | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._path = sanitize_path(path)
+        self._partition_by = tuple(partition_by)
+        if not self._partition_by:
+            msg = "partition_by must contain at least one column"
+            raise ValueError(msg)
+        if max_workers < 1:
+            msg = f"max_workers must be greater than 0 (received: {max_workers})"
+            raise ValueError(msg)
+        self._max_workers = max_workers
+        if max_rows_per_file is not None and max_rows_per_file < 1:
+            msg = f"max_rows_per_file must be greater than 0 (received: {max_rows_per_file})"
+            raise ValueError(msg)
+        self._max_rows_per_file = max_rows_per_file
+        self._kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, partition_by={self._partition_by}, "
+            f"max_workers={self._max_workers}, max_rows_per_file={self._max_rows_per_file}"
+            f"{str_kwargs(self._kwargs)})"
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            self._path == other._path
+            and self._partition_by == other._partition_by
+            and self._max_workers == other._max_workers
+            and self._max_rows_per_file == other._max_rows_per_file
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+        )
+
+    def export(self, frame: pl.LazyFrame) -> None:
+        logger.info(
+            f"Exporting the LazyFrame to the parquet dataset {self._path} "
+            f"partitioned by {self._partition_by} ..."
+        )
+        with (
+            atomic_path(self._path) as tmp_path,
+            tempfile.TemporaryDirectory(dir=tmp_path.parent) as tmp_dir,
+        ):
+            # The LazyFrame is computed once and sorted by partition,
+            # so each partition is a contiguous range of rows of the
+            # IPC file. The file is memory-mapped, so the partitions
+            # are zero-copy slices and each row is only read once.
+            source = Path(tmp_dir).joinpath("frame.arrow")
+            frame.sort(self._partition_by, maintain_order=True).sink_ipc(source, compression=None)
+            partitions = _split_partitions(
+                pl.read_ipc(source, memory_map=True, rechunk=False), self._partition_by
+            )
+            num_partitions = len(partitions)
+            tmp_path.mkdir()
+            writes = map_in_threads(
+                lambda item: self._write_partition(tmp_path, *item),
+                partitions,
+                max_workers=min(self._max_workers, num_partitions),
+            )
+            for _ in writes:
+                pass
+            # Release the memory-mapped file before the temporary
+            # directory is removed.
+            del partitions, writes
+        logger.info(
+            f"LazyFrame exported | {num_partitions:,} partitions  "
+            f"{len(find_parquet_files(self._path)):,} files"
+        )
+
+    def _write_partition(self, path: Path, keys: dict[str, Any], frame: pl.DataFrame) -> None:
+        r"""Write the files of a partition.
+
+        Args:
+            path: The path to the directory of the dataset.
+            keys: The values of the partition columns.
+            frame: The rows of the partition.
+        """
+        path = path.joinpath(get_partition_dir(keys))
+        path.mkdir(parents=True, exist_ok=True)
+        frame = frame.drop(self._partition_by)
+        size = self._max_rows_per_file or frame.shape[0]
+        for index, offset in enumerate(range(0, frame.shape[0], size)):
+            frame.slice(offset, size).lazy().sink_parquet(
+                path.joinpath(f"part-{index:05d}.parquet"), **self._kwargs
+            )
+
+
+def _split_partitions(
+    frame: pl.DataFrame, partition_by: Sequence[str]
+) -> list[tuple[dict[str, Any], pl.DataFrame]]:
+    r"""Split a DataFrame sorted by partition into its partitions.
+
+    Args:
+        frame: The DataFrame sorted by the partition columns.
+        partition_by: The partition columns.
+
+    Returns:
+        The values of the partition columns and the rows of each
+            partition. The rows are zero-copy slices of the
+            DataFrame.
+    """
+    partitions, offset = [], 0
+    runs = frame.select(pl.struct(partition_by).rle().alias("runs")).unnest("runs")
+    for num_rows, keys in runs.iter_rows():
+        partitions.append((keys, frame.slice(offset, num_rows)))
+        offset += num_rows
+    return partitions
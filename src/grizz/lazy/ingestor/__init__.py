@@ -4,10 +4,15 @@ from __future__ import annotations
 
 __all__ = [
     "BaseIngestor",
+    "ClickHouseArrowIngestor",
     "CsvFileIngestor",
     "CsvIngestor",
     "Ingestor",
+    "IpcFileIngestor",
+    "IpcIngestor",
     "JoinIngestor",
+    "ParquetDatasetIngestor",
+    "ParquetDirectoryIngestor",
     "ParquetFileIngestor",
     "ParquetIngestor",
     "is_ingestor_config",
@@ -15,7 +20,14 @@ __all__ = [
 ]
 
 from grizz.lazy.ingestor.base import BaseIngestor, is_ingestor_config, setup_ingestor
+from grizz.lazy.ingestor.clickhouse import ClickHouseArrowIngestor
 from grizz.lazy.ingestor.csv import CsvFileIngestor, CsvIngestor
+from grizz.lazy.ingestor.ipc import IpcFileIngestor, IpcIngestor
 from grizz.lazy.ingestor.join import JoinIngestor
-from grizz.lazy.ingestor.parquet import ParquetFileIngestor, ParquetIngestor
+from grizz.lazy.ingestor.parquet import (
+    ParquetDatasetIngestor,
+    ParquetDirectoryIngestor,
+    ParquetFileIngestor,
+    ParquetIngestor,
+)
 from grizz.lazy.ingestor.vanilla import Ingestor
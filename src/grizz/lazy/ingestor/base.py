@@ -83,6 +83,30 @@ class BaseIngestor(ABC, metaclass=AbstractFactory):
         ```
         """
 
+    def estimate_num_rows(self) -> int | None:
+        r"""Estimate the number of rows of the ingested LazyFrame.
+
+        The estimate is computed from metadata, for example the
+        footers of parquet files, so the LazyFrame is not computed.
+
+        Returns:
+            The estimated number of rows, or ``None`` if it cannot be
+                computed without computing the LazyFrame.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.lazy.ingestor import Ingestor
+        >>> ingestor = Ingestor(pl.LazyFrame({"col": [1, 2, 3]}))
+        >>> ingestor.estimate_num_rows() is None
+        True
+
+        ```
+        """
+        return None
+
 
 def is_ingestor_config(config: dict) -> bool:
     r"""Indicate if the input configuration is a configuration for a
@@ -0,0 +1,452 @@
+r"""Contain the implementation of a ClickHouse LazyFrame ingestor."""
+
+from __future__ import annotations
+
+__all__ = ["ClickHouseArrowIngestor"]
+
+import logging
+import math
+import operator
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+from coola import objects_are_equal
+
+from grizz.lazy.ingestor.base import BaseIngestor
+from grizz.utils.factory import setup_object
+from grizz.utils.imports import check_clickhouse_connect, check_pyarrow
+
+try:
+    from polars.io.plugins import register_io_source
+except ImportError:  # pragma: no cover
+    # The IO sources are not available in the old versions of polars.
+    register_io_source = None
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+
+    from grizz.utils.imports import is_clickhouse_connect_available
+
+    if is_clickhouse_connect_available():
+        import clickhouse_connect
+
+
+logger = logging.getLogger(__name__)
+
+# The comparison operators, with the operator used when the column is
+# on the right side of the comparison.
+_COMPARISON_OPERATORS = {
+    "=": (operator.eq, "="),
+    "!=": (operator.ne, "!="),
+    "<": (operator.lt, ">"),
+    "<=": (operator.le, ">="),
+    ">": (operator.gt, "<"),
+    ">=": (operator.ge, "<="),
+}
+
+_LOGICAL_OPERATORS = {"AND": operator.and_, "OR": operator.or_}
+
+
+def _format_float(value: float) -> str | None:
+    return repr(value) if math.isfinite(value) else None
+
+
+def _quote_string(value: str) -> str:
+    return "'" + value.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+_VALUE_FORMATTERS: dict[type[pl.DataType], Callable[[Any], str | None]] = {
+    pl.Boolean: lambda value: "true" if value else "false",
+    pl.Float32: _format_float,
+    pl.Float64: _format_float,
+    pl.Int8: str,
+    pl.Int16: str,
+    pl.Int32: str,
+    pl.Int64: str,
+    pl.UInt8: str,
+    pl.UInt16: str,
+    pl.UInt32: str,
+    pl.UInt64: str,
+    pl.String: _quote_string,
+}
+
+
+class ClickHouseArrowIngestor(BaseIngestor):
+    r"""Implement a ClickHouse LazyFrame ingestor that uses Arrow.
+
+    The LazyFrame is a polars IO source, so the query is only sent to
+    the server when the LazyFrame is collected. The columns selected
+    in the lazy pipeline and the row limit are pushed down to the SQL
+    query. The filters are also pushed down if they only use
+    comparisons between a column and a literal, ``is_in`` with
+    literal values, ``is_null``, and ``is_not_null``, combined with
+    ``&`` or ``|``. The filters are always applied again on the
+    received data, so a filter that cannot be pushed down is still
+    correct, it is just computed locally.
+
+    This ingestor requires ``clickhouse_connect``, ``pyarrow``, and a
+    version of ``polars`` with IO sources
+    (``polars.io.plugins.register_io_source``).
+
+    Args:
+        query: The query to get the data.
+        client: The ClickHouse client or its configuration.
+            Please check the documentation of
+            ``clickhouse_connect.get_client`` to get more information.
+        schema: The schema of the query result. If ``None``, it is
+            inferred by running the query with ``LIMIT 0``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.lazy.ingestor import ClickHouseArrowIngestor
+    >>> import clickhouse_connect
+    >>> client = clickhouse_connect.get_client()  # doctest: +SKIP
+    >>> ingestor = ClickHouseArrowIngestor(
+    ...     query="SELECT * FROM source.dataset", client=client
+    ... )  # doctest: +SKIP
+    >>> frame = ingestor.ingest()  # doctest: +SKIP
+    >>> # Sends: SELECT `col1`, `col2` FROM (SELECT * FROM source.dataset) WHERE (`col1` > 5)
+    >>> frame.filter(pl.col("col1") > 5).select("col1", "col2").collect()  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        query: str,
+        client: clickhouse_connect.driver.Client | dict,
+        schema: pl.Schema | dict[str, pl.DataType] | None = None,
+    ) -> None:
+        check_clickhouse_connect()
+        check_pyarrow()
+        if register_io_source is None:  # pragma: no cover
+            msg = (
+                f"{self.__class__.__qualname__} requires a version of polars with IO sources "
+                f"(received: {pl.__version__})"
+            )
+            raise RuntimeError(msg)
+        self._query = str(query)
+        self._client: clickhouse_connect.driver.Client = setup_object(client)
+        self._schema = None if schema is None else pl.Schema(schema)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}()"
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            self._query == other._query
+            and objects_are_equal(self._client, other._client, equal_nan=equal_nan)
+            and objects_are_equal(self._schema, other._schema, equal_nan=equal_nan)
+        )
+
+    def ingest(self) -> pl.LazyFrame:
+        logger.info(f"Ingesting data from ClickHouse... \n\nquery:\n{self._query}\n")
+        frame = register_io_source(self._scan, schema=self.get_schema())
+        logger.info(f"LazyFrame ingested | schema={frame.collect_schema()}")
+        return frame
+
+    def get_schema(self) -> pl.Schema:
+        r"""Get the schema of the query result.
+
+        Returns:
+            The schema, with the columns sorted by name.
+        """
+        if self._schema is None:
+            # The query is given by the user, so it is not an injection.
+            query = f"SELECT * FROM ({self._query}) LIMIT 0"  # noqa: S608
+            data = self._client.query_arrow(query=query)
+            schema = pl.from_arrow(data).schema
+            self._schema = pl.Schema({col: schema[col] for col in sorted(schema)})
+        return self._schema
+
+    def build_query(
+        self,
+        columns: Sequence[str] | None = None,
+        predicate: pl.Expr | None = None,
+        n_rows: int | None = None,
+    ) -> str:
+        r"""Build the SQL query sent to the server.
+
+        Args:
+            columns: The columns to select. If ``None``, all the
+                columns are selected.
+            predicate: The filter to push down. Only the parts of the
+                filter that can be translated to SQL are pushed down.
+            n_rows: The maximum number of rows. It is only pushed down
+                if the full predicate is translated to SQL.
+
+        Returns:
+            The SQL query.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from unittest.mock import Mock
+        >>> from grizz.lazy.ingestor import ClickHouseArrowIngestor
+        >>> ingestor = ClickHouseArrowIngestor(
+        ...     query="SELECT * FROM source.dataset",
+        ...     client=Mock(),
+        ...     schema={"col1": pl.Int64, "col2": pl.String},
+        ... )
+        >>> ingestor.build_query(columns=["col1"], n_rows=10)
+        'SELECT `col1` FROM (SELECT * FROM source.dataset) LIMIT 10'
+
+        ```
+        """
+        select = "*" if columns is None else ", ".join(map(_quote_identifier, columns))
+        # The query is given by the user, and the identifiers and the
+        # literals of the filter are quoted.
+        query = f"SELECT {select} FROM ({self._query})"  # noqa: S608
+        where, complete = (None, True) if predicate is None else _expr_to_sql(predicate)
+        if where is not None:
+            query += f" WHERE {where}"
+        if n_rows is not None and complete:
+            query += f" LIMIT {int(n_rows)}"
+        return query
+
+    def _scan(
+        self,
+        with_columns: list[str] | None,
+        predicate: pl.Expr | None,
+        n_rows: int | None,
+        batch_size: int | None,  # noqa: ARG002
+    ) -> Iterator[pl.DataFrame]:
+        r"""Implement the polars IO source.
+
+        Args:
+            with_columns: The columns to read, or ``None`` for all
+                the columns.
+            predicate: The filter to apply, or ``None``.
+            n_rows: The maximum number of rows, or ``None``.
+            batch_size: The hint for the batch size. It is ignored
+                because the batches are defined by the server.
+
+        Returns:
+            An iterator over the DataFrame batches.
+        """
+        columns = None
+        if with_columns is not None:
+            # The predicate can use columns that are not in the output.
+            needed = [] if predicate is None else predicate.meta.root_names()
+            columns = [col for col in self.get_schema() if col in with_columns or col in needed]
+            # At least one column is required to get the number of rows.
+            columns = columns or list(self.get_schema())[:1]
+        query = self.build_query(columns=columns, predicate=predicate, n_rows=n_rows)
+        logger.info(f"Sending query to ClickHouse:\n{query}")
+        with self._client.query_arrow_stream(query=query) as stream:
+            for batch in stream:
+                frame = pl.from_arrow(batch)
+                if predicate is not None:
+                    frame = frame.filter(predicate)
+                if with_columns is None:
+                    frame = frame.select(sorted(frame.columns))
+                else:
+                    frame = frame.select(with_columns)
+                if n_rows is not None:
+                    frame = frame.head(n_rows)
+                    n_rows -= frame.shape[0]
+                yield frame
+                if n_rows is not None and n_rows <= 0:
+                    break
+
+
+def _quote_identifier(name: str) -> str:
+    r"""Quote an identifier in a ClickHouse query.
+
+    Args:
+        name: The identifier.
+
+    Returns:
+        The quoted identifier.
+    """
+    return "`" + name.replace("\\", "\\\\").replace("`", "\\`") + "`"
+
+
+def _expr_to_sql(expr: pl.Expr) -> tuple[str | None, bool]:
+    r"""Translate a polars filter to a SQL condition.
+
+    The filter is matched against an explicit set of operations with
+    ``polars.Expr.meta.eq``, so the translation does not depend on
+    the internal representation of the expressions. The parts of the
+    filter that do not match any operation are not translated.
+
+    Args:
+        expr: The polars filter.
+
+    Returns:
+        A tuple with the SQL condition, or ``None`` if no part of the
+            filter can be translated, and a boolean that indicates if
+            the full filter was translated.
+    """
+    inputs = expr.meta.pop()
+    if len(inputs) == 2:
+        # The inputs are returned in the reverse order.
+        right, left = inputs
+        for name, op in _LOGICAL_OPERATORS.items():
+            if expr.meta.eq(op(left, right)):
+                return _logical_to_sql(name, left, right)
+    sql = _condition_to_sql(expr, inputs)
+    return sql, sql is not None
+
+
+def _logical_to_sql(name: str, left: pl.Expr, right: pl.Expr) -> tuple[str | None, bool]:
+    r"""Translate a conjunction or a disjunction to a SQL condition.
+
+    Args:
+        name: The SQL name of the logical operator, ``'AND'`` or
+            ``'OR'``.
+        left: The left operand.
+        right: The right operand.
+
+    Returns:
+        A tuple with the SQL condition, or ``None`` if no part of the
+            expression can be translated, and a boolean that indicates
+            if the full expression was translated.
+    """
+    left_sql, left_complete = _expr_to_sql(left)
+    right_sql, right_complete = _expr_to_sql(right)
+    complete = left_complete and right_complete
+    if complete:
+        return f"({left_sql} {name} {right_sql})", True
+    if name == "OR":
+        return None, False
+    # A part of a conjunction can be pushed down alone because the
+    # full filter is applied again on the received data.
+    return next((sql for sql in (left_sql, right_sql) if sql is not None), None), False
+
+
+def _condition_to_sql(expr: pl.Expr, inputs: Sequence[pl.Expr]) -> str | None:
+    r"""Translate a condition on a column to a SQL condition.
+
+    Args:
+        expr: The condition.
+        inputs: The inputs of the condition.
+
+    Returns:
+        The SQL condition, or ``None`` if the condition cannot be
+            translated.
+    """
+    if len(inputs) == 1:
+        return _null_check_to_sql(expr, inputs[0])
+    if len(inputs) == 2:
+        right, left = inputs
+        return _comparison_to_sql(expr, left, right) or _is_in_to_sql(expr, left, right)
+    return None
+
+
+def _comparison_to_sql(expr: pl.Expr, left: pl.Expr, right: pl.Expr) -> str | None:
+    r"""Translate a comparison between a column and a literal to a SQL
+    condition.
+
+    Args:
+        expr: The comparison.
+        left: The left operand.
+        right: The right operand.
+
+    Returns:
+        The SQL condition, or ``None`` if the expression is not a
+            comparison between a column and a literal.
+    """
+    for name, (op, mirrored) in _COMPARISON_OPERATORS.items():
+        if not expr.meta.eq(op(left, right)):
+            continue
+        if left.meta.is_column():
+            column, value, sql_op = left, right, name
+        else:
+            column, value, sql_op = right, left, mirrored
+        literal = _literal_to_sql(value)
+        if not column.meta.is_column() or literal is None:
+            return None
+        return f"({_quote_identifier(column.meta.output_name())} {sql_op} {literal})"
+    return None
+
+
+def _is_in_to_sql(expr: pl.Expr, column: pl.Expr, values: pl.Expr) -> str | None:
+    r"""Translate a ``is_in`` with literal values to a SQL condition.
+
+    Args:
+        expr: The expression.
+        column: The column expression.
+        values: The values expression.
+
+    Returns:
+        The SQL condition, or ``None`` if the expression is not a
+            ``is_in`` on a column with literal values.
+    """
+    if not (
+        column.meta.is_column() and values.meta.is_literal() and expr.meta.eq(column.is_in(values))
+    ):
+        return None
+    series = pl.select(values).to_series()
+    if isinstance(series.dtype, (pl.List, pl.Array)):
+        series = series.explode()
+    literals = [_value_to_sql(value, series.dtype) for value in series]
+    if not literals or None in literals:
+        return None
+    return f"({_quote_identifier(column.meta.output_name())} IN ({', '.join(literals)}))"
+
+
+def _null_check_to_sql(expr: pl.Expr, column: pl.Expr) -> str | None:
+    r"""Translate a ``is_null`` or ``is_not_null`` to a SQL condition.
+
+    Args:
+        expr: The expression.
+        column: The column expression.
+
+    Returns:
+        The SQL condition, or ``None`` if the expression is not a
+            null check on a column.
+    """
+    if not column.meta.is_column():
+        return None
+    name = _quote_identifier(column.meta.output_name())
+    if expr.meta.eq(column.is_null()):
+        return f"({name} IS NULL)"
+    if expr.meta.eq(column.is_not_null()):
+        return f"({name} IS NOT NULL)"
+    return None
+
+
+def _literal_to_sql(expr: pl.Expr) -> str | None:
+    r"""Get the SQL representation of a literal expression.
+
+    Args:
+        expr: The expression.
+
+    Returns:
+        The SQL representation of the literal, or ``None`` if the
+            expression is not a supported literal.
+    """
+    if not expr.meta.is_literal():
+        return None
+    series = pl.select(expr).to_series()
+    if series.len() != 1:
+        return None
+    return _value_to_sql(series.item(), series.dtype)
+
+
+def _value_to_sql(value: Any, dtype: pl.DataType) -> str | None:
+    r"""Get the SQL representation of a value.
+
+    Only the integer, float, boolean, and string values are
+    supported.
+
+    Args:
+        value: The value.
+        dtype: The data type of the value.
+
+    Returns:
+        The SQL representation of the value, or ``None`` if the value
+            is null or its data type is not supported.
+    """
+    formatter = _VALUE_FORMATTERS.get(dtype.base_type())
+    if value is None or formatter is None:
+        return None
+    return formatter(value)
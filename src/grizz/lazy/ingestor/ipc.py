@@ -0,0 +1,97 @@
+r"""Contain the implementation of Arrow IPC ingestors."""
+
+from __future__ import annotations
+
+__all__ = ["IpcFileIngestor", "IpcIngestor"]
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+from coola import objects_are_equal
+
+from grizz.ingestor.utils import check_data_file
+from grizz.lazy.ingestor.base import BaseIngestor
+from grizz.utils.format import str_kwargs
+from grizz.utils.path import human_file_size, sanitize_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from grizz.ingestor.parquet import FileSource
+
+logger = logging.getLogger(__name__)
+
+
+class IpcIngestor(BaseIngestor):
+    r"""Implement an Arrow IPC (Feather v2) ingestor.
+
+    Args:
+        source: The source to the Arrow IPC data to ingest.
+        **kwargs: Additional keyword arguments for
+            ``polars.scan_ipc``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.lazy.ingestor import IpcIngestor
+    >>> ingestor = IpcIngestor(source="/path/to/frame.arrow")
+    >>> ingestor
+    IpcIngestor(source=/path/to/frame.arrow)
+    >>> frame = ingestor.ingest()  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(self, source: FileSource, **kwargs: Any) -> None:
+        self._source = source
+        self._kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(source={self._source}{str_kwargs(self._kwargs)})"
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self._source == other._source and objects_are_equal(
+            self._kwargs, other._kwargs, equal_nan=equal_nan
+        )
+
+    def ingest(self) -> pl.LazyFrame:
+        logger.info(f"Ingesting Arrow IPC data from {self._source}...")
+        frame = pl.scan_ipc(self._source, **self._kwargs)
+        logger.info(f"LazyFrame ingested | schema={frame.collect_schema()}")
+        return frame
+
+
+class IpcFileIngestor(IpcIngestor):
+    r"""Implement an Arrow IPC (Feather v2) file ingestor.
+
+    Args:
+        path: The path to the Arrow IPC file to ingest.
+        **kwargs: Additional keyword arguments for
+            ``polars.scan_ipc``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.lazy.ingestor import IpcFileIngestor
+    >>> ingestor = IpcFileIngestor(path="/path/to/frame.arrow")
+    >>> ingestor
+    IpcFileIngestor(source=/path/to/frame.arrow)
+    >>> frame = ingestor.ingest()  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(self, path: Path | str, **kwargs: Any) -> None:
+        super().__init__(source=sanitize_path(path), **kwargs)
+
+    def ingest(self) -> pl.LazyFrame:
+        check_data_file(self._source)
+        logger.info(
+            f"Ingesting Arrow IPC file {self._source} | size={human_file_size(self._source)}"
+        )
+        return super().ingest()
@@ -1,4 +1,5 @@
-r"""Contain the implementation of parquet ingestors."""
+r"""Contain the implementation of an ingestor that joins the output of
+multiple LazyFrame ingestors."""
 
 from __future__ import annotations
 
@@ -11,6 +12,7 @@ from coola import objects_are_equal
 from coola.utils import repr_indent, repr_sequence
 from coola.utils.format import repr_mapping, repr_mapping_line
 
+from grizz.ingestor.utils import check_key_filter, get_inner_join_keys, make_key_filter
 from grizz.lazy.ingestor.base import BaseIngestor, setup_ingestor
 
 if TYPE_CHECKING:
@@ -27,6 +29,30 @@ class JoinIngestor(BaseIngestor):
 
     Args:
         ingestors: The list of ingestors.
+        reorder: If ``True``, the LazyFrames of an inner join are
+            joined from the smallest to the largest to reduce the
+            size of the intermediate results. The number of rows of
+            each LazyFrame is estimated from metadata, for example
+            the footers of parquet files
+            (see ``BaseIngestor.estimate_num_rows``), so the
+            LazyFrames are not computed. The columns are returned in
+            the same order as without reordering, but the row order
+            may be different. The LazyFrames are not reordered for
+            other join types, if the join does not use ``on`` with
+            column names, if the LazyFrames have duplicate columns,
+            if the number of rows of a LazyFrame cannot be
+            estimated, or if there are less than three LazyFrames.
+        key_filter: The method used to filter the join keys before
+            an inner join. If ``'is_in'`` or ``'range'``, the
+            smallest LazyFrame is collected, and the other
+            LazyFrames are filtered to keep only the rows whose keys
+            can match one of its keys
+            (see ``grizz.ingestor.utils.make_key_filter``). The
+            filter is pushed down to the scans, so a parquet reader
+            can skip the row groups without any matching key.
+            If ``None``, the LazyFrames are not filtered.
+            The LazyFrames are not filtered for other join types or
+            if the join does not use ``on`` with column names.
         **kwargs: Additional keyword arguments for
             ``polars.LazyFrame.join``.
 
@@ -75,6 +101,8 @@ class JoinIngestor(BaseIngestor):
         (2): Ingestor(
             (schema): Schema({'col': Int64, 'col4': Float64, 'col5': String})
           )
+      (reorder): False
+      (key_filter): None
       (kwargs): on='col', how='inner'
     )
     >>> frame = ingestor.ingest()
@@ -94,11 +122,20 @@ class JoinIngestor(BaseIngestor):
     ```
     """
 
-    def __init__(self, ingestors: Sequence[BaseIngestor | dict], **kwargs: Any) -> None:
+    def __init__(
+        self,
+        ingestors: Sequence[BaseIngestor | dict],
+        reorder: bool = False,
+        key_filter: str | None = None,
+        **kwargs: Any,
+    ) -> None:
         if len(ingestors) < 1:
             msg = "'ingestors' must contain at least one ingestor"
             raise ValueError(msg)
         self._ingestors = tuple(setup_ingestor(ingestor) for ingestor in ingestors)
+        self._reorder = reorder
+        check_key_filter(key_filter)
+        self._key_filter = key_filter
         self._kwargs = kwargs
 
     def __repr__(self) -> str:
@@ -106,6 +143,8 @@ class JoinIngestor(BaseIngestor):
             repr_mapping(
                 {
                     "ingestors": "\n" + repr_sequence(self._ingestors),
+                    "reorder": self._reorder,
+                    "key_filter": self._key_filter,
                     "kwargs": repr_mapping_line(self._kwargs),
                 }
             )
@@ -115,9 +154,12 @@ class JoinIngestor(BaseIngestor):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        return objects_are_equal(
-            self._ingestors, other._ingestors, equal_nan=equal_nan
-        ) and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+        return (
+            objects_are_equal(self._ingestors, other._ingestors, equal_nan=equal_nan)
+            and self._reorder == other._reorder
+            and self._key_filter == other._key_filter
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+        )
 
     def ingest(self) -> pl.LazyFrame:
         logger.info("Joining LazyFrames...")
@@ -126,8 +168,105 @@ class JoinIngestor(BaseIngestor):
         return frame
 
     def _ingest(self) -> pl.LazyFrame:
-        out = self._ingestors[0].ingest()
-        for ingestor in self._ingestors[1:]:
-            frame = ingestor.ingest()
+        frames = [ingestor.ingest() for ingestor in self._ingestors]
+        out = self._join(frames)
+        on = get_inner_join_keys(**self._kwargs)
+        if on is None or len(frames) < 2 or (self._key_filter is None and not self._reorder):
+            return out
+        columns = out.collect_schema().names()
+        num_rows = [ingestor.estimate_num_rows() for ingestor in self._ingestors]
+        if self._key_filter is not None:
+            frames = self._filter_keys(frames, on=on, num_rows=num_rows)
+        if (
+            self._reorder
+            and len(frames) >= 3
+            and self._can_reorder(frames, on=on)
+            and _all_known(num_rows)
+        ):
+            order = sorted(range(len(frames)), key=lambda i: num_rows[i])
+            logger.info(f"Joining the LazyFrames in the order {order} | estimated rows={num_rows}")
+            frames = [frames[i] for i in order]
+        return self._join(frames).select(columns)
+
+    def _join(self, frames: Sequence[pl.LazyFrame]) -> pl.LazyFrame:
+        r"""Join the LazyFrames from left to right.
+
+        Args:
+            frames: The LazyFrames to join.
+
+        Returns:
+            The joined LazyFrame.
+        """
+        out = frames[0]
+        for frame in frames[1:]:
             out = out.join(frame, **self._kwargs)
         return out
+
+    def _can_reorder(self, frames: Sequence[pl.LazyFrame], on: Sequence[str]) -> bool:
+        r"""Indicate if the LazyFrames can be joined in any order.
+
+        Args:
+            frames: The LazyFrames to join.
+            on: The key columns of the inner join.
+
+        Returns:
+            ``True`` if the columns that are not keys have unique
+                names, otherwise ``False``.
+        """
+        columns = [
+            col for frame in frames for col in frame.collect_schema().names() if col not in on
+        ]
+        if len(columns) != len(set(columns)):
+            # The suffix of the duplicate columns depends on the join order.
+            logger.info("The LazyFrames have duplicate columns, so the join order is not changed")
+            return False
+        return True
+
+    def _filter_keys(
+        self, frames: Sequence[pl.LazyFrame], on: Sequence[str], num_rows: Sequence[int | None]
+    ) -> list[pl.LazyFrame]:
+        r"""Filter the LazyFrames to keep only the rows whose keys can
+        match a key of the smallest LazyFrame.
+
+        Args:
+            frames: The LazyFrames to join.
+            on: The key columns of the inner join.
+            num_rows: The estimated number of rows of each LazyFrame,
+                or ``None`` if it is unknown.
+
+        Returns:
+            The filtered LazyFrames. The smallest LazyFrame is
+                collected once, so it is not computed again by the
+                join.
+        """
+        # The LazyFrames with an unknown number of rows come last, and
+        # the first one is used if no number of rows is known.
+        index = min(range(len(frames)), key=lambda i: (num_rows[i] is None, num_rows[i] or 0))
+        smallest = frames[index].collect()
+        expr = make_key_filter(smallest, on=on, key_filter=self._key_filter)
+        logger.info(
+            f"Filtering the join keys of {len(frames) - 1:,} LazyFrames with "
+            f"{self._key_filter!r} (smallest LazyFrame: {index})"
+        )
+        return [
+            smallest.lazy() if i == index else frame.filter(expr) for i, frame in enumerate(frames)
+        ]
+
+
+def _all_known(num_rows: Sequence[int | None]) -> bool:
+    r"""Indicate if the number of rows of all the LazyFrames is known.
+
+    Args:
+        num_rows: The estimated number of rows of each LazyFrame.
+
+    Returns:
+        ``True`` if all the numbers of rows are known, otherwise
+            ``False``.
+    """
+    if any(n is None for n in num_rows):
+        logger.info(
+            "The number of rows of some LazyFrames cannot be estimated, "
+            "so the join order is not changed"
+        )
+        return False
+    return True
@@ -2,7 +2,12 @@ r"""Contain the implementation of parquet ingestors."""
 
 from __future__ import annotations
 
-__all__ = ["ParquetFileIngestor", "ParquetIngestor"]
+__all__ = [
+    "ParquetDatasetIngestor",
+    "ParquetDirectoryIngestor",
+    "ParquetFileIngestor",
+    "ParquetIngestor",
+]
 
 import logging
 from typing import TYPE_CHECKING, Any
@@ -10,10 +15,17 @@ from typing import TYPE_CHECKING, Any
 import polars as pl
 from coola import objects_are_equal
 
-from grizz.ingestor.utils import check_data_file
+from grizz.ingestor.utils import (
+    check_concat_how,
+    check_data_dir,
+    check_data_file,
+    get_file_paths,
+)
 from grizz.lazy.ingestor.base import BaseIngestor
 from grizz.utils.format import str_kwargs
-from grizz.utils.path import human_file_size, sanitize_path
+from grizz.utils.hive import scan_partitioned_parquet
+from grizz.utils.parquet import ParquetIndex
+from grizz.utils.path import find_parquet_files, human_file_size, sanitize_path
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -28,6 +40,10 @@ class ParquetIngestor(BaseIngestor):
 
     Args:
         source: The source to the parquet data to ingest.
+        index_path: The path to the JSON file of the index of the
+            parquet footers (see ``grizz.utils.parquet.ParquetIndex``).
+            If it is set, the number of rows of the files is read
+            from the index instead of the footers of the files.
         **kwargs: Additional keyword arguments for
             ``polars.scan_parquet``.
 
@@ -44,18 +60,26 @@ class ParquetIngestor(BaseIngestor):
     ```
     """
 
-    def __init__(self, source: FileSource, **kwargs: Any) -> None:
+    def __init__(
+        self, source: FileSource, index_path: Path | str | None = None, **kwargs: Any
+    ) -> None:
         self._source = source
+        self._index_path = None if index_path is None else sanitize_path(index_path)
         self._kwargs = kwargs
 
     def __repr__(self) -> str:
-        return f"{self.__class__.__qualname__}(source={self._source}{str_kwargs(self._kwargs)})"
+        args = str_kwargs(self._kwargs)
+        if self._index_path is not None:
+            args = f", index_path={self._index_path}{args}"
+        return f"{self.__class__.__qualname__}(source={self._source}{args})"
 
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        return self._source == other._source and objects_are_equal(
-            self._kwargs, other._kwargs, equal_nan=equal_nan
+        return (
+            self._source == other._source
+            and self._index_path == other._index_path
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
         )
 
     def ingest(self) -> pl.LazyFrame:
@@ -64,12 +88,17 @@ class ParquetIngestor(BaseIngestor):
         logger.info(f"LazyFrame ingested | schema={frame.collect_schema()}")
         return frame
 
+    def estimate_num_rows(self) -> int:
+        return _get_num_rows(self._source, index_path=self._index_path, **self._kwargs)
+
 
 class ParquetFileIngestor(ParquetIngestor):
     r"""Implement a parquet file ingestor.
 
     Args:
         path: The path to the parquet file to ingest.
+        index_path: The path to the JSON file of the index of the
+            parquet footers. See ``ParquetIngestor``.
         **kwargs: Additional keyword arguments for
             ``polars.scan_parquet``.
 
@@ -86,10 +115,258 @@ class ParquetFileIngestor(ParquetIngestor):
     ```
     """
 
-    def __init__(self, path: Path | str, **kwargs: Any) -> None:
-        super().__init__(source=sanitize_path(path), **kwargs)
+    def __init__(
+        self, path: Path | str, index_path: Path | str | None = None, **kwargs: Any
+    ) -> None:
+        super().__init__(source=sanitize_path(path), index_path=index_path, **kwargs)
 
     def ingest(self) -> pl.LazyFrame:
         check_data_file(self._source)
         logger.info(f"Ingesting parquet file {self._source} | size={human_file_size(self._source)}")
         return super().ingest()
+
+
+class ParquetDatasetIngestor(BaseIngestor):
+    r"""Implement an ingestor for a hive-partitioned parquet dataset.
+
+    The dataset is a directory with one sub-directory per partition,
+    for example ``<path>/country=FR/day=2024-01-01/part-00000.parquet``.
+    The partition filters are applied to the directory names, so
+    only the directories of the matching partitions are listed and
+    only their files are opened
+    (see ``grizz.utils.hive.find_partition_files``).
+    The partition keys are added as columns.
+
+    Args:
+        path: The path to the root directory of the dataset.
+        filters: The filters of the partition keys. Each filter can
+            be a dictionary with the optional ``'start'`` (included)
+            and ``'end'`` (excluded) of a range, a list of accepted
+            values, or a single accepted value. If ``None``, all the
+            partitions are scanned.
+        cache_path: The path to the JSON file used to cache the
+            directory listings between runs. A cached listing is
+            reused while the modification time and the number of
+            hard links of its directory do not change. On
+            filesystems with a coarse modification time (e.g. NFS,
+            FUSE or FAT), a file added in the same tick as the
+            cached listing may be missed until its directory is
+            modified again. If ``None``, the listings are not cached.
+        hive_schema: The data types of the partition keys. The
+            partition keys without data type are strings.
+        column_filters: The filters of the columns of the files,
+            with the same format as ``filters``. The rows that do not
+            match are removed, and the files whose column statistics
+            show that they do not contain any matching row are not
+            opened. If ``None``, the rows are not filtered.
+        index_path: The path to the JSON file of the index of the
+            parquet footers and statistics
+            (see ``grizz.utils.parquet.ParquetIndex``). It is
+            required to use ``column_filters``.
+        **kwargs: Additional keyword arguments for
+            ``polars.scan_parquet``.
+
+    Raises:
+        ValueError: if ``column_filters`` is set without
+            ``index_path``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import date
+    >>> import polars as pl
+    >>> from grizz.lazy.ingestor import ParquetDatasetIngestor
+    >>> ingestor = ParquetDatasetIngestor(
+    ...     path="/path/to/dataset",
+    ...     filters={
+    ...         "day": {"start": date(2024, 1, 1), "end": date(2024, 1, 8)},
+    ...         "country": ["FR"],
+    ...     },
+    ...     hive_schema={"day": pl.Date},
+    ... )
+    >>> frame = ingestor.ingest()  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        filters: dict[str, Any] | None = None,
+        cache_path: Path | str | None = None,
+        hive_schema: dict[str, pl.DataType] | None = None,
+        column_filters: dict[str, Any] | None = None,
+        index_path: Path | str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._path = sanitize_path(path)
+        self._filters = filters
+        self._cache_path = None if cache_path is None else sanitize_path(cache_path)
+        self._hive_schema = hive_schema
+        if column_filters and index_path is None:
+            msg = "index_path is required to use column_filters"
+            raise ValueError(msg)
+        self._column_filters = column_filters
+        self._index_path = None if index_path is None else sanitize_path(index_path)
+        self._kwargs = kwargs
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, filters={self._filters}, "
+            f"column_filters={self._column_filters}{str_kwargs(self._kwargs)})"
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            self._path == other._path
+            and objects_are_equal(self._filters, other._filters, equal_nan=equal_nan)
+            and self._cache_path == other._cache_path
+            and objects_are_equal(self._hive_schema, other._hive_schema, equal_nan=equal_nan)
+            and objects_are_equal(self._column_filters, other._column_filters, equal_nan=equal_nan)
+            and self._index_path == other._index_path
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+        )
+
+    def ingest(self) -> pl.LazyFrame:
+        logger.info(f"Ingesting the parquet dataset {self._path} | filters={self._filters}")
+        frame = scan_partitioned_parquet(
+            self._path,
+            filters=self._filters,
+            cache_path=self._cache_path,
+            hive_schema=self._hive_schema,
+            column_filters=self._column_filters,
+            index_path=self._index_path,
+            **self._kwargs,
+        )
+        logger.info(f"LazyFrame ingested | schema={frame.collect_schema()}")
+        return frame
+
+
+class ParquetDirectoryIngestor(BaseIngestor):
+    r"""Implement an ingestor for a directory of parquet files.
+
+    Each file is scanned separately, then the LazyFrames are
+    concatenated in the order of their paths. The schemas of the
+    files do not need to be the same. By default, the columns that
+    are missing in a file are filled with nulls, and the columns
+    with different data types are cast to their supertype. The files
+    are read in parallel when the LazyFrame is collected, and the
+    result is not rechunked. If all the files have the same schema
+    (``how='vertical'``), the files are scanned together, so the
+    row groups of all the files are scheduled by a single scan.
+
+    Args:
+        path: The path to the directory with the parquet files.
+        recursive: Indicate if the parquet files in the
+            sub-directories are also ingested.
+        how: The method used to concatenate the LazyFrames of the
+            files. ``'vertical'`` requires the same schema for all
+            the files, ``'vertical_relaxed'`` also casts the columns
+            to their supertype, ``'diagonal'`` fills the missing
+            columns with nulls, and ``'diagonal_relaxed'`` does both.
+        index_path: The path to the JSON file of the index of the
+            parquet footers. See ``ParquetIngestor``.
+        **kwargs: Additional keyword arguments for
+            ``polars.scan_parquet``.
+
+    Raises:
+        ValueError: if ``how`` is not valid.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.lazy.ingestor import ParquetDirectoryIngestor
+    >>> ingestor = ParquetDirectoryIngestor(path="/path/to/dir")
+    >>> ingestor
+    ParquetDirectoryIngestor(path=/path/to/dir, recursive=True, how=diagonal_relaxed)
+    >>> frame = ingestor.ingest()  # doctest: +SKIP
+
+    ```
+    """
+
+    def __init__(
+        self,
+        path: Path | str,
+        recursive: bool = True,
+        how: str = "diagonal_relaxed",
+        index_path: Path | str | None = None,
+        **kwargs: Any,
+    ) -> None:
+        self._path = sanitize_path(path)
+        self._recursive = bool(recursive)
+        check_concat_how(how)
+        self._how = how
+        self._index_path = None if index_path is None else sanitize_path(index_path)
+        self._kwargs = kwargs
+
+    def __repr__(self) -> str:
+        args = str_kwargs(self._kwargs)
+        if self._index_path is not None:
+            args = f", index_path={self._index_path}{args}"
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, recursive={self._recursive}, "
+            f"how={self._how}{args})"
+        )
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return (
+            self._path == other._path
+            and self._recursive == other._recursive
+            and self._how == other._how
+            and self._index_path == other._index_path
+            and objects_are_equal(self._kwargs, other._kwargs, equal_nan=equal_nan)
+        )
+
+    def ingest(self) -> pl.LazyFrame:
+        check_data_dir(self._path)
+        files = sorted(find_parquet_files(self._path, recursive=self._recursive))
+        logger.info(f"Ingesting {len(files):,} parquet files from {self._path}...")
+        if not files:
+            frame = pl.LazyFrame()
+        elif self._how == "vertical":
+            frame = pl.scan_parquet(files, **self._kwargs)
+        else:
+            frame = pl.concat(
+                [pl.scan_parquet(file, **self._kwargs) for file in files],
+                how=self._how,
+                rechunk=False,
+            )
+        logger.info(f"LazyFrame ingested | schema={frame.collect_schema()}")
+        return frame
+
+    def estimate_num_rows(self) -> int:
+        files = sorted(find_parquet_files(self._path, recursive=self._recursive))
+        if self._index_path is not None and "n_rows" not in self._kwargs:
+            return _get_num_rows(files, index_path=self._index_path)
+        return sum(_get_num_rows(file, **self._kwargs) for file in files)
+
+
+def _get_num_rows(source: FileSource, index_path: Path | str | None = None, **kwargs: Any) -> int:
+    r"""Get the number of rows of parquet data from the footers of
+    its files.
+
+    Args:
+        source: The source to the parquet data.
+        index_path: The path to the JSON file of the index of the
+            parquet footers. If it is set and the source is a path
+            or a list of paths to files, the number of rows is read
+            from the index.
+        **kwargs: Additional keyword arguments for
+            ``polars.scan_parquet``.
+
+    Returns:
+        The number of rows.
+    """
+    paths = None if index_path is None or "n_rows" in kwargs else get_file_paths(source)
+    if paths is None:
+        return pl.scan_parquet(source, **kwargs).select(pl.len()).collect().item()
+    index = ParquetIndex(index_path)
+    num_rows = index.get_num_rows(paths)
+    index.save()
+    return num_rows
@@ -3,6 +3,7 @@ r"""Contain LazyFrame transformers."""
 from __future__ import annotations
 
 __all__ = [
+    "BaseFilterTransformer",
     "BaseTransformer",
     "ConcatColumns",
     "ConcatColumnsTransformer",
@@ -10,6 +11,15 @@ __all__ = [
     "DropNanRowTransformer",
     "DropNullRow",
     "DropNullRowTransformer",
+    "EagerAdapter",
+    "EagerAdapterTransformer",
+    "ExpressionTransformer",
+    "Filter",
+    "FilterIsIn",
+    "FilterIsInTransformer",
+    "FilterRange",
+    "FilterRangeTransformer",
+    "FilterTransformer",
     "InplaceReplace",
     "InplaceReplaceStrict",
     "InplaceReplaceStrictTransformer",
@@ -18,11 +28,15 @@ __all__ = [
     "ReplaceStrict",
     "ReplaceStrictTransformer",
     "ReplaceTransformer",
+    "Sequential",
+    "SequentialTransformer",
     "SqlTransformer",
     "is_transformer_config",
     "setup_transformer",
 ]
 
+from grizz.lazy.transformer.adapter import EagerAdapterTransformer
+from grizz.lazy.transformer.adapter import EagerAdapterTransformer as EagerAdapter
 from grizz.lazy.transformer.base import (
     BaseTransformer,
     is_transformer_config,
@@ -30,6 +44,14 @@ from grizz.lazy.transformer.base import (
 )
 from grizz.lazy.transformer.concat import ConcatColumnsTransformer
 from grizz.lazy.transformer.concat import ConcatColumnsTransformer as ConcatColumns
+from grizz.lazy.transformer.expression import ExpressionTransformer
+from grizz.lazy.transformer.filter import BaseFilterTransformer
+from grizz.lazy.transformer.filter import FilterIsInTransformer
+from grizz.lazy.transformer.filter import FilterIsInTransformer as FilterIsIn
+from grizz.lazy.transformer.filter import FilterRangeTransformer
+from grizz.lazy.transformer.filter import FilterRangeTransformer as FilterRange
+from grizz.lazy.transformer.filter import FilterTransformer
+from grizz.lazy.transformer.filter import FilterTransformer as Filter
 from grizz.lazy.transformer.nan import DropNanRowTransformer
 from grizz.lazy.transformer.nan import DropNanRowTransformer as DropNanRow
 from grizz.lazy.transformer.null import DropNullRowTransformer
@@ -44,4 +66,6 @@ from grizz.lazy.transformer.replace import ReplaceStrictTransformer
 from grizz.lazy.transformer.replace import ReplaceStrictTransformer as ReplaceStrict
 from grizz.lazy.transformer.replace import ReplaceTransformer
 from grizz.lazy.transformer.replace import ReplaceTransformer as Replace
+from grizz.lazy.transformer.sequential import SequentialTransformer
+from grizz.lazy.transformer.sequential import SequentialTransformer as Sequential
 from grizz.lazy.transformer.sql import SqlTransformer
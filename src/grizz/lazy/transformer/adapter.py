@@ -0,0 +1,169 @@
+r"""Contain a transformer to run a ``polars.DataFrame`` transformer on a
+LazyFrame."""
+
+from __future__ import annotations
+
+__all__ = ["EagerAdapterTransformer"]
+
+import logging
+from typing import TYPE_CHECKING
+
+import polars as pl
+from coola.utils import repr_indent, repr_mapping, str_indent, str_mapping
+
+from grizz.lazy.transformer.columns import BaseArgTransformer
+from grizz.transformer.base import setup_transformer
+from grizz.transformer.utils import get_classname
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+    from grizz.transformer.base import BaseTransformer as BaseEagerTransformer
+
+logger = logging.getLogger(__name__)
+
+
+class EagerAdapterTransformer(BaseArgTransformer):
+    r"""Implement a transformer to run any ``polars.DataFrame``
+    transformer on a LazyFrame.
+
+    The ``polars.DataFrame`` transformer is applied with
+    ``polars.LazyFrame.map_batches``, so only this step leaves the
+    lazy engine and the rest of the query plan is still optimized.
+    Fitting the transformer requires to collect the LazyFrame.
+
+    Args:
+        transformer: The ``polars.DataFrame`` transformer or its
+            configuration.
+        schema: The output schema of the transformer. If ``None``,
+            the output schema is inferred by applying the transformer
+            on the first ``infer_schema_length`` rows of the input.
+        infer_schema_length: The number of rows used to infer the
+            output schema. ``0`` means the transformer is applied on
+            an empty DataFrame, so the input query plan is not
+            executed. Some transformers, like the ``sklearn``
+            transformers, need at least one row.
+        streamable: Whether the transformer can be applied
+            independently on each batch of rows by the streaming
+            engine. It should be ``True`` only if the transformer
+            processes each row independently of the others.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.lazy.transformer import EagerAdapter
+    >>> from grizz.transformer import StripChars
+    >>> transformer = EagerAdapter(StripChars(columns=["col2", "col3"], prefix="", suffix="_out"))
+    >>> transformer
+    EagerAdapterTransformer(
+      (transformer): StripCharsTransformer(columns=('col2', 'col3'), exclude_columns=(), exist_policy='raise', missing_policy='raise', prefix='', suffix='_out')
+      (schema): None
+      (infer_schema_length): 0
+      (streamable): False
+    )
+    >>> frame = pl.LazyFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["a ", " b", "  c  ", "d", "e"],
+    ...     }
+    ... )
+    >>> out = transformer.transform(frame)
+    >>> out.collect()
+    shape: (5, 5)
+    ┌──────┬──────┬───────┬──────────┬──────────┐
+    │ col1 ┆ col2 ┆ col3  ┆ col2_out ┆ col3_out │
+    │ ---  ┆ ---  ┆ ---   ┆ ---      ┆ ---      │
+    │ i64  ┆ str  ┆ str   ┆ str      ┆ str      │
+    ╞══════╪══════╪═══════╪══════════╪══════════╡
+    │ 1    ┆ 1    ┆ a     ┆ 1        ┆ a        │
+    │ 2    ┆ 2    ┆  b    ┆ 2        ┆ b        │
+    │ 3    ┆ 3    ┆   c   ┆ 3        ┆ c        │
+    │ 4    ┆ 4    ┆ d     ┆ 4        ┆ d        │
+    │ 5    ┆ 5    ┆ e     ┆ 5        ┆ e        │
+    └──────┴──────┴───────┴──────────┴──────────┘
+
+    ```
+    """
+
+    def __init__(
+        self,
+        transformer: BaseEagerTransformer | dict,
+        schema: Mapping[str, pl.DataType] | None = None,
+        infer_schema_length: int = 0,
+        streamable: bool = False,
+    ) -> None:
+        self._transformer = setup_transformer(transformer)
+        self._schema = pl.Schema(schema) if schema is not None else None
+        if infer_schema_length < 0:
+            msg = (
+                "infer_schema_length must be greater or equal to 0 "
+                f"(received: {infer_schema_length})"
+            )
+            raise ValueError(msg)
+        self._infer_schema_length = infer_schema_length
+        self._streamable = streamable
+
+    def __repr__(self) -> str:
+        args = repr_indent(repr_mapping(self.get_args()))
+        return f"{self.__class__.__qualname__}(\n  {args}\n)"
+
+    def __str__(self) -> str:
+        args = str_indent(str_mapping(self.get_args()))
+        return f"{self.__class__.__qualname__}(\n  {args}\n)"
+
+    def get_args(self) -> dict:
+        return {
+            "transformer": self._transformer,
+            "schema": self._schema,
+            "infer_schema_length": self._infer_schema_length,
+            "streamable": self._streamable,
+        }
+
+    def fit(self, frame: pl.LazyFrame) -> None:
+        logger.info(f"Collecting the LazyFrame to fit {get_classname(self._transformer)}...")
+        self._transformer.fit(frame.collect())
+
+    def transform(self, frame: pl.LazyFrame) -> pl.LazyFrame:
+        return frame.map_batches(
+            self._transformer.transform,
+            schema=self.get_output_schema(frame),
+            predicate_pushdown=False,
+            projection_pushdown=False,
+            slice_pushdown=False,
+            streamable=self._streamable,
+        )
+
+    def get_output_schema(self, frame: pl.LazyFrame) -> pl.Schema:
+        r"""Get the output schema of the transformer.
+
+        Args:
+            frame: The input LazyFrame.
+
+        Returns:
+            The declared output schema if it was given, otherwise the
+                inferred output schema.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.lazy.transformer import EagerAdapter
+        >>> from grizz.transformer import InplaceCast
+        >>> transformer = EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32))
+        >>> frame = pl.LazyFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+        >>> transformer.get_output_schema(frame)
+        Schema({'col1': Float32, 'col2': String})
+
+        ```
+        """
+        if self._schema is not None:
+            return self._schema
+        if self._infer_schema_length == 0:
+            sample = pl.DataFrame(schema=frame.collect_schema())
+        else:
+            sample = frame.head(self._infer_schema_length).collect()
+        return self._transformer.transform(sample).schema
@@ -0,0 +1,106 @@
+r"""Contain a transformer that runs an expression-based
+``polars.DataFrame`` transformer on a LazyFrame."""
+
+from __future__ import annotations
+
+__all__ = ["ExpressionTransformer"]
+
+import logging
+from typing import TYPE_CHECKING
+
+from coola.utils import repr_indent, repr_mapping, str_indent, str_mapping
+
+from grizz.lazy.transformer.columns import BaseArgTransformer
+from grizz.transformer.base import setup_transformer
+from grizz.transformer.columns import BaseArgTransformer as BaseEagerArgTransformer
+from grizz.transformer.utils import get_classname, message_skip_fit
+
+if TYPE_CHECKING:
+    import polars as pl
+
+    from grizz.transformer.base import BaseTransformer as BaseEagerTransformer
+
+logger = logging.getLogger(__name__)
+
+
+class ExpressionTransformer(BaseArgTransformer):
+    r"""Implement a transformer that runs an expression-based
+    ``polars.DataFrame`` transformer on a LazyFrame.
+
+    The ``polars.DataFrame`` transformer is converted to ``polars``
+    expressions with ``to_exprs``, so the transformation is added to
+    the LazyFrame query plan and nothing is collected.
+
+    Args:
+        transformer: The ``polars.DataFrame`` transformer or its
+            configuration. It must be stateless and implement
+            ``to_exprs``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.lazy.transformer import ExpressionTransformer
+    >>> from grizz.transformer import InplaceCast
+    >>> transformer = ExpressionTransformer(InplaceCast(columns=["col1", "col3"], dtype=pl.Int32))
+    >>> transformer
+    ExpressionTransformer(
+      (transformer): InplaceCastTransformer(columns=('col1', 'col3'), exclude_columns=(), missing_policy='raise', dtype=Int32)
+    )
+    >>> frame = pl.LazyFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["1", "2", "3", "4", "5"],
+    ...         "col4": ["a", "b", "c", "d", "e"],
+    ...     }
+    ... )
+    >>> out = transformer.transform(frame)
+    >>> out.collect()
+    shape: (5, 4)
+    ┌──────┬──────┬──────┬──────┐
+    │ col1 ┆ col2 ┆ col3 ┆ col4 │
+    │ ---  ┆ ---  ┆ ---  ┆ ---  │
+    │ i32  ┆ str  ┆ i32  ┆ str  │
+    ╞══════╪══════╪══════╪══════╡
+    │ 1    ┆ 1    ┆ 1    ┆ a    │
+    │ 2    ┆ 2    ┆ 2    ┆ b    │
+    │ 3    ┆ 3    ┆ 3    ┆ c    │
+    │ 4    ┆ 4    ┆ 4    ┆ d    │
+    │ 5    ┆ 5    ┆ 5    ┆ e    │
+    └──────┴──────┴──────┴──────┘
+
+    ```
+    """
+
+    def __init__(self, transformer: BaseEagerTransformer | dict) -> None:
+        self._transformer = setup_transformer(transformer)
+
+    def __repr__(self) -> str:
+        args = repr_indent(repr_mapping({"transformer": self._transformer}))
+        return f"{self.__class__.__qualname__}(\n  {args}\n)"
+
+    def __str__(self) -> str:
+        args = str_indent(str_mapping({"transformer": self._transformer}))
+        return f"{self.__class__.__qualname__}(\n  {args}\n)"
+
+    def get_args(self) -> dict:
+        return {"transformer": self._transformer}
+
+    def fit(self, frame: pl.LazyFrame) -> None:  # noqa: ARG002
+        logger.info(message_skip_fit(get_classname(self)))
+
+    def transform(self, frame: pl.LazyFrame) -> pl.LazyFrame:
+        exprs = None
+        if isinstance(self._transformer, BaseEagerArgTransformer):
+            exprs = self._transformer.to_exprs(frame.collect_schema())
+        if exprs is None:
+            msg = (
+                f"{get_classname(self._transformer)} cannot be represented by polars "
+                "expressions, so it cannot be used in a LazyFrame query plan"
+            )
+            raise TypeError(msg)
+        if not exprs:
+            return frame
+        return frame.with_columns(exprs)
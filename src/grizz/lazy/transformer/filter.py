@@ -0,0 +1,239 @@
+r"""Contain ``polars.LazyFrame`` transformers to filter the rows of
+LazyFrames."""
+
+from __future__ import annotations
+
+__all__ = [
+    "BaseFilterTransformer",
+    "FilterIsInTransformer",
+    "FilterRangeTransformer",
+    "FilterTransformer",
+]
+
+import logging
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+from coola.utils.format import repr_mapping_line
+
+from grizz.lazy.transformer.columns import BaseArgTransformer
+from grizz.transformer.utils import get_classname, message_skip_fit
+from grizz.utils.hive import make_column_filter
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+logger = logging.getLogger(__name__)
+
+
+class BaseFilterTransformer(BaseArgTransformer):
+    r"""Define a base class to implement transformers that only keep
+    the rows matching a predicate.
+
+    The predicate is added to the LazyFrame query plan, so ``polars``
+    pushes it down to the scan (e.g. ``polars.scan_parquet`` or
+    ``polars.scan_csv``) and the rows that do not match are not
+    loaded in memory.
+    """
+
+    def fit(self, frame: pl.LazyFrame) -> None:  # noqa: ARG002
+        logger.info(message_skip_fit(get_classname(self)))
+
+    def transform(self, frame: pl.LazyFrame) -> pl.LazyFrame:
+        logger.info("Filtering the rows of the LazyFrame...")
+        return frame.filter(self.get_predicate())
+
+    @abstractmethod
+    def get_predicate(self) -> pl.Expr:
+        r"""Get the predicate of the rows to keep.
+
+        Returns:
+            The predicate expression.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.lazy.transformer import FilterRange
+        >>> transformer = FilterRange(col="col1", start=2, end=4)
+        >>> frame = pl.LazyFrame({"col1": [1, 2, 3, 4, 5]})
+        >>> frame.filter(transformer.get_predicate()).collect()["col1"].to_list()
+        [2, 3]
+
+        ```
+        """
+
+
+class FilterTransformer(BaseFilterTransformer):
+    r"""Implement a transformer that only keeps the rows matching a
+    predicate.
+
+    Args:
+        predicate: The predicate of the rows to keep. It can be a
+            ``polars`` expression or a SQL expression, for example
+            ``"col1 > 2 AND col4 IN ('a', 'b')"``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.lazy.transformer import Filter
+    >>> transformer = Filter(predicate="col1 > 2 AND col4 != 'e'")
+    >>> transformer
+    FilterTransformer(predicate="col1 > 2 AND col4 != 'e'")
+    >>> frame = pl.LazyFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["1", "2", "3", "4", "5"],
+    ...         "col4": ["a", "b", "c", "d", "e"],
+    ...     }
+    ... )
+    >>> out = transformer.transform(frame)
+    >>> out.collect()
+    shape: (2, 4)
+    ┌──────┬──────┬──────┬──────┐
+    │ col1 ┆ col2 ┆ col3 ┆ col4 │
+    │ ---  ┆ ---  ┆ ---  ┆ ---  │
+    │ i64  ┆ str  ┆ str  ┆ str  │
+    ╞══════╪══════╪══════╪══════╡
+    │ 3    ┆ 3    ┆ 3    ┆ c    │
+    │ 4    ┆ 4    ┆ 4    ┆ d    │
+    └──────┴──────┴──────┴──────┘
+
+    ```
+    """
+
+    def __init__(self, predicate: pl.Expr | str) -> None:
+        self._predicate = predicate
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line({"predicate": str(self._predicate)})
+        return f"{self.__class__.__qualname__}({args})"
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
+        if not isinstance(other, self.__class__):
+            return False
+        return self.get_predicate().meta.eq(other.get_predicate())
+
+    def get_args(self) -> dict:
+        return {"predicate": self._predicate}
+
+    def get_predicate(self) -> pl.Expr:
+        if isinstance(self._predicate, str):
+            return pl.sql_expr(self._predicate)
+        return self._predicate
+
+
+class FilterRangeTransformer(BaseFilterTransformer):
+    r"""Implement a transformer that only keeps the rows where the
+    value of a column is in a range.
+
+    The rows with a null value are removed.
+
+    Args:
+        col: The column to filter on.
+        start: The start of the range (included). If ``None``, the
+            range has no lower bound.
+        end: The end of the range (excluded). If ``None``, the range
+            has no upper bound.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.lazy.transformer import FilterRange
+    >>> transformer = FilterRange(col="col1", start=2, end=4)
+    >>> transformer
+    FilterRangeTransformer(col='col1', start=2, end=4)
+    >>> frame = pl.LazyFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["1", "2", "3", "4", "5"],
+    ...         "col4": ["a", "b", "c", "d", "e"],
+    ...     }
+    ... )
+    >>> out = transformer.transform(frame)
+    >>> out.collect()
+    shape: (2, 4)
+    ┌──────┬──────┬──────┬──────┐
+    │ col1 ┆ col2 ┆ col3 ┆ col4 │
+    │ ---  ┆ ---  ┆ ---  ┆ ---  │
+    │ i64  ┆ str  ┆ str  ┆ str  │
+    ╞══════╪══════╪══════╪══════╡
+    │ 2    ┆ 2    ┆ 2    ┆ b    │
+    │ 3    ┆ 3    ┆ 3    ┆ c    │
+    └──────┴──────┴──────┴──────┘
+
+    ```
+    """
+
+    def __init__(self, col: str, start: Any = None, end: Any = None) -> None:
+        self._col = col
+        self._start = start
+        self._end = end
+
+    def get_args(self) -> dict:
+        return {"col": self._col, "start": self._start, "end": self._end}
+
+    def get_predicate(self) -> pl.Expr:
+        return make_column_filter(self._col, {"start": self._start, "end": self._end})
+
+
+class FilterIsInTransformer(BaseFilterTransformer):
+    r"""Implement a transformer that only keeps the rows where the
+    value of a column is in a set of values.
+
+    Args:
+        col: The column to filter on.
+        values: The accepted values. ``None`` accepts the null
+            values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.lazy.transformer import FilterIsIn
+    >>> transformer = FilterIsIn(col="col4", values=["a", "c", "e"])
+    >>> transformer
+    FilterIsInTransformer(col='col4', values=('a', 'c', 'e'))
+    >>> frame = pl.LazyFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["1", "2", "3", "4", "5"],
+    ...         "col4": ["a", "b", "c", "d", "e"],
+    ...     }
+    ... )
+    >>> out = transformer.transform(frame)
+    >>> out.collect()
+    shape: (3, 4)
+    ┌──────┬──────┬──────┬──────┐
+    │ col1 ┆ col2 ┆ col3 ┆ col4 │
+    │ ---  ┆ ---  ┆ ---  ┆ ---  │
+    │ i64  ┆ str  ┆ str  ┆ str  │
+    ╞══════╪══════╪══════╪══════╡
+    │ 1    ┆ 1    ┆ 1    ┆ a    │
+    │ 3    ┆ 3    ┆ 3    ┆ c    │
+    │ 5    ┆ 5    ┆ 5    ┆ e    │
+    └──────┴──────┴──────┴──────┘
+
+    ```
+    """
+
+    def __init__(self, col: str, values: Sequence) -> None:
+        self._col = col
+        self._values = tuple(values)
+
+    def get_args(self) -> dict:
+        return {"col": self._col, "values": self._values}
+
+    def get_predicate(self) -> pl.Expr:
+        return make_column_filter(self._col, self._values)
@@ -0,0 +1,160 @@
+r"""Contain a transformer to combine sequentially multiple LazyFrame
+transformers."""
+
+from __future__ import annotations
+
+__all__ = ["SequentialTransformer"]
+
+from typing import TYPE_CHECKING, Any
+
+from coola import objects_are_equal
+from coola.utils import repr_indent, repr_sequence, str_indent, str_sequence
+
+from grizz.lazy.transformer.base import BaseTransformer, setup_transformer
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import polars as pl
+
+
+class SequentialTransformer(BaseTransformer):
+    r"""Implement a ``polars.LazyFrame`` transformer to apply
+    sequentially several transformers.
+
+    The transformers are composed into a single LazyFrame query plan,
+    so ``polars`` can optimize the whole pipeline at once, for example
+    by pushing down the projections and predicates into the scan.
+
+    Args:
+        transformers: The transformers or their configurations.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.lazy.transformer import Sequential, DropNullRow, InplaceReplace
+    >>> transformer = Sequential(
+    ...     [
+    ...         DropNullRow(columns=["col1"]),
+    ...         InplaceReplace(col="col2", old={"a": "x"}),
+    ...     ]
+    ... )
+    >>> transformer
+    SequentialTransformer(
+      (0): DropNullRowTransformer(columns=('col1',), exclude_columns=(), missing_policy='raise')
+      (1): InplaceReplaceTransformer(col='col2', missing_policy='raise', old={'a': 'x'})
+    )
+    >>> frame = pl.LazyFrame(
+    ...     {
+    ...         "col1": [1, 2, None, 4, 5],
+    ...         "col2": ["a", "b", "c", "d", "e"],
+    ...     }
+    ... )
+    >>> out = transformer.transform(frame)
+    >>> out.collect()
+    shape: (4, 2)
+    ┌──────┬──────┐
+    │ col1 ┆ col2 │
+    │ ---  ┆ ---  │
+    │ i64  ┆ str  │
+    ╞══════╪══════╡
+    │ 1    ┆ x    │
+    │ 2    ┆ b    │
+    │ 4    ┆ d    │
+    │ 5    ┆ e    │
+    └──────┴──────┘
+
+    ```
+    """
+
+    def __init__(self, transformers: Sequence[BaseTransformer | dict]) -> None:
+        self._transformers = tuple(setup_transformer(transformer) for transformer in transformers)
+
+    def __repr__(self) -> str:
+        args = ""
+        if self._transformers:
+            args = f"\n  {repr_indent(repr_sequence(self._transformers))}\n"
+        return f"{self.__class__.__qualname__}({args})"
+
+    def __str__(self) -> str:
+        args = ""
+        if self._transformers:
+            args = f"\n  {str_indent(str_sequence(self._transformers))}\n"
+        return f"{self.__class__.__qualname__}({args})"
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return objects_are_equal(self._transformers, other._transformers, equal_nan=equal_nan)
+
+    def fit(self, frame: pl.LazyFrame) -> None:
+        for transformer in self._transformers:
+            transformer.fit(frame)
+            frame = transformer.transform(frame)
+
+    def fit_transform(self, frame: pl.LazyFrame) -> pl.LazyFrame:
+        for transformer in self._transformers:
+            frame = transformer.fit_transform(frame)
+        return frame
+
+    def transform(self, frame: pl.LazyFrame) -> pl.LazyFrame:
+        for transformer in self._transformers:
+            frame = transformer.transform(frame)
+        return frame
+
+    def explain(self, frame: pl.LazyFrame, **kwargs: Any) -> str:
+        r"""Get the query plan of the whole pipeline.
+
+        Args:
+            frame: The ``polars.LazyFrame`` to transform.
+            **kwargs: The keyword arguments passed to
+                ``polars.LazyFrame.explain``.
+
+        Returns:
+            The query plan of the transformed LazyFrame.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.lazy.transformer import Sequential, DropNullRow
+        >>> transformer = Sequential([DropNullRow(columns=["col1"])])
+        >>> frame = pl.LazyFrame({"col1": [1, 2, None, 4, 5], "col2": ["a", "b", "c", "d", "e"]})
+        >>> plan = transformer.explain(frame)
+        >>> isinstance(plan, str)
+        True
+
+        ```
+        """
+        return self.transform(frame).explain(**kwargs)
+
+    def profile(self, frame: pl.LazyFrame, **kwargs: Any) -> tuple[pl.DataFrame, pl.DataFrame]:
+        r"""Run the whole pipeline and profile the query.
+
+        Args:
+            frame: The ``polars.LazyFrame`` to transform.
+            **kwargs: The keyword arguments passed to
+                ``polars.LazyFrame.profile``.
+
+        Returns:
+            A tuple with the materialized DataFrame and a DataFrame
+                with the timing of each node of the query plan.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.lazy.transformer import Sequential, DropNullRow
+        >>> transformer = Sequential([DropNullRow(columns=["col1"])])
+        >>> frame = pl.LazyFrame({"col1": [1, 2, None, 4, 5], "col2": ["a", "b", "c", "d", "e"]})
+        >>> out, timings = transformer.profile(frame)
+        >>> out.shape
+        (4, 2)
+
+        ```
+        """
+        return self.transform(frame).profile(**kwargs)
@@ -6,6 +6,7 @@ __all__ = [
     "AbsDiffHorizontal",
     "AbsDiffHorizontalTransformer",
     "BaseArgTransformer",
+    "BaseFilterTransformer",
     "BaseIn1Out1Transformer",
     "BaseIn2Out1Transformer",
     "BaseInNOut1Transformer",
@@ -14,6 +15,8 @@ __all__ = [
     "BaseTransformer",
     "Binarizer",
     "BinarizerTransformer",
+    "Cache",
+    "CacheTransformer",
     "Cast",
     "CastTransformer",
     "CategoricalCast",
@@ -68,8 +71,14 @@ __all__ = [
     "FillNanTransformer",
     "FillNull",
     "FillNullTransformer",
+    "Filter",
     "FilterCardinality",
     "FilterCardinalityTransformer",
+    "FilterIsIn",
+    "FilterIsInTransformer",
+    "FilterRange",
+    "FilterRangeTransformer",
+    "FilterTransformer",
     "FirstRow",
     "FirstRowTransformer",
     "FloatCast",
@@ -196,6 +205,8 @@ from grizz.transformer.base import (
     is_transformer_config,
     setup_transformer,
 )
+from grizz.transformer.cache import CacheTransformer
+from grizz.transformer.cache import CacheTransformer as Cache
 from grizz.transformer.cardinality import FilterCardinalityTransformer
 from grizz.transformer.cardinality import (
     FilterCardinalityTransformer as FilterCardinality,
@@ -338,6 +349,13 @@ from grizz.transformer.fill import InplaceFillNanTransformer
 from grizz.transformer.fill import InplaceFillNanTransformer as InplaceFillNan
 from grizz.transformer.fill import InplaceFillNullTransformer
 from grizz.transformer.fill import InplaceFillNullTransformer as InplaceFillNull
+from grizz.transformer.filter import BaseFilterTransformer
+from grizz.transformer.filter import FilterIsInTransformer
+from grizz.transformer.filter import FilterIsInTransformer as FilterIsIn
+from grizz.transformer.filter import FilterRangeTransformer
+from grizz.transformer.filter import FilterRangeTransformer as FilterRange
+from grizz.transformer.filter import FilterTransformer
+from grizz.transformer.filter import FilterTransformer as Filter
 from grizz.transformer.function import FunctionTransformer
 from grizz.transformer.function import FunctionTransformer as Function
 from grizz.transformer.json import InplaceJsonDecodeTransformer
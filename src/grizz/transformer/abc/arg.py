@@ -14,6 +14,7 @@ from coola.utils.format import repr_mapping_line, str_mapping_line
 from iden.utils.time import timeblock
 
 from grizz.transformer.base import BaseTransformer
+from grizz.utils.diagnostics import is_diagnostics_enabled
 from grizz.utils.format import str_dataframe_diff
 
 if TYPE_CHECKING:
@@ -57,7 +58,12 @@ class BaseArgTransformer(BaseTransformer):
         self.check_is_fitted()
         with timeblock(f"{self.__class__.__qualname__}.transform - " + "time: {time}"):
             out = self._transform(frame)
-        logger.info(str_dataframe_diff(orig=frame, final=out))
+        if is_diagnostics_enabled(logger=logger):
+            logger.info(
+                str_dataframe_diff(
+                    orig=frame, final=out, estimated_size=is_diagnostics_enabled("full")
+                )
+            )
         return out
 
     @abstractmethod
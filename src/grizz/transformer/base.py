@@ -20,6 +20,8 @@ from objectory import AbstractFactory
 from objectory.utils import is_object_config
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Sequence
+
     import polars as pl
     from coola.equality import EqualityConfig
 
@@ -272,6 +274,182 @@ class BaseTransformer(ABC, metaclass=AbstractFactory):
         ```
         """
 
+    def transform_batches(self, frames: Iterable[pl.DataFrame]) -> Iterator[pl.DataFrame]:
+        r"""Transform a stream of ``polars.DataFrame`` batches.
+
+        The batches are transformed one after another with the current
+        parameters of the transformer, so only one batch is in memory
+        at a time. The transformer must be fitted before to call this
+        method if it has some parameters to fit.
+
+        Args:
+            frames: The ``polars.DataFrame`` batches to transform.
+
+        Returns:
+            An iterator over the transformed batches.
+
+        Raises:
+            ValueError: if the transformer does not support batches
+                (see ``supports_batches``).
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.transformer import InplaceCast
+        >>> transformer = InplaceCast(columns=["col1"], dtype=pl.Float32)
+        >>> frame = pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]})
+        >>> for out in transformer.transform_batches(frame.iter_slices(n_rows=2)):
+        ...     print(out.shape, out.schema["col1"])
+        ...
+        (2, 2) Float32
+        (2, 2) Float32
+        (1, 2) Float32
+
+        ```
+        """
+        if not self.supports_batches():
+            msg = (
+                f"{self.__class__.__qualname__} cannot transform the DataFrame batch by batch "
+                "because its output depends on the whole DataFrame"
+            )
+            raise ValueError(msg)
+        return (self.transform(frame) for frame in frames)
+
+    def supports_batches(self) -> bool:
+        r"""Indicate if the transformer can transform a DataFrame batch
+        by batch.
+
+        This is only possible if each output row only depends on the
+        matching input row and on the fitted parameters, so the
+        concatenation of the transformed batches is equal to the
+        transformed DataFrame. For example, sorting the rows or
+        removing the duplicate rows needs the whole DataFrame.
+
+        Returns:
+            ``True`` if the transformer supports batches,
+                otherwise ``False``.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from grizz.transformer import CopyColumn, Sort
+        >>> CopyColumn(in_col="col1", out_col="out").supports_batches()
+        True
+        >>> Sort(columns=["col1"]).supports_batches()
+        False
+
+        ```
+        """
+        return False
+
+    def get_input_columns(self) -> tuple[str, ...] | None:
+        r"""Get the input columns used by the transformer.
+
+        Returns:
+            The input columns, or ``None`` if they are unknown, for
+                example if they depend on the DataFrame.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from grizz.transformer import CopyColumn
+        >>> transformer = CopyColumn(in_col="col1", out_col="out")
+        >>> transformer.get_input_columns()
+        ('col1',)
+
+        ```
+        """
+        return None
+
+    def get_output_columns(self) -> tuple[str, ...] | None:
+        r"""Get the columns added or updated by the transformer.
+
+        Returns:
+            The output columns, or ``None`` if they are unknown, for
+                example if they depend on the DataFrame.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from grizz.transformer import CopyColumn
+        >>> transformer = CopyColumn(in_col="col1", out_col="out")
+        >>> transformer.get_output_columns()
+        ('out',)
+
+        ```
+        """
+        return None
+
+    def find_required_columns(self, columns: Sequence[str] | None = None) -> tuple[str, ...] | None:
+        r"""Find the columns of the input DataFrame that are required
+        to compute some columns of the output DataFrame.
+
+        The other columns of the input DataFrame do not need to be
+        ingested, because they do not change the requested output
+        columns.
+
+        Args:
+            columns: The output columns that are used after the
+                transformation. If ``None``, all the output columns
+                are used.
+
+        Returns:
+            The required input columns, or ``None`` if all the input
+                columns may be required.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from grizz.transformer import CopyColumn
+        >>> transformer = CopyColumn(in_col="col1", out_col="out")
+        >>> transformer.find_required_columns(["col2", "out"])
+        ('col2', 'col1')
+        >>> transformer.find_required_columns() is None
+        True
+
+        ```
+        """
+        if columns is None:
+            return None
+        inputs, outputs = self.get_input_columns(), self.get_output_columns()
+        if inputs is None or outputs is None:
+            return None
+        return tuple(dict.fromkeys([*(col for col in columns if col not in outputs), *inputs]))
+
+    def get_row_filter(self) -> pl.Expr | None:
+        r"""Get a predicate of the rows of the input DataFrame that are
+        required to compute the output DataFrame.
+
+        The rows that do not match the predicate can be removed
+        before the transformation, for example when the data is
+        ingested, without changing the output DataFrame.
+
+        Returns:
+            The predicate, or ``None`` if all the rows may be
+                required.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from grizz.transformer import CopyColumn, FilterRange
+        >>> transformer = CopyColumn(in_col="col1", out_col="out")
+        >>> transformer.get_row_filter() is None
+        True
+        >>> transformer = FilterRange(col="col1", start=2)
+        >>> transformer.get_row_filter() is None
+        False
+
+        ```
+        """
+        return None
+
 
 def is_transformer_config(config: dict) -> bool:
     r"""Indicate if the input configuration is a configuration for a
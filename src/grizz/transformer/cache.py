@@ -0,0 +1,160 @@
+r"""Contain a transformer that caches the output of another transformer
+on disk."""
+
+from __future__ import annotations
+
+__all__ = ["CacheTransformer"]
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from coola.utils import repr_indent, repr_mapping, str_indent, str_mapping
+
+from grizz.transformer.base import BaseTransformer, setup_transformer
+from grizz.utils.cache import DiskFrameCache
+from grizz.utils.hashing import hash_dataframe, hash_object, str_to_sha256
+from grizz.utils.profiling import profile_block
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    import polars as pl
+
+logger = logging.getLogger(__name__)
+
+
+class CacheTransformer(BaseTransformer):
+    r"""Implement a transformer that caches the output of another
+    transformer on disk.
+
+    The output DataFrame is stored in the Arrow IPC format. The cache
+    key combines the arguments and fitted state of the transformer
+    (see ``grizz.utils.hashing.hash_object``) with a fingerprint of
+    the input DataFrame (see ``grizz.utils.hashing.hash_dataframe``),
+    so the cached output is only used if the transformer and its
+    input did not change.
+
+    Args:
+        transformer: The transformer or its configuration.
+        path: The path to the cache directory.
+        max_size: The maximum size of the cache in bytes. When the
+            cache is full, the least recently used outputs are
+            removed. If ``None``, the cache size is not limited.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> import polars as pl
+    >>> from pathlib import Path
+    >>> from grizz.transformer import Cache, InplaceCast
+    >>> frame = pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]})
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     transformer = Cache(
+    ...         InplaceCast(columns=["col1"], dtype=pl.Float32), path=Path(tmpdir)
+    ...     )
+    ...     out = transformer.transform(frame)  # computed
+    ...     out = transformer.transform(frame)  # loaded from the cache
+    ...
+    >>> out
+    shape: (5, 2)
+    ┌──────┬──────┐
+    │ col1 ┆ col2 │
+    │ ---  ┆ ---  │
+    │ f32  ┆ str  │
+    ╞══════╪══════╡
+    │ 1.0  ┆ a    │
+    │ 2.0  ┆ b    │
+    │ 3.0  ┆ c    │
+    │ 4.0  ┆ d    │
+    │ 5.0  ┆ e    │
+    └──────┴──────┘
+
+    ```
+    """
+
+    def __init__(
+        self,
+        transformer: BaseTransformer | dict,
+        path: Path | str,
+        max_size: int | None = None,
+    ) -> None:
+        self._transformer = setup_transformer(transformer)
+        self._cache = DiskFrameCache(path=path, max_size=max_size)
+
+    def __repr__(self) -> str:
+        args = repr_indent(repr_mapping({"transformer": self._transformer, "cache": self._cache}))
+        return f"{self.__class__.__qualname__}(\n  {args}\n)"
+
+    def __str__(self) -> str:
+        args = str_indent(str_mapping({"transformer": self._transformer, "cache": self._cache}))
+        return f"{self.__class__.__qualname__}(\n  {args}\n)"
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:
+        if not isinstance(other, self.__class__):
+            return False
+        return self._cache.equal(other._cache) and self._transformer.equal(
+            other._transformer, equal_nan=equal_nan
+        )
+
+    def fit(self, frame: pl.DataFrame) -> None:
+        self._transformer.fit(frame)
+
+    def fit_transform(self, frame: pl.DataFrame) -> pl.DataFrame:
+        self.fit(frame)
+        return self.transform(frame)
+
+    def transform(self, frame: pl.DataFrame) -> pl.DataFrame:
+        with profile_block(
+            f"{self.__class__.__qualname__}.transform", category="transform", frame=frame
+        ) as record:
+            key = self.get_key(frame)
+            out = self._cache.get(key)
+            if out is None:
+                out = self._transformer.transform(frame)
+                self._cache.set(key, out)
+            if record is not None:
+                record.set_output(out)
+        return out
+
+    def get_input_columns(self) -> tuple[str, ...] | None:
+        return self._transformer.get_input_columns()
+
+    def get_output_columns(self) -> tuple[str, ...] | None:
+        return self._transformer.get_output_columns()
+
+    def find_required_columns(self, columns: Sequence[str] | None = None) -> tuple[str, ...] | None:
+        return self._transformer.find_required_columns(columns)
+
+    def get_row_filter(self) -> pl.Expr | None:
+        return self._transformer.get_row_filter()
+
+    def supports_batches(self) -> bool:
+        return self._transformer.supports_batches()
+
+    def get_key(self, frame: pl.DataFrame) -> str:
+        r"""Get the cache key of the output of the transformer.
+
+        Args:
+            frame: The input DataFrame.
+
+        Returns:
+            The cache key.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.transformer import Cache, InplaceCast
+        >>> transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path="/tmp/")
+        >>> frame = pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]})
+        >>> key = transformer.get_key(frame)
+        >>> len(key)
+        64
+
+        ```
+        """
+        return str_to_sha256(f"{hash_dataframe(frame)}|{hash_object(self._transformer)}")
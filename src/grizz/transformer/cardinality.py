@@ -12,6 +12,7 @@ import polars as pl
 
 from grizz.transformer.columns import BaseInNTransformer
 from grizz.transformer.utils import get_classname, message_skip_fit
+from grizz.utils.diagnostics import is_diagnostics_enabled
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -114,13 +115,17 @@ class FilterCardinalityTransformer(BaseInNTransformer):
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         columns = self.find_common_columns(frame)
-        logger.info(
-            f"Filtering {len(columns):,} columns based on their "
-            f"cardinality [{self._n_min}, {self._n_max})..."
-        )
+        if is_diagnostics_enabled(logger=logger):
+            logger.info(
+                f"Filtering {len(columns):,} columns based on their "
+                f"cardinality [{self._n_min}, {self._n_max})..."
+            )
         valid = frame.select(
             pl.n_unique(*columns).is_between(self._n_min, self._n_max, closed="left")
         )
         cols_to_drop = [col.name for col in valid.iter_columns() if not col[0]]
-        logger.info(f"Dropping {len(cols_to_drop):,} columns: {cols_to_drop}")
+        if is_diagnostics_enabled("full", logger=logger):
+            logger.info(f"Dropping {len(cols_to_drop):,} columns: {cols_to_drop}")
+        elif is_diagnostics_enabled(logger=logger):
+            logger.info(f"Dropping {len(cols_to_drop):,} columns")
         return frame.drop(cols_to_drop)
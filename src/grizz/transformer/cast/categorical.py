@@ -116,14 +116,18 @@ class CategoricalCastTransformer(BaseIn1Out1Transformer):
             "missing_policy": self._missing_policy,
         } | self._kwargs
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         logger.info(f"Casting column {self._in_col!r} to categorical column {self._out_col!r} ...")
-        return frame.with_columns(
-            pl.col(self._in_col).cast(pl.Categorical(**self._kwargs)).alias(self._out_col)
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in_col).cast(pl.Categorical(**self._kwargs))
 
 
 class InplaceCategoricalCastTransformer(CategoricalCastTransformer):
@@ -133,6 +133,11 @@ class ToDatetimeTransformer(BaseInNOutNTransformer):
     def get_args(self) -> dict:
         return super().get_args() | self._kwargs
 
+    def supports_batches(self) -> bool:
+        # The format is inferred from the data if it is not given, so
+        # it could be different for each batch.
+        return self._kwargs.get("format") is not None
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -107,8 +107,8 @@ class DecimalCastTransformer(CastTransformer):
     ```
     """
 
-    def _cast(self, frame: pl.DataFrame, columns: Sequence[str]) -> pl.DataFrame:
-        return frame.select((cs.by_name(columns) & cs.decimal()).cast(self._dtype, **self._kwargs))
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return (cs.by_name(columns) & cs.decimal()).cast(self._dtype, **self._kwargs)
 
 
 class InplaceDecimalCastTransformer(InplaceCastTransformer):
@@ -189,5 +189,5 @@ class InplaceDecimalCastTransformer(InplaceCastTransformer):
     ```
     """
 
-    def _cast(self, frame: pl.DataFrame, columns: Sequence[str]) -> pl.DataFrame:
-        return frame.select((cs.by_name(columns) & cs.decimal()).cast(self._dtype, **self._kwargs))
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return (cs.by_name(columns) & cs.decimal()).cast(self._dtype, **self._kwargs)
@@ -107,8 +107,8 @@ class FloatCastTransformer(CastTransformer):
     ```
     """
 
-    def _cast(self, frame: pl.DataFrame, columns: Sequence[str]) -> pl.DataFrame:
-        return frame.select((cs.by_name(columns) & cs.float()).cast(self._dtype, **self._kwargs))
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return (cs.by_name(columns) & cs.float()).cast(self._dtype, **self._kwargs)
 
 
 class InplaceFloatCastTransformer(InplaceCastTransformer):
@@ -189,5 +189,5 @@ class InplaceFloatCastTransformer(InplaceCastTransformer):
     ```
     """
 
-    def _cast(self, frame: pl.DataFrame, columns: Sequence[str]) -> pl.DataFrame:
-        return frame.select((cs.by_name(columns) & cs.float()).cast(self._dtype, **self._kwargs))
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return (cs.by_name(columns) & cs.float()).cast(self._dtype, **self._kwargs)
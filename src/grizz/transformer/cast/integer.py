@@ -107,8 +107,8 @@ class IntegerCastTransformer(CastTransformer):
     ```
     """
 
-    def _cast(self, frame: pl.DataFrame, columns: Sequence[str]) -> pl.DataFrame:
-        return frame.select((cs.by_name(columns) & cs.integer()).cast(self._dtype, **self._kwargs))
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return (cs.by_name(columns) & cs.integer()).cast(self._dtype, **self._kwargs)
 
 
 class InplaceIntegerCastTransformer(InplaceCastTransformer):
@@ -189,5 +189,5 @@ class InplaceIntegerCastTransformer(InplaceCastTransformer):
     ```
     """
 
-    def _cast(self, frame: pl.DataFrame, columns: Sequence[str]) -> pl.DataFrame:
-        return frame.select((cs.by_name(columns) & cs.integer()).cast(self._dtype, **self._kwargs))
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return (cs.by_name(columns) & cs.integer()).cast(self._dtype, **self._kwargs)
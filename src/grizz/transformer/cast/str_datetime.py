@@ -133,13 +133,21 @@ class StringToDatetimeTransformer(BaseInNOutNTransformer):
     def get_args(self) -> dict:
         return super().get_args() | self._kwargs
 
+    def supports_batches(self) -> bool:
+        # The format is inferred from the data if it is not given, so
+        # it could be different for each batch.
+        return self._kwargs.get("format") is not None
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         columns = self.find_common_columns(frame)
         logger.info(f"Converting {len(columns):,} string columns to datetime columns...")
-        return frame.select((cs.by_name(columns) & cs.string()).str.to_datetime(**self._kwargs))
+        return frame.select(self._to_expr(columns))
+
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return (cs.by_name(columns) & cs.string()).str.to_datetime(**self._kwargs)
 
 
 class InplaceStringToDatetimeTransformer(StringToDatetimeTransformer):
@@ -125,16 +125,19 @@ class CastTransformer(BaseInNOutNTransformer):
     def get_args(self) -> dict:
         return super().get_args() | {"dtype": self._dtype} | self._kwargs
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         columns = self.find_common_columns(frame)
         logger.info(f"Casting {len(columns):,} columns to {self._dtype}...")
-        return self._cast(frame, columns)
+        return frame.select(self._to_expr(columns))
 
-    def _cast(self, frame: pl.DataFrame, columns: Sequence[str]) -> pl.DataFrame:
-        return frame.select(cs.by_name(columns).cast(self._dtype, **self._kwargs))
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return cs.by_name(columns).cast(self._dtype, **self._kwargs)
 
 
 class InplaceCastTransformer(CastTransformer):
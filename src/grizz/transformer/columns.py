@@ -16,6 +16,7 @@ import logging
 from abc import abstractmethod
 from typing import TYPE_CHECKING, Any
 
+import polars as pl
 from coola import objects_are_equal
 from coola.utils.format import repr_mapping_line
 from iden.utils.time import timeblock
@@ -31,13 +32,13 @@ from grizz.utils.column import (
     find_common_columns,
     find_missing_columns,
 )
+from grizz.utils.diagnostics import is_diagnostics_enabled
 from grizz.utils.format import str_dataframe_diff
+from grizz.utils.profiling import profile_block
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
 
-    import polars as pl
-
 logger = logging.getLogger(__name__)
 
 
@@ -55,7 +56,11 @@ class BaseArgTransformer(BaseTransformer):
         return objects_are_equal(self.get_args(), other.get_args(), equal_nan=equal_nan)
 
     def fit(self, frame: pl.DataFrame) -> None:
-        with timeblock(f"{self.__class__.__qualname__}.fit - " + "time: {time}"):
+        name = f"{self.__class__.__qualname__}.fit"
+        with (
+            profile_block(name, category="fit", frame=frame),
+            timeblock(f"{name} - " + "time: {time}"),
+        ):
             self._fit_data(frame)
 
     def fit_transform(self, frame: pl.DataFrame) -> pl.DataFrame:
@@ -63,9 +68,18 @@ class BaseArgTransformer(BaseTransformer):
         return self.transform(frame)
 
     def transform(self, frame: pl.DataFrame) -> pl.DataFrame:
-        with timeblock(f"{self.__class__.__qualname__}.transform - " + "time: {time}"):
-            out = self._transform_data(frame)
-        logger.info(str_dataframe_diff(orig=frame, final=out))
+        name = f"{self.__class__.__qualname__}.transform"
+        with profile_block(name, category="transform", frame=frame) as record:
+            with timeblock(f"{name} - " + "time: {time}"):
+                out = self._transform_data(frame)
+            if record is not None:
+                record.set_output(out)
+        if is_diagnostics_enabled(logger=logger):
+            logger.info(
+                str_dataframe_diff(
+                    orig=frame, final=out, estimated_size=is_diagnostics_enabled("full")
+                )
+            )
         return out
 
     @abstractmethod
@@ -76,6 +90,39 @@ class BaseArgTransformer(BaseTransformer):
             The arguments of the transformer.
         """
 
+    def to_exprs(self, schema: pl.Schema) -> list[pl.Expr] | None:  # noqa: ARG002
+        r"""Get the ``polars`` expressions equivalent to the
+        transformation.
+
+        The expressions can be passed to ``with_columns`` to apply the
+        transformation. This is only possible for stateless
+        transformers that add or replace columns without changing the
+        number of rows.
+
+        Args:
+            schema: The schema of the DataFrame to transform.
+
+        Returns:
+            The expressions to pass to ``with_columns``, or ``None``
+                if the transformation cannot be represented by
+                expressions.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.transformer import CopyColumn
+        >>> transformer = CopyColumn(in_col="col1", out_col="out")
+        >>> frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+        >>> exprs = transformer.to_exprs(frame.schema)
+        >>> frame.with_columns(exprs).columns
+        ['col1', 'col2', 'out']
+
+        ```
+        """
+        return None
+
     @abstractmethod
     def _fit_data(self, frame: pl.DataFrame) -> None:
         r"""Fit to the data in the ``polars.DataFrame``.
@@ -158,6 +205,23 @@ class BaseIn1Out1Transformer(BaseArgTransformer):
         self._check_output_column(frame)
         return self._transform(frame)
 
+    def to_exprs(self, schema: pl.Schema) -> list[pl.Expr] | None:
+        expr = self._to_expr()
+        if expr is None:
+            return None
+        frame = pl.DataFrame(schema=schema)
+        self._check_input_column(frame)
+        if self._in_col not in frame:
+            return []
+        self._check_output_column(frame)
+        return [expr.alias(self._out_col)]
+
+    def get_input_columns(self) -> tuple[str, ...]:
+        return (self._in_col,)
+
+    def get_output_columns(self) -> tuple[str, ...]:
+        return (self._out_col,)
+
     def get_args(self) -> dict:
         return {
             "in_col": self._in_col,
@@ -201,6 +265,18 @@ class BaseIn1Out1Transformer(BaseArgTransformer):
             The transformed DataFrame.
         """
 
+    def _to_expr(self) -> pl.Expr | None:
+        r"""Get the ``polars`` expression that computes the output
+        column.
+
+        The output column name is set by the caller.
+
+        Returns:
+            The expression, or ``None`` if the transformation cannot
+                be represented by an expression.
+        """
+        return None
+
 
 class BaseIn2Out1Transformer(BaseArgTransformer):
     r"""Define a base class to implement ``polars.DataFrame``
@@ -325,6 +401,23 @@ class BaseIn2Out1Transformer(BaseArgTransformer):
         self._check_output_column(frame)
         return self._transform(frame)
 
+    def to_exprs(self, schema: pl.Schema) -> list[pl.Expr] | None:
+        expr = self._to_expr()
+        if expr is None:
+            return None
+        frame = pl.DataFrame(schema=schema)
+        self._check_input_columns(frame)
+        if self._in1_col not in frame or self._in2_col not in frame:
+            return []
+        self._check_output_column(frame)
+        return [expr.alias(self._out_col)]
+
+    def get_input_columns(self) -> tuple[str, ...]:
+        return (self._in1_col, self._in2_col)
+
+    def get_output_columns(self) -> tuple[str, ...]:
+        return (self._out_col,)
+
     def get_args(self) -> dict:
         return {
             "in1_col": self._in1_col,
@@ -370,6 +463,18 @@ class BaseIn2Out1Transformer(BaseArgTransformer):
             The transformed DataFrame.
         """
 
+    def _to_expr(self) -> pl.Expr | None:
+        r"""Get the ``polars`` expression that computes the output
+        column.
+
+        The output column name is set by the caller.
+
+        Returns:
+            The expression, or ``None`` if the transformation cannot
+                be represented by an expression.
+        """
+        return None
+
 
 class BaseInNTransformer(BaseArgTransformer):
     r"""Define a base class to implement ``polars.DataFrame``
@@ -464,6 +569,14 @@ class BaseInNTransformer(BaseArgTransformer):
             "missing_policy": self._missing_policy,
         }
 
+    def get_input_columns(self) -> tuple[str, ...] | None:
+        if self._columns is None:
+            return None
+        return tuple(col for col in self._columns if col not in self._exclude_columns)
+
+    def get_output_columns(self) -> tuple[str, ...] | None:
+        return ()
+
     def find_columns(self, frame: pl.DataFrame) -> tuple[str, ...]:
         r"""Find the columns to transform.
 
@@ -606,6 +719,21 @@ class BaseInNTransformer(BaseArgTransformer):
             The transformed DataFrame.
         """
 
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr | None:  # noqa: ARG002
+        r"""Get the ``polars`` expression that computes the output
+        column(s).
+
+        The output column names are set by the caller.
+
+        Args:
+            columns: The input columns to transform.
+
+        Returns:
+            The expression, or ``None`` if the transformation cannot
+                be represented by an expression.
+        """
+        return None
+
 
 class BaseInNOut1Transformer(BaseInNTransformer):
     r"""Define a base class to implement ``polars.DataFrame``
@@ -710,6 +838,18 @@ class BaseInNOut1Transformer(BaseInNTransformer):
         self._check_output_column(frame)
         return self._transform(frame)
 
+    def to_exprs(self, schema: pl.Schema) -> list[pl.Expr] | None:
+        frame = pl.DataFrame(schema=schema)
+        expr = self._to_expr(self.find_common_columns(frame))
+        if expr is None:
+            return None
+        self._check_input_columns(frame)
+        self._check_output_column(frame)
+        return [expr.alias(self._out_col)]
+
+    def get_output_columns(self) -> tuple[str, ...]:
+        return (self._out_col,)
+
     def get_args(self) -> dict:
         return {
             "columns": self._columns,
@@ -833,6 +973,23 @@ class BaseInNOutNTransformer(BaseInNTransformer):
         out = self._transform(frame)
         return frame.with_columns(out.rename(lambda col: f"{self._prefix}{col}{self._suffix}"))
 
+    def to_exprs(self, schema: pl.Schema) -> list[pl.Expr] | None:
+        frame = pl.DataFrame(schema=schema)
+        expr = self._to_expr(self.find_common_columns(frame))
+        if expr is None:
+            return None
+        self._check_input_columns(frame)
+        self._check_output_column(frame)
+        if self._prefix or self._suffix:
+            expr = expr.name.map(lambda col: f"{self._prefix}{col}{self._suffix}")
+        return [expr]
+
+    def get_output_columns(self) -> tuple[str, ...] | None:
+        columns = self.get_input_columns()
+        if columns is None:
+            return None
+        return tuple(f"{self._prefix}{col}{self._suffix}" for col in columns)
+
     def get_args(self) -> dict:
         return {
             "columns": self._columns,
@@ -6,15 +6,13 @@ from __future__ import annotations
 __all__ = ["ColumnCloseTransformer"]
 
 import logging
-from typing import TYPE_CHECKING
+
+import polars as pl
 
 from grizz.transformer.columns import BaseIn2Out1Transformer
 from grizz.transformer.utils import get_classname, message_skip_fit
 from grizz.utils.format import str_boolean_series_stats
 
-if TYPE_CHECKING:
-    import polars as pl
-
 logger = logging.getLogger(__name__)
 
 
@@ -135,6 +133,9 @@ class ColumnCloseTransformer(BaseIn2Out1Transformer):
             "missing_policy": self._missing_policy,
         }
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -144,12 +145,15 @@ class ColumnCloseTransformer(BaseIn2Out1Transformer):
             f"and expected column {self._in2_col!r} | out_col={self._out_col!r} | "
             f"atol={self._atol}  rtol={self._rtol}  equal_nan={self._equal_nan}"
         )
-        diff = (frame[self._in1_col] - frame[self._in2_col]).abs()
-        tol = frame[self._in2_col].abs() * self._rtol + self._atol
-        tol_check = (diff <= tol) & ~frame[self._in2_col].is_nan()
+        tol_check = frame.select(self._to_expr().alias(self._out_col)).to_series()
+        logger.info(f"column: {self._out_col!r} | {str_boolean_series_stats(tol_check)}")
+        return frame.with_columns(tol_check)
 
+    def _to_expr(self) -> pl.Expr:
+        actual, expected = pl.col(self._in1_col), pl.col(self._in2_col)
+        diff = (actual - expected).abs()
+        tol = expected.abs() * self._rtol + self._atol
+        tol_check = (diff <= tol) & ~expected.is_nan()
         if self._equal_nan:
-            nan_check = frame[self._in1_col].is_nan() & frame[self._in2_col].is_nan()
-            tol_check = tol_check | nan_check
-        logger.info(f"column: {self._out_col!r} | {str_boolean_series_stats(tol_check)}")
-        return frame.with_columns(tol_check.alias(self._out_col))
+            tol_check = tol_check | (actual.is_nan() & expected.is_nan())
+        return tol_check
@@ -29,6 +29,9 @@ class BaseColumnComparatorTransformer(BaseIn2Out1Transformer):
     r"""Define a base class to compare element-wise two columns of a
     DataFrame."""
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -110,9 +113,10 @@ class ColumnEqualTransformer(BaseColumnComparatorTransformer):
             f"Applying the equal operation between {self._in1_col!r} "
             f"and {self._in2_col!r} | out_col={self._out_col!r}"
         )
-        return frame.with_columns(
-            pl.col(self._in1_col).eq(pl.col(self._in2_col)).alias(self._out_col)
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in1_col).eq(pl.col(self._in2_col))
 
 
 class ColumnEqualMissingTransformer(BaseColumnComparatorTransformer):
@@ -192,9 +196,10 @@ class ColumnEqualMissingTransformer(BaseColumnComparatorTransformer):
             f"Applying the equal missing operation between {self._in1_col!r} "
             f"and {self._in2_col!r} | out_col={self._out_col!r}"
         )
-        return frame.with_columns(
-            pl.col(self._in1_col).eq_missing(pl.col(self._in2_col)).alias(self._out_col)
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in1_col).eq_missing(pl.col(self._in2_col))
 
 
 class ColumnGreaterEqualTransformer(BaseColumnComparatorTransformer):
@@ -274,9 +279,10 @@ class ColumnGreaterEqualTransformer(BaseColumnComparatorTransformer):
             f"Applying the greater than or equal operation between {self._in1_col!r} "
             f"and {self._in2_col!r} | out_col={self._out_col!r}"
         )
-        return frame.with_columns(
-            pl.col(self._in1_col).ge(pl.col(self._in2_col)).alias(self._out_col)
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in1_col).ge(pl.col(self._in2_col))
 
 
 class ColumnGreaterTransformer(BaseColumnComparatorTransformer):
@@ -356,9 +362,10 @@ class ColumnGreaterTransformer(BaseColumnComparatorTransformer):
             f"Applying the greater than operation between {self._in1_col!r} "
             f"and {self._in2_col!r} | out_col={self._out_col!r}"
         )
-        return frame.with_columns(
-            pl.col(self._in1_col).gt(pl.col(self._in2_col)).alias(self._out_col)
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in1_col).gt(pl.col(self._in2_col))
 
 
 class ColumnLowerEqualTransformer(BaseColumnComparatorTransformer):
@@ -438,9 +445,10 @@ class ColumnLowerEqualTransformer(BaseColumnComparatorTransformer):
             f"Applying the lower than or equal operation between {self._in1_col!r} "
             f"and {self._in2_col!r} | out_col={self._out_col!r}"
         )
-        return frame.with_columns(
-            pl.col(self._in1_col).le(pl.col(self._in2_col)).alias(self._out_col)
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in1_col).le(pl.col(self._in2_col))
 
 
 class ColumnLowerTransformer(BaseColumnComparatorTransformer):
@@ -520,9 +528,10 @@ class ColumnLowerTransformer(BaseColumnComparatorTransformer):
             f"Applying the lower than operation between {self._in1_col!r} "
             f"and {self._in2_col!r} | out_col={self._out_col!r}"
         )
-        return frame.with_columns(
-            pl.col(self._in1_col).lt(pl.col(self._in2_col)).alias(self._out_col)
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in1_col).lt(pl.col(self._in2_col))
 
 
 class ColumnNotEqualTransformer(BaseColumnComparatorTransformer):
@@ -602,9 +611,10 @@ class ColumnNotEqualTransformer(BaseColumnComparatorTransformer):
             f"Applying the not equal operation between {self._in1_col!r} "
             f"and {self._in2_col!r} | out_col={self._out_col!r}"
         )
-        return frame.with_columns(
-            pl.col(self._in1_col).ne(pl.col(self._in2_col)).alias(self._out_col)
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in1_col).ne(pl.col(self._in2_col))
 
 
 class ColumnNotEqualMissingTransformer(BaseColumnComparatorTransformer):
@@ -685,6 +695,7 @@ class ColumnNotEqualMissingTransformer(BaseColumnComparatorTransformer):
             f"Applying the not equal missing operation between {self._in1_col!r} "
             f"and {self._in2_col!r} | out_col={self._out_col!r}"
         )
-        return frame.with_columns(
-            pl.col(self._in1_col).ne_missing(pl.col(self._in2_col)).alias(self._out_col)
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in1_col).ne_missing(pl.col(self._in2_col))
@@ -20,6 +20,7 @@ from abc import abstractmethod
 from typing import TYPE_CHECKING, Any
 
 import polars as pl
+import polars.selectors as cs
 
 from grizz.transformer.columns import BaseInNOutNTransformer
 from grizz.transformer.utils import get_classname, message_skip_fit
@@ -84,6 +85,9 @@ class BaseComparatorTransformer(BaseInNOutNTransformer):
     def get_args(self) -> dict:
         return super().get_args() | {"target": self._target}
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -93,18 +97,21 @@ class BaseComparatorTransformer(BaseInNOutNTransformer):
             f"Applying the {self._get_operation_name()} operation on "
             f"{len(columns):,} columns | prefix={self._prefix!r} | suffix={self._suffix!r}"
         )
-        return self._compare(frame.select(columns))
+        return frame.select(self._to_expr(columns))
+
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return self._compare(cs.by_name(columns))
 
     @abstractmethod
-    def _compare(self, frame: pl.DataFrame) -> pl.DataFrame:
+    def _compare(self, expr: pl.Expr) -> pl.Expr:
         r"""Generate the comparison results.
 
         Args:
-            frame: The DataFrame to compare.
+            expr: The expression with the columns to compare.
 
         Returns:
-            A DataFrame with the same shape and columns as the input,
-                but that contains the result of the comparison.
+            An expression that contains the result of the comparison
+                for each input column.
         """
 
     @abstractmethod
@@ -193,8 +200,8 @@ class EqualTransformer(BaseComparatorTransformer):
     ```
     """
 
-    def _compare(self, frame: pl.DataFrame) -> pl.DataFrame:
-        return frame.select(pl.all().eq(self._target))
+    def _compare(self, expr: pl.Expr) -> pl.Expr:
+        return expr.eq(self._target)
 
     def _get_operation_name(self) -> str:
         return "equal"
@@ -278,8 +285,8 @@ class EqualMissingTransformer(BaseComparatorTransformer):
     ```
     """
 
-    def _compare(self, frame: pl.DataFrame) -> pl.DataFrame:
-        return frame.select(pl.all().eq_missing(self._target))
+    def _compare(self, expr: pl.Expr) -> pl.Expr:
+        return expr.eq_missing(self._target)
 
     def _get_operation_name(self) -> str:
         return "equal missing"
@@ -365,8 +372,8 @@ class GreaterEqualTransformer(BaseComparatorTransformer):
     ```
     """
 
-    def _compare(self, frame: pl.DataFrame) -> pl.DataFrame:
-        return frame.select(pl.all().ge(self._target))
+    def _compare(self, expr: pl.Expr) -> pl.Expr:
+        return expr.ge(self._target)
 
     def _get_operation_name(self) -> str:
         return "greater than or equal"
@@ -450,8 +457,8 @@ class GreaterTransformer(BaseComparatorTransformer):
     ```
     """
 
-    def _compare(self, frame: pl.DataFrame) -> pl.DataFrame:
-        return frame.select(pl.all().gt(self._target))
+    def _compare(self, expr: pl.Expr) -> pl.Expr:
+        return expr.gt(self._target)
 
     def _get_operation_name(self) -> str:
         return "greater than"
@@ -535,8 +542,8 @@ class LowerEqualTransformer(BaseComparatorTransformer):
     ```
     """
 
-    def _compare(self, frame: pl.DataFrame) -> pl.DataFrame:
-        return frame.select(pl.all().le(self._target))
+    def _compare(self, expr: pl.Expr) -> pl.Expr:
+        return expr.le(self._target)
 
     def _get_operation_name(self) -> str:
         return "lower than or equal"
@@ -619,8 +626,8 @@ class LowerTransformer(BaseComparatorTransformer):
     ```
     """
 
-    def _compare(self, frame: pl.DataFrame) -> pl.DataFrame:
-        return frame.select(pl.all().lt(self._target))
+    def _compare(self, expr: pl.Expr) -> pl.Expr:
+        return expr.lt(self._target)
 
     def _get_operation_name(self) -> str:
         return "lower than"
@@ -703,8 +710,8 @@ class NotEqualTransformer(BaseComparatorTransformer):
     ```
     """
 
-    def _compare(self, frame: pl.DataFrame) -> pl.DataFrame:
-        return frame.select(pl.all().ne(self._target))
+    def _compare(self, expr: pl.Expr) -> pl.Expr:
+        return expr.ne(self._target)
 
     def _get_operation_name(self) -> str:
         return "not equal"
@@ -790,8 +797,8 @@ class NotEqualMissingTransformer(BaseComparatorTransformer):
     ```
     """
 
-    def _compare(self, frame: pl.DataFrame) -> pl.DataFrame:
-        return frame.select(pl.all().ne_missing(self._target))
+    def _compare(self, expr: pl.Expr) -> pl.Expr:
+        return expr.ne_missing(self._target)
 
     def _get_operation_name(self) -> str:
         return "not equal missing"
@@ -5,6 +5,7 @@ from __future__ import annotations
 __all__ = ["ConcatColumnsTransformer"]
 
 import logging
+from typing import TYPE_CHECKING
 
 import polars as pl
 import polars.selectors as cs
@@ -12,6 +13,9 @@ import polars.selectors as cs
 from grizz.transformer.columns import BaseInNOut1Transformer
 from grizz.transformer.utils import get_classname, message_skip_fit
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 logger = logging.getLogger(__name__)
 
 
@@ -92,10 +96,16 @@ class ConcatColumnsTransformer(BaseInNOut1Transformer):
     ```
     """
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         columns = self.find_common_columns(frame)
         logger.info(f"Concatenating {len(columns):,} columns to {self._out_col!r} ...")
-        return frame.with_columns(pl.concat_list(cs.by_name(columns).alias(self._out_col)))
+        return frame.with_columns(self._to_expr(columns).alias(self._out_col))
+
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return pl.concat_list(cs.by_name(columns))
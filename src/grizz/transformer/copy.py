@@ -5,12 +5,17 @@ from __future__ import annotations
 __all__ = ["CopyColumnTransformer", "CopyColumnsTransformer"]
 
 import logging
+from typing import TYPE_CHECKING
 
 import polars as pl
+import polars.selectors as cs
 
 from grizz.transformer.columns import BaseIn1Out1Transformer, BaseInNOutNTransformer
 from grizz.transformer.utils import get_classname, message_skip_fit
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 logger = logging.getLogger(__name__)
 
 
@@ -85,12 +90,18 @@ class CopyColumnTransformer(BaseIn1Out1Transformer):
     ```
     """
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         logger.info(f"Copying column {self._in_col!r} to {self._out_col!r} ...")
-        return frame.with_columns(pl.col(self._in_col).alias(self._out_col))
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in_col)
 
 
 class CopyColumnsTransformer(BaseInNOutNTransformer):
@@ -169,6 +180,9 @@ class CopyColumnsTransformer(BaseInNOutNTransformer):
     ```
     """
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -178,4 +192,7 @@ class CopyColumnsTransformer(BaseInNOutNTransformer):
             f"Copying {len(columns):,} columns | prefix={self._prefix!r} | "
             f"suffix={self._suffix!r} ..."
         )
-        return frame.select(columns)
+        return frame.select(self._to_expr(columns))
+
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return cs.by_name(columns)
@@ -111,9 +111,10 @@ class DiffTransformer(BaseIn1Out1Transformer):
             f"Computing the first discrete difference between shifted items | "
             f"in_col={self._in_col!r} | out_col={self._out_col!r} | shift={self._shift}"
         )
-        return frame.with_columns(
-            frame.select(pl.col(self._in_col).diff(n=self._shift).alias(self._out_col))
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in_col).diff(n=self._shift)
 
 
 class TimeDiffTransformer(BaseArgTransformer):
@@ -89,6 +89,9 @@ class AbsDiffHorizontalTransformer(BaseIn2Out1Transformer):
     ```
     """
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -97,9 +100,10 @@ class AbsDiffHorizontalTransformer(BaseIn2Out1Transformer):
             f"Computing the absolute difference between {self._in1_col!r} and "
             f"{self._in2_col!r} | out_col={self._out_col!r}"
         )
-        return frame.with_columns(
-            frame.select((pl.col(self._in1_col) - pl.col(self._in2_col)).abs().alias(self._out_col))
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return (pl.col(self._in1_col) - pl.col(self._in2_col)).abs()
 
 
 class DiffHorizontalTransformer(BaseIn2Out1Transformer):
@@ -176,6 +180,9 @@ class DiffHorizontalTransformer(BaseIn2Out1Transformer):
     ```
     """
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -184,6 +191,7 @@ class DiffHorizontalTransformer(BaseIn2Out1Transformer):
             f"Computing the difference between {self._in1_col!r} and "
             f"{self._in2_col!r} | out_col={self._out_col!r}"
         )
-        return frame.with_columns(
-            frame.select((pl.col(self._in1_col) - pl.col(self._in2_col)).alias(self._out_col))
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in1_col) - pl.col(self._in2_col)
@@ -127,13 +127,21 @@ class FillNanTransformer(BaseInNOutNTransformer):
     def get_args(self) -> dict:
         return super().get_args() | self._kwargs
 
+    def supports_batches(self) -> bool:
+        # A fill value expression (e.g. ``pl.col("col").mean()``) can
+        # depend on the whole column.
+        return not isinstance(self._kwargs.get("value"), pl.Expr)
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         columns = self.find_common_columns(frame)
         logger.info(f"Filling NaN values of {len(columns):,} columns...")
-        return frame.select((cs.by_name(columns) & cs.float()).fill_nan(**self._kwargs))
+        return frame.select(self._to_expr(columns))
+
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return (cs.by_name(columns) & cs.float()).fill_nan(**self._kwargs)
 
 
 class InplaceFillNanTransformer(FillNanTransformer):
@@ -331,13 +339,22 @@ class FillNullTransformer(BaseInNOutNTransformer):
     def get_args(self) -> dict:
         return super().get_args() | self._kwargs
 
+    def supports_batches(self) -> bool:
+        # The fill strategies (e.g. ``'forward'`` or ``'mean'``) and
+        # the fill value expressions (e.g. ``pl.col("col").mean()``)
+        # can depend on the whole column.
+        return "strategy" not in self._kwargs and not isinstance(self._kwargs.get("value"), pl.Expr)
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         columns = self.find_common_columns(frame)
         logger.info(f"Filling NaN values of {len(columns):,} columns...")
-        return frame.select(cs.by_name(columns).fill_null(**self._kwargs))
+        return frame.select(self._to_expr(columns))
+
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return cs.by_name(columns).fill_null(**self._kwargs)
 
 
 class InplaceFillNullTransformer(FillNullTransformer):
@@ -0,0 +1,366 @@
+r"""Contain ``polars.DataFrame`` transformers to filter the rows of
+DataFrames."""
+
+from __future__ import annotations
+
+__all__ = [
+    "BaseFilterTransformer",
+    "FilterIsInTransformer",
+    "FilterRangeTransformer",
+    "FilterTransformer",
+]
+
+import logging
+import operator
+from abc import abstractmethod
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+from coola.utils.format import repr_mapping_line
+
+from grizz.transformer.columns import BaseArgTransformer
+from grizz.transformer.utils import get_classname, message_skip_fit
+from grizz.utils.hive import make_column_filter
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+logger = logging.getLogger(__name__)
+
+_COMPARISON_OPERATORS = (
+    operator.eq,
+    operator.ne,
+    operator.lt,
+    operator.le,
+    operator.gt,
+    operator.ge,
+)
+
+_LOGICAL_OPERATORS = (operator.and_, operator.or_)
+
+
+class BaseFilterTransformer(BaseArgTransformer):
+    r"""Define a base class to implement transformers that only keep
+    the rows matching a predicate.
+
+    The columns are not changed, so the predicate can also be applied
+    when the data is ingested (see ``BaseTransformer.get_row_filter``)
+    if it is evaluated row by row, i.e. if it only combines
+    comparisons, ``is_in``, ``is_between`` and null checks of columns
+    and literals.
+    """
+
+    def _fit_data(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
+        logger.info(message_skip_fit(get_classname(self)))
+
+    def _transform_data(self, frame: pl.DataFrame) -> pl.DataFrame:
+        logger.info(f"Filtering the rows of the DataFrame of shape={frame.shape}...")
+        return frame.filter(self.get_predicate())
+
+    def get_input_columns(self) -> tuple[str, ...] | None:
+        return tuple(dict.fromkeys(self.get_predicate().meta.root_names()))
+
+    def get_output_columns(self) -> tuple[str, ...] | None:
+        return ()
+
+    def supports_batches(self) -> bool:
+        return True
+
+    def get_row_filter(self) -> pl.Expr | None:
+        predicate = self.get_predicate()
+        return predicate if _is_row_predicate(predicate) else None
+
+    @abstractmethod
+    def get_predicate(self) -> pl.Expr:
+        r"""Get the predicate of the rows to keep.
+
+        Returns:
+            The predicate expression.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.transformer import FilterRange
+        >>> transformer = FilterRange(col="col1", start=2, end=4)
+        >>> frame = pl.DataFrame({"col1": [1, 2, 3, 4, 5]})
+        >>> frame.filter(transformer.get_predicate())["col1"].to_list()
+        [2, 3]
+
+        ```
+        """
+
+
+class FilterTransformer(BaseFilterTransformer):
+    r"""Implement a transformer that only keeps the rows matching a
+    predicate.
+
+    The rows are only filtered before the transformation (see
+    ``BaseTransformer.get_row_filter``) if the predicate is evaluated
+    row by row. A predicate that depends on other rows, for example
+    a comparison to an aggregation of a column, is only applied when
+    the DataFrame is transformed.
+
+    Args:
+        predicate: The predicate of the rows to keep. It can be a
+            ``polars`` expression or a SQL expression, for example
+            ``"col1 > 2 AND col4 IN ('a', 'b')"``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.transformer import Filter
+    >>> transformer = Filter(predicate="col1 > 2 AND col4 != 'e'")
+    >>> transformer
+    FilterTransformer(predicate="col1 > 2 AND col4 != 'e'")
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["1", "2", "3", "4", "5"],
+    ...         "col4": ["a", "b", "c", "d", "e"],
+    ...     }
+    ... )
+    >>> frame
+    shape: (5, 4)
+    ┌──────┬──────┬──────┬──────┐
+    │ col1 ┆ col2 ┆ col3 ┆ col4 │
+    │ ---  ┆ ---  ┆ ---  ┆ ---  │
+    │ i64  ┆ str  ┆ str  ┆ str  │
+    ╞══════╪══════╪══════╪══════╡
+    │ 1    ┆ 1    ┆ 1    ┆ a    │
+    │ 2    ┆ 2    ┆ 2    ┆ b    │
+    │ 3    ┆ 3    ┆ 3    ┆ c    │
+    │ 4    ┆ 4    ┆ 4    ┆ d    │
+    │ 5    ┆ 5    ┆ 5    ┆ e    │
+    └──────┴──────┴──────┴──────┘
+    >>> out = transformer.transform(frame)
+    >>> out
+    shape: (2, 4)
+    ┌──────┬──────┬──────┬──────┐
+    │ col1 ┆ col2 ┆ col3 ┆ col4 │
+    │ ---  ┆ ---  ┆ ---  ┆ ---  │
+    │ i64  ┆ str  ┆ str  ┆ str  │
+    ╞══════╪══════╪══════╪══════╡
+    │ 3    ┆ 3    ┆ 3    ┆ c    │
+    │ 4    ┆ 4    ┆ 4    ┆ d    │
+    └──────┴──────┴──────┴──────┘
+
+    ```
+    """
+
+    def __init__(self, predicate: pl.Expr | str) -> None:
+        self._predicate = predicate
+
+    def __repr__(self) -> str:
+        args = repr_mapping_line({"predicate": str(self._predicate)})
+        return f"{self.__class__.__qualname__}({args})"
+
+    def equal(self, other: Any, equal_nan: bool = False) -> bool:  # noqa: ARG002
+        if not isinstance(other, self.__class__):
+            return False
+        return self.get_predicate().meta.eq(other.get_predicate())
+
+    def get_args(self) -> dict:
+        return {"predicate": self._predicate}
+
+    def get_predicate(self) -> pl.Expr:
+        if isinstance(self._predicate, str):
+            return pl.sql_expr(self._predicate)
+        return self._predicate
+
+
+class FilterRangeTransformer(BaseFilterTransformer):
+    r"""Implement a transformer that only keeps the rows where the
+    value of a column is in a range.
+
+    The rows with a null value are removed.
+
+    Args:
+        col: The column to filter on.
+        start: The start of the range (included). If ``None``, the
+            range has no lower bound.
+        end: The end of the range (excluded). If ``None``, the range
+            has no upper bound.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.transformer import FilterRange
+    >>> transformer = FilterRange(col="col1", start=2, end=4)
+    >>> transformer
+    FilterRangeTransformer(col='col1', start=2, end=4)
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["1", "2", "3", "4", "5"],
+    ...         "col4": ["a", "b", "c", "d", "e"],
+    ...     }
+    ... )
+    >>> out = transformer.transform(frame)
+    >>> out
+    shape: (2, 4)
+    ┌──────┬──────┬──────┬──────┐
+    │ col1 ┆ col2 ┆ col3 ┆ col4 │
+    │ ---  ┆ ---  ┆ ---  ┆ ---  │
+    │ i64  ┆ str  ┆ str  ┆ str  │
+    ╞══════╪══════╪══════╪══════╡
+    │ 2    ┆ 2    ┆ 2    ┆ b    │
+    │ 3    ┆ 3    ┆ 3    ┆ c    │
+    └──────┴──────┴──────┴──────┘
+
+    ```
+    """
+
+    def __init__(self, col: str, start: Any = None, end: Any = None) -> None:
+        self._col = col
+        self._start = start
+        self._end = end
+
+    def get_args(self) -> dict:
+        return {"col": self._col, "start": self._start, "end": self._end}
+
+    def get_predicate(self) -> pl.Expr:
+        return make_column_filter(self._col, {"start": self._start, "end": self._end})
+
+
+class FilterIsInTransformer(BaseFilterTransformer):
+    r"""Implement a transformer that only keeps the rows where the
+    value of a column is in a set of values.
+
+    Args:
+        col: The column to filter on.
+        values: The accepted values. ``None`` accepts the null
+            values.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.transformer import FilterIsIn
+    >>> transformer = FilterIsIn(col="col4", values=["a", "c", "e"])
+    >>> transformer
+    FilterIsInTransformer(col='col4', values=('a', 'c', 'e'))
+    >>> frame = pl.DataFrame(
+    ...     {
+    ...         "col1": [1, 2, 3, 4, 5],
+    ...         "col2": ["1", "2", "3", "4", "5"],
+    ...         "col3": ["1", "2", "3", "4", "5"],
+    ...         "col4": ["a", "b", "c", "d", "e"],
+    ...     }
+    ... )
+    >>> out = transformer.transform(frame)
+    >>> out
+    shape: (3, 4)
+    ┌──────┬──────┬──────┬──────┐
+    │ col1 ┆ col2 ┆ col3 ┆ col4 │
+    │ ---  ┆ ---  ┆ ---  ┆ ---  │
+    │ i64  ┆ str  ┆ str  ┆ str  │
+    ╞══════╪══════╪══════╪══════╡
+    │ 1    ┆ 1    ┆ 1    ┆ a    │
+    │ 3    ┆ 3    ┆ 3    ┆ c    │
+    │ 5    ┆ 5    ┆ 5    ┆ e    │
+    └──────┴──────┴──────┴──────┘
+
+    ```
+    """
+
+    def __init__(self, col: str, values: Sequence) -> None:
+        self._col = col
+        self._values = tuple(values)
+
+    def get_args(self) -> dict:
+        return {"col": self._col, "values": self._values}
+
+    def get_predicate(self) -> pl.Expr:
+        return make_column_filter(self._col, self._values)
+
+
+def _is_row_predicate(expr: pl.Expr) -> bool:
+    r"""Indicate if a predicate is evaluated row by row.
+
+    The predicate is matched against an explicit set of operations
+    with ``polars.Expr.meta.eq``: the conjunctions, disjunctions and
+    negations of comparisons, ``is_in``, ``is_between`` and null
+    checks of columns and scalar literals. The other predicates, for
+    example the aggregations or the window expressions, may depend on
+    the other rows.
+
+    Args:
+        expr: The predicate.
+
+    Returns:
+        ``True`` if the predicate is evaluated row by row,
+            otherwise ``False``.
+    """
+    if expr.meta.is_literal():
+        return _is_scalar_literal(expr)
+    inputs = expr.meta.pop()
+    if len(inputs) == 2:
+        # The inputs are returned in the reverse order.
+        right, left = inputs
+        if any(expr.meta.eq(op(left, right)) for op in _LOGICAL_OPERATORS):
+            return _is_row_predicate(left) and _is_row_predicate(right)
+    if len(inputs) == 1:
+        (value,) = inputs
+        if expr.meta.eq(~value) or expr.meta.eq(value.cast(pl.Boolean)):
+            return _is_row_predicate(value)
+    return _is_row_condition(expr, inputs)
+
+
+def _is_row_condition(expr: pl.Expr, inputs: Sequence[pl.Expr]) -> bool:
+    r"""Indicate if a condition is a comparison, a ``is_in``, a
+    ``is_between`` or a null check of columns and scalar literals.
+
+    Args:
+        expr: The condition.
+        inputs: The inputs of the condition.
+
+    Returns:
+        ``True`` if the condition is evaluated row by row,
+            otherwise ``False``.
+    """
+    if len(inputs) == 1:
+        (column,) = inputs
+        return column.meta.is_column() and (
+            expr.meta.eq(column.is_null()) or expr.meta.eq(column.is_not_null())
+        )
+    if len(inputs) == 2:
+        right, left = inputs
+        if any(expr.meta.eq(op(left, right)) for op in _COMPARISON_OPERATORS):
+            return all(
+                value.meta.is_column() or _is_scalar_literal(value) for value in (left, right)
+            )
+        return left.meta.is_column() and right.meta.is_literal() and expr.meta.eq(left.is_in(right))
+    if len(inputs) == 3:
+        upper, lower, column = inputs
+        return (
+            column.meta.is_column()
+            and all(_is_scalar_literal(value) for value in (lower, upper))
+            and any(
+                expr.meta.eq(column.is_between(lower, upper, closed=closed))
+                for closed in ("both", "left", "right", "none")
+            )
+        )
+    return False
+
+
+def _is_scalar_literal(expr: pl.Expr) -> bool:
+    r"""Indicate if an expression is a literal with a single value.
+
+    Args:
+        expr: The expression.
+
+    Returns:
+        ``True`` if the expression is a scalar literal, otherwise
+            ``False``.
+    """
+    return expr.meta.is_literal() and pl.select(expr).height == 1
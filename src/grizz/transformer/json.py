@@ -124,13 +124,21 @@ class JsonDecodeTransformer(BaseInNOutNTransformer):
     def get_args(self) -> dict:
         return super().get_args() | self._kwargs
 
+    def supports_batches(self) -> bool:
+        # The data type is inferred from the data if it is not given,
+        # so it could be different for each batch.
+        return self._kwargs.get("dtype") is not None
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         columns = self.find_common_columns(frame)
         logger.info(f"Converting {len(columns):,} columns to JSON...")
-        return frame.select(
+        return frame.select(self._to_expr(columns))
+
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return (
             (cs.by_name(columns) & cs.string())
             .str.replace_all("'", '"')
             .str.json_decode(**self._kwargs)
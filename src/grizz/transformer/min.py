@@ -5,12 +5,16 @@ from __future__ import annotations
 __all__ = ["MinHorizontalTransformer"]
 
 import logging
+from typing import TYPE_CHECKING
 
 import polars as pl
 
 from grizz.transformer.columns import BaseInNOut1Transformer
 from grizz.transformer.utils import get_classname, message_skip_fit
 
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,6 +95,9 @@ class MinHorizontalTransformer(BaseInNOut1Transformer):
     ```
     """
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -100,4 +107,7 @@ class MinHorizontalTransformer(BaseInNOut1Transformer):
             f"Getting the minimum value across {len(columns):,} columns: {columns} "
             f"| out_col={self._out_col!r} ..."
         )
-        return frame.with_columns(pl.min_horizontal(columns).alias(self._out_col))
+        return frame.with_columns(self._to_expr(columns).alias(self._out_col))
+
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return pl.min_horizontal(columns)
@@ -13,6 +13,7 @@ import polars.selectors as cs
 
 from grizz.transformer.columns import BaseInNTransformer
 from grizz.transformer.utils import get_classname, message_skip_fit
+from grizz.utils.diagnostics import is_diagnostics_enabled
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
@@ -114,20 +115,23 @@ class DropNullColumnTransformer(BaseInNTransformer):
         logger.info(message_skip_fit(get_classname(self)))
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
-        logger.info(
-            f"Checking columns and dropping the columns that have too "
-            f"many null values (threshold={self._threshold})..."
-        )
+        if is_diagnostics_enabled(logger=logger):
+            logger.info(
+                f"Checking columns and dropping the columns that have too "
+                f"many null values (threshold={self._threshold})..."
+            )
         if frame.is_empty():
             return frame
         columns = self.find_common_columns(frame)
         pct = frame.select(columns).null_count() / frame.shape[0]
         cols = list(compress(pct.columns, (pct >= self._threshold).row(0)))
-        logger.info(
-            f"Dropping {len(cols):,} columns that have too "
-            f"many null values (threshold={self._threshold})..."
-        )
-        logger.info(f"dropped columns: {cols}")
+        if is_diagnostics_enabled(logger=logger):
+            logger.info(
+                f"Dropping {len(cols):,} columns that have too "
+                f"many null values (threshold={self._threshold})..."
+            )
+        if is_diagnostics_enabled("full", logger=logger):
+            logger.info(f"dropped columns: {cols}")
         return frame.drop(cols, **self._kwargs)
 
 
@@ -199,6 +203,9 @@ class DropNullRowTransformer(BaseInNTransformer):
     ```
     """
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -124,6 +124,9 @@ class ReplaceTransformer(BaseIn1Out1Transformer):
     def get_args(self) -> dict:
         return super().get_args() | self._kwargs
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -132,7 +135,10 @@ class ReplaceTransformer(BaseIn1Out1Transformer):
             f"Replacing values from column {self._in_col!r} and "
             f"saving output in {self._out_col!r} ..."
         )
-        return frame.with_columns(pl.col(self._in_col).replace(**self._kwargs).alias(self._out_col))
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in_col).replace(**self._kwargs)
 
 
 class InplaceReplaceTransformer(ReplaceTransformer):
@@ -328,6 +334,9 @@ class ReplaceStrictTransformer(BaseIn1Out1Transformer):
     def get_args(self) -> dict:
         return super().get_args() | self._kwargs
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -336,9 +345,10 @@ class ReplaceStrictTransformer(BaseIn1Out1Transformer):
             f"Replacing values from column {self._in_col!r} and "
             f"saving output in {self._out_col!r} ..."
         )
-        return frame.with_columns(
-            pl.col(self._in_col).replace_strict(**self._kwargs).alias(self._out_col)
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in_col).replace_strict(**self._kwargs)
 
 
 class InplaceReplaceStrictTransformer(ReplaceStrictTransformer):
@@ -12,6 +12,8 @@ from grizz.transformer.columns import BaseInNTransformer
 from grizz.transformer.utils import get_classname, message_skip_fit
 
 if TYPE_CHECKING:
+    from collections.abc import Sequence
+
     import polars as pl
 
 
@@ -70,6 +72,20 @@ class ColumnSelectionTransformer(BaseInNTransformer):
     ```
     """
 
+    def get_output_columns(self) -> tuple[str, ...] | None:
+        return self.get_input_columns()
+
+    def find_required_columns(
+        self,
+        columns: Sequence[str] | None = None,  # noqa: ARG002
+    ) -> tuple[str, ...] | None:
+        # All the selected columns are required, even if they are not
+        # used later, because the missing columns are checked.
+        return self.get_input_columns()
+
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
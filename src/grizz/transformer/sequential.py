@@ -5,18 +5,29 @@ from __future__ import annotations
 
 __all__ = ["SequentialTransformer"]
 
+import logging
 from typing import TYPE_CHECKING, Any
 
 from coola import objects_are_equal
 from coola.utils import repr_indent, repr_sequence, str_indent, str_sequence
+from iden.utils.time import timeblock
 
 from grizz.transformer.base import BaseTransformer, setup_transformer
+from grizz.transformer.columns import BaseArgTransformer
+from grizz.transformer.filter import BaseFilterTransformer
+from grizz.utils.cache import DiskFrameCache
+from grizz.utils.diagnostics import check_diagnostics_level, diagnostics_level
+from grizz.utils.hashing import hash_dataframe, hash_object, str_to_sha256
+from grizz.utils.profiling import profile_block
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Iterable, Iterator, Sequence
+    from pathlib import Path
 
     import polars as pl
 
+logger = logging.getLogger(__name__)
+
 
 class SequentialTransformer(BaseTransformer):
     r"""Implement a ``polars.DataFrame`` transformer to apply
@@ -24,6 +35,29 @@ class SequentialTransformer(BaseTransformer):
 
     Args:
         transformers: The transformers or their configurations.
+        fuse: If ``True``, the consecutive transformers that can be
+            represented by ``polars`` expressions (see
+            ``BaseArgTransformer.to_exprs``) are combined into a single
+            query plan, so the intermediate DataFrames are not
+            materialized. The output is the same as the step-by-step
+            execution.
+        diagnostics: The diagnostics level used when the transformers
+            are applied. The valid values are ``'off'``,
+            ``'summary'``, and ``'full'``. If ``None``, the global
+            diagnostics level is used. See
+            ``grizz.utils.diagnostics`` for more information.
+        cache: The path to a cache directory. If it is set, the
+            output of each transformer is stored in the Arrow IPC
+            format, and the longest prefix of the pipeline whose
+            transformers and input did not change is loaded from the
+            cache instead of being recomputed. The cache key of each
+            output combines a fingerprint of the input DataFrame with
+            the arguments and fitted state of all the previous
+            transformers. The ``fuse`` option is ignored if the cache
+            is used.
+        cache_max_size: The maximum size of the cache in bytes. When
+            the cache is full, the least recently used outputs are
+            removed. If ``None``, the cache size is not limited.
 
     Example usage:
 
@@ -81,8 +115,22 @@ class SequentialTransformer(BaseTransformer):
     ```
     """
 
-    def __init__(self, transformers: Sequence[BaseTransformer | dict]) -> None:
+    def __init__(
+        self,
+        transformers: Sequence[BaseTransformer | dict],
+        fuse: bool = False,
+        diagnostics: str | None = None,
+        cache: Path | str | None = None,
+        cache_max_size: int | None = None,
+    ) -> None:
         self._transformers = tuple(setup_transformer(transformer) for transformer in transformers)
+        self._fuse = bool(fuse)
+        if diagnostics is not None:
+            check_diagnostics_level(diagnostics)
+        self._diagnostics = diagnostics
+        self._cache = None
+        if cache is not None:
+            self._cache = DiskFrameCache(path=cache, max_size=cache_max_size)
 
     def __repr__(self) -> str:
         args = ""
@@ -99,18 +147,281 @@ class SequentialTransformer(BaseTransformer):
     def equal(self, other: Any, equal_nan: bool = False) -> bool:
         if not isinstance(other, self.__class__):
             return False
-        return objects_are_equal(self._transformers, other._transformers, equal_nan=equal_nan)
+        return (
+            self._fuse == other._fuse
+            and self._diagnostics == other._diagnostics
+            and _caches_are_equal(self._cache, other._cache)
+            and objects_are_equal(self._transformers, other._transformers, equal_nan=equal_nan)
+        )
 
     def fit(self, frame: pl.DataFrame) -> None:
-        for transformer in self._transformers:
-            transformer.fit(frame)
+        with (
+            profile_block(f"{self.__class__.__qualname__}.fit", category="fit", frame=frame),
+            diagnostics_level(self._diagnostics),
+        ):
+            for transformer in self._transformers:
+                transformer.fit(frame)
 
     def fit_transform(self, frame: pl.DataFrame) -> pl.DataFrame:
+        with (
+            profile_block(
+                f"{self.__class__.__qualname__}.fit_transform", category="fit", frame=frame
+            ) as record,
+            diagnostics_level(self._diagnostics),
+        ):
+            out = self._transform(frame, fit=True)
+            if record is not None:
+                record.set_output(out)
+        return out
+
+    def transform(self, frame: pl.DataFrame) -> pl.DataFrame:
+        with (
+            profile_block(
+                f"{self.__class__.__qualname__}.transform", category="transform", frame=frame
+            ) as record,
+            diagnostics_level(self._diagnostics),
+        ):
+            out = self._transform(frame, fit=False)
+            if record is not None:
+                record.set_output(out)
+        return out
+
+    def transform_batches(self, frames: Iterable[pl.DataFrame]) -> Iterator[pl.DataFrame]:
+        if self._fuse or self._diagnostics is not None or self._cache is not None:
+            return super().transform_batches(frames)
+        frames = iter(frames)
+        for transformer in self._transformers:
+            frames = transformer.transform_batches(frames)
+        return frames
+
+    def supports_batches(self) -> bool:
+        return all(transformer.supports_batches() for transformer in self._transformers)
+
+    def find_required_columns(self, columns: Sequence[str] | None = None) -> tuple[str, ...] | None:
+        r"""Find the columns of the input DataFrame that are required
+        to compute some columns of the output DataFrame.
+
+        The required columns are propagated from the last transformer
+        to the first one. A transformer that selects columns (for
+        example ``ColumnSelection``) limits the columns required by
+        the previous transformers.
+
+        Args:
+            columns: The output columns that are used after the
+                transformation. If ``None``, all the output columns
+                are used.
+
+        Returns:
+            The required input columns, or ``None`` if all the input
+                columns may be required.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.transformer import Sequential, ColumnSelection, CopyColumn, InplaceCast
+        >>> transformer = Sequential(
+        ...     [
+        ...         InplaceCast(columns=["col1"], dtype=pl.Float32),
+        ...         CopyColumn(in_col="col2", out_col="col3"),
+        ...         ColumnSelection(columns=["col1", "col3"]),
+        ...     ]
+        ... )
+        >>> transformer.find_required_columns()
+        ('col2', 'col1')
+
+        ```
+        """
+        for transformer in reversed(self._transformers):
+            columns = transformer.find_required_columns(columns)
+        return None if columns is None else tuple(columns)
+
+    def get_row_filter(self) -> pl.Expr | None:
+        r"""Get a predicate of the rows of the input DataFrame that are
+        required to compute the output DataFrame.
+
+        The predicates of the first transformers are combined while
+        they only filter rows (for example ``FilterRange``) row by
+        row. The predicates of the next transformers cannot be used
+        because they may depend on the previous transformations.
+
+        Returns:
+            The predicate, or ``None`` if all the rows may be
+                required.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.transformer import Sequential, FilterIsIn, FilterRange, InplaceCast
+        >>> transformer = Sequential(
+        ...     [
+        ...         FilterRange(col="col1", start=2),
+        ...         FilterIsIn(col="col2", values=["a", "b"]),
+        ...         InplaceCast(columns=["col1"], dtype=pl.Float32),
+        ...         FilterRange(col="col1", end=5),
+        ...     ]
+        ... )
+        >>> frame = pl.DataFrame(
+        ...     {"col1": [1, 2, 3, 4, 5, 6], "col2": ["a", "b", "c", "a", "b", "c"]}
+        ... )
+        >>> frame.filter(transformer.get_row_filter())["col1"].to_list()
+        [2, 4, 5]
+
+        ```
+        """
+        predicate = None
         for transformer in self._transformers:
-            frame = transformer.fit_transform(frame)
+            row_filter = transformer.get_row_filter()
+            if row_filter is None:
+                break
+            predicate = row_filter if predicate is None else predicate & row_filter
+            if not isinstance(transformer, BaseFilterTransformer):
+                break
+        return predicate
+
+    def _transform(self, frame: pl.DataFrame, fit: bool) -> pl.DataFrame:
+        r"""Transform the DataFrame with all the transformers.
+
+        Args:
+            frame: The ``polars.DataFrame`` to transform.
+            fit: If ``True``, the transformers are fitted before being
+                applied.
+
+        Returns:
+            The transformed DataFrame.
+        """
+        if self._cache is not None:
+            return self._cached_transform(frame, fit=fit)
+        if self._fuse:
+            return self._fused_transform(frame, fit=fit)
+        for transformer in self._transformers:
+            frame = transformer.fit_transform(frame) if fit else transformer.transform(frame)
         return frame
 
-    def transform(self, frame: pl.DataFrame) -> pl.DataFrame:
+    def _cached_transform(self, frame: pl.DataFrame, fit: bool) -> pl.DataFrame:
+        r"""Transform the DataFrame by loading the longest unchanged
+        prefix of the pipeline from the cache.
+
+        The transformers are always applied when they are fitted
+        because the fitting needs their input DataFrame, but their
+        outputs are stored in the cache.
+
+        Args:
+            frame: The ``polars.DataFrame`` to transform.
+            fit: If ``True``, the transformers are fitted before being
+                applied.
+
+        Returns:
+            The transformed DataFrame.
+        """
+        key = hash_dataframe(frame)
+        if fit:
+            for transformer in self._transformers:
+                frame = transformer.fit_transform(frame)
+                key = _get_step_key(key, transformer)
+                self._cache.set(key, frame)
+            return frame
+
+        keys = []
         for transformer in self._transformers:
+            key = _get_step_key(key, transformer)
+            keys.append(key)
+        start = 0
+        for i in reversed(range(len(keys))):
+            cached = self._cache.get(keys[i])
+            if cached is not None:
+                logger.info(f"Loaded the output of the first {i + 1:,} transformers from the cache")
+                frame, start = cached, i + 1
+                break
+        for transformer, key in zip(self._transformers[start:], keys[start:]):
             frame = transformer.transform(frame)
+            self._cache.set(key, frame)
+        return frame
+
+    def _fused_transform(self, frame: pl.DataFrame, fit: bool) -> pl.DataFrame:
+        r"""Transform the DataFrame by combining the consecutive
+        expression-based transformers into a single query plan.
+
+        The expression-based transformers are stateless, so there is
+        nothing to fit for them.
+
+        Args:
+            frame: The ``polars.DataFrame`` to transform.
+            fit: If ``True``, the other transformers are fitted before
+                being applied.
+
+        Returns:
+            The transformed DataFrame.
+        """
+        plan, num_fused = None, 0
+        for transformer in self._transformers:
+            exprs = None
+            if isinstance(transformer, BaseArgTransformer):
+                schema = frame.schema if plan is None else plan.collect_schema()
+                exprs = transformer.to_exprs(schema)
+            if exprs is not None:
+                if plan is None:
+                    plan = frame.lazy()
+                if exprs:
+                    plan = plan.with_columns(exprs)
+                num_fused += 1
+                continue
+            if plan is not None:
+                frame = _collect_fused(plan, num_fused)
+                plan, num_fused = None, 0
+            frame = transformer.fit_transform(frame) if fit else transformer.transform(frame)
+        if plan is not None:
+            frame = _collect_fused(plan, num_fused)
         return frame
+
+
+def _collect_fused(plan: pl.LazyFrame, num_transformers: int) -> pl.DataFrame:
+    r"""Collect the query plan of some fused transformers.
+
+    Args:
+        plan: The query plan to collect.
+        num_transformers: The number of fused transformers.
+
+    Returns:
+        The collected DataFrame.
+    """
+    name = f"Fused {num_transformers:,} transformers"
+    with (
+        profile_block(name, category="transform") as record,
+        timeblock(f"{name} - " + "time: {time}"),
+    ):
+        out = plan.collect()
+        if record is not None:
+            record.set_output(out)
+    return out
+
+
+def _get_step_key(key: str, transformer: BaseTransformer) -> str:
+    r"""Get the cache key of the output of a transformer.
+
+    Args:
+        key: The cache key of the input DataFrame.
+        transformer: The transformer.
+
+    Returns:
+        The cache key of the output DataFrame.
+    """
+    return str_to_sha256(f"{key}|{hash_object(transformer)}")
+
+
+def _caches_are_equal(cache1: DiskFrameCache | None, cache2: DiskFrameCache | None) -> bool:
+    r"""Indicate if two optional caches are equal or not.
+
+    Args:
+        cache1: The first cache.
+        cache2: The second cache.
+
+    Returns:
+        ``True`` if the two caches are equal, otherwise ``False``.
+    """
+    if cache1 is None or cache2 is None:
+        return cache1 is cache2
+    return cache1.equal(cache2)
@@ -107,6 +107,9 @@ class LabelEncoderTransformer(BaseIn1Out1Transformer):
         check_sklearn()
         self._encoder = LabelEncoder()
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:
         logger.info(f"Fitting the label encoder to the data in column {self._in_col!r}")
         self._encoder.fit(frame[self._in_col].to_numpy())
@@ -128,6 +128,9 @@ class MaxAbsScalerTransformer(BaseInNOutNTransformer):
     def get_args(self) -> dict:
         return super().get_args() | {"propagate_nulls": self._propagate_nulls}
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:
         columns = self.find_common_columns(frame)
         logger.info(f"Fitting the max scaling parameters of {len(columns):,} columns...")
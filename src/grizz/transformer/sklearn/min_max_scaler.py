@@ -135,6 +135,9 @@ class MinMaxScalerTransformer(BaseInNOutNTransformer):
     def get_args(self) -> dict:
         return super().get_args() | {"propagate_nulls": self._propagate_nulls} | self._kwargs
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:
         columns = self.find_common_columns(frame)
         logger.info(f"Fitting the min/max scaling parameters of {len(columns):,} columns...")
@@ -9,6 +9,7 @@ from typing import TYPE_CHECKING, Any
 
 from grizz.transformer.columns import BaseArgTransformer, BaseInNTransformer
 from grizz.transformer.utils import get_classname, message_skip_fit
+from grizz.utils.diagnostics import is_diagnostics_enabled
 
 logger = logging.getLogger(__name__)
 
@@ -98,7 +99,10 @@ class SortTransformer(BaseInNTransformer):
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         columns = self._find_existing_columns(frame)
-        logger.info(f"Sorting rows based on {len(columns):,} columns: {columns}")
+        if is_diagnostics_enabled("full", logger=logger):
+            logger.info(f"Sorting rows based on {len(columns):,} columns: {columns}")
+        elif is_diagnostics_enabled(logger=logger):
+            logger.info(f"Sorting rows based on {len(columns):,} columns...")
         # Note: it is not possible to use find_common_columns because find_common_columns
         # may change the order of the columns.
         return frame.sort(columns, **self._kwargs)
@@ -124,13 +124,19 @@ class StripCharsTransformer(BaseInNOutNTransformer):
     def get_args(self) -> dict:
         return super().get_args() | self._kwargs
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         columns = self.find_common_columns(frame)
         logger.info(f"Stripping characters of {len(columns):,} columns...")
-        return frame.select((cs.by_name(columns) & cs.string()).str.strip_chars(**self._kwargs))
+        return frame.select(self._to_expr(columns))
+
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
+        return (cs.by_name(columns) & cs.string()).str.strip_chars(**self._kwargs)
 
 
 class InplaceStripCharsTransformer(StripCharsTransformer):
@@ -118,6 +118,9 @@ class SumHorizontalTransformer(BaseInNOut1Transformer):
     def get_args(self) -> dict:
         return super().get_args() | self._kwargs
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
@@ -127,6 +130,9 @@ class SumHorizontalTransformer(BaseInNOut1Transformer):
             f"Summing all values horizontally across {len(columns):,} columns: {columns} "
             f"| out_col={self._out_col!r}"
         )
+        return frame.with_columns(self._to_expr(columns).alias(self._out_col))
+
+    def _to_expr(self, columns: Sequence[str]) -> pl.Expr:
         if not columns:
-            return frame.with_columns(pl.lit(None).alias(self._out_col))
-        return frame.with_columns(pl.sum_horizontal(columns, **self._kwargs).alias(self._out_col))
+            return pl.lit(None)
+        return pl.sum_horizontal(columns, **self._kwargs)
@@ -93,15 +93,15 @@ class TimeToSecondTransformer(BaseIn1Out1Transformer):
     ```
     """
 
+    def supports_batches(self) -> bool:
+        return True
+
     def _fit(self, frame: pl.DataFrame) -> None:  # noqa: ARG002
         logger.info(message_skip_fit(get_classname(self)))
 
     def _transform(self, frame: pl.DataFrame) -> pl.DataFrame:
         logger.info(f"Converting time column {self._in_col!r} to seconds {self._out_col!r} ...")
-        return frame.with_columns(
-            pl.col(self._in_col)
-            .cast(pl.Duration)
-            .dt.total_microseconds()
-            .truediv(1e6)
-            .alias(self._out_col)
-        )
+        return frame.with_columns(self._to_expr().alias(self._out_col))
+
+    def _to_expr(self) -> pl.Expr:
+        return pl.col(self._in_col).cast(pl.Duration).dt.total_microseconds().truediv(1e6)
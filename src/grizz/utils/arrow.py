@@ -0,0 +1,168 @@
+r"""Contain utility functions to write DataFrames with Arrow."""
+
+from __future__ import annotations
+
+__all__ = ["get_file_format", "write_frames"]
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from grizz.utils.imports import check_pyarrow, is_pyarrow_available
+from grizz.utils.path import atomic_path, human_file_size, sanitize_path
+
+if is_pyarrow_available():  # pragma: no cover
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from pathlib import Path
+
+    import polars as pl
+
+logger = logging.getLogger(__name__)
+
+FILE_FORMATS = {
+    ".arrow": "ipc",
+    ".feather": "ipc",
+    ".ipc": "ipc",
+    ".parquet": "parquet",
+    ".pq": "parquet",
+}
+
+
+def get_file_format(path: Path | str) -> str:
+    r"""Get the file format from the file extension.
+
+    Args:
+        path: The path to the file.
+
+    Returns:
+        The file format: ``'parquet'`` or ``'ipc'``.
+
+    Raises:
+        ValueError: if the file extension is not supported.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.utils.arrow import get_file_format
+    >>> get_file_format("/path/to/data.parquet")
+    'parquet'
+    >>> get_file_format("/path/to/data.arrow")
+    'ipc'
+
+    ```
+    """
+    suffix = sanitize_path(path).suffix.lower()
+    if suffix not in FILE_FORMATS:
+        msg = (
+            f"Incorrect file extension: '{suffix}'. The valid extensions are: "
+            f"{', '.join(map(repr, sorted(FILE_FORMATS)))}"
+        )
+        raise ValueError(msg)
+    return FILE_FORMATS[suffix]
+
+
+def write_frames(
+    frames: Iterable[pl.DataFrame],
+    path: Path | str,
+    file_format: str | None = None,
+    **kwargs: Any,
+) -> int:
+    r"""Write a stream of DataFrames to a single parquet or Arrow IPC
+    file.
+
+    The DataFrames are written one by one with a ``pyarrow`` writer,
+    so only one DataFrame is in memory at a time. All the DataFrames
+    must have the same schema. The file is written to a temporary
+    file and then renamed, so a partially written file is never read.
+    This function requires ``pyarrow``.
+
+    Args:
+        frames: The DataFrames to write.
+        path: The path to the file.
+        file_format: The file format: ``'parquet'`` or ``'ipc'``.
+            If ``None``, it is inferred from the file extension.
+        **kwargs: Additional keyword arguments for
+            ``pyarrow.parquet.ParquetWriter`` or
+            ``pyarrow.ipc.new_file``.
+
+    Returns:
+        The number of written rows.
+
+    Raises:
+        ValueError: if the file format is not supported or if the
+            schemas of the DataFrames are different.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> import polars as pl
+    >>> from pathlib import Path
+    >>> from grizz.utils.arrow import write_frames
+    >>> frames = [pl.DataFrame({"col1": [1, 2, 3]}), pl.DataFrame({"col1": [4, 5]})]
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     path = Path(tmpdir).joinpath("data.parquet")
+    ...     write_frames(frames, path)
+    ...     pl.read_parquet(path).shape
+    ...
+    5
+    (5, 1)
+
+    ```
+    """
+    check_pyarrow()
+    path = sanitize_path(path)
+    file_format = file_format or get_file_format(path)
+    if file_format not in ("ipc", "parquet"):
+        msg = f"Incorrect file format: '{file_format}'. The valid formats are: 'ipc', 'parquet'"
+        raise ValueError(msg)
+
+    num_rows = 0
+    with atomic_path(path) as tmp_path:
+        writer, schema = None, None
+        try:
+            for frame in frames:
+                table = frame.to_arrow()
+                if writer is None:
+                    schema = table.schema
+                    writer = _new_writer(tmp_path, schema, file_format, **kwargs)
+                elif not table.schema.equals(schema):
+                    msg = (
+                        f"The schema of the DataFrame is different from the schema of the "
+                        f"file:\n{table.schema}\nvs\n{schema}"
+                    )
+                    raise ValueError(msg)
+                writer.write_table(table)
+                num_rows += table.num_rows
+            if writer is None:
+                # The file is created even if there is no data.
+                writer = _new_writer(tmp_path, pa.schema([]), file_format, **kwargs)
+        finally:
+            if writer is not None:
+                writer.close()
+    logger.info(f"Wrote {num_rows:,} rows to {path} | size={human_file_size(path)}")
+    return num_rows
+
+
+def _new_writer(
+    path: Path, schema: pa.Schema, file_format: str, **kwargs: Any
+) -> pq.ParquetWriter | pa.ipc.RecordBatchFileWriter:
+    r"""Create a ``pyarrow`` writer.
+
+    Args:
+        path: The path to the file.
+        schema: The schema of the data.
+        file_format: The file format: ``'parquet'`` or ``'ipc'``.
+        **kwargs: Additional keyword arguments for the writer.
+
+    Returns:
+        The writer.
+    """
+    if file_format == "parquet":
+        return pq.ParquetWriter(str(path), schema, **kwargs)
+    return pa.ipc.new_file(str(path), schema, **kwargs)
@@ -0,0 +1,178 @@
+r"""Contain a content-addressed cache to store DataFrames on disk."""
+
+from __future__ import annotations
+
+__all__ = ["DiskFrameCache"]
+
+import contextlib
+import logging
+import os
+from typing import TYPE_CHECKING
+
+import polars as pl
+
+from grizz.utils.format import human_byte
+from grizz.utils.path import atomic_path, sanitize_path
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class DiskFrameCache:
+    r"""Implement a cache to store DataFrames on disk in the Arrow IPC
+    format.
+
+    Each DataFrame is stored in a file named after its key, so the
+    key should be a fingerprint of what produced the DataFrame. The
+    files are written to a temporary file and then renamed, so a
+    partially written file is never read. When the total size of the
+    cache exceeds ``max_size``, the least recently used files are
+    removed.
+
+    Args:
+        path: The path to the cache directory.
+        max_size: The maximum size of the cache in bytes.
+            If ``None``, the cache size is not limited.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> import polars as pl
+    >>> from pathlib import Path
+    >>> from grizz.utils.cache import DiskFrameCache
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     cache = DiskFrameCache(Path(tmpdir).joinpath("cache"))
+    ...     cache.set("abc", pl.DataFrame({"col1": [1, 2, 3]}))
+    ...     cache.get("abc").shape
+    ...
+    (3, 1)
+
+    ```
+    """
+
+    def __init__(self, path: Path | str, max_size: int | None = None) -> None:
+        self._path = sanitize_path(path)
+        if max_size is not None and max_size < 0:
+            msg = f"max_size must be greater or equal to 0 (received: {max_size})"
+            raise ValueError(msg)
+        self._max_size = max_size
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(path={self._path}, max_size={self._max_size})"
+
+    def equal(self, other: DiskFrameCache) -> bool:
+        r"""Indicate if two caches are equal or not.
+
+        Args:
+            other: The other object to compare.
+
+        Returns:
+            ``True`` if the two caches have the same path and maximum
+                size, otherwise ``False``.
+        """
+        if not isinstance(other, self.__class__):
+            return False
+        return self._path == other._path and self._max_size == other._max_size
+
+    @property
+    def path(self) -> Path:
+        r"""The path to the cache directory."""
+        return self._path
+
+    def contains(self, key: str) -> bool:
+        r"""Indicate if a DataFrame is stored in the cache.
+
+        Args:
+            key: The key of the DataFrame.
+
+        Returns:
+            ``True`` if a DataFrame is stored for this key,
+                otherwise ``False``.
+        """
+        return self._get_path(key).is_file()
+
+    def get(self, key: str) -> pl.DataFrame | None:
+        r"""Get a DataFrame from the cache.
+
+        Args:
+            key: The key of the DataFrame.
+
+        Returns:
+            The DataFrame if it is stored in the cache,
+                otherwise ``None``.
+        """
+        path = self._get_path(key)
+        try:
+            frame = pl.read_ipc(path, memory_map=False)
+        except FileNotFoundError:
+            return None
+        # Update the modification time to implement the LRU eviction.
+        # The entry can be evicted by another process after it is read,
+        # but the DataFrame is already loaded.
+        with contextlib.suppress(FileNotFoundError):
+            os.utime(path)
+        logger.info(f"Loaded DataFrame (shape={frame.shape}) from cache {path}")
+        return frame
+
+    def set(self, key: str, frame: pl.DataFrame) -> None:
+        r"""Store a DataFrame in the cache.
+
+        Args:
+            key: The key of the DataFrame.
+            frame: The DataFrame to store.
+        """
+        path = self._get_path(key)
+        with atomic_path(path) as tmp_path:
+            frame.write_ipc(tmp_path)
+        logger.info(f"Stored DataFrame (shape={frame.shape}) in cache {path}")
+        self.evict()
+
+    def clear(self) -> None:
+        r"""Remove all the DataFrames from the cache."""
+        for path in self._find_files():
+            path.unlink(missing_ok=True)
+
+    def evict(self) -> None:
+        r"""Remove the least recently used DataFrames until the cache
+        size is lower than the maximum size."""
+        if self._max_size is None:
+            return
+        files = []
+        for path in self._find_files():
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files, key=lambda item: item[0]):
+            if total <= self._max_size:
+                break
+            logger.info(f"Evicting {path} ({human_byte(size)}) from the cache")
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def _find_files(self) -> list[Path]:
+        r"""Find the files stored in the cache.
+
+        Returns:
+            The paths to the stored DataFrames.
+        """
+        if not self._path.is_dir():
+            return []
+        return list(self._path.glob("*.arrow"))
+
+    def _get_path(self, key: str) -> Path:
+        r"""Get the path to the file of a key.
+
+        Args:
+            key: The key of the DataFrame.
+
+        Returns:
+            The path to the file.
+        """
+        return self._path.joinpath(f"{key}.arrow")
@@ -0,0 +1,80 @@
+r"""Contain utility functions to run tasks concurrently."""
+
+from __future__ import annotations
+
+__all__ = ["map_in_threads"]
+
+import contextvars
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterable, Iterator
+
+T = TypeVar("T")
+
+
+def map_in_threads(
+    func: Callable[[Any], T], items: Iterable[Any], max_workers: int = 1
+) -> Iterator[T]:
+    r"""Apply a function to each item with a pool of threads.
+
+    The results are returned in the order of the items. The items are
+    read lazily, and at most ``max_workers`` calls are pending at a
+    time, so only a few items are in memory if ``items`` is a
+    generator. Each call runs in a copy of the current context, so
+    the active profiler and diagnostics level are propagated to the
+    threads. The pending calls are cancelled if a call raises an
+    exception or if the iterator is closed.
+
+    Args:
+        func: The function to apply to each item.
+        items: The items.
+        max_workers: The maximum number of threads. If ``1`` or
+            lower, the function is applied sequentially in the
+            current thread.
+
+    Returns:
+        An iterator over the results, in the order of the items.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.utils.concurrency import map_in_threads
+    >>> list(map_in_threads(lambda x: x * 2, [1, 2, 3, 4], max_workers=2))
+    [2, 4, 6, 8]
+
+    ```
+    """
+    if max_workers <= 1:
+        return map(func, items)
+    return _map_in_threads(func, items, max_workers)
+
+
+def _map_in_threads(
+    func: Callable[[Any], T], items: Iterable[Any], max_workers: int
+) -> Iterator[T]:
+    r"""Apply a function to each item with a pool of threads.
+
+    Args:
+        func: The function to apply to each item.
+        items: The items.
+        max_workers: The maximum number of threads.
+
+    Yields:
+        The results, in the order of the items.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        try:
+            for item in items:
+                pending.append(executor.submit(contextvars.copy_context().run, func, item))
+                if len(pending) >= max_workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
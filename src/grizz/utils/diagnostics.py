@@ -0,0 +1,182 @@
+r"""Contain utility functions to control the diagnostics computed by the
+transformers.
+
+The diagnostics are the log messages that describe what a transformer
+did, for example the difference of shape and estimated size between
+the input and output DataFrames, or the list of dropped columns.
+Computing them can be expensive, so they can be disabled globally with
+``set_diagnostics_level`` or in a block of code with
+``diagnostics_level``. The following levels are available:
+
+- ``'off'``: no diagnostics are computed.
+- ``'summary'``: only the cheap diagnostics are computed, for example
+    the shape of the DataFrames or the number of dropped columns.
+- ``'full'`` (default): all the diagnostics are computed, including
+    the estimated size of the DataFrames and the column names.
+"""
+
+from __future__ import annotations
+
+__all__ = [
+    "check_diagnostics_level",
+    "diagnostics_level",
+    "get_diagnostics_level",
+    "is_diagnostics_enabled",
+    "set_diagnostics_level",
+]
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+_LEVELS = {"off": 0, "summary": 1, "full": 2}
+
+_DIAGNOSTICS_LEVEL = "full"
+_CONTEXT_LEVEL: ContextVar[str | None] = ContextVar("grizz_diagnostics_level", default=None)
+
+
+def check_diagnostics_level(level: str) -> None:
+    r"""Check the diagnostics level.
+
+    Args:
+        level: The diagnostics level.
+
+    Raises:
+        ValueError: if ``level`` is not a valid diagnostics level.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.utils.diagnostics import check_diagnostics_level
+    >>> check_diagnostics_level("summary")
+
+    ```
+    """
+    if level not in _LEVELS:
+        msg = (
+            f"Incorrect diagnostics level: {level}. The valid values are: "
+            f"'full', 'off', 'summary'"
+        )
+        raise ValueError(msg)
+
+
+def get_diagnostics_level() -> str:
+    r"""Get the current diagnostics level.
+
+    Returns:
+        The diagnostics level of the current context if it was set
+            with ``diagnostics_level``, otherwise the global
+            diagnostics level.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.utils.diagnostics import get_diagnostics_level
+    >>> get_diagnostics_level()
+    'full'
+
+    ```
+    """
+    level = _CONTEXT_LEVEL.get()
+    if level is None:
+        return _DIAGNOSTICS_LEVEL
+    return level
+
+
+def set_diagnostics_level(level: str) -> None:
+    r"""Set the global diagnostics level.
+
+    Args:
+        level: The diagnostics level. The valid values are
+            ``'off'``, ``'summary'``, and ``'full'``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.utils.diagnostics import get_diagnostics_level, set_diagnostics_level
+    >>> set_diagnostics_level("off")
+    >>> get_diagnostics_level()
+    'off'
+    >>> set_diagnostics_level("full")
+
+    ```
+    """
+    check_diagnostics_level(level)
+    global _DIAGNOSTICS_LEVEL  # noqa: PLW0603
+    _DIAGNOSTICS_LEVEL = level
+
+
+@contextmanager
+def diagnostics_level(level: str | None) -> Generator[None, None, None]:
+    r"""Context manager to set the diagnostics level in a block of
+    code.
+
+    The previous diagnostics level is restored when the block exits.
+
+    Args:
+        level: The diagnostics level. If ``None``, the current
+            diagnostics level is not changed.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.utils.diagnostics import diagnostics_level, get_diagnostics_level
+    >>> with diagnostics_level("summary"):
+    ...     get_diagnostics_level()
+    ...
+    'summary'
+    >>> get_diagnostics_level()
+    'full'
+
+    ```
+    """
+    if level is None:
+        yield
+        return
+    check_diagnostics_level(level)
+    token = _CONTEXT_LEVEL.set(level)
+    try:
+        yield
+    finally:
+        _CONTEXT_LEVEL.reset(token)
+
+
+def is_diagnostics_enabled(level: str = "summary", logger: logging.Logger | None = None) -> bool:
+    r"""Indicate if the diagnostics of a given level should be
+    computed.
+
+    Args:
+        level: The level of the diagnostics to compute.
+        logger: The logger used to log the diagnostics. If it is not
+            enabled for ``INFO`` messages, the diagnostics are
+            disabled because they would not be logged.
+
+    Returns:
+        ``True`` if the diagnostics should be computed,
+            otherwise ``False``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.utils.diagnostics import diagnostics_level, is_diagnostics_enabled
+    >>> is_diagnostics_enabled("full")
+    True
+    >>> with diagnostics_level("summary"):
+    ...     is_diagnostics_enabled("summary"), is_diagnostics_enabled("full")
+    ...
+    (True, False)
+
+    ```
+    """
+    if _LEVELS[get_diagnostics_level()] < _LEVELS[level]:
+        return False
+    return logger is None or logger.isEnabledFor(logging.INFO)
@@ -200,12 +200,15 @@ def str_size_diff(orig: float, final: float) -> str:
     )
 
 
-def str_dataframe_diff(orig: pl.DataFrame, final: pl.DataFrame) -> str:
+def str_dataframe_diff(orig: pl.DataFrame, final: pl.DataFrame, estimated_size: bool = True) -> str:
     r"""Return a string that shows the difference between DataFrames.
 
     Args:
         orig: The original DataFrame.
         final: The final DataFrame.
+        estimated_size: If ``True``, the difference of estimated size
+            is also shown. Estimating the size of a DataFrame can be
+            slow for DataFrames with nested or string columns.
 
     Returns:
         The generated string with the difference of DataFrames.
@@ -240,10 +243,14 @@ def str_dataframe_diff(orig: pl.DataFrame, final: pl.DataFrame) -> str:
     out = []
     if orig.shape != final.shape:
         out.append(str_shape_diff(orig=orig.shape, final=final.shape))
-    if orig.estimated_size() != final.estimated_size():
-        out.append(str_size_diff(orig=orig.estimated_size(), final=final.estimated_size()))
+    if estimated_size:
+        orig_size, final_size = orig.estimated_size(), final.estimated_size()
+        if orig_size != final_size:
+            out.append(str_size_diff(orig=orig_size, final=final_size))
     if out:
         return "\n".join(out)
+    if not estimated_size:
+        return "DataFrame shape did not changed"
     return "DataFrame shape and size did not changed"
 
 
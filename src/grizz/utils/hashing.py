@@ -2,9 +2,28 @@ r"""Contain utility functions to compute hash of objects."""
 
 from __future__ import annotations
 
-__all__ = ["str_to_sha256"]
+__all__ = ["DataFrameHasher", "hash_dataframe", "hash_object", "str_to_sha256"]
 
+import functools
 import hashlib
+import math
+from collections.abc import Mapping
+from enum import Enum
+from pathlib import PurePath
+from types import BuiltinFunctionType, CodeType, FunctionType, MethodType
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+from coola.utils import is_numpy_available
+
+if is_numpy_available():
+    import numpy as np
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from collections.abc import Set as AbstractSet
+
+_MODULUS = 2**64
 
 
 def str_to_sha256(string: str) -> str:
@@ -27,3 +46,345 @@ def str_to_sha256(string: str) -> str:
     ```
     """
     return hashlib.sha256(str(string).encode("utf-8")).hexdigest()
+
+
+class DataFrameHasher:
+    r"""Implement an incremental hasher to compute a fingerprint of the
+    content of DataFrames.
+
+    The fingerprint combines the schema, the number of rows, and two
+    reductions of the row hashes: their sum, which does not depend
+    on the row order, and their sum weighted by the row position.
+    Both reductions are additive, so the rows can be hashed chunk by
+    chunk: updating the hasher with several DataFrames gives the same
+    fingerprint as updating it with their concatenation. The rows
+    are hashed with fixed seeds, so the fingerprint is stable across
+    processes for a given ``polars`` version.
+
+    The state of the hasher can be saved with ``state_dict`` and
+    restored with ``load_state_dict``, so the fingerprint of
+    append-only data can be updated by hashing only the new rows.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.utils.hashing import DataFrameHasher, hash_dataframe
+    >>> frame = pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]})
+    >>> hasher = DataFrameHasher()
+    >>> for chunk in frame.iter_slices(n_rows=2):
+    ...     hasher.update(chunk)
+    ...
+    >>> hasher.num_rows
+    5
+    >>> hasher.hexdigest() == hash_dataframe(frame)
+    True
+
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._schema: list[tuple[str, str]] | None = None
+        self._num_rows = 0
+        self._total = 0
+        self._weighted = 0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(num_rows={self._num_rows:,})"
+
+    @property
+    def num_rows(self) -> int:
+        r"""The number of hashed rows."""
+        return self._num_rows
+
+    def update(self, frame: pl.DataFrame | pl.LazyFrame) -> None:
+        r"""Update the fingerprint with the rows of a DataFrame.
+
+        The rows of a ``polars.LazyFrame`` are reduced in the query
+        plan, so the LazyFrame is never fully materialized.
+
+        Args:
+            frame: The DataFrame or LazyFrame with the new rows.
+
+        Raises:
+            ValueError: if the schema of the DataFrame is different
+                from the schema of the previous DataFrames.
+        """
+        frame = frame.lazy()
+        schema = [(name, str(dtype)) for name, dtype in frame.collect_schema().items()]
+        if self._schema is not None and schema != self._schema:
+            msg = (
+                "The schema of the DataFrame is different from the schema of the previous "
+                f"DataFrames:\n({schema})\nvs\n({self._schema})"
+            )
+            raise ValueError(msg)
+        self._schema = schema
+
+        exprs = [pl.len().alias("num_rows")]
+        if schema:
+            hashes = pl.struct(pl.all()).hash(seed=0, seed_1=1, seed_2=2, seed_3=3)
+            positions = pl.int_range(1, pl.len() + 1, dtype=pl.UInt64)
+            exprs.extend(
+                [hashes.sum().alias("total"), (hashes * positions).sum().alias("weighted")]
+            )
+        stats = frame.select(exprs).collect().row(0, named=True)
+        total, weighted = stats.get("total") or 0, stats.get("weighted") or 0
+        # The weights of the new rows are shifted by the number of previous rows.
+        self._weighted = (self._weighted + weighted + self._num_rows * total) % _MODULUS
+        self._total = (self._total + total) % _MODULUS
+        self._num_rows += stats["num_rows"]
+
+    def hexdigest(self) -> str:
+        r"""Return the fingerprint of the hashed rows.
+
+        Returns:
+            The SHA-256 fingerprint.
+        """
+        return str_to_sha256(f"{self._schema}|{self._num_rows}|{self._total}|{self._weighted}")
+
+    def state_dict(self) -> dict:
+        r"""Return the state of the hasher.
+
+        Returns:
+            The state of the hasher. It only contains JSON
+                serializable values.
+        """
+        return {
+            "schema": None if self._schema is None else [list(item) for item in self._schema],
+            "num_rows": self._num_rows,
+            "total": self._total,
+            "weighted": self._weighted,
+        }
+
+    def load_state_dict(self, state: dict) -> None:
+        r"""Load the state of the hasher.
+
+        Args:
+            state: The state of the hasher, as returned by
+                ``state_dict``.
+        """
+        schema = state["schema"]
+        self._schema = None if schema is None else [tuple(item) for item in schema]
+        self._num_rows = state["num_rows"]
+        self._total = state["total"]
+        self._weighted = state["weighted"]
+
+
+def hash_dataframe(frame: pl.DataFrame | pl.LazyFrame, sample_size: int | None = None) -> str:
+    r"""Compute a fingerprint of the content of a DataFrame.
+
+    See ``DataFrameHasher`` for more information about the
+    fingerprint.
+
+    Args:
+        frame: The DataFrame or LazyFrame to hash.
+        sample_size: The maximum number of rows to hash. If the
+            DataFrame has more rows, only rows taken at regular
+            intervals are hashed, so the changes in the other rows
+            are not detected. If ``None``, all the rows are hashed.
+
+    Returns:
+        The SHA-256 fingerprint of the DataFrame.
+
+    Raises:
+        ValueError: if ``sample_size`` is not positive.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.utils.hashing import hash_dataframe
+    >>> frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    >>> hash_dataframe(frame) == hash_dataframe(frame.clone())
+    True
+    >>> hash_dataframe(frame) == hash_dataframe(frame.lazy())
+    True
+    >>> hash_dataframe(frame) == hash_dataframe(frame.reverse())
+    False
+
+    ```
+    """
+    hasher = DataFrameHasher()
+    if sample_size is None:
+        hasher.update(frame)
+        return hasher.hexdigest()
+
+    if sample_size <= 0:
+        msg = f"sample_size must be greater than 0 (received: {sample_size})"
+        raise ValueError(msg)
+    frame = frame.lazy()
+    num_rows = frame.select(pl.len()).collect().item()
+    step = max(math.ceil(num_rows / sample_size), 1)
+    hasher.update(frame.gather_every(step))
+    return str_to_sha256(f"{hasher.hexdigest()}|{num_rows}|{step}")
+
+
+def hash_object(obj: Any) -> str:
+    r"""Compute a fingerprint of a Python object.
+
+    The fingerprint is computed on an explicit representation of the
+    object, so it does not depend on the process, for example on the
+    iteration order of the sets of strings. An object is represented
+    by its class and its attributes, so the fingerprint of a
+    transformer captures its arguments and its fitted parameters.
+    A function is represented by its name, its bytecode, its
+    default arguments and its closure.
+
+    Args:
+        obj: The object to hash.
+
+    Returns:
+        The SHA-256 fingerprint of the object.
+
+    Raises:
+        TypeError: if the object cannot be represented, for example
+            an object without attributes like a lock.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.utils.hashing import hash_object
+    >>> hash_object({"a": 1, "b": 2}) == hash_object({"b": 2, "a": 1})
+    True
+    >>> hash_object({"a": 1, "b": 2}) == hash_object({"a": 1, "b": 3})
+    False
+
+    ```
+    """
+    return str_to_sha256(_get_stable_repr(obj))
+
+
+def _get_stable_repr(obj: Any) -> str:
+    r"""Get a representation of an object that is stable across
+    processes.
+
+    Args:
+        obj: The object to represent.
+
+    Returns:
+        The representation of the object.
+
+    Raises:
+        TypeError: if the object cannot be represented.
+    """
+    for types, func in _STABLE_REPRS:
+        if isinstance(obj, types):
+            return func(obj)
+    if is_numpy_available() and isinstance(obj, (np.ndarray, np.generic)):
+        return _numpy_repr(obj)
+    if hasattr(obj, "__dict__"):
+        return f"{_type_repr(type(obj))}({_get_stable_repr(vars(obj))})"
+    msg = f"Cannot compute a stable representation of an object of type {type(obj)}"
+    raise TypeError(msg)
+
+
+def _type_repr(cls: type) -> str:
+    return f"{cls.__module__}.{cls.__qualname__}"
+
+
+def _scalar_repr(obj: Any) -> str:
+    return f"{type(obj).__qualname__}:{obj!r}"
+
+
+def _sequence_repr(obj: Sequence) -> str:
+    items = ",".join(_get_stable_repr(item) for item in obj)
+    return f"{type(obj).__qualname__}[{items}]"
+
+
+def _set_repr(obj: AbstractSet) -> str:
+    items = ",".join(sorted(_get_stable_repr(item) for item in obj))
+    return f"{type(obj).__qualname__}{{{items}}}"
+
+
+def _mapping_repr(obj: Mapping) -> str:
+    items = ",".join(
+        sorted(f"{_get_stable_repr(key)}:{_get_stable_repr(value)}" for key, value in obj.items())
+    )
+    return f"{type(obj).__qualname__}{{{items}}}"
+
+
+def _enum_repr(obj: Enum) -> str:
+    return f"{_type_repr(type(obj))}.{obj.name}"
+
+
+def _path_repr(obj: PurePath) -> str:
+    return f"path:{obj.as_posix()}"
+
+
+def _dtype_repr(obj: pl.DataType) -> str:
+    return f"dtype:{obj!r}"
+
+
+def _expr_repr(obj: pl.Expr) -> str:
+    return f"expr:{hashlib.sha256(obj.meta.serialize()).hexdigest()}"
+
+
+def _frame_repr(obj: pl.DataFrame | pl.Series) -> str:
+    if isinstance(obj, pl.Series):
+        return f"series:{obj.name!r}:{hash_dataframe(obj.to_frame())}"
+    return f"frame:{hash_dataframe(obj)}"
+
+
+def _code_repr(obj: CodeType) -> str:
+    return (
+        f"code:{obj.co_code.hex()}|{_get_stable_repr(obj.co_consts)}"
+        f"|{_get_stable_repr(obj.co_names)}"
+    )
+
+
+def _function_repr(obj: FunctionType) -> str:
+    closure = [cell.cell_contents for cell in obj.__closure__ or ()]
+    return (
+        f"function:{obj.__module__}.{obj.__qualname__}|{_get_stable_repr(obj.__code__)}"
+        f"|{_get_stable_repr(obj.__defaults__)}|{_get_stable_repr(closure)}"
+    )
+
+
+def _builtin_repr(obj: BuiltinFunctionType) -> str:
+    return f"builtin:{obj.__module__}.{obj.__qualname__}"
+
+
+def _method_repr(obj: MethodType) -> str:
+    return f"method:{_get_stable_repr(obj.__func__)}|{_get_stable_repr(obj.__self__)}"
+
+
+def _partial_repr(obj: functools.partial) -> str:
+    return (
+        f"partial:{_get_stable_repr(obj.func)}|{_get_stable_repr(obj.args)}"
+        f"|{_get_stable_repr(obj.keywords)}"
+    )
+
+
+def _numpy_repr(obj: np.ndarray | np.generic) -> str:
+    if isinstance(obj, np.generic):
+        return f"numpy.{type(obj).__qualname__}:{obj.item()!r}"
+    if obj.dtype.hasobject:
+        return f"ndarray:{obj.shape}:{_get_stable_repr(obj.tolist())}"
+    data = hashlib.sha256(np.ascontiguousarray(obj).tobytes()).hexdigest()
+    return f"ndarray:{obj.dtype.str}:{obj.shape}:{data}"
+
+
+# The order matters because the first matching type is used, for
+# example ``bool`` is a subclass of ``int`` and an enum member can be a
+# subclass of ``str``.
+_STABLE_REPRS: tuple[tuple[type | tuple[type, ...], Callable[[Any], str]], ...] = (
+    (Enum, _enum_repr),
+    (type(None), _scalar_repr),
+    ((bool, int, float, complex, str, bytes), _scalar_repr),
+    ((list, tuple), _sequence_repr),
+    ((set, frozenset), _set_repr),
+    (Mapping, _mapping_repr),
+    (PurePath, _path_repr),
+    (type, _type_repr),
+    (pl.DataType, _dtype_repr),
+    (pl.Expr, _expr_repr),
+    ((pl.DataFrame, pl.Series), _frame_repr),
+    (CodeType, _code_repr),
+    (FunctionType, _function_repr),
+    (BuiltinFunctionType, _builtin_repr),
+    (MethodType, _method_repr),
+    (functools.partial, _partial_repr),
+)
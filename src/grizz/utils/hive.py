@@ -0,0 +1,547 @@
+r"""Contain utility functions to manage hive-partitioned datasets."""
+
+from __future__ import annotations
+
+__all__ = [
+    "HIVE_DEFAULT_PARTITION",
+    "find_partition_files",
+    "get_partition_dir",
+    "make_column_filter",
+    "make_partition_filter",
+    "match_partition_value",
+    "parse_partition_dir",
+    "scan_partitioned_parquet",
+]
+
+import json
+import logging
+import os
+from collections import defaultdict
+from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+from urllib.parse import quote, unquote
+
+import polars as pl
+
+from grizz.utils.parquet import ParquetIndex
+from grizz.utils.path import atomic_path, sanitize_path
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+HIVE_DEFAULT_PARTITION = "__HIVE_DEFAULT_PARTITION__"
+
+
+def get_partition_dir(keys: Mapping[str, Any]) -> str:
+    r"""Get the relative directory of a partition in a hive-partitioned
+    dataset.
+
+    The values are converted to strings and percent-encoded, so they
+    can be used in a path. A null value is represented by
+    ``HIVE_DEFAULT_PARTITION``.
+
+    Args:
+        keys: The partition keys and their values.
+
+    Returns:
+        The relative directory of the partition.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import date
+    >>> from grizz.utils.hive import get_partition_dir
+    >>> get_partition_dir({"country": "FR", "day": date(2024, 1, 1)})
+    'country=FR/day=2024-01-01'
+    >>> get_partition_dir({"country": None, "city": "a/b"})
+    'country=__HIVE_DEFAULT_PARTITION__/city=a%2Fb'
+
+    ```
+    """
+    return "/".join(
+        f"{quote(str(key), safe='')}="
+        f"{HIVE_DEFAULT_PARTITION if value is None else quote(str(value), safe='')}"
+        for key, value in keys.items()
+    )
+
+
+def make_partition_filter(keys: Mapping[str, Any]) -> pl.Expr:
+    r"""Make an expression that selects the rows of a partition.
+
+    Args:
+        keys: The partition keys and their values. A null value
+            selects the rows where the column is null.
+
+    Returns:
+        The filter expression.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.utils.hive import make_partition_filter
+    >>> frame = pl.DataFrame({"col1": ["a", "a", None], "col2": [1, 2, 1]})
+    >>> frame.filter(make_partition_filter({"col1": None, "col2": 1})).shape
+    (1, 2)
+
+    ```
+    """
+    return pl.all_horizontal(pl.col(key).eq_missing(value) for key, value in keys.items())
+
+
+def make_column_filter(column: str, column_filter: Any) -> pl.Expr:
+    r"""Make an expression that selects the rows where the value of a
+    column matches a filter.
+
+    Args:
+        column: The column name.
+        column_filter: The filter. It can be a dictionary with the
+            optional ``'start'`` (included) and ``'end'`` (excluded)
+            of a range, a list, tuple, or set of accepted values, or
+            a single accepted value. ``None`` selects the null values.
+
+    Returns:
+        The filter expression.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.utils.hive import make_column_filter
+    >>> frame = pl.DataFrame({"col1": [1, 2, 3, 4, None]})
+    >>> frame.filter(make_column_filter("col1", {"start": 2, "end": 4}))["col1"].to_list()
+    [2, 3]
+    >>> frame.filter(make_column_filter("col1", [1, None]))["col1"].to_list()
+    [1, None]
+
+    ```
+    """
+    col = pl.col(column)
+    if isinstance(column_filter, dict):
+        start, end = column_filter.get("start"), column_filter.get("end")
+        expr = pl.lit(True)
+        if start is not None:
+            expr = expr & (col >= start)
+        if end is not None:
+            expr = expr & (col < end)
+        return expr & col.is_not_null()
+    if not isinstance(column_filter, (list, tuple, set, frozenset)):
+        column_filter = [column_filter]
+    values = [value for value in column_filter if value is not None]
+    expr = col.is_in(values)
+    if len(values) < len(column_filter):
+        expr = expr | col.is_null()
+    return expr
+
+
+def parse_partition_dir(path: Path | str) -> dict[str, str | None]:
+    r"""Parse the partition keys from the relative directory of a
+    partition in a hive-partitioned dataset.
+
+    This function is the inverse of ``get_partition_dir``. The parts
+    of the path that are not ``key=value`` are ignored.
+
+    Args:
+        path: The relative directory of the partition.
+
+    Returns:
+        The partition keys and their values. The values are strings,
+            or ``None`` for a null value.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.utils.hive import parse_partition_dir
+    >>> parse_partition_dir("country=FR/day=2024-01-01")
+    {'country': 'FR', 'day': '2024-01-01'}
+    >>> parse_partition_dir("country=__HIVE_DEFAULT_PARTITION__/city=a%2Fb")
+    {'country': None, 'city': 'a/b'}
+
+    ```
+    """
+    keys = {}
+    for part in str(path).replace(os.sep, "/").split("/"):
+        key, sep, value = part.partition("=")
+        if not sep or not key:
+            continue
+        keys[unquote(key)] = None if value == HIVE_DEFAULT_PARTITION else unquote(value)
+    return keys
+
+
+def match_partition_value(value: str | None, partition_filter: Any) -> bool:
+    r"""Indicate if the value of a partition key matches a filter.
+
+    The value is converted to the type of the filter values before
+    the comparison, so for example the directory ``day=2024-01-05``
+    matches the range ``{"start": date(2024, 1, 1)}``. The supported
+    types are ``str``, ``int``, ``float``, ``bool``, ``date``, and
+    ``datetime``.
+
+    Args:
+        value: The value of the partition key, or ``None`` for a null
+            value.
+        partition_filter: The filter. It can be a dictionary with the
+            optional ``'start'`` (included) and ``'end'`` (excluded)
+            of a range, a list, tuple, or set of accepted values, or
+            a single accepted value.
+
+    Returns:
+        ``True`` if the value matches the filter, otherwise ``False``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from datetime import date
+    >>> from grizz.utils.hive import match_partition_value
+    >>> match_partition_value("2024-01-05", {"start": date(2024, 1, 1), "end": date(2024, 2, 1)})
+    True
+    >>> match_partition_value("12", [3, 12])
+    True
+    >>> match_partition_value("FR", "DE")
+    False
+
+    ```
+    """
+    if isinstance(partition_filter, dict):
+        return _match_range(
+            value, start=partition_filter.get("start"), end=partition_filter.get("end")
+        )
+    if not isinstance(partition_filter, (list, tuple, set, frozenset)):
+        partition_filter = [partition_filter]
+    return any(_match_accepted_value(value, accepted) for accepted in partition_filter)
+
+
+def find_partition_files(
+    path: Path | str,
+    filters: Mapping[str, Any] | None = None,
+    cache_path: Path | str | None = None,
+    suffix: str = ".parquet",
+) -> list[Path]:
+    r"""Find the files of the partitions of a hive-partitioned dataset
+    that match some filters.
+
+    The directories are listed level by level, and a directory is
+    only listed if its partition value matches the filter of its key
+    (see ``match_partition_value``), so the directories of the
+    partitions that do not match are never listed. The files and
+    directories whose name starts with ``'.'`` or ``'_'`` are
+    ignored.
+
+    If ``cache_path`` is set, the listings of the directories are
+    stored in this JSON file with the modification time and the
+    number of hard links of each directory. The listing of a
+    directory is reused if both did not change, so only one ``stat``
+    call per directory is required after the first call. Adding or
+    removing a file or a directory changes the modification time of
+    its parent directory, and adding or removing a directory also
+    changes its number of hard links on most filesystems. On
+    filesystems with a coarse modification time (e.g. NFS, FUSE or
+    FAT), a file added to a directory in the same tick as the cached
+    listing may be missed until the directory is modified again.
+
+    Args:
+        path: The path to the root directory of the dataset.
+        filters: The filters of the partition keys. The keys without
+            a filter are not filtered. If ``None``, all the files are
+            returned.
+        cache_path: The path to the JSON file of the cached
+            directory listings. If ``None``, the listings are not
+            cached.
+        suffix: The suffix of the files to find.
+
+    Returns:
+        The sorted paths to the files of the matching partitions.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> import polars as pl
+    >>> from pathlib import Path
+    >>> from grizz.utils.hive import find_partition_files
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     for day in ["2024-01-01", "2024-01-02"]:
+    ...         path = Path(tmpdir).joinpath(f"day={day}")
+    ...         path.mkdir()
+    ...         pl.DataFrame({"col1": [1, 2]}).write_parquet(path.joinpath("part-00000.parquet"))
+    ...     files = find_partition_files(tmpdir, filters={"day": ["2024-01-02"]})
+    ...
+    >>> [f"{file.parent.name}/{file.name}" for file in files]
+    ['day=2024-01-02/part-00000.parquet']
+
+    ```
+    """
+    path = sanitize_path(path)
+    filters = filters or {}
+    cache = _load_listing_cache(cache_path, root=path)
+    num_listed = 0
+    files = []
+    directories = [path]
+    while directories:
+        directory = directories.pop()
+        relative = directory.relative_to(path).as_posix()
+        stat = directory.stat()
+        listing = cache.get(relative)
+        if (
+            listing is None
+            or listing.get("mtime") != stat.st_mtime_ns
+            or listing.get("nlink") != stat.st_nlink
+        ):
+            listing = _list_directory(directory, suffix)
+            listing["mtime"] = stat.st_mtime_ns
+            listing["nlink"] = stat.st_nlink
+            cache[relative] = listing
+            num_listed += 1
+        files.extend(directory.joinpath(name) for name in listing["files"])
+        for name in listing["dirs"]:
+            keys = parse_partition_dir(name)
+            if all(
+                match_partition_value(value, filters[key])
+                for key, value in keys.items()
+                if key in filters
+            ):
+                directories.append(directory.joinpath(name))
+    logger.debug(f"Found {len(files):,} files in {path} | listed directories: {num_listed:,}")
+    if cache_path is not None and num_listed > 0:
+        with atomic_path(cache_path) as tmp_path:
+            tmp_path.write_text(json.dumps({"path": str(path), "listings": cache}))
+    return sorted(files)
+
+
+def scan_partitioned_parquet(
+    path: Path | str,
+    filters: Mapping[str, Any] | None = None,
+    cache_path: Path | str | None = None,
+    hive_schema: Mapping[str, pl.DataType] | None = None,
+    column_filters: Mapping[str, Any] | None = None,
+    index_path: Path | str | None = None,
+    **kwargs: Any,
+) -> pl.LazyFrame:
+    r"""Scan the parquet files of the partitions of a hive-partitioned
+    dataset that match some filters.
+
+    Only the files of the matching partitions are scanned
+    (see ``find_partition_files``). The partition keys are added as
+    columns, after the columns of the files.
+
+    The column filters select the rows whose values match the
+    filters (see ``make_column_filter``). The files whose column
+    statistics show that they do not contain any matching row are
+    not scanned (see ``grizz.utils.parquet.ParquetIndex.prune``).
+    The statistics are read from the index, so the footers of the
+    files are only read when the files change.
+
+    Args:
+        path: The path to the root directory of the dataset.
+        filters: The filters of the partition keys. If ``None``, all
+            the partitions are scanned.
+        cache_path: The path to the JSON file of the cached
+            directory listings. If ``None``, the listings are not
+            cached.
+        hive_schema: The data types of the partition keys. The
+            partition keys without data type are strings.
+        column_filters: The filters of the columns of the files.
+            If ``None``, the rows are not filtered.
+        index_path: The path to the JSON file of the parquet index.
+            It is required to use ``column_filters``.
+        **kwargs: Additional keyword arguments for
+            ``polars.scan_parquet``.
+
+    Returns:
+        The LazyFrame. It is empty if no partition matches the
+            filters.
+
+    Raises:
+        ValueError: if ``column_filters`` is set without
+            ``index_path``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> import polars as pl
+    >>> from pathlib import Path
+    >>> from grizz.utils.hive import scan_partitioned_parquet
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     for day in ["2024-01-01", "2024-01-02"]:
+    ...         path = Path(tmpdir).joinpath(f"day={day}")
+    ...         path.mkdir()
+    ...         pl.DataFrame({"col1": [1, 2]}).write_parquet(path.joinpath("part-00000.parquet"))
+    ...     frame = scan_partitioned_parquet(
+    ...         tmpdir, filters={"day": ["2024-01-02"]}, hive_schema={"day": pl.Date}
+    ...     ).collect()
+    ...
+    >>> frame.shape
+    (2, 2)
+    >>> frame.columns
+    ['col1', 'day']
+
+    ```
+    """
+    if column_filters and index_path is None:
+        msg = "index_path is required to use column_filters"
+        raise ValueError(msg)
+    path = sanitize_path(path)
+    hive_schema = hive_schema or {}
+    files = find_partition_files(path, filters=filters, cache_path=cache_path)
+    if column_filters:
+        index = ParquetIndex(index_path)
+        files = index.prune(files, column_filters)
+        index.save()
+    partitions = defaultdict(list)
+    for file in files:
+        partitions[file.parent].append(file)
+    if not partitions:
+        return pl.LazyFrame()
+    frames = []
+    for directory, files in partitions.items():
+        keys = parse_partition_dir(directory.relative_to(path).as_posix())
+        frames.append(
+            pl.scan_parquet(files, hive_partitioning=False, **kwargs).with_columns(
+                pl.lit(value, dtype=pl.String).cast(hive_schema.get(key, pl.String)).alias(key)
+                for key, value in keys.items()
+            )
+        )
+    frame = pl.concat(frames, how="vertical")
+    if column_filters:
+        frame = frame.filter(
+            *[make_column_filter(column, value) for column, value in column_filters.items()]
+        )
+    return frame
+
+
+def _match_range(value: str | None, start: Any, end: Any) -> bool:
+    r"""Indicate if the value of a partition key is in a range.
+
+    Args:
+        value: The value of the partition key, or ``None`` for a null
+            value.
+        start: The start of the range (included), or ``None`` if the
+            range has no lower bound.
+        end: The end of the range (excluded), or ``None`` if the
+            range has no upper bound.
+
+    Returns:
+        ``True`` if the value is in the range, otherwise ``False``.
+            A null value is never in a range.
+    """
+    if value is None:
+        return False
+    if start is not None:
+        converted = _convert_value(value, start)
+        if converted is None or converted < start:
+            return False
+    if end is not None:
+        converted = _convert_value(value, end)
+        if converted is None or converted >= end:
+            return False
+    return True
+
+
+def _match_accepted_value(value: str | None, accepted: Any) -> bool:
+    r"""Indicate if the value of a partition key is equal to an
+    accepted value.
+
+    Args:
+        value: The value of the partition key, or ``None`` for a null
+            value.
+        accepted: The accepted value. ``None`` accepts the null
+            values.
+
+    Returns:
+        ``True`` if the value is equal to the accepted value,
+            otherwise ``False``.
+    """
+    if accepted is None or value is None:
+        return accepted is None and value is None
+    return _convert_value(value, accepted) == accepted
+
+
+# The converters of the partition values. The order matters because
+# ``bool`` is a subclass of ``int`` and ``datetime`` is a subclass of
+# ``date``.
+_CONVERTERS = (
+    (bool, lambda value: value.lower() == "true"),
+    (int, int),
+    (float, float),
+    (datetime, datetime.fromisoformat),
+    (date, date.fromisoformat),
+)
+
+
+def _convert_value(value: str, like: Any) -> Any:
+    r"""Convert the string value of a partition key to the type of
+    another value.
+
+    Args:
+        value: The value to convert.
+        like: The value whose type is used.
+
+    Returns:
+        The converted value, or ``None`` if the value cannot be
+            converted.
+    """
+    for cls, converter in _CONVERTERS:
+        if isinstance(like, cls):
+            try:
+                return converter(value)
+            except ValueError:
+                return None
+    return value
+
+
+def _list_directory(path: Path, suffix: str) -> dict[str, Any]:
+    r"""List the sub-directories and the files of a directory.
+
+    Args:
+        path: The path to the directory.
+        suffix: The suffix of the files to list.
+
+    Returns:
+        A dictionary with the sorted names of the sub-directories
+            (``'dirs'``) and of the files (``'files'``).
+    """
+    dirs, files = [], []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.name.startswith((".", "_")):
+                continue
+            if entry.is_dir():
+                dirs.append(entry.name)
+            elif entry.name.endswith(suffix):
+                files.append(entry.name)
+    return {"dirs": sorted(dirs), "files": sorted(files)}
+
+
+def _load_listing_cache(path: Path | str | None, root: Path) -> dict[str, dict[str, Any]]:
+    r"""Load the cached directory listings.
+
+    Args:
+        path: The path to the JSON file of the cached directory
+            listings, or ``None``.
+        root: The path to the root directory of the dataset.
+
+    Returns:
+        The cached directory listings, indexed by the path relative
+            to the root directory. It is empty if the file does not
+            exist, cannot be read, or is for another dataset.
+    """
+    if path is None:
+        return {}
+    try:
+        cache = json.loads(sanitize_path(path).read_text())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("path") != str(root):
+        return {}
+    return cache.get("listings", {})
@@ -0,0 +1,184 @@
+r"""Contain an inter-process file lock."""
+
+from __future__ import annotations
+
+__all__ = ["FileLock"]
+
+import errno
+import logging
+import os
+import sys
+import time
+from typing import TYPE_CHECKING
+
+from grizz.utils.path import sanitize_path
+
+if sys.platform == "win32":  # pragma: no cover
+    import msvcrt
+else:
+    import fcntl
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from grizz.types import Self
+
+logger = logging.getLogger(__name__)
+
+# The error codes raised when the lock is held by another process.
+_LOCKED_ERRNOS = frozenset({errno.EWOULDBLOCK, errno.EAGAIN, errno.EACCES, errno.EDEADLK})
+
+
+class FileLock:
+    r"""Implement an inter-process lock based on a lock file.
+
+    The lock is an advisory lock on the lock file (``flock`` on POSIX
+    systems, ``msvcrt.locking`` on Windows), so it is automatically
+    released by the operating system if the process holding it dies.
+    The lock is not reentrant.
+
+    Args:
+        path: The path to the lock file. It is created if it does not
+            exist.
+        timeout: The maximum time in seconds to wait for the lock.
+            If ``None``, wait until the lock is acquired.
+        poll_interval: The time in seconds between two attempts to
+            acquire the lock.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> from pathlib import Path
+    >>> from grizz.utils.lock import FileLock
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     lock = FileLock(Path(tmpdir).joinpath("data.lock"))
+    ...     with lock:
+    ...         lock.is_locked
+    ...
+    True
+
+    ```
+    """
+
+    def __init__(
+        self, path: Path | str, timeout: float | None = None, poll_interval: float = 0.05
+    ) -> None:
+        self._path = sanitize_path(path)
+        self._timeout = timeout
+        self._poll_interval = poll_interval
+        self._fd: int | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(path={self._path}, timeout={self._timeout}, "
+            f"poll_interval={self._poll_interval})"
+        )
+
+    def __enter__(self) -> Self:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.release()
+
+    @property
+    def is_locked(self) -> bool:
+        r"""Indicate if the lock is held by this object."""
+        return self._fd is not None
+
+    def acquire(self, blocking: bool = True) -> bool:
+        r"""Acquire the lock.
+
+        Args:
+            blocking: If ``True``, wait until the lock is acquired or
+                the timeout expires. If ``False``, return immediately.
+
+        Returns:
+            ``True`` if the lock was acquired, ``False`` if
+                ``blocking=False`` and the lock is held by another
+                process.
+
+        Raises:
+            RuntimeError: if the lock is already held by this object.
+            TimeoutError: if the lock cannot be acquired before the
+                timeout.
+            OSError: if the lock file cannot be locked for another
+                reason than the lock being held by another process.
+        """
+        if self._fd is not None:
+            msg = f"The lock {self._path} is already acquired"
+            raise RuntimeError(msg)
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        start = time.monotonic()
+        waiting = False
+        while True:
+            fd = os.open(self._path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                locked = _try_lock(fd)
+            except OSError:
+                os.close(fd)
+                raise
+            if locked:
+                self._fd = fd
+                return True
+            os.close(fd)
+            if not blocking:
+                return False
+            if not waiting:
+                logger.info(f"Waiting for the lock {self._path}...")
+                waiting = True
+            if self._timeout is not None and time.monotonic() - start >= self._timeout:
+                msg = f"Could not acquire the lock {self._path} in {self._timeout} seconds"
+                raise TimeoutError(msg)
+            time.sleep(self._poll_interval)
+
+    def release(self) -> None:
+        r"""Release the lock.
+
+        Nothing happens if the lock is not held by this object.
+        """
+        if self._fd is None:
+            return
+        _unlock(self._fd)
+        os.close(self._fd)
+        self._fd = None
+
+
+def _try_lock(fd: int) -> bool:
+    r"""Try to lock a file descriptor without blocking.
+
+    Args:
+        fd: The file descriptor to lock.
+
+    Returns:
+        ``True`` if the file descriptor was locked, ``False`` if the
+            lock is held by another process.
+
+    Raises:
+        OSError: if the file descriptor cannot be locked for another
+            reason.
+    """
+    try:
+        if sys.platform == "win32":  # pragma: no cover
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError as exc:
+        if exc.errno in _LOCKED_ERRNOS:
+            return False
+        raise
+    return True
+
+
+def _unlock(fd: int) -> None:
+    r"""Unlock a file descriptor.
+
+    Args:
+        fd: The file descriptor to unlock.
+    """
+    if sys.platform == "win32":  # pragma: no cover
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
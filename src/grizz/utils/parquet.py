@@ -0,0 +1,438 @@
+r"""Contain an index of the metadata of parquet files."""
+
+from __future__ import annotations
+
+__all__ = ["ParquetIndex"]
+
+import base64
+import json
+import logging
+import threading
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import TYPE_CHECKING, Any
+
+from grizz.utils.concurrency import map_in_threads
+from grizz.utils.imports import check_pyarrow, is_pyarrow_available
+from grizz.utils.path import atomic_path, find_parquet_files, sanitize_path
+
+if is_pyarrow_available():  # pragma: no cover
+    import pyarrow.parquet as pq
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Mapping, Sequence
+    from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class ParquetIndex:
+    r"""Implement an index of the metadata of parquet files.
+
+    The index stores the metadata of each parquet file: the schema,
+    the number of rows, the row groups, and the minimum, maximum, and
+    number of nulls of each column. The metadata of a file is read
+    from its footer the first time, then reused while the
+    modification time and the size of the file do not change, so the
+    files do not need to be opened again. The index is stored in a
+    JSON file, so it can be reused between runs.
+
+    The index can be used to count the rows or to get the schemas of
+    many files, or to skip the files that cannot contain the rows
+    selected by a filter (see ``prune``).
+
+    This class requires ``pyarrow``.
+
+    Args:
+        path: The path to the JSON file of the index. It is loaded if
+            it exists.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> import polars as pl
+    >>> from pathlib import Path
+    >>> from grizz.utils.parquet import ParquetIndex
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     path = Path(tmpdir).joinpath("data.parquet")
+    ...     pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", None]}).write_parquet(path)
+    ...     index = ParquetIndex(Path(tmpdir).joinpath("index.json"))
+    ...     metadata = index.get(path)
+    ...
+    >>> metadata["num_rows"]
+    3
+    >>> list(metadata["schema"])
+    ['col1', 'col2']
+    >>> metadata["columns"]["col1"]
+    {'min': 1, 'max': 3, 'null_count': 0}
+
+    ```
+    """
+
+    def __init__(self, path: Path | str) -> None:
+        check_pyarrow()
+        self._path = sanitize_path(path)
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = self._load()
+        self._modified = False
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(path={self._path}, num_files={len(self._entries):,})"
+
+    @property
+    def path(self) -> Path:
+        r"""The path to the JSON file of the index."""
+        return self._path
+
+    def get(self, path: Path | str) -> dict[str, Any]:
+        r"""Get the metadata of a parquet file.
+
+        The metadata is read from the footer of the file if the file
+        is not in the index or if it changed since it was indexed.
+        Call ``save`` to store the new metadata in the index file.
+
+        Args:
+            path: The path to the parquet file.
+
+        Returns:
+            The metadata of the file, with the following keys:
+                ``'schema'`` (the data type of each column),
+                ``'num_rows'``, ``'row_groups'`` (the number of rows,
+                the index of the first row, and the column statistics
+                of each row group), and ``'columns'`` (the column
+                statistics of the file). The column statistics are
+                dictionaries with the keys ``'min'``, ``'max'``, and
+                ``'null_count'``. A statistic is ``None`` if it is
+                unknown.
+        """
+        path = sanitize_path(path)
+        stat = path.stat()
+        key = str(path)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None or entry["mtime"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+            entry = _read_metadata(path)
+            entry |= {"mtime": stat.st_mtime_ns, "size": stat.st_size}
+            with self._lock:
+                self._entries[key] = entry
+                self._modified = True
+        return entry
+
+    def index(
+        self, path: Path | str, recursive: bool = True, max_workers: int = 1
+    ) -> dict[Path, dict[str, Any]]:
+        r"""Index all the parquet files in a directory and save the
+        index.
+
+        The files of the directory that are no longer on disk are
+        removed from the index.
+
+        Args:
+            path: The path to the directory or to a parquet file.
+            recursive: Indicate if the parquet files in the
+                sub-directories are also indexed.
+            max_workers: The maximum number of footers to read
+                concurrently.
+
+        Returns:
+            The metadata of each parquet file.
+        """
+        path = sanitize_path(path)
+        files = sorted(find_parquet_files(path, recursive=recursive))
+        found = {str(file) for file in files}
+        with self._lock:
+            prefix = f"{path}/"
+            for key in [key for key in self._entries if key.startswith(prefix)]:
+                if key not in found:
+                    del self._entries[key]
+                    self._modified = True
+        metadata = dict(zip(files, self.get_many(files, max_workers=max_workers)))
+        self.save()
+        return metadata
+
+    def get_many(self, paths: Iterable[Path | str], max_workers: int = 1) -> list[dict[str, Any]]:
+        r"""Get the metadata of several parquet files.
+
+        Args:
+            paths: The paths to the parquet files.
+            max_workers: The maximum number of footers to read
+                concurrently.
+
+        Returns:
+            The metadata of each file, in the same order as the paths.
+        """
+        return list(map_in_threads(self.get, paths, max_workers=max_workers))
+
+    def get_num_rows(self, paths: Iterable[Path | str]) -> int:
+        r"""Get the total number of rows of several parquet files.
+
+        Args:
+            paths: The paths to the parquet files.
+
+        Returns:
+            The total number of rows.
+        """
+        return sum(self.get(path)["num_rows"] for path in paths)
+
+    def prune(self, paths: Sequence[Path | str], filters: Mapping[str, Any]) -> list[Path]:
+        r"""Remove the parquet files that cannot contain rows that
+        match some filters.
+
+        A file is removed if the minimum and maximum of a column show
+        that no value of the column can match its filter. A file is
+        kept if a column has no statistics.
+
+        Args:
+            paths: The paths to the parquet files.
+            filters: The filters of the columns. Each filter can be a
+                dictionary with the optional ``'start'`` (included)
+                and ``'end'`` (excluded) of a range, a list of
+                accepted values, or a single accepted value.
+
+        Returns:
+            The paths to the files that can contain matching rows.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import tempfile
+        >>> import polars as pl
+        >>> from pathlib import Path
+        >>> from grizz.utils.parquet import ParquetIndex
+        >>> with tempfile.TemporaryDirectory() as tmpdir:
+        ...     paths = [Path(tmpdir).joinpath(f"data{i}.parquet") for i in range(3)]
+        ...     for i, path in enumerate(paths):
+        ...         pl.DataFrame({"col1": [10 * i, 10 * i + 5]}).write_parquet(path)
+        ...     index = ParquetIndex(Path(tmpdir).joinpath("index.json"))
+        ...     files = index.prune(paths, filters={"col1": {"start": 12}})
+        ...
+        >>> [file.name for file in files]
+        ['data1.parquet', 'data2.parquet']
+
+        ```
+        """
+        kept = []
+        for path in paths:
+            columns = self.get(path)["columns"]
+            if all(
+                _may_match(columns[column], partition_filter)
+                for column, partition_filter in filters.items()
+                if column in columns
+            ):
+                kept.append(sanitize_path(path))
+        logger.debug(f"Pruned {len(paths) - len(kept):,}/{len(paths):,} parquet files")
+        return kept
+
+    def save(self) -> None:
+        r"""Save the index in the JSON file if it was modified."""
+        with self._lock:
+            if not self._modified:
+                return
+            data = json.dumps(self._entries, default=_encode_value)
+            self._modified = False
+        with atomic_path(self._path) as tmp_path:
+            tmp_path.write_text(data)
+        logger.info(f"Saved the parquet index {self._path} ({len(self._entries):,} files)")
+
+    def _load(self) -> dict[str, dict[str, Any]]:
+        r"""Load the index from the JSON file.
+
+        Returns:
+            The metadata of each file, indexed by path. It is empty
+                if the file does not exist or cannot be read.
+        """
+        try:
+            data = json.loads(self._path.read_text(), object_hook=_decode_value)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            logger.warning(f"Could not read the parquet index {self._path}. It is rebuilt")
+            return {}
+        return data
+
+
+def _read_metadata(path: Path) -> dict[str, Any]:
+    r"""Read the metadata of a parquet file from its footer.
+
+    Args:
+        path: The path to the parquet file.
+
+    Returns:
+        The metadata of the file. See ``ParquetIndex.get``.
+    """
+    metadata = pq.read_metadata(path)
+    schema = metadata.schema.to_arrow_schema()
+    row_groups, offset = [], 0
+    for i in range(metadata.num_row_groups):
+        row_group = metadata.row_group(i)
+        columns = {}
+        for j in range(row_group.num_columns):
+            column = row_group.column(j)
+            stats = column.statistics
+            has_min_max = stats is not None and stats.has_min_max
+            columns[column.path_in_schema] = {
+                "min": _check_value(stats.min) if has_min_max else None,
+                "max": _check_value(stats.max) if has_min_max else None,
+                "null_count": (
+                    stats.null_count if stats is not None and stats.has_null_count else None
+                ),
+            }
+        row_groups.append({"num_rows": row_group.num_rows, "offset": offset, "columns": columns})
+        offset += row_group.num_rows
+    return {
+        "schema": {field.name: str(field.type) for field in schema},
+        "num_rows": metadata.num_rows,
+        "row_groups": row_groups,
+        "columns": _merge_column_stats(row_groups),
+    }
+
+
+def _merge_column_stats(row_groups: list[dict[str, Any]]) -> dict[str, dict[str, Any]]:
+    r"""Merge the column statistics of the row groups of a file.
+
+    Args:
+        row_groups: The metadata of the row groups.
+
+    Returns:
+        The column statistics of the file. A statistic is ``None`` if
+            it is unknown for at least one row group.
+    """
+    if not row_groups:
+        return {}
+    merged = {}
+    for column in row_groups[0]["columns"]:
+        stats = [row_group["columns"].get(column, {}) for row_group in row_groups]
+        mins = [stat.get("min") for stat in stats]
+        maxs = [stat.get("max") for stat in stats]
+        null_counts = [stat.get("null_count") for stat in stats]
+        merged[column] = {
+            "min": None if None in mins else _safe_reduce(min, mins),
+            "max": None if None in maxs else _safe_reduce(max, maxs),
+            "null_count": None if None in null_counts else sum(null_counts),
+        }
+    return merged
+
+
+def _safe_reduce(func: Any, values: list[Any]) -> Any:
+    r"""Apply ``min`` or ``max`` to values that may not be comparable.
+
+    Args:
+        func: ``min`` or ``max``.
+        values: The values.
+
+    Returns:
+        The result, or ``None`` if the values are not comparable.
+    """
+    try:
+        return func(values)
+    except TypeError:
+        return None
+
+
+def _may_match(stats: dict[str, Any], partition_filter: Any) -> bool:
+    r"""Indicate if a column with some statistics may contain a value
+    that matches a filter.
+
+    Args:
+        stats: The statistics of the column.
+        partition_filter: The filter.
+
+    Returns:
+        ``False`` if no value of the column can match the filter,
+            otherwise ``True``.
+    """
+    low, high = stats.get("min"), stats.get("max")
+    if low is None or high is None:
+        return True
+    try:
+        if isinstance(partition_filter, dict):
+            start, end = partition_filter.get("start"), partition_filter.get("end")
+            return (start is None or high >= start) and (end is None or low < end)
+        if not isinstance(partition_filter, (list, tuple, set, frozenset)):
+            partition_filter = [partition_filter]
+        return any(
+            low <= value <= high if value is not None else stats.get("null_count") != 0
+            for value in partition_filter
+        )
+    except TypeError:
+        return True
+
+
+# The encoders of the statistic values that are not JSON types. The
+# order matters because ``datetime`` is a subclass of ``date``.
+_ENCODERS = (
+    (datetime, "__datetime__", datetime.isoformat),
+    (date, "__date__", date.isoformat),
+    (time, "__time__", time.isoformat),
+    (Decimal, "__decimal__", str),
+    (bytes, "__bytes__", lambda value: base64.b64encode(value).decode("ascii")),
+)
+
+
+def _check_value(value: Any) -> Any:
+    r"""Check that a statistic value can be stored in JSON.
+
+    Args:
+        value: The value to check.
+
+    Returns:
+        The value if it is a JSON type or if it can be encoded by
+            ``_encode_value``, otherwise ``None``.
+    """
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    if isinstance(value, tuple(cls for cls, _, _ in _ENCODERS)):
+        return value
+    return None
+
+
+def _encode_value(value: Any) -> dict[str, Any]:
+    r"""Encode a statistic value that is not a JSON type.
+
+    This function is used as the ``default`` function of
+    ``json.dumps``, so the index keeps the original values in memory
+    and only the stored values are encoded.
+
+    Args:
+        value: The value to encode.
+
+    Returns:
+        The encoded value.
+
+    Raises:
+        TypeError: if the value cannot be encoded.
+    """
+    for cls, key, encoder in _ENCODERS:
+        if isinstance(value, cls):
+            return {key: encoder(value)}
+    msg = f"Object of type {type(value).__qualname__} is not JSON serializable"
+    raise TypeError(msg)
+
+
+_DECODERS = {
+    "__datetime__": datetime.fromisoformat,
+    "__date__": date.fromisoformat,
+    "__time__": time.fromisoformat,
+    "__decimal__": Decimal,
+    "__bytes__": base64.b64decode,
+}
+
+
+def _decode_value(obj: dict[str, Any]) -> Any:
+    r"""Decode a statistic value encoded by ``_encode_value``.
+
+    Args:
+        obj: A JSON object.
+
+    Returns:
+        The decoded value if the object is an encoded value,
+            otherwise the object.
+    """
+    if len(obj) == 1:
+        key, value = next(iter(obj.items()))
+        if key in _DECODERS:
+            return _DECODERS[key](value)
+    return obj
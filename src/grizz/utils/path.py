@@ -2,8 +2,17 @@ r"""Contain utility functions to manage paths."""
 
 from __future__ import annotations
 
-__all__ = ["find_files", "find_parquet_files", "human_file_size", "sanitize_path"]
-
+__all__ = [
+    "atomic_path",
+    "find_files",
+    "find_parquet_files",
+    "human_file_size",
+    "sanitize_path",
+]
+
+import shutil
+import uuid
+from contextlib import contextmanager
 from pathlib import Path
 from typing import TYPE_CHECKING
 from urllib.parse import unquote, urlparse
@@ -11,7 +20,7 @@ from urllib.parse import unquote, urlparse
 from grizz.utils.format import human_byte
 
 if TYPE_CHECKING:
-    from collections.abc import Callable
+    from collections.abc import Callable, Generator
 
 
 def human_file_size(path: Path | str, decimal: int = 2) -> str:
@@ -130,3 +139,81 @@ def find_parquet_files(path: Path | str, recursive: bool = True) -> list[Path]:
     return find_files(
         path=path, filter_fn=lambda path: path.name.endswith(".parquet"), recursive=recursive
     )
+
+
+@contextmanager
+def atomic_path(path: Path | str) -> Generator[Path, None, None]:
+    r"""Context manager to write a file or a directory atomically.
+
+    The context manager yields a temporary path in the same directory
+    as the target path. The data should be written to this temporary
+    path, and it is renamed to the target path when the block exits
+    without error. The temporary path is removed if the block raises
+    an exception.
+
+    A file is replaced with a single rename, which is atomic on POSIX
+    systems, so a reader never sees a partially written file. A
+    directory cannot replace a non-empty directory, so the existing
+    directory is first renamed aside, then the new directory is
+    renamed to the target path, and finally the old directory is
+    removed. A reader never sees a partially written directory, but
+    the target path does not exist between the two renames.
+
+    Args:
+        path: The target path.
+
+    Yields:
+        The temporary path to write to.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import tempfile
+    >>> from pathlib import Path
+    >>> from grizz.utils.path import atomic_path
+    >>> with tempfile.TemporaryDirectory() as tmpdir:
+    ...     path = Path(tmpdir).joinpath("data.txt")
+    ...     with atomic_path(path) as tmp_path:
+    ...         _ = tmp_path.write_text("abc")
+    ...     path.read_text()
+    ...
+    'abc'
+
+    ```
+    """
+    path = sanitize_path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        yield tmp_path
+        if tmp_path.is_dir() and path.is_dir():
+            _replace_directory(tmp_path, path)
+        else:
+            tmp_path.replace(path)
+    finally:
+        if tmp_path.is_dir():
+            shutil.rmtree(tmp_path)
+        else:
+            tmp_path.unlink(missing_ok=True)
+
+
+def _replace_directory(src: Path, dst: Path) -> None:
+    r"""Replace a directory by another directory.
+
+    The old directory is renamed aside before the new directory is
+    renamed to the target path, and it is only removed after. If the
+    new directory cannot be renamed, the old directory is restored.
+
+    Args:
+        src: The path to the new directory.
+        dst: The path to the directory to replace.
+    """
+    old_path = dst.with_name(f".{dst.name}.{uuid.uuid4().hex}.old")
+    dst.replace(old_path)
+    try:
+        src.replace(dst)
+    except BaseException:
+        old_path.replace(dst)
+        raise
+    shutil.rmtree(old_path)
@@ -0,0 +1,412 @@
+r"""Contain utility functions to profile the ``polars.DataFrame``
+pipelines."""
+
+from __future__ import annotations
+
+__all__ = ["ProfileRecord", "Profiler", "profile_block"]
+
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any
+
+import polars as pl
+
+from grizz.utils.path import sanitize_path
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+    from pathlib import Path
+
+    from grizz.types import Self
+
+_ACTIVE_PROFILER: ContextVar[Profiler | None] = ContextVar("grizz_profiler", default=None)
+# The parent record is stored with its profiler, so the records of a
+# profiler are never nested under the records of another profiler.
+_PARENT_RECORD: ContextVar[tuple[Profiler, int] | None] = ContextVar(
+    "grizz_profiler_parent", default=None
+)
+
+
+class ProfileRecord:
+    r"""Implement a record of one profiled step.
+
+    Args:
+        index: The index of the record in the profiler.
+        name: The name of the step, for example
+            ``'InplaceCastTransformer.transform'``.
+        category: The category of the step, for example
+            ``'transform'``, ``'fit'`` or ``'ingest'``.
+        parent: The index of the parent record, or ``None`` if the
+            step is not nested in another profiled step.
+        depth: The nesting depth of the step.
+        start: The start time of the step in seconds, relative to the
+            creation of the profiler.
+
+    Example usage:
+
+    ```pycon
+
+    >>> from grizz.utils.profiling import ProfileRecord
+    >>> record = ProfileRecord(index=0, name="step", category="transform")
+    >>> record
+    ProfileRecord(index=0, name='step', category='transform', parent=None, depth=0)
+
+    ```
+    """
+
+    def __init__(
+        self,
+        index: int,
+        name: str,
+        category: str,
+        parent: int | None = None,
+        depth: int = 0,
+        start: float = 0.0,
+    ) -> None:
+        self.index = index
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.depth = depth
+        self.start = start
+        self.duration: float | None = None
+        self.thread_id = threading.get_ident()
+        self.rows_in: int | None = None
+        self.columns_in: int | None = None
+        self.bytes_in: int | None = None
+        self.rows_out: int | None = None
+        self.columns_out: int | None = None
+        self.bytes_out: int | None = None
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__qualname__}(index={self.index:,}, name={self.name!r}, "
+            f"category={self.category!r}, parent={self.parent}, depth={self.depth:,})"
+        )
+
+    def set_input(self, frame: pl.DataFrame) -> None:
+        r"""Set the shape and estimated size of the input DataFrame.
+
+        Nothing is recorded if the input is not a
+        ``polars.DataFrame``, so a LazyFrame is never collected.
+
+        Args:
+            frame: The input DataFrame.
+        """
+        if isinstance(frame, pl.DataFrame):
+            self.rows_in, self.columns_in = frame.shape
+            self.bytes_in = frame.estimated_size()
+
+    def set_output(self, frame: pl.DataFrame) -> None:
+        r"""Set the shape and estimated size of the output DataFrame.
+
+        Nothing is recorded if the output is not a
+        ``polars.DataFrame``, so a LazyFrame is never collected.
+
+        Args:
+            frame: The output DataFrame.
+        """
+        if isinstance(frame, pl.DataFrame):
+            self.rows_out, self.columns_out = frame.shape
+            self.bytes_out = frame.estimated_size()
+
+    def to_dict(self) -> dict[str, Any]:
+        r"""Return the record as a dictionary.
+
+        Returns:
+            The record as a dictionary.
+
+        Example usage:
+
+        ```pycon
+
+        >>> from grizz.utils.profiling import ProfileRecord
+        >>> record = ProfileRecord(index=0, name="step", category="transform")
+        >>> record.to_dict()["name"]
+        'step'
+
+        ```
+        """
+        return {
+            "index": self.index,
+            "name": self.name,
+            "category": self.category,
+            "parent": self.parent,
+            "depth": self.depth,
+            "start": self.start,
+            "duration": self.duration,
+            "thread_id": self.thread_id,
+            "rows_in": self.rows_in,
+            "columns_in": self.columns_in,
+            "bytes_in": self.bytes_in,
+            "rows_out": self.rows_out,
+            "columns_out": self.columns_out,
+            "bytes_out": self.bytes_out,
+        }
+
+
+class Profiler:
+    r"""Implement a profiler to record the steps of the
+    ``polars.DataFrame`` pipelines.
+
+    The profiler is activated with a ``with`` statement. While it is
+    active, each transformer, ingestor or wrapper invocation that is
+    instrumented with ``profile_block`` is recorded with its wall
+    time, the shape and estimated size of its input and output, and
+    its nesting under the other steps. The profiler is bound to the
+    current context, so the steps executed in other threads are not
+    recorded unless the context is copied.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.transformer import Sequential, InplaceCast
+    >>> from grizz.utils.profiling import Profiler
+    >>> transformer = Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)])
+    >>> frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    >>> with Profiler() as profiler:
+    ...     out = transformer.transform(frame)
+    ...
+    >>> [(record.name, record.depth) for record in profiler.records]
+    [('SequentialTransformer.transform', 0), ('InplaceCastTransformer.transform', 1)]
+    >>> profiler.records[1].rows_out
+    3
+
+    ```
+    """
+
+    def __init__(self) -> None:
+        self._records: list[ProfileRecord] = []
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._token = None
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__qualname__}(num_records={len(self._records):,})"
+
+    def __enter__(self) -> Self:
+        self._token = _ACTIVE_PROFILER.set(self)
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        _ACTIVE_PROFILER.reset(self._token)
+        self._token = None
+
+    @property
+    def records(self) -> tuple[ProfileRecord, ...]:
+        r"""The records of the profiled steps, in start order."""
+        return tuple(self._records)
+
+    def start_record(self, name: str, category: str, parent: int | None) -> ProfileRecord:
+        r"""Create a new record and add it to the profiler.
+
+        Args:
+            name: The name of the step.
+            category: The category of the step.
+            parent: The index of the parent record, or ``None``.
+
+        Returns:
+            The new record.
+        """
+        with self._lock:
+            depth = 0 if parent is None else self._records[parent].depth + 1
+            record = ProfileRecord(
+                index=len(self._records),
+                name=name,
+                category=category,
+                parent=parent,
+                depth=depth,
+                start=time.perf_counter() - self._origin,
+            )
+            self._records.append(record)
+        return record
+
+    def stop_record(self, record: ProfileRecord) -> None:
+        r"""Set the duration of a record.
+
+        Args:
+            record: The record to stop.
+        """
+        record.duration = time.perf_counter() - self._origin - record.start
+
+    def to_dict(self) -> list[dict[str, Any]]:
+        r"""Return the records as a list of dictionaries.
+
+        Returns:
+            The records as a list of dictionaries.
+        """
+        return [record.to_dict() for record in self._records]
+
+    def to_frame(self) -> pl.DataFrame:
+        r"""Return the records as a DataFrame.
+
+        Returns:
+            A DataFrame with one row per record. It can be sorted by
+                ``duration`` to find the slowest steps.
+
+        Example usage:
+
+        ```pycon
+
+        >>> import polars as pl
+        >>> from grizz.transformer import InplaceCast
+        >>> from grizz.utils.profiling import Profiler
+        >>> transformer = InplaceCast(columns=["col1"], dtype=pl.Float32)
+        >>> frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+        >>> with Profiler() as profiler:
+        ...     out = transformer.transform(frame)
+        ...
+        >>> profiler.to_frame().select(["name", "rows_in", "rows_out"])
+        shape: (1, 3)
+        ┌──────────────────────────────────┬─────────┬──────────┐
+        │ name                             ┆ rows_in ┆ rows_out │
+        │ ---                              ┆ ---     ┆ ---      │
+        │ str                              ┆ i64     ┆ i64      │
+        ╞══════════════════════════════════╪═════════╪══════════╡
+        │ InplaceCastTransformer.transform ┆ 3       ┆ 3        │
+        └──────────────────────────────────┴─────────┴──────────┘
+
+        ```
+        """
+        return pl.DataFrame(
+            self.to_dict(),
+            schema={
+                "index": pl.Int64,
+                "name": pl.String,
+                "category": pl.String,
+                "parent": pl.Int64,
+                "depth": pl.Int64,
+                "start": pl.Float64,
+                "duration": pl.Float64,
+                "thread_id": pl.Int64,
+                "rows_in": pl.Int64,
+                "columns_in": pl.Int64,
+                "bytes_in": pl.Int64,
+                "rows_out": pl.Int64,
+                "columns_out": pl.Int64,
+                "bytes_out": pl.Int64,
+            },
+        )
+
+    def to_json(self, path: Path | str | None = None) -> str:
+        r"""Export the records to JSON.
+
+        Args:
+            path: The path to the JSON file to write. If ``None``, the
+                JSON is only returned.
+
+        Returns:
+            The records in JSON format.
+        """
+        content = json.dumps(self.to_dict(), indent=2)
+        if path is not None:
+            _write_text(path, content)
+        return content
+
+    def to_chrome_trace(self, path: Path | str | None = None) -> dict[str, Any]:
+        r"""Export the records to the Chrome trace event format.
+
+        The trace can be loaded in ``chrome://tracing`` or Perfetto.
+        The nested steps are displayed below their parent step.
+
+        Args:
+            path: The path to the JSON file to write. If ``None``, the
+                trace is only returned.
+
+        Returns:
+            The trace in Chrome trace event format.
+        """
+        pid = os.getpid()
+        events = []
+        for record in self._records:
+            args = record.to_dict()
+            for key in ("name", "category", "start", "duration", "thread_id"):
+                args.pop(key)
+            events.append(
+                {
+                    "name": record.name,
+                    "cat": record.category,
+                    "ph": "X",
+                    "ts": record.start * 1e6,
+                    "dur": (record.duration or 0.0) * 1e6,
+                    "pid": pid,
+                    "tid": record.thread_id,
+                    "args": args,
+                }
+            )
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            _write_text(path, json.dumps(trace))
+        return trace
+
+
+@contextmanager
+def profile_block(
+    name: str, category: str, frame: pl.DataFrame | None = None
+) -> Generator[ProfileRecord | None, None, None]:
+    r"""Profile a block of code with the active profiler.
+
+    This context manager does nothing if no profiler is active, so it
+    can be used in the hot paths of the pipelines.
+
+    Args:
+        name: The name of the step.
+        category: The category of the step, for example
+            ``'transform'``, ``'fit'`` or ``'ingest'``.
+        frame: The input DataFrame of the step, if any.
+
+    Yields:
+        The record of the step, or ``None`` if no profiler is active.
+            The output DataFrame can be set with
+            ``record.set_output``.
+
+    Example usage:
+
+    ```pycon
+
+    >>> import polars as pl
+    >>> from grizz.utils.profiling import Profiler, profile_block
+    >>> frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    >>> with Profiler() as profiler:
+    ...     with profile_block("my_step", category="transform", frame=frame) as record:
+    ...         out = frame.head(2)
+    ...         record.set_output(out)
+    ...
+    >>> profiler.records[0].rows_in, profiler.records[0].rows_out
+    (3, 2)
+
+    ```
+    """
+    profiler = _ACTIVE_PROFILER.get()
+    if profiler is None:
+        yield None
+        return
+    parent = _PARENT_RECORD.get()
+    parent_index = parent[1] if parent is not None and parent[0] is profiler else None
+    record = profiler.start_record(name=name, category=category, parent=parent_index)
+    if frame is not None:
+        record.set_input(frame)
+    token = _PARENT_RECORD.set((profiler, record.index))
+    try:
+        yield record
+    finally:
+        _PARENT_RECORD.reset(token)
+        profiler.stop_record(record)
+
+
+def _write_text(path: Path | str, content: str) -> None:
+    r"""Write a text file and create the parent directory if needed.
+
+    Args:
+        path: The path to the file to write.
+        content: The text to write.
+    """
+    path = sanitize_path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
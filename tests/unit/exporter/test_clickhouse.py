@@ -0,0 +1,371 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+from unittest.mock import Mock, patch
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.exporter import ClickHouseArrowExporter
+from grizz.exporter.clickhouse import insert_batches
+from grizz.testing.fixture import clickhouse_connect_available, pyarrow_available
+from grizz.utils.imports import is_clickhouse_connect_available, is_pyarrow_available
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+if is_clickhouse_connect_available():
+    from clickhouse_connect.driver import Client
+if is_pyarrow_available():
+    import pyarrow as pa
+
+
+@pytest.fixture
+def frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["1", "2", "3", "4", "5"],
+            "col3": ["a", "b", "c", "d", "e"],
+        }
+    )
+
+
+def get_inserted_frame(*clients: Mock) -> pl.DataFrame:
+    tables = [
+        call.kwargs["arrow_table"]
+        for client in clients
+        for call in client.insert_arrow.call_args_list
+    ]
+    return pl.from_arrow(pa.concat_tables(tables)).sort("col1")
+
+
+class CountingClients:
+    r"""Count the number of inserts running concurrently on a pool of
+    clients."""
+
+    def __init__(self, num_clients: int, delay: float) -> None:
+        self._lock = threading.Lock()
+        self.num_running = 0
+        self.max_running = 0
+        self.clients = [
+            Mock(spec=Client, insert_arrow=Mock(side_effect=self._make_insert(delay)))
+            for _ in range(num_clients)
+        ]
+
+    def _make_insert(self, delay: float) -> Callable:
+        def insert(**kwargs: Any) -> None:  # noqa: ARG001
+            with self._lock:
+                self.num_running += 1
+                self.max_running = max(self.max_running, self.num_running)
+            time.sleep(delay)
+            with self._lock:
+                self.num_running -= 1
+
+        return insert
+
+
+#############################################
+#     Tests for ClickHouseArrowExporter     #
+#############################################
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_repr() -> None:
+    assert repr(ClickHouseArrowExporter(table="target.dataset", client=Mock(spec=Client))) == (
+        "ClickHouseArrowExporter(table=target.dataset, batch_size=100,000, max_workers=1, "
+        "max_retries=0)"
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_str() -> None:
+    assert str(ClickHouseArrowExporter(table="target.dataset", client=Mock(spec=Client))) == (
+        "ClickHouseArrowExporter(table=target.dataset, batch_size=100,000, max_workers=1, "
+        "max_retries=0)"
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_true() -> None:
+    client = Mock(spec=Client)
+    assert ClickHouseArrowExporter(table="target.dataset", client=client).equal(
+        ClickHouseArrowExporter(table="target.dataset", client=client)
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_false_different_table() -> None:
+    client = Mock(spec=Client)
+    assert not ClickHouseArrowExporter(table="target.dataset", client=client).equal(
+        ClickHouseArrowExporter(table="target.dataset2", client=client)
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_false_different_client() -> None:
+    assert not ClickHouseArrowExporter(table="target.dataset", client=Mock(spec=Client)).equal(
+        ClickHouseArrowExporter(table="target.dataset", client=Mock(spec=Client))
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_false_different_batch_size() -> None:
+    client = Mock(spec=Client)
+    assert not ClickHouseArrowExporter(table="target.dataset", client=client).equal(
+        ClickHouseArrowExporter(table="target.dataset", client=client, batch_size=10)
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_false_different_max_retries() -> None:
+    client = Mock(spec=Client)
+    assert not ClickHouseArrowExporter(table="target.dataset", client=client).equal(
+        ClickHouseArrowExporter(table="target.dataset", client=client, max_retries=3)
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_false_different_deduplication_prefix() -> None:
+    client = Mock(spec=Client)
+    assert not ClickHouseArrowExporter(table="target.dataset", client=client).equal(
+        ClickHouseArrowExporter(table="target.dataset", client=client, deduplication_prefix="a")
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_false_different_kwargs() -> None:
+    client = Mock(spec=Client)
+    assert not ClickHouseArrowExporter(table="target.dataset", client=client).equal(
+        ClickHouseArrowExporter(table="target.dataset", client=client, database="db")
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_false_different_type() -> None:
+    assert not ClickHouseArrowExporter(table="target.dataset", client=Mock(spec=Client)).equal(42)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export(frame: pl.DataFrame) -> None:
+    client = Mock(spec=Client)
+    ClickHouseArrowExporter(table="target.dataset", client=client).export(frame)
+    client.insert_arrow.assert_called_once()
+    assert client.insert_arrow.call_args.kwargs["table"] == "target.dataset"
+    assert_frame_equal(get_inserted_frame(client), frame)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_batch_size(frame: pl.DataFrame) -> None:
+    client = Mock(spec=Client)
+    ClickHouseArrowExporter(table="target.dataset", client=client, batch_size=2).export(frame)
+    calls = client.insert_arrow.call_args_list
+    assert [call.kwargs["arrow_table"].num_rows for call in calls] == [2, 2, 1]
+    assert_frame_equal(get_inserted_frame(client), frame)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_kwargs(frame: pl.DataFrame) -> None:
+    client = Mock(spec=Client)
+    ClickHouseArrowExporter(table="dataset", client=client, database="target").export(frame)
+    assert client.insert_arrow.call_args.kwargs["database"] == "target"
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_empty() -> None:
+    client = Mock(spec=Client)
+    ClickHouseArrowExporter(table="target.dataset", client=client).export(
+        pl.DataFrame({"col1": [], "col2": []})
+    )
+    client.insert_arrow.assert_not_called()
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_concurrent(frame: pl.DataFrame) -> None:
+    clients = CountingClients(num_clients=3, delay=0.1)
+    ClickHouseArrowExporter(table="target.dataset", client=clients.clients, batch_size=1).export(
+        frame
+    )
+    assert clients.max_running == 3
+    assert_frame_equal(get_inserted_frame(*clients.clients), frame)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_max_workers(frame: pl.DataFrame) -> None:
+    clients = CountingClients(num_clients=3, delay=0.05)
+    ClickHouseArrowExporter(
+        table="target.dataset", client=clients.clients, batch_size=1, max_workers=2
+    ).export(frame)
+    assert clients.max_running == 2
+    clients.clients[2].insert_arrow.assert_not_called()
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_retry(frame: pl.DataFrame) -> None:
+    client = Mock(spec=Client, insert_arrow=Mock(side_effect=[ConnectionError, TimeoutError, None]))
+    with patch("grizz.exporter.clickhouse.time.sleep") as sleep:
+        ClickHouseArrowExporter(
+            table="target.dataset", client=client, max_retries=2, retry_delay=0.5
+        ).export(frame)
+    assert client.insert_arrow.call_count == 3
+    assert [call.args[0] for call in sleep.call_args_list] == [0.5, 1.0]
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_retry_fail(frame: pl.DataFrame) -> None:
+    client = Mock(spec=Client, insert_arrow=Mock(side_effect=ConnectionError("insert failed")))
+    exporter = ClickHouseArrowExporter(
+        table="target.dataset", client=client, max_retries=2, retry_delay=0.0
+    )
+    with pytest.raises(ConnectionError, match="insert failed"):
+        exporter.export(frame)
+    assert client.insert_arrow.call_count == 3
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_retry_not_retryable(frame: pl.DataFrame) -> None:
+    client = Mock(spec=Client, insert_arrow=Mock(side_effect=ValueError("incorrect data")))
+    exporter = ClickHouseArrowExporter(
+        table="target.dataset", client=client, max_retries=2, retry_delay=0.0
+    )
+    with pytest.raises(ValueError, match="incorrect data"):
+        exporter.export(frame)
+    client.insert_arrow.assert_called_once()
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_retry_deduplication_token(frame: pl.DataFrame) -> None:
+    client = Mock(spec=Client, insert_arrow=Mock(side_effect=[ConnectionError, None, None]))
+    ClickHouseArrowExporter(
+        table="target.dataset",
+        client=client,
+        batch_size=3,
+        max_retries=1,
+        retry_delay=0.0,
+        deduplication_prefix="export",
+    ).export(frame)
+    tokens = [
+        call.kwargs["settings"]["insert_deduplication_token"]
+        for call in client.insert_arrow.call_args_list
+    ]
+    assert tokens == ["export-0", "export-0", "export-1"]
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_retry_fail_concurrent(frame: pl.DataFrame) -> None:
+    clients = [
+        Mock(spec=Client, insert_arrow=Mock(side_effect=ConnectionError("insert failed")))
+        for _ in range(2)
+    ]
+    exporter = ClickHouseArrowExporter(table="target.dataset", client=clients, batch_size=1)
+    with pytest.raises(ConnectionError, match="insert failed"):
+        exporter.export(frame)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_incorrect_client() -> None:
+    with pytest.raises(ValueError, match="'client' must contain at least one client"):
+        ClickHouseArrowExporter(table="target.dataset", client=[])
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_incorrect_batch_size() -> None:
+    with pytest.raises(ValueError, match="batch_size must be greater than 0"):
+        ClickHouseArrowExporter(table="target.dataset", client=Mock(spec=Client), batch_size=0)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_incorrect_max_workers() -> None:
+    with pytest.raises(ValueError, match="max_workers must be greater than 0"):
+        ClickHouseArrowExporter(table="target.dataset", client=Mock(spec=Client), max_workers=0)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_incorrect_max_retries() -> None:
+    with pytest.raises(ValueError, match="max_retries must be greater or equal to 0"):
+        ClickHouseArrowExporter(table="target.dataset", client=Mock(spec=Client), max_retries=-1)
+
+
+####################################
+#     Tests for insert_batches     #
+####################################
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_insert_batches(frame: pl.DataFrame) -> None:
+    client = Mock(spec=Client)
+    batches = frame.to_arrow().to_batches(max_chunksize=2)
+    assert insert_batches(batches, table="target.dataset", clients=[client]) == 5
+    assert client.insert_arrow.call_count == 3
+    assert all(
+        isinstance(call.kwargs["arrow_table"], pa.Table)
+        for call in client.insert_arrow.call_args_list
+    )
+    assert_frame_equal(get_inserted_frame(client), frame)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_insert_batches_tables(frame: pl.DataFrame) -> None:
+    client = Mock(spec=Client)
+    tables = [frame.slice(0, 3).to_arrow(), frame.slice(3).to_arrow()]
+    assert insert_batches(tables, table="target.dataset", clients=[client]) == 5
+    assert_frame_equal(get_inserted_frame(client), frame)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_insert_batches_generator(frame: pl.DataFrame) -> None:
+    clients = CountingClients(num_clients=2, delay=0.01)
+    batches = (batch for batch in frame.to_arrow().to_batches(max_chunksize=1))
+    assert insert_batches(batches, table="target.dataset", clients=clients.clients) == 5
+    assert_frame_equal(get_inserted_frame(*clients.clients), frame)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_insert_batches_deduplication_token(frame: pl.DataFrame) -> None:
+    client = Mock(spec=Client)
+    batches = frame.to_arrow().to_batches(max_chunksize=2)
+    insert_batches(batches, table="target.dataset", clients=[client], settings={"async_insert": 1})
+    settings = [call.kwargs["settings"] for call in client.insert_arrow.call_args_list]
+    assert all(setting["async_insert"] == 1 for setting in settings)
+    tokens = [setting["insert_deduplication_token"] for setting in settings]
+    assert len(set(tokens)) == 3
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_insert_batches_empty() -> None:
+    client = Mock(spec=Client)
+    assert insert_batches([], table="target.dataset", clients=[client]) == 0
+    client.insert_arrow.assert_not_called()
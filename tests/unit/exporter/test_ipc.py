@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.exporter import IpcExporter
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="module")
+def dataframe() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["a", "b", "c", "d", "e"],
+            "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+        },
+        schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.Float64},
+    )
+
+
+#################################
+#     Tests for IpcExporter     #
+#################################
+
+
+def test_ipc_exporter_repr(tmp_path: Path) -> None:
+    assert repr(IpcExporter(tmp_path.joinpath("data.arrow"))).startswith("IpcExporter(")
+
+
+def test_ipc_exporter_repr_with_kwargs(tmp_path: Path) -> None:
+    assert repr(IpcExporter(tmp_path.joinpath("data.arrow"), compression="lz4")).startswith(
+        "IpcExporter("
+    )
+
+
+def test_ipc_exporter_str(tmp_path: Path) -> None:
+    assert str(IpcExporter(tmp_path.joinpath("data.arrow"))).startswith("IpcExporter(")
+
+
+def test_ipc_exporter_str_with_kwargs(tmp_path: Path) -> None:
+    assert str(IpcExporter(tmp_path.joinpath("data.arrow"), compression="lz4")).startswith(
+        "IpcExporter("
+    )
+
+
+def test_ipc_exporter_equal_true(tmp_path: Path) -> None:
+    assert IpcExporter(tmp_path.joinpath("data.arrow")).equal(
+        IpcExporter(tmp_path.joinpath("data.arrow"))
+    )
+
+
+def test_ipc_exporter_equal_false_different_path(tmp_path: Path) -> None:
+    assert not IpcExporter(tmp_path.joinpath("data.arrow")).equal(
+        IpcExporter(tmp_path.joinpath("data2.arrow"))
+    )
+
+
+def test_ipc_exporter_equal_false_different_kwargs(tmp_path: Path) -> None:
+    assert not IpcExporter(tmp_path.joinpath("data.arrow")).equal(
+        IpcExporter(tmp_path.joinpath("data.arrow"), include_header=False)
+    )
+
+
+def test_ipc_exporter_equal_false_different_type(tmp_path: Path) -> None:
+    assert not IpcExporter(tmp_path.joinpath("data.arrow")).equal(42)
+
+
+def test_ipc_exporter_export(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    path = tmp_path.joinpath("my_folder/data.arrow")
+    assert not path.is_file()
+    IpcExporter(path).export(dataframe)
+    assert path.is_file()
+
+
+def test_ipc_exporter_export_with_kwargs(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    path = tmp_path.joinpath("my_folder/data.arrow")
+    assert not path.is_file()
+    IpcExporter(path, compression="lz4").export(dataframe)
+    assert path.is_file()
+
+    assert_frame_equal(
+        pl.read_ipc(path),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            },
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.Float64},
+        ),
+    )
@@ -6,7 +6,8 @@ import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
-from grizz.exporter import ParquetExporter
+from grizz.exporter import ParquetExporter, ParquetPartitionExporter
+from grizz.utils.path import find_parquet_files
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -95,3 +96,173 @@ def test_parquet_exporter_export_with_kwargs(tmp_path: Path, dataframe: pl.DataF
             schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.Float64},
         ),
     )
+
+
+##############################################
+#     Tests for ParquetPartitionExporter     #
+##############################################
+
+
+def list_files(path: Path) -> list[str]:
+    return sorted(file.relative_to(path).as_posix() for file in find_parquet_files(path))
+
+
+@pytest.fixture
+def dataframe_part() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["a", "b", "a", "b", None],
+            "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+        },
+        schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.Float64},
+    )
+
+
+def test_parquet_partition_exporter_repr(tmp_path: Path) -> None:
+    assert repr(ParquetPartitionExporter(tmp_path, partition_by=["col2"])).startswith(
+        "ParquetPartitionExporter("
+    )
+
+
+def test_parquet_partition_exporter_str(tmp_path: Path) -> None:
+    assert str(ParquetPartitionExporter(tmp_path, partition_by=["col2"])).startswith(
+        "ParquetPartitionExporter("
+    )
+
+
+def test_parquet_partition_exporter_equal_true(tmp_path: Path) -> None:
+    assert ParquetPartitionExporter(tmp_path, partition_by=["col2"]).equal(
+        ParquetPartitionExporter(tmp_path, partition_by=["col2"])
+    )
+
+
+def test_parquet_partition_exporter_equal_false_different_path(tmp_path: Path) -> None:
+    assert not ParquetPartitionExporter(tmp_path, partition_by=["col2"]).equal(
+        ParquetPartitionExporter(tmp_path.joinpath("data"), partition_by=["col2"])
+    )
+
+
+def test_parquet_partition_exporter_equal_false_different_partition_by(tmp_path: Path) -> None:
+    assert not ParquetPartitionExporter(tmp_path, partition_by=["col2"]).equal(
+        ParquetPartitionExporter(tmp_path, partition_by=["col1"])
+    )
+
+
+def test_parquet_partition_exporter_equal_false_different_max_workers(tmp_path: Path) -> None:
+    assert not ParquetPartitionExporter(tmp_path, partition_by=["col2"]).equal(
+        ParquetPartitionExporter(tmp_path, partition_by=["col2"], max_workers=2)
+    )
+
+
+def test_parquet_partition_exporter_equal_false_different_max_rows_per_file(
+    tmp_path: Path,
+) -> None:
+    assert not ParquetPartitionExporter(tmp_path, partition_by=["col2"]).equal(
+        ParquetPartitionExporter(tmp_path, partition_by=["col2"], max_rows_per_file=2)
+    )
+
+
+def test_parquet_partition_exporter_equal_false_different_kwargs(tmp_path: Path) -> None:
+    assert not ParquetPartitionExporter(tmp_path, partition_by=["col2"]).equal(
+        ParquetPartitionExporter(tmp_path, partition_by=["col2"], compression="gzip")
+    )
+
+
+def test_parquet_partition_exporter_equal_false_different_type(tmp_path: Path) -> None:
+    assert not ParquetPartitionExporter(tmp_path, partition_by=["col2"]).equal(42)
+
+
+def test_parquet_partition_exporter_incorrect_partition_by(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="partition_by must contain at least one column"):
+        ParquetPartitionExporter(tmp_path, partition_by=[])
+
+
+def test_parquet_partition_exporter_incorrect_max_workers(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_workers must be greater than 0"):
+        ParquetPartitionExporter(tmp_path, partition_by=["col2"], max_workers=0)
+
+
+def test_parquet_partition_exporter_incorrect_max_rows_per_file(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_rows_per_file must be greater than 0"):
+        ParquetPartitionExporter(tmp_path, partition_by=["col2"], max_rows_per_file=0)
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_parquet_partition_exporter_export(
+    tmp_path: Path, dataframe_part: pl.DataFrame, max_workers: int
+) -> None:
+    path = tmp_path.joinpath("my_folder/data")
+    ParquetPartitionExporter(path, partition_by=["col2"], max_workers=max_workers).export(
+        dataframe_part
+    )
+    assert list_files(path) == [
+        "col2=__HIVE_DEFAULT_PARTITION__/part-00000.parquet",
+        "col2=a/part-00000.parquet",
+        "col2=b/part-00000.parquet",
+    ]
+    assert_frame_equal(
+        pl.read_parquet(path.joinpath("col2=a/part-00000.parquet")),
+        pl.DataFrame({"col1": [1, 3], "col3": [1.2, 3.2]}),
+    )
+    assert_frame_equal(
+        pl.read_parquet(path, hive_partitioning=True).sort("col1"),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+                "col2": ["a", "b", "a", "b", None],
+            }
+        ),
+    )
+
+
+def test_parquet_partition_exporter_export_multiple_columns(
+    tmp_path: Path, dataframe_part: pl.DataFrame
+) -> None:
+    ParquetPartitionExporter(tmp_path, partition_by=["col2", "col1"]).export(dataframe_part)
+    assert list_files(tmp_path) == [
+        "col2=__HIVE_DEFAULT_PARTITION__/col1=5/part-00000.parquet",
+        "col2=a/col1=1/part-00000.parquet",
+        "col2=a/col1=3/part-00000.parquet",
+        "col2=b/col1=2/part-00000.parquet",
+        "col2=b/col1=4/part-00000.parquet",
+    ]
+
+
+def test_parquet_partition_exporter_export_max_rows_per_file(
+    tmp_path: Path, dataframe_part: pl.DataFrame
+) -> None:
+    ParquetPartitionExporter(tmp_path, partition_by=["col2"], max_rows_per_file=1).export(
+        dataframe_part
+    )
+    assert list_files(tmp_path) == [
+        "col2=__HIVE_DEFAULT_PARTITION__/part-00000.parquet",
+        "col2=a/part-00000.parquet",
+        "col2=a/part-00001.parquet",
+        "col2=b/part-00000.parquet",
+        "col2=b/part-00001.parquet",
+    ]
+    assert_frame_equal(
+        pl.read_parquet(tmp_path.joinpath("col2=a/part-00001.parquet")),
+        pl.DataFrame({"col1": [3], "col3": [3.2]}),
+    )
+
+
+def test_parquet_partition_exporter_export_with_kwargs(
+    tmp_path: Path, dataframe_part: pl.DataFrame
+) -> None:
+    ParquetPartitionExporter(
+        tmp_path, partition_by=["col2"], compression="gzip", row_group_size=1
+    ).export(dataframe_part)
+    assert len(find_parquet_files(tmp_path)) == 3
+
+
+def test_parquet_partition_exporter_export_replace(
+    tmp_path: Path, dataframe_part: pl.DataFrame
+) -> None:
+    path = tmp_path.joinpath("data")
+    ParquetPartitionExporter(path, partition_by=["col2"]).export(dataframe_part)
+    ParquetPartitionExporter(path, partition_by=["col1"]).export(dataframe_part)
+    assert len(find_parquet_files(path)) == 5
+    assert not path.joinpath("col2=a").exists()
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import os
+import time
 from typing import TYPE_CHECKING
+from unittest.mock import Mock
 
 import polars as pl
 import pytest
@@ -9,6 +12,7 @@ from polars.testing import assert_frame_equal
 from grizz.exceptions import DataNotFoundError
 from grizz.exporter import ParquetExporter
 from grizz.ingestor import CacheIngestor, CsvFileIngestor, ParquetFileIngestor
+from grizz.utils.lock import FileLock
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -187,3 +191,130 @@ def test_cache_ingestor_ingest_missing_file(tmp_path: Path) -> None:
     )
     with pytest.raises(DataNotFoundError, match=r"Data file does not exist"):
         ingestor.ingest()
+
+
+def test_cache_ingestor_ttl_without_path(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match=r"path is required to use ttl or fingerprint"):
+        CacheIngestor(
+            fast_ingestor=ParquetFileIngestor(tmp_path.joinpath("data.parquet")),
+            slow_ingestor=CsvFileIngestor(tmp_path.joinpath("data.csv")),
+            exporter=ParquetExporter(tmp_path.joinpath("data.parquet")),
+            ttl=10,
+        )
+
+
+def test_cache_ingestor_equal_false_different_ttl(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    assert not CacheIngestor(
+        fast_ingestor=ParquetFileIngestor(path),
+        slow_ingestor=CsvFileIngestor(tmp_path.joinpath("data.csv")),
+        exporter=ParquetExporter(path),
+        path=path,
+        ttl=10,
+    ).equal(
+        CacheIngestor(
+            fast_ingestor=ParquetFileIngestor(path),
+            slow_ingestor=CsvFileIngestor(tmp_path.joinpath("data.csv")),
+            exporter=ParquetExporter(path),
+            path=path,
+            ttl=20,
+        )
+    )
+
+
+def test_cache_ingestor_ingest_ttl_valid(tmp_path: Path, frame_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame({"col1": [1, 2]}).write_parquet(path)
+    ingestor = CacheIngestor(
+        fast_ingestor=ParquetFileIngestor(path),
+        slow_ingestor=CsvFileIngestor(frame_path),
+        exporter=ParquetExporter(path),
+        path=path,
+        ttl=3600,
+    )
+    assert_frame_equal(ingestor.ingest(), pl.DataFrame({"col1": [1, 2]}))
+
+
+def test_cache_ingestor_ingest_ttl_expired(tmp_path: Path, frame_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame({"col1": [1, 2]}).write_parquet(path)
+    os.utime(path, (time.time() - 100, time.time() - 100))
+    ingestor = CacheIngestor(
+        fast_ingestor=ParquetFileIngestor(path),
+        slow_ingestor=CsvFileIngestor(frame_path),
+        exporter=ParquetExporter(path),
+        path=path,
+        ttl=10,
+    )
+    out = ingestor.ingest()
+    assert out.shape == (5, 3)
+    assert_frame_equal(pl.read_parquet(path), out)
+
+
+def test_cache_ingestor_ingest_fingerprint(tmp_path: Path, frame_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    fingerprint = Mock(return_value="v1")
+    ingestor = CacheIngestor(
+        fast_ingestor=ParquetFileIngestor(path),
+        slow_ingestor=CsvFileIngestor(frame_path),
+        exporter=ParquetExporter(path),
+        path=path,
+        fingerprint=fingerprint,
+    )
+    assert ingestor.ingest().shape == (5, 3)
+    assert tmp_path.joinpath("data.parquet.fingerprint").read_text() == "v1"
+
+    # The fingerprint did not change so the cached data is used.
+    pl.DataFrame({"col1": [1, 2]}).write_parquet(path)
+    assert_frame_equal(ingestor.ingest(), pl.DataFrame({"col1": [1, 2]}))
+
+    # The fingerprint changed so the cached data is refreshed.
+    fingerprint.return_value = "v2"
+    assert ingestor.ingest().shape == (5, 3)
+    assert tmp_path.joinpath("data.parquet.fingerprint").read_text() == "v2"
+
+
+def test_cache_ingestor_ingest_lock_released(tmp_path: Path, frame_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    ingestor = CacheIngestor(
+        fast_ingestor=ParquetFileIngestor(path),
+        slow_ingestor=CsvFileIngestor(frame_path),
+        exporter=ParquetExporter(path),
+        path=path,
+    )
+    assert ingestor.ingest().shape == (5, 3)
+    lock = FileLock(tmp_path.joinpath("data.parquet.lock"))
+    assert lock.acquire(blocking=False)
+    lock.release()
+
+
+def test_cache_ingestor_ingest_serve_stale(tmp_path: Path, frame_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame({"col1": [1, 2]}).write_parquet(path)
+    os.utime(path, (time.time() - 100, time.time() - 100))
+    ingestor = CacheIngestor(
+        fast_ingestor=ParquetFileIngestor(path),
+        slow_ingestor=CsvFileIngestor(frame_path),
+        exporter=ParquetExporter(path),
+        path=path,
+        ttl=10,
+        serve_stale=True,
+    )
+    # Another process is refreshing the data.
+    with FileLock(tmp_path.joinpath("data.parquet.lock")):
+        assert_frame_equal(ingestor.ingest(), pl.DataFrame({"col1": [1, 2]}))
+    assert ingestor.ingest().shape == (5, 3)
+
+
+def test_cache_ingestor_ingest_lock_timeout(tmp_path: Path, frame_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    ingestor = CacheIngestor(
+        fast_ingestor=ParquetFileIngestor(path),
+        slow_ingestor=CsvFileIngestor(frame_path),
+        exporter=ParquetExporter(path),
+        path=path,
+        lock_timeout=0.1,
+    )
+    with FileLock(tmp_path.joinpath("data.parquet.lock")), pytest.raises(TimeoutError):
+        ingestor.ingest()
+    assert not path.exists()
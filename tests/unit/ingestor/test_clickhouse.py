@@ -1,15 +1,25 @@
 from __future__ import annotations
 
+import threading
+import time
+from contextlib import nullcontext
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Any
 from unittest.mock import Mock
 
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
-from grizz.ingestor import ClickHouseArrowIngestor
+from grizz.ingestor import ClickHouseArrowIngestor, ClickHouseSyncIngestor
+from grizz.ingestor.clickhouse import make_key_partitions, make_time_partitions
 from grizz.testing.fixture import clickhouse_connect_available, pyarrow_available
 from grizz.utils.imports import is_clickhouse_connect_available, is_pyarrow_available
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator, Sequence
+    from pathlib import Path
+
 if is_clickhouse_connect_available():
     from clickhouse_connect.driver import Client
 if is_pyarrow_available():
@@ -101,3 +111,480 @@ def test_clickhouse_arrow_ingestor_ingest(table: pa.Table) -> None:
         ),
     )
     client_mock.query_arrow.assert_called_once_with(query="select * from source.dataset")
+
+
+@pytest.fixture
+def batches(table: pa.Table) -> list[pa.RecordBatch]:
+    return table.select(["col3", "col2", "col1"]).to_batches(max_chunksize=2)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_iter_batches(batches: list[pa.RecordBatch]) -> None:
+    client_mock = Mock(spec=Client, query_arrow_stream=Mock(return_value=nullcontext(batches)))
+    ingestor = ClickHouseArrowIngestor(query="select * from source.dataset", client=client_mock)
+    out = list(ingestor.iter_batches())
+    assert len(out) == 3
+    assert_frame_equal(
+        out[0], pl.DataFrame({"col1": [1, 2], "col2": ["a", "b"], "col3": [1.2, 2.2]})
+    )
+    assert_frame_equal(
+        pl.concat(out),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+    client_mock.query_arrow_stream.assert_called_once_with(query="select * from source.dataset")
+    client_mock.query_arrow.assert_not_called()
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_iter_batches_lazy(batches: list[pa.RecordBatch]) -> None:
+    def stream() -> Iterator[pa.RecordBatch]:
+        yield batches[0]
+        msg = "the stream is consumed one batch at a time"
+        raise RuntimeError(msg)
+
+    client_mock = Mock(spec=Client, query_arrow_stream=Mock(return_value=nullcontext(stream())))
+    ingestor = ClickHouseArrowIngestor(query="select * from source.dataset", client=client_mock)
+    iterator = ingestor.iter_batches()
+    assert next(iterator).shape == (2, 3)
+    with pytest.raises(RuntimeError, match=r"the stream is consumed one batch at a time"):
+        next(iterator)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+@pytest.mark.parametrize("filename", ["data.parquet", "data.arrow"])
+def test_clickhouse_arrow_ingestor_ingest_to_file(
+    tmp_path: Path, batches: list[pa.RecordBatch], filename: str
+) -> None:
+    client_mock = Mock(spec=Client, query_arrow_stream=Mock(return_value=nullcontext(batches)))
+    ingestor = ClickHouseArrowIngestor(query="select * from source.dataset", client=client_mock)
+    path = tmp_path.joinpath(filename)
+    assert ingestor.ingest_to_file(path) == 5
+    reader = pl.read_parquet if filename.endswith(".parquet") else pl.read_ipc
+    assert_frame_equal(
+        reader(path),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+
+
+class FakeClient:
+    r"""Implement a stand-in for a ClickHouse client that runs the
+    partitioned query on a local table."""
+
+    def __init__(self, table: pa.Table) -> None:
+        self._frame = pl.from_arrow(table)
+        self.queries = []
+
+    def query_arrow(self, query: str, parameters: dict) -> pa.Table:  # noqa: ARG002
+        self.queries.append(parameters)
+        return self._frame.filter(
+            pl.col("col1").is_between(parameters["start"], parameters["end"], closed="left")
+        ).to_arrow()
+
+
+class CountingClients:
+    r"""Count the number of queries running concurrently on a pool of
+    clients."""
+
+    def __init__(self, table: pa.Table, num_clients: int, delay: float) -> None:
+        self._lock = threading.Lock()
+        self.num_running = 0
+        self.max_running = 0
+        self.clients = [
+            Mock(spec=Client, query_arrow=Mock(side_effect=self._make_query(table, delay)))
+            for _ in range(num_clients)
+        ]
+
+    def _make_query(self, table: pa.Table, delay: float) -> Callable:
+        client = FakeClient(table)
+
+        def query(query: str, parameters: dict) -> pa.Table:
+            with self._lock:
+                self.num_running += 1
+                self.max_running = max(self.max_running, self.num_running)
+            time.sleep(delay)
+            with self._lock:
+                self.num_running -= 1
+            return client.query_arrow(query, parameters)
+
+        return query
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_incorrect_max_workers() -> None:
+    with pytest.raises(ValueError, match=r"max_workers must be greater than 0"):
+        ClickHouseArrowIngestor(
+            query="select * from source.dataset", client=Mock(spec=Client), max_workers=0
+        )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_empty_clients() -> None:
+    with pytest.raises(ValueError, match=r"'client' must contain at least one client"):
+        ClickHouseArrowIngestor(query="select * from source.dataset", client=[])
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_empty_partitions() -> None:
+    with pytest.raises(ValueError, match=r"'partitions' must contain at least one partition"):
+        ClickHouseArrowIngestor(
+            query="select * from source.dataset", client=Mock(spec=Client), partitions=[]
+        )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_equal_false_different_partitions() -> None:
+    client_mock = Mock(spec=Client)
+    assert not ClickHouseArrowIngestor(
+        query="select * from source.dataset",
+        client=client_mock,
+        partitions=make_key_partitions([0, 3, 6]),
+    ).equal(
+        ClickHouseArrowIngestor(
+            query="select * from source.dataset",
+            client=client_mock,
+            partitions=make_key_partitions([0, 2, 6]),
+        )
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_ingest_partitions(table: pa.Table) -> None:
+    client = FakeClient(table)
+    ingestor = ClickHouseArrowIngestor(
+        query="select * from source.dataset",
+        client=Mock(spec=Client, query_arrow=Mock(side_effect=client.query_arrow)),
+        partitions=make_key_partitions([0, 2, 4, 10]),
+    )
+    assert_frame_equal(
+        ingestor.ingest(),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+    assert client.queries == [
+        {"start": 0, "end": 2},
+        {"start": 2, "end": 4},
+        {"start": 4, "end": 10},
+    ]
+
+
+@clickhouse_connect_available
+@pyarrow_available
+@pytest.mark.parametrize(("num_clients", "max_workers"), [(1, None), (2, None), (3, 2)])
+def test_clickhouse_arrow_ingestor_ingest_partitions_pool(
+    table: pa.Table, num_clients: int, max_workers: int | None
+) -> None:
+    pool = CountingClients(table, num_clients=num_clients, delay=0.05)
+    ingestor = ClickHouseArrowIngestor(
+        query="select * from source.dataset",
+        client=pool.clients,
+        partitions=make_key_partitions([0, 1, 2, 3, 4, 5, 6]),
+        max_workers=max_workers,
+    )
+    assert_frame_equal(
+        ingestor.ingest(),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+    assert pool.max_running <= (max_workers or num_clients)
+    assert sum(client.query_arrow.call_count for client in pool.clients) == 6
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_ingest_partitions_order(table: pa.Table) -> None:
+    # The first sub-query is the slowest, but the results are concatenated in order.
+    def query(query: str, parameters: dict) -> pa.Table:
+        time.sleep(0.1 if parameters["start"] == 0 else 0.0)
+        return FakeClient(table).query_arrow(query, parameters)
+
+    clients = [Mock(spec=Client, query_arrow=Mock(side_effect=query)) for _ in range(3)]
+    ingestor = ClickHouseArrowIngestor(
+        query="select * from source.dataset",
+        client=clients,
+        partitions=make_key_partitions([0, 2, 4, 6]),
+    )
+    assert ingestor.ingest()["col1"].to_list() == [1, 2, 3, 4, 5]
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_iter_batches_partitions(
+    batches: Sequence[pa.RecordBatch],
+) -> None:
+    client_mock = Mock(
+        spec=Client,
+        query_arrow_stream=Mock(side_effect=[nullcontext(batches[:1]), nullcontext(batches[1:])]),
+    )
+    ingestor = ClickHouseArrowIngestor(
+        query="select * from source.dataset",
+        client=client_mock,
+        partitions=make_key_partitions([0, 3, 6]),
+    )
+    assert pl.concat(ingestor.iter_batches())["col1"].to_list() == [1, 2, 3, 4, 5]
+    assert client_mock.query_arrow_stream.call_args_list[1].kwargs == {
+        "query": "select * from source.dataset",
+        "parameters": {"start": 3, "end": 6},
+    }
+
+
+##########################################
+#     Tests for make_time_partitions     #
+##########################################
+
+
+def test_make_time_partitions() -> None:
+    assert make_time_partitions(date(2024, 1, 1), date(2024, 1, 10), timedelta(days=4)) == [
+        {"start": date(2024, 1, 1), "end": date(2024, 1, 5)},
+        {"start": date(2024, 1, 5), "end": date(2024, 1, 9)},
+        {"start": date(2024, 1, 9), "end": date(2024, 1, 10)},
+    ]
+
+
+def test_make_time_partitions_exact() -> None:
+    assert make_time_partitions(date(2024, 1, 1), date(2024, 1, 5), timedelta(days=2)) == [
+        {"start": date(2024, 1, 1), "end": date(2024, 1, 3)},
+        {"start": date(2024, 1, 3), "end": date(2024, 1, 5)},
+    ]
+
+
+def test_make_time_partitions_empty() -> None:
+    assert make_time_partitions(date(2024, 1, 5), date(2024, 1, 1), timedelta(days=2)) == []
+
+
+def test_make_time_partitions_int() -> None:
+    assert make_time_partitions(0, 5, 2) == [
+        {"start": 0, "end": 2},
+        {"start": 2, "end": 4},
+        {"start": 4, "end": 5},
+    ]
+
+
+def test_make_time_partitions_incorrect_step() -> None:
+    with pytest.raises(ValueError, match=r"step must be positive"):
+        make_time_partitions(date(2024, 1, 1), date(2024, 1, 10), timedelta(days=0))
+
+
+#########################################
+#     Tests for make_key_partitions     #
+#########################################
+
+
+def test_make_key_partitions() -> None:
+    assert make_key_partitions([0, 100, 200]) == [
+        {"start": 0, "end": 100},
+        {"start": 100, "end": 200},
+    ]
+
+
+def test_make_key_partitions_empty() -> None:
+    assert make_key_partitions([0]) == []
+
+
+############################################
+#     Tests for ClickHouseSyncIngestor     #
+############################################
+
+
+class FakeSyncClient:
+    r"""Implement a stand-in for a ClickHouse client that runs the
+    watermark query on a local table."""
+
+    def __init__(self, frame: pl.DataFrame) -> None:
+        self.frame = frame
+        self.parameters = []
+
+    def query_arrow_stream(self, query: str, parameters: dict) -> nullcontext:  # noqa: ARG002
+        self.parameters.append(parameters)
+        frame = self.frame.filter(pl.col("col1") > parameters["watermark"])
+        return nullcontext(frame.to_arrow().to_batches(max_chunksize=2))
+
+
+@pytest.fixture
+def sync_client() -> FakeSyncClient:
+    return FakeSyncClient(pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}))
+
+
+def make_sync_ingestor(client: FakeSyncClient, path: Path, **kwargs: Any) -> ClickHouseSyncIngestor:
+    return ClickHouseSyncIngestor(
+        query="SELECT * FROM source.dataset WHERE col1 > {watermark:Int64}",
+        client=client,
+        path=path,
+        column="col1",
+        initial_watermark=0,
+        **kwargs,
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_repr(tmp_path: Path) -> None:
+    assert repr(make_sync_ingestor(Mock(spec=Client), tmp_path)).startswith(
+        "ClickHouseSyncIngestor("
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_str(tmp_path: Path) -> None:
+    assert str(make_sync_ingestor(Mock(spec=Client), tmp_path)).startswith(
+        "ClickHouseSyncIngestor("
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_equal_true(tmp_path: Path) -> None:
+    client_mock = Mock(spec=Client)
+    assert make_sync_ingestor(client_mock, tmp_path).equal(
+        make_sync_ingestor(client_mock, tmp_path)
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_equal_false_different_path(tmp_path: Path) -> None:
+    client_mock = Mock(spec=Client)
+    assert not make_sync_ingestor(client_mock, tmp_path).equal(
+        make_sync_ingestor(client_mock, tmp_path.joinpath("data"))
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_equal_false_different_file_format(tmp_path: Path) -> None:
+    client_mock = Mock(spec=Client)
+    assert not make_sync_ingestor(client_mock, tmp_path).equal(
+        make_sync_ingestor(client_mock, tmp_path, file_format="ipc")
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_equal_false_different_type(tmp_path: Path) -> None:
+    assert not make_sync_ingestor(Mock(spec=Client), tmp_path).equal(42)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_incorrect_file_format(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="Incorrect file format: 'csv'"):
+        make_sync_ingestor(Mock(spec=Client), tmp_path, file_format="csv")
+
+
+@clickhouse_connect_available
+@pyarrow_available
+@pytest.mark.parametrize("file_format", ["ipc", "parquet"])
+def test_clickhouse_sync_ingestor_ingest(
+    tmp_path: Path, sync_client: FakeSyncClient, file_format: str
+) -> None:
+    ingestor = make_sync_ingestor(sync_client, tmp_path.joinpath("data"), file_format=file_format)
+    assert_frame_equal(
+        ingestor.ingest(), pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    )
+    sync_client.frame = pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]})
+    assert_frame_equal(
+        ingestor.ingest(),
+        pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]}),
+    )
+    assert sync_client.parameters == [{"watermark": 0}, {"watermark": 3}]
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_ingest_empty(tmp_path: Path) -> None:
+    client = FakeSyncClient(pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}))
+    ingestor = make_sync_ingestor(client, tmp_path.joinpath("data"))
+    client.frame = client.frame.clear()
+    assert_frame_equal(ingestor.ingest(), pl.DataFrame())
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_sync(tmp_path: Path, sync_client: FakeSyncClient) -> None:
+    path = tmp_path.joinpath("data")
+    ingestor = make_sync_ingestor(sync_client, path)
+    assert ingestor.get_watermark() == 0
+    assert ingestor.sync() == 3
+    assert ingestor.get_watermark() == 3
+    sync_client.frame = pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]})
+    assert ingestor.sync() == 2
+    assert ingestor.get_watermark() == 5
+    assert sorted(file.name for file in path.iterdir()) == [
+        "part-000000.parquet",
+        "part-000001.parquet",
+    ]
+    assert tmp_path.joinpath("data.watermark").is_file()
+    assert tmp_path.joinpath("data.lock").is_file()
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_sync_no_new_rows(
+    tmp_path: Path, sync_client: FakeSyncClient
+) -> None:
+    path = tmp_path.joinpath("data")
+    ingestor = make_sync_ingestor(sync_client, path)
+    assert ingestor.sync() == 3
+    assert ingestor.sync() == 0
+    assert ingestor.get_watermark() == 3
+    assert [file.name for file in path.iterdir()] == ["part-000000.parquet"]
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_sync_persistent(
+    tmp_path: Path, sync_client: FakeSyncClient
+) -> None:
+    path = tmp_path.joinpath("data")
+    assert make_sync_ingestor(sync_client, path).sync() == 3
+    ingestor = make_sync_ingestor(sync_client, path)
+    assert ingestor.get_watermark() == 3
+    assert ingestor.sync() == 0
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_sync_ingestor_sync_remove_uncommitted_files(
+    tmp_path: Path, sync_client: FakeSyncClient
+) -> None:
+    path = tmp_path.joinpath("data")
+    ingestor = make_sync_ingestor(sync_client, path)
+    assert ingestor.sync() == 3
+    # Simulate a sync interrupted before the watermark was stored.
+    pl.DataFrame({"col1": [4], "col2": ["d"]}).write_parquet(path.joinpath("part-000001.parquet"))
+    pl.DataFrame({"col1": [5], "col2": ["e"]}).write_parquet(path.joinpath("part-000002.parquet"))
+    assert ingestor.sync() == 0
+    assert [file.name for file in path.iterdir()] == ["part-000000.parquet"]
+    assert_frame_equal(
+        ingestor.ingest(), pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    )
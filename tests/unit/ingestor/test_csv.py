@@ -39,6 +39,14 @@ def test_csv_ingestor_repr_with_kwargs(frame_path: Path) -> None:
     assert repr(CsvIngestor(frame_path, columns=["col1", "col3"])).startswith("CsvIngestor(")
 
 
+def test_csv_ingestor_repr_pushdown(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.csv")
+    assert repr(CsvIngestor(path).select_columns(["col1"]).filter_rows(pl.col("col1") > 2)) == (
+        f"CsvIngestor(source={path}, selected_columns=('col1',), "
+        f'predicate=[(col("col1")) > (dyn int: 2)])'
+    )
+
+
 def test_csv_ingestor_str(frame_path: Path) -> None:
     assert str(CsvIngestor(frame_path)).startswith("CsvIngestor(")
 
@@ -65,6 +73,31 @@ def test_csv_ingestor_equal_false_different_kwargs(tmp_path: Path) -> None:
     )
 
 
+def test_csv_ingestor_equal_true_pushdown(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.csv")
+    ingestor = CsvIngestor(path).select_columns(["col1"]).filter_rows(pl.col("col1") > 2)
+    assert ingestor.equal(
+        CsvIngestor(path).select_columns(["col1"]).filter_rows(pl.col("col1") > 2)
+    )
+
+
+def test_csv_ingestor_equal_false_different_selected_columns(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.csv")
+    ingestor = CsvIngestor(path).select_columns(["col1"])
+    assert not ingestor.equal(CsvIngestor(path).select_columns(["col2"]))
+
+
+def test_csv_ingestor_equal_false_different_predicate(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.csv")
+    ingestor = CsvIngestor(path).filter_rows(pl.col("col1") > 2)
+    assert not ingestor.equal(CsvIngestor(path).filter_rows(pl.col("col1") > 3))
+
+
+def test_csv_ingestor_equal_false_missing_predicate(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.csv")
+    assert not CsvIngestor(path).filter_rows(pl.col("col1") > 2).equal(CsvIngestor(path))
+
+
 def test_csv_ingestor_equal_false_different_type(tmp_path: Path) -> None:
     assert not CsvIngestor(tmp_path.joinpath("data.csv")).equal(42)
 
@@ -95,6 +128,76 @@ def test_csv_ingestor_ingest_with_kwargs(frame_path: Path) -> None:
     )
 
 
+def test_csv_ingestor_select_columns(frame_path: Path) -> None:
+    ingestor = CsvIngestor(frame_path).select_columns(["col3", "col1", "col4"])
+    expected = CsvIngestor(frame_path).ingest().select(["col1", "col3"])
+    assert_frame_equal(ingestor.ingest(), expected)
+
+
+def test_csv_ingestor_select_columns_no_common_column(frame_path: Path) -> None:
+    ingestor = CsvIngestor(frame_path).select_columns(["col4"])
+    assert_frame_equal(ingestor.ingest(), CsvIngestor(frame_path).ingest())
+
+
+def test_csv_ingestor_select_columns_does_not_read(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.csv")
+    ingestor = CsvIngestor(path).select_columns(["col1"])
+    assert ingestor.equal(CsvIngestor(path).select_columns(["col1"]))
+    assert not ingestor.equal(CsvIngestor(path))
+
+
+def test_csv_ingestor_select_columns_with_columns(frame_path: Path) -> None:
+    assert CsvIngestor(frame_path, columns=["col1"]).select_columns(["col1", "col3"]) is None
+
+
+def test_csv_ingestor_select_columns_bytes(frame_path: Path) -> None:
+    assert CsvIngestor(frame_path.read_bytes()).select_columns(["col1"]) is None
+
+
+def test_csv_ingestor_filter_rows(frame_path: Path) -> None:
+    ingestor = CsvIngestor(frame_path).filter_rows(pl.col("col1") > 2)
+    assert_frame_equal(
+        ingestor.ingest(),
+        pl.DataFrame({"col1": [3, 4, 5], "col2": ["c", "d", "e"], "col3": [3.2, 4.2, 5.2]}),
+    )
+
+
+def test_csv_ingestor_filter_rows_multiple(frame_path: Path) -> None:
+    ingestor = CsvIngestor(frame_path).filter_rows(pl.col("col1") > 2)
+    ingestor = ingestor.filter_rows(pl.col("col2") != "d")
+    assert_frame_equal(
+        ingestor.ingest(),
+        pl.DataFrame({"col1": [3, 5], "col2": ["c", "e"], "col3": [3.2, 5.2]}),
+    )
+
+
+def test_csv_ingestor_filter_rows_select_columns(frame_path: Path) -> None:
+    ingestor = CsvIngestor(frame_path).select_columns(["col2"]).filter_rows(pl.col("col1") > 3)
+    assert_frame_equal(ingestor.ingest(), pl.DataFrame({"col2": ["d", "e"]}))
+
+
+def test_csv_ingestor_filter_rows_does_not_change_ingestor(frame_path: Path) -> None:
+    ingestor = CsvIngestor(frame_path)
+    ingestor.filter_rows(pl.col("col1") > 2)
+    assert ingestor.ingest().shape == (5, 3)
+
+
+def test_csv_ingestor_filter_rows_n_rows(frame_path: Path) -> None:
+    assert CsvIngestor(frame_path, n_rows=2).filter_rows(pl.col("col1") > 2) is None
+
+
+def test_csv_ingestor_filter_rows_incompatible_kwargs(frame_path: Path) -> None:
+    assert CsvIngestor(frame_path, batch_size=2).filter_rows(pl.col("col1") > 2) is None
+
+
+def test_csv_ingestor_filter_rows_bytes(frame_path: Path) -> None:
+    assert CsvIngestor(frame_path.read_bytes()).filter_rows(pl.col("col1") > 2) is None
+
+
+def test_csv_ingestor_filter_rows_new_columns(frame_path: Path) -> None:
+    assert CsvIngestor(frame_path, new_columns=["a", "b", "c"]).filter_rows(pl.col("a") > 2) is None
+
+
 #####################################
 #     Tests for CsvFileIngestor     #
 #####################################
@@ -170,3 +273,21 @@ def test_csv_file_ingestor_ingest_missing_path(tmp_path: Path) -> None:
     ingestor = CsvFileIngestor(tmp_path.joinpath("data.csv"))
     with pytest.raises(DataNotFoundError, match=r"Data file does not exist"):
         ingestor.ingest()
+
+
+def test_csv_file_ingestor_select_columns(frame_path: Path) -> None:
+    ingestor = CsvFileIngestor(frame_path).select_columns(["col1", "col2"])
+    assert isinstance(ingestor, CsvFileIngestor)
+    expected = CsvFileIngestor(frame_path).ingest().select(["col1", "col2"])
+    assert_frame_equal(ingestor.ingest(), expected)
+
+
+def test_csv_file_ingestor_select_columns_missing_path(tmp_path: Path) -> None:
+    with pytest.raises(DataNotFoundError, match=r"Data file does not exist"):
+        CsvFileIngestor(tmp_path.joinpath("data.csv")).select_columns(["col1"])
+
+
+def test_csv_file_ingestor_filter_rows(frame_path: Path) -> None:
+    ingestor = CsvFileIngestor(frame_path).filter_rows(pl.col("col1") <= 2)
+    assert isinstance(ingestor, CsvFileIngestor)
+    assert ingestor.ingest()["col1"].to_list() == [1, 2]
@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.exceptions import DataNotFoundError
+from grizz.ingestor import IpcFileIngestor, IpcIngestor
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="module")
+def frame_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("data").joinpath("frame.arrow")
+    pl.DataFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["a", "b", "c", "d", "e"],
+            "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+        }
+    ).write_ipc(path)
+    return path
+
+
+#################################
+#     Tests for IpcIngestor     #
+#################################
+
+
+def test_ipc_ingestor_repr(frame_path: Path) -> None:
+    assert repr(IpcIngestor(frame_path)).startswith("IpcIngestor(")
+
+
+def test_ipc_ingestor_repr_with_kwargs(frame_path: Path) -> None:
+    assert repr(IpcIngestor(frame_path, columns=["col1", "col3"])).startswith("IpcIngestor(")
+
+
+def test_ipc_ingestor_repr_pushdown(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.arrow")
+    assert repr(IpcIngestor(path).select_columns(["col1"]).filter_rows(pl.col("col1") > 2)) == (
+        f"IpcIngestor(source={path}, selected_columns=('col1',), "
+        f'predicate=[(col("col1")) > (dyn int: 2)])'
+    )
+
+
+def test_ipc_ingestor_str(frame_path: Path) -> None:
+    assert str(IpcIngestor(frame_path)).startswith("IpcIngestor(")
+
+
+def test_ipc_ingestor_str_with_kwargs(frame_path: Path) -> None:
+    assert str(IpcIngestor(frame_path, columns=["col1", "col3"])).startswith("IpcIngestor(")
+
+
+def test_ipc_ingestor_equal_true(tmp_path: Path) -> None:
+    assert IpcIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcIngestor(tmp_path.joinpath("data.arrow"))
+    )
+
+
+def test_ipc_ingestor_equal_false_different_path(tmp_path: Path) -> None:
+    assert not IpcIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcIngestor(tmp_path.joinpath("data2.arrow"))
+    )
+
+
+def test_ipc_ingestor_equal_false_different_kwargs(tmp_path: Path) -> None:
+    assert not IpcIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcIngestor(tmp_path.joinpath("data.arrow"), include_header=False)
+    )
+
+
+def test_ipc_ingestor_equal_true_pushdown(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.arrow")
+    ingestor = IpcIngestor(path).select_columns(["col1"]).filter_rows(pl.col("col1") > 2)
+    assert ingestor.equal(
+        IpcIngestor(path).select_columns(["col1"]).filter_rows(pl.col("col1") > 2)
+    )
+
+
+def test_ipc_ingestor_equal_false_different_selected_columns(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.arrow")
+    ingestor = IpcIngestor(path).select_columns(["col1"])
+    assert not ingestor.equal(IpcIngestor(path).select_columns(["col2"]))
+
+
+def test_ipc_ingestor_equal_false_different_predicate(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.arrow")
+    ingestor = IpcIngestor(path).filter_rows(pl.col("col1") > 2)
+    assert not ingestor.equal(IpcIngestor(path).filter_rows(pl.col("col1") > 3))
+
+
+def test_ipc_ingestor_equal_false_missing_predicate(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.arrow")
+    assert not IpcIngestor(path).filter_rows(pl.col("col1") > 2).equal(IpcIngestor(path))
+
+
+def test_ipc_ingestor_equal_false_different_type(tmp_path: Path) -> None:
+    assert not IpcIngestor(tmp_path.joinpath("data.arrow")).equal(42)
+
+
+def test_ipc_ingestor_ingest(frame_path: Path) -> None:
+    assert_frame_equal(
+        IpcIngestor(frame_path).ingest(),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+
+
+def test_ipc_ingestor_ingest_with_kwargs(frame_path: Path) -> None:
+    assert_frame_equal(
+        IpcIngestor(frame_path, columns=["col1", "col3"]).ingest(),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+
+
+def test_ipc_ingestor_select_columns(frame_path: Path) -> None:
+    ingestor = IpcIngestor(frame_path).select_columns(["col3", "col1", "col4"])
+    expected = IpcIngestor(frame_path).ingest().select(["col1", "col3"])
+    assert_frame_equal(ingestor.ingest(), expected)
+
+
+def test_ipc_ingestor_select_columns_no_common_column(frame_path: Path) -> None:
+    ingestor = IpcIngestor(frame_path).select_columns(["col4"])
+    assert_frame_equal(ingestor.ingest(), IpcIngestor(frame_path).ingest())
+
+
+def test_ipc_ingestor_select_columns_does_not_read(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.arrow")
+    ingestor = IpcIngestor(path).select_columns(["col1"])
+    assert ingestor.equal(IpcIngestor(path).select_columns(["col1"]))
+    assert not ingestor.equal(IpcIngestor(path))
+
+
+def test_ipc_ingestor_select_columns_with_columns(frame_path: Path) -> None:
+    assert IpcIngestor(frame_path, columns=["col1"]).select_columns(["col1", "col3"]) is None
+
+
+def test_ipc_ingestor_select_columns_bytes(frame_path: Path) -> None:
+    assert IpcIngestor(frame_path.read_bytes()).select_columns(["col1"]) is None
+
+
+def test_ipc_ingestor_filter_rows(frame_path: Path) -> None:
+    ingestor = IpcIngestor(frame_path).filter_rows(pl.col("col1") > 2)
+    assert_frame_equal(
+        ingestor.ingest(),
+        pl.DataFrame({"col1": [3, 4, 5], "col2": ["c", "d", "e"], "col3": [3.2, 4.2, 5.2]}),
+    )
+
+
+def test_ipc_ingestor_filter_rows_multiple(frame_path: Path) -> None:
+    ingestor = IpcIngestor(frame_path).filter_rows(pl.col("col1") > 2)
+    ingestor = ingestor.filter_rows(pl.col("col2") != "d")
+    assert_frame_equal(
+        ingestor.ingest(),
+        pl.DataFrame({"col1": [3, 5], "col2": ["c", "e"], "col3": [3.2, 5.2]}),
+    )
+
+
+def test_ipc_ingestor_filter_rows_select_columns(frame_path: Path) -> None:
+    ingestor = IpcIngestor(frame_path).select_columns(["col2"]).filter_rows(pl.col("col1") > 3)
+    assert_frame_equal(ingestor.ingest(), pl.DataFrame({"col2": ["d", "e"]}))
+
+
+def test_ipc_ingestor_filter_rows_does_not_change_ingestor(frame_path: Path) -> None:
+    ingestor = IpcIngestor(frame_path)
+    ingestor.filter_rows(pl.col("col1") > 2)
+    assert ingestor.ingest().shape == (5, 3)
+
+
+def test_ipc_ingestor_filter_rows_n_rows(frame_path: Path) -> None:
+    assert IpcIngestor(frame_path, n_rows=2).filter_rows(pl.col("col1") > 2) is None
+
+
+def test_ipc_ingestor_filter_rows_incompatible_kwargs(frame_path: Path) -> None:
+    assert IpcIngestor(frame_path, use_pyarrow=True).filter_rows(pl.col("col1") > 2) is None
+
+
+def test_ipc_ingestor_filter_rows_bytes(frame_path: Path) -> None:
+    assert IpcIngestor(frame_path.read_bytes()).filter_rows(pl.col("col1") > 2) is None
+
+
+#####################################
+#     Tests for IpcFileIngestor     #
+#####################################
+
+
+def test_ipc_file_ingestor_repr(frame_path: Path) -> None:
+    assert repr(IpcFileIngestor(frame_path)).startswith("IpcFileIngestor(")
+
+
+def test_ipc_file_ingestor_repr_with_kwargs(frame_path: Path) -> None:
+    assert repr(IpcFileIngestor(frame_path, columns=["col1", "col3"])).startswith(
+        "IpcFileIngestor("
+    )
+
+
+def test_ipc_file_ingestor_str(frame_path: Path) -> None:
+    assert str(IpcFileIngestor(frame_path)).startswith("IpcFileIngestor(")
+
+
+def test_ipc_file_ingestor_str_with_kwargs(frame_path: Path) -> None:
+    assert str(IpcFileIngestor(frame_path, columns=["col1", "col3"])).startswith("IpcFileIngestor(")
+
+
+def test_ipc_file_ingestor_equal_true(tmp_path: Path) -> None:
+    assert IpcFileIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcFileIngestor(tmp_path.joinpath("data.arrow"))
+    )
+
+
+def test_ipc_file_ingestor_equal_false_different_path(tmp_path: Path) -> None:
+    assert not IpcFileIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcFileIngestor(tmp_path.joinpath("data2.arrow"))
+    )
+
+
+def test_ipc_file_ingestor_equal_false_different_kwargs(tmp_path: Path) -> None:
+    assert not IpcFileIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcFileIngestor(tmp_path.joinpath("data.arrow"), include_header=False)
+    )
+
+
+def test_ipc_file_ingestor_equal_false_different_type(tmp_path: Path) -> None:
+    assert not IpcFileIngestor(tmp_path.joinpath("data.arrow")).equal(42)
+
+
+def test_ipc_file_ingestor_ingest(frame_path: Path) -> None:
+    assert_frame_equal(
+        IpcFileIngestor(frame_path).ingest(),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+
+
+def test_ipc_file_ingestor_ingest_with_kwargs(frame_path: Path) -> None:
+    assert_frame_equal(
+        IpcFileIngestor(frame_path, columns=["col1", "col3"]).ingest(),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+
+
+def test_ipc_file_ingestor_ingest_missing_path(tmp_path: Path) -> None:
+    ingestor = IpcFileIngestor(tmp_path.joinpath("data.arrow"))
+    with pytest.raises(DataNotFoundError, match=r"Data file does not exist"):
+        ingestor.ingest()
+
+
+def test_ipc_file_ingestor_ingest_memory_map_false(frame_path: Path) -> None:
+    assert_frame_equal(
+        IpcFileIngestor(frame_path, memory_map=False).ingest(),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+
+
+def test_ipc_file_ingestor_select_columns(frame_path: Path) -> None:
+    ingestor = IpcFileIngestor(frame_path).select_columns(["col1", "col2"])
+    assert isinstance(ingestor, IpcFileIngestor)
+    expected = IpcFileIngestor(frame_path).ingest().select(["col1", "col2"])
+    assert_frame_equal(ingestor.ingest(), expected)
+
+
+def test_ipc_file_ingestor_select_columns_missing_path(tmp_path: Path) -> None:
+    with pytest.raises(DataNotFoundError, match=r"Data file does not exist"):
+        IpcFileIngestor(tmp_path.joinpath("data.arrow")).select_columns(["col1"])
+
+
+def test_ipc_file_ingestor_filter_rows(frame_path: Path) -> None:
+    ingestor = IpcFileIngestor(frame_path).filter_rows(pl.col("col1") <= 2)
+    assert isinstance(ingestor, IpcFileIngestor)
+    assert ingestor.ingest()["col1"].to_list() == [1, 2]
@@ -1,15 +1,20 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
-from grizz.ingestor import BaseIngestor, Ingestor, JoinIngestor
+from grizz.ingestor import BaseIngestor, Ingestor, JoinIngestor, ParquetIngestor
+from grizz.utils.profiling import Profiler, profile_block
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from pathlib import Path
 
 
 @pytest.fixture
@@ -53,6 +58,16 @@ def test_join_ingestor_incorrect_ingestors() -> None:
         JoinIngestor([])
 
 
+def test_join_ingestor_incorrect_max_workers(ingestors: Sequence[BaseIngestor]) -> None:
+    with pytest.raises(ValueError, match=r"max_workers must be greater than 0"):
+        JoinIngestor(ingestors, max_workers=0)
+
+
+def test_join_ingestor_incorrect_key_filter(ingestors: Sequence[BaseIngestor]) -> None:
+    with pytest.raises(ValueError, match=r"Incorrect key_filter: incorrect"):
+        JoinIngestor(ingestors, key_filter="incorrect")
+
+
 def test_join_ingestor_repr(ingestors: Sequence[BaseIngestor]) -> None:
     assert repr(JoinIngestor(ingestors)).startswith("JoinIngestor(")
 
@@ -83,6 +98,18 @@ def test_join_ingestor_equal_false_different_ingestors(ingestors: Sequence[BaseI
     )
 
 
+def test_join_ingestor_equal_false_different_max_workers(
+    ingestors: Sequence[BaseIngestor],
+) -> None:
+    assert not JoinIngestor(ingestors).equal(JoinIngestor(ingestors, max_workers=2))
+
+
+def test_join_ingestor_equal_false_different_key_filter(
+    ingestors: Sequence[BaseIngestor],
+) -> None:
+    assert not JoinIngestor(ingestors).equal(JoinIngestor(ingestors, key_filter="is_in"))
+
+
 def test_join_ingestor_equal_false_different_kwargs(ingestors: Sequence[BaseIngestor]) -> None:
     assert not JoinIngestor(ingestors).equal(JoinIngestor(ingestors, on="col"))
 
@@ -121,3 +148,167 @@ def test_join_ingestor_ingest_left(ingestors: Sequence[BaseIngestor]) -> None:
             }
         ),
     )
+
+
+@pytest.mark.parametrize("max_workers", [2, 3, 8])
+def test_join_ingestor_ingest_max_workers(
+    ingestors: Sequence[BaseIngestor], max_workers: int
+) -> None:
+    assert_frame_equal(
+        JoinIngestor(ingestors, max_workers=max_workers, on="col", how="left").ingest(),
+        pl.DataFrame(
+            {
+                "col": [1, 2, 3, 4, 5],
+                "col1": ["1", "2", "3", "4", "5"],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [-1, -2, -3, None, -5],
+                "col4": [1.1, 2.2, 3.3, 4.4, 5.5],
+                "col5": ["1.1", "2.2", "3.3", "4.4", "5.5"],
+            }
+        ),
+    )
+
+
+class SlowIngestor(Ingestor):
+    def __init__(self, frame: pl.DataFrame, delay: float) -> None:
+        super().__init__(frame)
+        self._delay = delay
+        self.thread_id = None
+
+    def ingest(self) -> pl.DataFrame:
+        self.thread_id = threading.get_ident()
+        time.sleep(self._delay)
+        with profile_block("SlowIngestor.ingest", category="ingest"):
+            return super().ingest()
+
+
+def test_join_ingestor_ingest_max_workers_order() -> None:
+    # The first ingestor finishes last, but the join order is the order of the ingestors.
+    ingestor1 = SlowIngestor(pl.DataFrame({"col": [1, 2, 3], "col1": ["a", "b", "c"]}), 0.2)
+    ingestor2 = SlowIngestor(pl.DataFrame({"col": [3, 2, 1], "col2": [3.0, 2.0, 1.0]}), 0.0)
+    out = JoinIngestor([ingestor1, ingestor2], max_workers=2, on="col", how="left").ingest()
+    assert_frame_equal(
+        out, pl.DataFrame({"col": [1, 2, 3], "col1": ["a", "b", "c"], "col2": [1.0, 2.0, 3.0]})
+    )
+    assert ingestor1.thread_id != ingestor2.thread_id
+
+
+def test_join_ingestor_ingest_max_workers_profiler() -> None:
+    ingestor = JoinIngestor(
+        [
+            SlowIngestor(pl.DataFrame({"col": [1, 2, 3], "col1": ["a", "b", "c"]}), 0.0),
+            SlowIngestor(pl.DataFrame({"col": [1, 2, 3], "col2": [1.0, 2.0, 3.0]}), 0.0),
+        ],
+        max_workers=2,
+        on="col",
+    )
+    with Profiler() as profiler:
+        ingestor.ingest()
+    assert [record.name for record in profiler.records] == [
+        "SlowIngestor.ingest",
+        "SlowIngestor.ingest",
+    ]
+
+
+class RecordingIngestor(Ingestor):
+    def __init__(self, frame: pl.DataFrame, events: list[str], name: str) -> None:
+        super().__init__(frame)
+        self._events = events
+        self._name = name
+
+    def ingest(self) -> pl.DataFrame:
+        self._events.append(f"ingest {self._name}")
+        return super().ingest()
+
+
+def test_join_ingestor_ingest_sequential_incremental(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    events = []
+    join = pl.DataFrame.join
+
+    def recording_join(self: pl.DataFrame, other: pl.DataFrame, **kwargs: Any) -> pl.DataFrame:
+        events.append("join")
+        return join(self, other, **kwargs)
+
+    monkeypatch.setattr(pl.DataFrame, "join", recording_join)
+    ingestor = JoinIngestor(
+        [
+            RecordingIngestor(pl.DataFrame({"col": [1, 2], "col1": ["a", "b"]}), events, "1"),
+            RecordingIngestor(pl.DataFrame({"col": [1, 2], "col2": ["c", "d"]}), events, "2"),
+            RecordingIngestor(pl.DataFrame({"col": [1, 2], "col3": ["e", "f"]}), events, "3"),
+        ],
+        on="col",
+    )
+    out = ingestor.ingest()
+    # Each DataFrame is joined before the next one is ingested.
+    assert events == ["ingest 1", "ingest 2", "join", "ingest 3", "join"]
+    assert out.columns == ["col", "col1", "col2", "col3"]
+
+
+@pytest.mark.parametrize("key_filter", ["is_in", "range"])
+def test_join_ingestor_ingest_key_filter(
+    ingestors: Sequence[BaseIngestor], key_filter: str
+) -> None:
+    assert_frame_equal(
+        JoinIngestor(ingestors, key_filter=key_filter, on="col", how="inner").ingest(),
+        pl.DataFrame(
+            {
+                "col": [1, 2, 3, 5],
+                "col1": ["1", "2", "3", "5"],
+                "col2": ["a", "b", "c", "e"],
+                "col3": [-1, -2, -3, -5],
+                "col4": [1.1, 2.2, 3.3, 5.5],
+                "col5": ["1.1", "2.2", "3.3", "5.5"],
+            }
+        ),
+        check_row_order=False,
+    )
+
+
+def test_join_ingestor_ingest_key_filter_filtered(caplog: pytest.LogCaptureFixture) -> None:
+    ingestor = JoinIngestor(
+        [
+            Ingestor(pl.DataFrame({"col": [2, 5], "col2": ["a", "b"]})),
+            Ingestor(pl.DataFrame({"col": list(range(10)), "col1": list(range(10))})),
+        ],
+        key_filter="is_in",
+        on="col",
+    )
+    with caplog.at_level(logging.INFO):
+        out = ingestor.ingest()
+    assert "pushed to 0/1 ingestors" in caplog.text
+    assert_frame_equal(out, pl.DataFrame({"col": [2, 5], "col2": ["a", "b"], "col1": [2, 5]}))
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_join_ingestor_ingest_key_filter_pushed(
+    tmp_path: Path, caplog: pytest.LogCaptureFixture, max_workers: int
+) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame({"col": list(range(1000)), "col1": list(range(1000))}).write_parquet(
+        path, row_group_size=100
+    )
+    ingestor = JoinIngestor(
+        [
+            Ingestor(pl.DataFrame({"col": [10, 20], "col2": ["a", "b"]})),
+            ParquetIngestor(path),
+            Ingestor(pl.DataFrame({"col": [10, 30], "col3": [1.0, 3.0]})),
+        ],
+        max_workers=max_workers,
+        key_filter="range",
+        on="col",
+    )
+    with caplog.at_level(logging.INFO):
+        out = ingestor.ingest()
+    assert "pushed to 1/2 ingestors" in caplog.text
+    assert_frame_equal(out, pl.DataFrame({"col": [10], "col2": ["a"], "col1": [10], "col3": [1.0]}))
+
+
+def test_join_ingestor_ingest_key_filter_left(
+    ingestors: Sequence[BaseIngestor], caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.INFO):
+        out = JoinIngestor(ingestors, key_filter="is_in", on="col", how="left").ingest()
+    assert "Filtering the join keys" not in caplog.text
+    assert out.shape == (5, 6)
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+from datetime import date
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
 from grizz.exceptions import DataNotFoundError
-from grizz.ingestor import ParquetFileIngestor, ParquetIngestor
+from grizz.ingestor import (
+    ParquetDatasetIngestor,
+    ParquetDirectoryIngestor,
+    ParquetFileIngestor,
+    ParquetIngestor,
+)
+from grizz.testing.fixture import pyarrow_available
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -41,6 +49,14 @@ def test_parquet_ingestor_repr_with_kwargs(frame_path: Path) -> None:
     )
 
 
+def test_parquet_ingestor_repr_pushdown(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    assert repr(ParquetIngestor(path).select_columns(["col1"]).filter_rows(pl.col("col1") > 2)) == (
+        f"ParquetIngestor(source={path}, selected_columns=('col1',), "
+        f'predicate=[(col("col1")) > (dyn int: 2)])'
+    )
+
+
 def test_parquet_ingestor_str(frame_path: Path) -> None:
     assert str(ParquetIngestor(frame_path)).startswith("ParquetIngestor(")
 
@@ -67,6 +83,39 @@ def test_parquet_ingestor_equal_false_different_kwargs(tmp_path: Path) -> None:
     )
 
 
+def test_parquet_ingestor_equal_true_pushdown(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    ingestor = ParquetIngestor(path).select_columns(["col1"]).filter_rows(pl.col("col1") > 2)
+    assert ingestor.equal(
+        ParquetIngestor(path).select_columns(["col1"]).filter_rows(pl.col("col1") > 2)
+    )
+
+
+def test_parquet_ingestor_equal_false_different_selected_columns(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    ingestor = ParquetIngestor(path).select_columns(["col1"])
+    assert not ingestor.equal(ParquetIngestor(path).select_columns(["col2"]))
+
+
+def test_parquet_ingestor_equal_false_different_predicate(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    ingestor = ParquetIngestor(path).filter_rows(pl.col("col1") > 2)
+    assert not ingestor.equal(ParquetIngestor(path).filter_rows(pl.col("col1") > 3))
+
+
+def test_parquet_ingestor_equal_false_missing_predicate(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    assert not ParquetIngestor(path).filter_rows(pl.col("col1") > 2).equal(ParquetIngestor(path))
+
+
+def test_parquet_ingestor_equal_false_different_index_path(tmp_path: Path) -> None:
+    assert not ParquetIngestor(tmp_path.joinpath("data.parquet")).equal(
+        ParquetIngestor(
+            tmp_path.joinpath("data.parquet"), index_path=tmp_path.joinpath("index.json")
+        )
+    )
+
+
 def test_parquet_ingestor_equal_false_different_type(tmp_path: Path) -> None:
     assert not ParquetIngestor(tmp_path.joinpath("data.parquet")).equal(42)
 
@@ -96,6 +145,84 @@ def test_parquet_ingestor_ingest_with_kwargs(frame_path: Path) -> None:
     )
 
 
+def test_parquet_ingestor_select_columns(frame_path: Path) -> None:
+    ingestor = ParquetIngestor(frame_path).select_columns(["col3", "col1", "col4"])
+    expected = ParquetIngestor(frame_path).ingest().select(["col1", "col3"])
+    assert_frame_equal(ingestor.ingest(), expected)
+
+
+def test_parquet_ingestor_select_columns_no_common_column(frame_path: Path) -> None:
+    ingestor = ParquetIngestor(frame_path).select_columns(["col4"])
+    assert_frame_equal(ingestor.ingest(), ParquetIngestor(frame_path).ingest())
+
+
+def test_parquet_ingestor_select_columns_does_not_read(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    ingestor = ParquetIngestor(path).select_columns(["col1"])
+    assert ingestor.equal(ParquetIngestor(path).select_columns(["col1"]))
+    assert not ingestor.equal(ParquetIngestor(path))
+
+
+@pyarrow_available
+def test_parquet_ingestor_select_columns_index(tmp_path: Path, frame_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    ingestor = ParquetIngestor(frame_path, index_path=index_path).select_columns(["col3", "col1"])
+    expected = ParquetIngestor(frame_path).ingest().select(["col1", "col3"])
+    assert_frame_equal(ingestor.ingest(), expected)
+    assert index_path.is_file()
+    # The schema is read from the index, so the file is not scanned.
+    with patch("polars.scan_parquet", side_effect=AssertionError):
+        assert_frame_equal(ingestor.ingest(), expected)
+
+
+def test_parquet_ingestor_select_columns_with_columns(frame_path: Path) -> None:
+    assert ParquetIngestor(frame_path, columns=["col1"]).select_columns(["col1", "col3"]) is None
+
+
+def test_parquet_ingestor_select_columns_bytes(frame_path: Path) -> None:
+    assert ParquetIngestor(frame_path.read_bytes()).select_columns(["col1"]) is None
+
+
+def test_parquet_ingestor_filter_rows(frame_path: Path) -> None:
+    ingestor = ParquetIngestor(frame_path).filter_rows(pl.col("col1") > 2)
+    assert_frame_equal(
+        ingestor.ingest(),
+        pl.DataFrame({"col1": [3, 4, 5], "col2": ["c", "d", "e"], "col3": [3.2, 4.2, 5.2]}),
+    )
+
+
+def test_parquet_ingestor_filter_rows_multiple(frame_path: Path) -> None:
+    ingestor = ParquetIngestor(frame_path).filter_rows(pl.col("col1") > 2)
+    ingestor = ingestor.filter_rows(pl.col("col2") != "d")
+    assert_frame_equal(
+        ingestor.ingest(),
+        pl.DataFrame({"col1": [3, 5], "col2": ["c", "e"], "col3": [3.2, 5.2]}),
+    )
+
+
+def test_parquet_ingestor_filter_rows_select_columns(frame_path: Path) -> None:
+    ingestor = ParquetIngestor(frame_path).select_columns(["col2"]).filter_rows(pl.col("col1") > 3)
+    assert_frame_equal(ingestor.ingest(), pl.DataFrame({"col2": ["d", "e"]}))
+
+
+def test_parquet_ingestor_filter_rows_does_not_change_ingestor(frame_path: Path) -> None:
+    ingestor = ParquetIngestor(frame_path)
+    ingestor.filter_rows(pl.col("col1") > 2)
+    assert ingestor.ingest().shape == (5, 3)
+
+
+def test_parquet_ingestor_filter_rows_n_rows(frame_path: Path) -> None:
+    assert ParquetIngestor(frame_path, n_rows=2).filter_rows(pl.col("col1") > 2) is None
+
+
+def test_parquet_ingestor_filter_rows_incompatible_kwargs(frame_path: Path) -> None:
+    assert ParquetIngestor(frame_path, use_pyarrow=True).filter_rows(pl.col("col1") > 2) is None
+
+
+def test_parquet_ingestor_filter_rows_bytes(frame_path: Path) -> None:
+    assert ParquetIngestor(frame_path.read_bytes()).filter_rows(pl.col("col1") > 2) is None
+
+
 #########################################
 #     Tests for ParquetFileIngestor     #
 #########################################
@@ -172,3 +299,326 @@ def test_parquet_file_ingestor_ingest_missing_path(tmp_path: Path) -> None:
     ingestor = ParquetFileIngestor(tmp_path.joinpath("data.parquet"))
     with pytest.raises(DataNotFoundError, match=r"Data file does not exist"):
         ingestor.ingest()
+
+
+def test_parquet_file_ingestor_select_columns(frame_path: Path) -> None:
+    ingestor = ParquetFileIngestor(frame_path).select_columns(["col1", "col2"])
+    assert isinstance(ingestor, ParquetFileIngestor)
+    expected = ParquetFileIngestor(frame_path).ingest().select(["col1", "col2"])
+    assert_frame_equal(ingestor.ingest(), expected)
+
+
+def test_parquet_file_ingestor_select_columns_missing_path(tmp_path: Path) -> None:
+    with pytest.raises(DataNotFoundError, match=r"Data file does not exist"):
+        ParquetFileIngestor(tmp_path.joinpath("data.parquet")).select_columns(["col1"])
+
+
+def test_parquet_file_ingestor_filter_rows(frame_path: Path) -> None:
+    ingestor = ParquetFileIngestor(frame_path).filter_rows(pl.col("col1") <= 2)
+    assert isinstance(ingestor, ParquetFileIngestor)
+    assert ingestor.ingest()["col1"].to_list() == [1, 2]
+
+
+@pytest.fixture(scope="module")
+def dataset_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("dataset")
+    for day, country, values in [
+        ("2024-01-01", "FR", [1, 2]),
+        ("2024-01-01", "DE", [3]),
+        ("2024-01-02", "FR", [4]),
+        ("2024-01-03", "FR", [5, 6]),
+    ]:
+        partition = path.joinpath(f"day={day}", f"country={country}")
+        partition.mkdir(parents=True)
+        pl.DataFrame({"col1": values}).write_parquet(partition.joinpath("part-00000.parquet"))
+    return path
+
+
+############################################
+#     Tests for ParquetDatasetIngestor     #
+############################################
+
+
+def test_parquet_dataset_ingestor_column_filters_without_index_path(dataset_path: Path) -> None:
+    with pytest.raises(ValueError, match="index_path is required to use column_filters"):
+        ParquetDatasetIngestor(dataset_path, column_filters={"col1": 1})
+
+
+def test_parquet_dataset_ingestor_repr(dataset_path: Path) -> None:
+    assert repr(ParquetDatasetIngestor(dataset_path)).startswith("ParquetDatasetIngestor(")
+
+
+def test_parquet_dataset_ingestor_str(dataset_path: Path) -> None:
+    assert str(ParquetDatasetIngestor(dataset_path)).startswith("ParquetDatasetIngestor(")
+
+
+def test_parquet_dataset_ingestor_equal_true(dataset_path: Path) -> None:
+    assert ParquetDatasetIngestor(dataset_path, filters={"country": "FR"}).equal(
+        ParquetDatasetIngestor(dataset_path, filters={"country": "FR"})
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_path(
+    tmp_path: Path, dataset_path: Path
+) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(ParquetDatasetIngestor(tmp_path))
+
+
+def test_parquet_dataset_ingestor_equal_false_different_filters(dataset_path: Path) -> None:
+    assert not ParquetDatasetIngestor(dataset_path, filters={"country": "FR"}).equal(
+        ParquetDatasetIngestor(dataset_path, filters={"country": "DE"})
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_cache_path(
+    tmp_path: Path, dataset_path: Path
+) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(
+        ParquetDatasetIngestor(dataset_path, cache_path=tmp_path.joinpath("cache.json"))
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_hive_schema(dataset_path: Path) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(
+        ParquetDatasetIngestor(dataset_path, hive_schema={"day": pl.Date})
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_column_filters(
+    tmp_path: Path, dataset_path: Path
+) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    assert not ParquetDatasetIngestor(
+        dataset_path, column_filters={"col1": 1}, index_path=index_path
+    ).equal(ParquetDatasetIngestor(dataset_path, column_filters={"col1": 2}, index_path=index_path))
+
+
+def test_parquet_dataset_ingestor_equal_false_different_index_path(
+    tmp_path: Path, dataset_path: Path
+) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(
+        ParquetDatasetIngestor(dataset_path, index_path=tmp_path.joinpath("index.json"))
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_kwargs(dataset_path: Path) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(
+        ParquetDatasetIngestor(dataset_path, n_rows=1)
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_type(dataset_path: Path) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(42)
+
+
+def test_parquet_dataset_ingestor_ingest(dataset_path: Path) -> None:
+    frame = ParquetDatasetIngestor(dataset_path).ingest()
+    assert_frame_equal(
+        frame.sort("col1"),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5, 6],
+                "day": ["2024-01-01"] * 3 + ["2024-01-02"] + ["2024-01-03"] * 2,
+                "country": ["FR", "FR", "DE", "FR", "FR", "FR"],
+            }
+        ),
+    )
+
+
+def test_parquet_dataset_ingestor_ingest_filters(dataset_path: Path) -> None:
+    frame = ParquetDatasetIngestor(
+        dataset_path,
+        filters={"day": {"start": date(2024, 1, 1), "end": date(2024, 1, 3)}, "country": ["FR"]},
+        hive_schema={"day": pl.Date},
+    ).ingest()
+    assert_frame_equal(
+        frame.sort("col1"),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 4],
+                "day": [date(2024, 1, 1), date(2024, 1, 1), date(2024, 1, 2)],
+                "country": ["FR", "FR", "FR"],
+            }
+        ),
+    )
+
+
+def test_parquet_dataset_ingestor_ingest_no_match(dataset_path: Path) -> None:
+    frame = ParquetDatasetIngestor(dataset_path, filters={"country": "IT"}).ingest()
+    assert_frame_equal(frame, pl.DataFrame())
+
+
+def test_parquet_dataset_ingestor_ingest_cache_path(tmp_path: Path, dataset_path: Path) -> None:
+    cache_path = tmp_path.joinpath("cache.json")
+    ingestor = ParquetDatasetIngestor(
+        dataset_path, filters={"day": "2024-01-02"}, cache_path=cache_path
+    )
+    expected = pl.DataFrame({"col1": [4], "day": ["2024-01-02"], "country": ["FR"]})
+    assert_frame_equal(ingestor.ingest(), expected)
+    assert cache_path.is_file()
+    assert_frame_equal(ingestor.ingest(), expected)
+
+
+def test_parquet_dataset_ingestor_ingest_with_kwargs(dataset_path: Path) -> None:
+    frame = ParquetDatasetIngestor(dataset_path, filters={"day": "2024-01-03"}, n_rows=1).ingest()
+    assert_frame_equal(frame, pl.DataFrame({"col1": [5], "day": ["2024-01-03"], "country": ["FR"]}))
+
+
+@pyarrow_available
+def test_parquet_dataset_ingestor_ingest_column_filters(tmp_path: Path, dataset_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    frame = ParquetDatasetIngestor(
+        dataset_path,
+        filters={"country": "FR"},
+        column_filters={"col1": {"start": 2, "end": 5}},
+        index_path=index_path,
+    ).ingest()
+    assert_frame_equal(
+        frame.sort("col1"),
+        pl.DataFrame(
+            {"col1": [2, 4], "day": ["2024-01-01", "2024-01-02"], "country": ["FR", "FR"]}
+        ),
+    )
+    assert index_path.is_file()
+
+
+@pytest.fixture(scope="module")
+def directory_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("exports")
+    pl.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}).write_parquet(
+        path.joinpath("day-01.parquet")
+    )
+    pl.DataFrame({"col1": [3], "col2": ["c"], "col3": [3.5]}).write_parquet(
+        path.joinpath("day-02.parquet")
+    )
+    path.joinpath("2024").mkdir()
+    pl.DataFrame(
+        {"col1": [4, 5], "col3": [4.5, 5.5]}, schema={"col1": pl.Int32, "col3": pl.Float64}
+    ).write_parquet(path.joinpath("2024", "day-03.parquet"))
+    path.joinpath("notes.txt").write_text("meow")
+    return path
+
+
+##############################################
+#     Tests for ParquetDirectoryIngestor     #
+##############################################
+
+
+def test_parquet_directory_ingestor_repr(directory_path: Path) -> None:
+    assert repr(ParquetDirectoryIngestor(directory_path)) == (
+        f"ParquetDirectoryIngestor(path={directory_path}, recursive=True, "
+        f"how=diagonal_relaxed, max_workers=1)"
+    )
+
+
+def test_parquet_directory_ingestor_str(directory_path: Path) -> None:
+    assert str(ParquetDirectoryIngestor(directory_path)).startswith("ParquetDirectoryIngestor(")
+
+
+def test_parquet_directory_ingestor_incorrect_how(directory_path: Path) -> None:
+    with pytest.raises(ValueError, match=r"Incorrect how: horizontal."):
+        ParquetDirectoryIngestor(directory_path, how="horizontal")
+
+
+def test_parquet_directory_ingestor_incorrect_max_workers(directory_path: Path) -> None:
+    with pytest.raises(ValueError, match=r"max_workers must be greater than 0 \(received: 0\)"):
+        ParquetDirectoryIngestor(directory_path, max_workers=0)
+
+
+def test_parquet_directory_ingestor_equal_true(directory_path: Path) -> None:
+    assert ParquetDirectoryIngestor(directory_path).equal(ParquetDirectoryIngestor(directory_path))
+
+
+def test_parquet_directory_ingestor_equal_false_different_path(
+    tmp_path: Path, directory_path: Path
+) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(ParquetDirectoryIngestor(tmp_path))
+
+
+def test_parquet_directory_ingestor_equal_false_different_recursive(directory_path: Path) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(
+        ParquetDirectoryIngestor(directory_path, recursive=False)
+    )
+
+
+def test_parquet_directory_ingestor_equal_false_different_how(directory_path: Path) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(
+        ParquetDirectoryIngestor(directory_path, how="diagonal")
+    )
+
+
+def test_parquet_directory_ingestor_equal_false_different_max_workers(
+    directory_path: Path,
+) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(
+        ParquetDirectoryIngestor(directory_path, max_workers=2)
+    )
+
+
+def test_parquet_directory_ingestor_equal_false_different_kwargs(directory_path: Path) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(
+        ParquetDirectoryIngestor(directory_path, n_rows=1)
+    )
+
+
+def test_parquet_directory_ingestor_equal_false_different_type(directory_path: Path) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(42)
+
+
+def test_parquet_directory_ingestor_ingest(directory_path: Path) -> None:
+    assert_frame_equal(
+        ParquetDirectoryIngestor(directory_path).ingest(),
+        pl.DataFrame(
+            {
+                "col1": [4, 5, 1, 2, 3],
+                "col3": [4.5, 5.5, None, None, 3.5],
+                "col2": [None, None, "a", "b", "c"],
+            }
+        ),
+    )
+
+
+def test_parquet_directory_ingestor_ingest_max_workers(directory_path: Path) -> None:
+    assert_frame_equal(
+        ParquetDirectoryIngestor(directory_path, max_workers=2).ingest(),
+        ParquetDirectoryIngestor(directory_path).ingest(),
+    )
+
+
+def test_parquet_directory_ingestor_ingest_not_recursive(directory_path: Path) -> None:
+    assert_frame_equal(
+        ParquetDirectoryIngestor(directory_path, recursive=False).ingest(),
+        pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"], "col3": [None, None, 3.5]}),
+    )
+
+
+def test_parquet_directory_ingestor_ingest_diagonal(directory_path: Path) -> None:
+    assert_frame_equal(
+        ParquetDirectoryIngestor(directory_path, recursive=False, how="diagonal").ingest(),
+        pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"], "col3": [None, None, 3.5]}),
+    )
+
+
+def test_parquet_directory_ingestor_ingest_vertical(tmp_path: Path) -> None:
+    pl.DataFrame({"col1": [1, 2]}).write_parquet(tmp_path.joinpath("data1.parquet"))
+    pl.DataFrame({"col1": [3]}).write_parquet(tmp_path.joinpath("data2.parquet"))
+    assert_frame_equal(
+        ParquetDirectoryIngestor(tmp_path, how="vertical").ingest(),
+        pl.DataFrame({"col1": [1, 2, 3]}),
+    )
+
+
+def test_parquet_directory_ingestor_ingest_with_kwargs(directory_path: Path) -> None:
+    assert_frame_equal(
+        ParquetDirectoryIngestor(directory_path, recursive=False, columns=["col1"]).ingest(),
+        pl.DataFrame({"col1": [1, 2, 3]}),
+    )
+
+
+def test_parquet_directory_ingestor_ingest_empty(tmp_path: Path) -> None:
+    assert_frame_equal(ParquetDirectoryIngestor(tmp_path).ingest(), pl.DataFrame())
+
+
+def test_parquet_directory_ingestor_ingest_missing(tmp_path: Path) -> None:
+    with pytest.raises(DataNotFoundError, match=r"Data directory does not exist"):
+        ParquetDirectoryIngestor(tmp_path.joinpath("missing")).ingest()
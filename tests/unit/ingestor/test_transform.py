@@ -1,13 +1,21 @@
 from __future__ import annotations
 
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
 from grizz.ingestor import Ingestor, ParquetFileIngestor, TransformIngestor
-from grizz.transformer import InplaceCast
+from grizz.transformer import (
+    ColumnSelection,
+    Filter,
+    FilterIsIn,
+    FilterRange,
+    InplaceCast,
+    Sequential,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -86,6 +94,32 @@ def test_transform_ingestor_equal_false_different_transformer(frame_path: Path)
     )
 
 
+def test_transform_ingestor_equal_false_different_prune_columns(frame_path: Path) -> None:
+    assert not TransformIngestor(
+        ingestor=ParquetFileIngestor(path=frame_path),
+        transformer=InplaceCast(columns=["col1", "col3"], dtype=pl.Float32),
+    ).equal(
+        TransformIngestor(
+            ingestor=ParquetFileIngestor(path=frame_path),
+            transformer=InplaceCast(columns=["col1", "col3"], dtype=pl.Float32),
+            prune_columns=True,
+        )
+    )
+
+
+def test_transform_ingestor_equal_false_different_pushdown_filters(frame_path: Path) -> None:
+    assert not TransformIngestor(
+        ingestor=ParquetFileIngestor(path=frame_path),
+        transformer=InplaceCast(columns=["col1", "col3"], dtype=pl.Float32),
+    ).equal(
+        TransformIngestor(
+            ingestor=ParquetFileIngestor(path=frame_path),
+            transformer=InplaceCast(columns=["col1", "col3"], dtype=pl.Float32),
+            pushdown_filters=True,
+        )
+    )
+
+
 def test_transform_ingestor_equal_false_different_type(frame_path: Path) -> None:
     assert not TransformIngestor(
         ingestor=ParquetFileIngestor(path=frame_path),
@@ -109,3 +143,126 @@ def test_transform_ingestor_ingest(frame_path: Path) -> None:
             schema={"col1": pl.Float32, "col2": pl.String, "col3": pl.Float32},
         ),
     )
+
+
+def test_transform_ingestor_ingest_prune_columns(frame_path: Path) -> None:
+    ingestor = TransformIngestor(
+        ingestor=ParquetFileIngestor(path=frame_path),
+        transformer=Sequential(
+            [
+                InplaceCast(columns=["col1"], dtype=pl.Float32),
+                ColumnSelection(columns=["col1", "col2"]),
+            ]
+        ),
+        prune_columns=True,
+    )
+    with patch("grizz.ingestor.parquet.pl.read_parquet", wraps=pl.read_parquet) as read_mock:
+        frame = ingestor.ingest()
+    assert read_mock.call_args.kwargs["columns"] == ["col1", "col2"]
+    assert_frame_equal(
+        frame,
+        pl.DataFrame(
+            {"col1": [1.0, 2.0, 3.0, 4.0, 5.0], "col2": ["a", "b", "c", "d", "e"]},
+            schema={"col1": pl.Float32, "col2": pl.String},
+        ),
+    )
+
+
+def test_transform_ingestor_ingest_prune_columns_all_columns(frame_path: Path) -> None:
+    ingestor = TransformIngestor(
+        ingestor=ParquetFileIngestor(path=frame_path),
+        transformer=InplaceCast(columns=["col1", "col3"], dtype=pl.Float32),
+        prune_columns=True,
+    )
+    with patch("grizz.ingestor.parquet.pl.read_parquet", wraps=pl.read_parquet) as read_mock:
+        frame = ingestor.ingest()
+    assert "columns" not in read_mock.call_args.kwargs
+    assert frame.columns == ["col1", "col2", "col3"]
+
+
+def test_transform_ingestor_ingest_prune_columns_unsupported_ingestor() -> None:
+    frame = pl.DataFrame({"col1": ["1", "2", "3"], "col2": ["a", "b", "c"]})
+    ingestor = TransformIngestor(
+        ingestor=Ingestor(frame),
+        transformer=ColumnSelection(columns=["col1"]),
+        prune_columns=True,
+    )
+    assert_frame_equal(ingestor.ingest(), pl.DataFrame({"col1": ["1", "2", "3"]}))
+
+
+def test_transform_ingestor_ingest_pushdown_filters(frame_path: Path) -> None:
+    ingestor = TransformIngestor(
+        ingestor=ParquetFileIngestor(path=frame_path),
+        transformer=Sequential(
+            [
+                FilterRange(col="col3", start=2.0),
+                FilterIsIn(col="col2", values=["a", "b", "d"]),
+                InplaceCast(columns=["col1"], dtype=pl.Float32),
+            ]
+        ),
+        pushdown_filters=True,
+    )
+    with patch("grizz.ingestor.parquet.pl.read_parquet", wraps=pl.read_parquet) as read_mock:
+        frame = ingestor.ingest()
+    read_mock.assert_not_called()
+    assert_frame_equal(
+        frame,
+        pl.DataFrame(
+            {"col1": [2.0, 4.0], "col2": ["b", "d"], "col3": [2.2, 4.2]},
+            schema={"col1": pl.Float32, "col2": pl.String, "col3": pl.Float64},
+        ),
+    )
+
+
+def test_transform_ingestor_ingest_pushdown_filters_prune_columns(frame_path: Path) -> None:
+    ingestor = TransformIngestor(
+        ingestor=ParquetFileIngestor(path=frame_path),
+        transformer=Sequential(
+            [
+                FilterRange(col="col3", start=2.0, end=4.0),
+                ColumnSelection(columns=["col2"]),
+            ]
+        ),
+        prune_columns=True,
+        pushdown_filters=True,
+    )
+    assert_frame_equal(ingestor.ingest(), pl.DataFrame({"col2": ["b", "c"]}))
+
+
+def test_transform_ingestor_ingest_pushdown_filters_no_filter(frame_path: Path) -> None:
+    ingestor = TransformIngestor(
+        ingestor=ParquetFileIngestor(path=frame_path),
+        transformer=InplaceCast(columns=["col1"], dtype=pl.Float32),
+        pushdown_filters=True,
+    )
+    with patch("grizz.ingestor.parquet.pl.read_parquet", wraps=pl.read_parquet) as read_mock:
+        frame = ingestor.ingest()
+    read_mock.assert_called_once()
+    assert frame.shape == (5, 3)
+
+
+def test_transform_ingestor_ingest_pushdown_filters_aggregation(frame_path: Path) -> None:
+    ingestor = TransformIngestor(
+        ingestor=ParquetFileIngestor(path=frame_path),
+        transformer=Sequential(
+            [
+                FilterRange(col="col3", start=2.0),
+                Filter(predicate=pl.col("col3") > pl.col("col3").mean()),
+            ]
+        ),
+        pushdown_filters=True,
+    )
+    assert_frame_equal(
+        ingestor.ingest(),
+        pl.DataFrame({"col1": ["4", "5"], "col2": ["d", "e"], "col3": [4.2, 5.2]}),
+    )
+
+
+def test_transform_ingestor_ingest_pushdown_filters_unsupported_ingestor() -> None:
+    frame = pl.DataFrame({"col1": ["1", "2", "3"], "col2": ["a", "b", "c"]})
+    ingestor = TransformIngestor(
+        ingestor=Ingestor(frame),
+        transformer=FilterIsIn(col="col2", values=["a", "c"]),
+        pushdown_filters=True,
+    )
+    assert_frame_equal(ingestor.ingest(), pl.DataFrame({"col1": ["1", "3"], "col2": ["a", "c"]}))
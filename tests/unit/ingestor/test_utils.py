@@ -2,15 +2,65 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
+import polars as pl
 import pytest
 from iden.io import save_text
+from polars.testing import assert_frame_equal
 
 from grizz.exceptions import DataNotFoundError
-from grizz.ingestor.utils import check_data_file
+from grizz.ingestor.utils import (
+    check_concat_how,
+    check_data_dir,
+    check_data_file,
+    check_key_filter,
+    find_available_columns,
+    get_file_paths,
+    get_inner_join_keys,
+    is_scan_compatible,
+    make_key_filter,
+    predicates_are_equal,
+    scan_filtered,
+)
 
 if TYPE_CHECKING:
     from pathlib import Path
 
+######################################
+#     Tests for check_concat_how     #
+######################################
+
+
+@pytest.mark.parametrize("how", ["diagonal", "diagonal_relaxed", "vertical", "vertical_relaxed"])
+def test_check_concat_how_valid(how: str) -> None:
+    check_concat_how(how)
+
+
+def test_check_concat_how_incorrect() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect how: horizontal."):
+        check_concat_how("horizontal")
+
+
+####################################
+#     Tests for check_data_dir     #
+####################################
+
+
+def test_check_data_dir_exists(tmp_path: Path) -> None:
+    check_data_dir(tmp_path)
+
+
+def test_check_data_dir_missing(tmp_path: Path) -> None:
+    with pytest.raises(DataNotFoundError, match=r"Data directory does not exist"):
+        check_data_dir(tmp_path.joinpath("dataset"))
+
+
+def test_check_data_dir_file(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    save_text("meow", path)
+    with pytest.raises(DataNotFoundError, match=r"Data directory does not exist"):
+        check_data_dir(path)
+
+
 #####################################
 #     Tests for check_data_file     #
 #####################################
@@ -26,3 +76,249 @@ def test_check_data_file_missing(tmp_path: Path) -> None:
     path = tmp_path.joinpath("data.txt")
     with pytest.raises(DataNotFoundError, match=r"Data file does not exist"):
         check_data_file(path)
+
+
+######################################
+#     Tests for check_key_filter     #
+######################################
+
+
+@pytest.mark.parametrize("key_filter", [None, "is_in", "range"])
+def test_check_key_filter_valid(key_filter: str | None) -> None:
+    check_key_filter(key_filter)
+
+
+def test_check_key_filter_incorrect() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect key_filter: incorrect"):
+        check_key_filter("incorrect")
+
+
+############################################
+#     Tests for find_available_columns     #
+############################################
+
+
+def test_find_available_columns() -> None:
+    assert find_available_columns(["col3", "col1", "col4"], ["col1", "col2", "col3"]) == [
+        "col1",
+        "col3",
+    ]
+
+
+def test_find_available_columns_no_common_column() -> None:
+    assert find_available_columns(["col4"], ["col1", "col2", "col3"]) == []
+
+
+def test_find_available_columns_empty() -> None:
+    assert find_available_columns([], ["col1", "col2", "col3"]) == []
+
+
+####################################
+#     Tests for get_file_paths     #
+####################################
+
+
+def test_get_file_paths(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    path.write_bytes(b"")
+    assert get_file_paths(path) == [path]
+
+
+def test_get_file_paths_str(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    path.write_bytes(b"")
+    assert get_file_paths(str(path)) == [path]
+
+
+def test_get_file_paths_list(tmp_path: Path) -> None:
+    paths = [tmp_path.joinpath("data1.parquet"), tmp_path.joinpath("data2.parquet")]
+    for path in paths:
+        path.write_bytes(b"")
+    assert get_file_paths(paths) == paths
+
+
+def test_get_file_paths_directory(tmp_path: Path) -> None:
+    assert get_file_paths(tmp_path) is None
+
+
+def test_get_file_paths_missing(tmp_path: Path) -> None:
+    assert get_file_paths(tmp_path.joinpath("data.parquet")) is None
+
+
+def test_get_file_paths_bytes() -> None:
+    assert get_file_paths(b"data") is None
+
+
+#########################################
+#     Tests for get_inner_join_keys     #
+#########################################
+
+
+def test_get_inner_join_keys_str() -> None:
+    assert get_inner_join_keys(on="col") == ["col"]
+
+
+def test_get_inner_join_keys_list() -> None:
+    assert get_inner_join_keys(on=["col1", "col2"], how="inner") == ["col1", "col2"]
+
+
+def test_get_inner_join_keys_left() -> None:
+    assert get_inner_join_keys(on="col", how="left") is None
+
+
+def test_get_inner_join_keys_left_on() -> None:
+    assert get_inner_join_keys(left_on="col1", right_on="col2") is None
+
+
+def test_get_inner_join_keys_expr() -> None:
+    assert get_inner_join_keys(on=pl.col("col")) is None
+
+
+def test_get_inner_join_keys_empty() -> None:
+    assert get_inner_join_keys() is None
+
+
+########################################
+#     Tests for is_scan_compatible     #
+########################################
+
+
+def test_is_scan_compatible_empty() -> None:
+    assert is_scan_compatible(pl.scan_parquet, {})
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"columns": ["col1", "col2"]},
+        {"hive_partitioning": False},
+        {"columns": ["col1"], "rechunk": True},
+    ],
+)
+def test_is_scan_compatible_true(kwargs: dict) -> None:
+    assert is_scan_compatible(pl.scan_parquet, kwargs)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"columns": [0, 1]},
+        {"n_rows": 10},
+        {"use_pyarrow": True},
+        {"columns": ["col1"], "pyarrow_options": {}},
+    ],
+)
+def test_is_scan_compatible_false(kwargs: dict) -> None:
+    assert not is_scan_compatible(pl.scan_parquet, kwargs)
+
+
+def test_is_scan_compatible_csv() -> None:
+    assert is_scan_compatible(pl.scan_csv, {"separator": ";", "columns": ["col1"]})
+
+
+##########################################
+#     Tests for predicates_are_equal     #
+##########################################
+
+
+def test_predicates_are_equal_true() -> None:
+    assert predicates_are_equal(pl.col("col1") > 2, pl.col("col1") > 2)
+
+
+def test_predicates_are_equal_true_none() -> None:
+    assert predicates_are_equal(None, None)
+
+
+def test_predicates_are_equal_false() -> None:
+    assert not predicates_are_equal(pl.col("col1") > 2, pl.col("col1") > 3)
+
+
+@pytest.mark.parametrize(
+    ("predicate1", "predicate2"), [(pl.col("col1") > 2, None), (None, pl.col("col1") > 2)]
+)
+def test_predicates_are_equal_false_none(
+    predicate1: pl.Expr | None, predicate2: pl.Expr | None
+) -> None:
+    assert not predicates_are_equal(predicate1, predicate2)
+
+
+###################################
+#     Tests for scan_filtered     #
+###################################
+
+
+def test_scan_filtered(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]}).write_parquet(path)
+    frame = scan_filtered(pl.scan_parquet, path, pl.col("col1") > 3)
+    assert isinstance(frame, pl.LazyFrame)
+    assert_frame_equal(frame.collect(), pl.DataFrame({"col1": [4, 5], "col2": ["d", "e"]}))
+
+
+def test_scan_filtered_columns(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.csv")
+    pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]}).write_csv(path)
+    frame = scan_filtered(pl.scan_csv, path, pl.col("col1") <= 2, columns=["col2"])
+    assert_frame_equal(frame.collect(), pl.DataFrame({"col2": ["a", "b"]}))
+
+
+#####################################
+#     Tests for make_key_filter     #
+#####################################
+
+
+@pytest.fixture
+def frame() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "col1": [1, 2, 3, 4, 5, None],
+            "col2": ["a", "b", "c", "d", "e", "f"],
+        }
+    )
+
+
+def test_make_key_filter_is_in(frame: pl.DataFrame) -> None:
+    keys = pl.DataFrame({"col1": [4, 2, 2, None]})
+    assert_frame_equal(
+        frame.filter(make_key_filter(keys, on=["col1"])),
+        pl.DataFrame({"col1": [2, 4], "col2": ["b", "d"]}),
+    )
+
+
+def test_make_key_filter_is_in_multiple_keys(frame: pl.DataFrame) -> None:
+    keys = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "c", "z"]})
+    assert_frame_equal(
+        frame.filter(make_key_filter(keys, on=["col1", "col2"])),
+        pl.DataFrame({"col1": [1, 3], "col2": ["a", "c"]}),
+    )
+
+
+def test_make_key_filter_is_in_lazyframe(frame: pl.DataFrame) -> None:
+    keys = pl.LazyFrame({"col1": [4, 2]})
+    assert_frame_equal(
+        frame.lazy().filter(make_key_filter(keys, on=["col1"])).collect(),
+        pl.DataFrame({"col1": [2, 4], "col2": ["b", "d"]}),
+    )
+
+
+def test_make_key_filter_is_in_empty(frame: pl.DataFrame) -> None:
+    keys = pl.DataFrame({"col1": []}, schema={"col1": pl.Int64})
+    assert frame.filter(make_key_filter(keys, on=["col1"])).shape == (0, 2)
+
+
+def test_make_key_filter_range(frame: pl.DataFrame) -> None:
+    keys = pl.DataFrame({"col1": [4, 2, None]})
+    assert_frame_equal(
+        frame.filter(make_key_filter(keys, on=["col1"], key_filter="range")),
+        pl.DataFrame({"col1": [2, 3, 4], "col2": ["b", "c", "d"]}),
+    )
+
+
+def test_make_key_filter_range_empty(frame: pl.DataFrame) -> None:
+    keys = pl.DataFrame({"col1": []}, schema={"col1": pl.Int64})
+    assert frame.filter(make_key_filter(keys, on=["col1"], key_filter="range")).shape == (0, 2)
+
+
+def test_make_key_filter_incorrect(frame: pl.DataFrame) -> None:
+    with pytest.raises(ValueError, match=r"Incorrect key_filter: incorrect"):
+        make_key_filter(frame, on=["col1"], key_filter="incorrect")
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import Mock
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.lazy.exporter import ClickHouseArrowExporter
+from grizz.testing.fixture import clickhouse_connect_available, pyarrow_available
+from grizz.utils.imports import is_clickhouse_connect_available, is_pyarrow_available
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+if is_clickhouse_connect_available():
+    from clickhouse_connect.driver import Client
+if is_pyarrow_available():
+    import pyarrow as pa
+
+
+@pytest.fixture
+def frame() -> pl.LazyFrame:
+    return pl.LazyFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["1", "2", "3", "4", "5"],
+            "col3": ["a", "b", "c", "d", "e"],
+        }
+    )
+
+
+def get_inserted_frame(client: Mock) -> pl.DataFrame:
+    tables = [call.kwargs["arrow_table"] for call in client.insert_arrow.call_args_list]
+    return pl.from_arrow(pa.concat_tables(tables))
+
+
+#############################################
+#     Tests for ClickHouseArrowExporter     #
+#############################################
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_repr() -> None:
+    assert repr(ClickHouseArrowExporter(table="target.dataset", client=Mock(spec=Client))) == (
+        "ClickHouseArrowExporter(table=target.dataset, batch_size=100,000, max_workers=1, "
+        "max_retries=0)"
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_str() -> None:
+    assert str(ClickHouseArrowExporter(table="target.dataset", client=Mock(spec=Client))) == (
+        "ClickHouseArrowExporter(table=target.dataset, batch_size=100,000, max_workers=1, "
+        "max_retries=0)"
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_true() -> None:
+    client = Mock(spec=Client)
+    assert ClickHouseArrowExporter(table="target.dataset", client=client).equal(
+        ClickHouseArrowExporter(table="target.dataset", client=client)
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_false_different_table() -> None:
+    client = Mock(spec=Client)
+    assert not ClickHouseArrowExporter(table="target.dataset", client=client).equal(
+        ClickHouseArrowExporter(table="target.dataset2", client=client)
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_false_different_tmp_dir(tmp_path: Path) -> None:
+    client = Mock(spec=Client)
+    assert not ClickHouseArrowExporter(table="target.dataset", client=client).equal(
+        ClickHouseArrowExporter(table="target.dataset", client=client, tmp_dir=tmp_path)
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_equal_false_different_type() -> None:
+    assert not ClickHouseArrowExporter(table="target.dataset", client=Mock(spec=Client)).equal(42)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export(frame: pl.LazyFrame) -> None:
+    client = Mock(spec=Client)
+    ClickHouseArrowExporter(table="target.dataset", client=client).export(frame)
+    client.insert_arrow.assert_called_once()
+    assert client.insert_arrow.call_args.kwargs["table"] == "target.dataset"
+    assert_frame_equal(get_inserted_frame(client), frame.collect())
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_batch_size(frame: pl.LazyFrame) -> None:
+    client = Mock(spec=Client)
+    ClickHouseArrowExporter(table="target.dataset", client=client, batch_size=2).export(frame)
+    calls = client.insert_arrow.call_args_list
+    assert [call.kwargs["arrow_table"].num_rows for call in calls] == [2, 2, 1]
+    assert_frame_equal(get_inserted_frame(client), frame.collect())
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_tmp_dir(tmp_path: Path, frame: pl.LazyFrame) -> None:
+    client = Mock(spec=Client)
+    ClickHouseArrowExporter(table="target.dataset", client=client, tmp_dir=tmp_path).export(
+        frame.filter(pl.col("col1") > 2)
+    )
+    assert_frame_equal(get_inserted_frame(client), frame.filter(pl.col("col1") > 2).collect())
+    assert list(tmp_path.iterdir()) == []
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_exporter_export_retry(frame: pl.LazyFrame) -> None:
+    client = Mock(spec=Client, insert_arrow=Mock(side_effect=[ConnectionError, None]))
+    ClickHouseArrowExporter(
+        table="target.dataset", client=client, max_retries=1, retry_delay=0.0
+    ).export(frame)
+    assert client.insert_arrow.call_count == 2
@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+from contextlib import nullcontext
+from datetime import date
+from unittest.mock import Mock
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.lazy.ingestor import ClickHouseArrowIngestor
+from grizz.testing.fixture import clickhouse_connect_available, pyarrow_available
+from grizz.utils.imports import is_clickhouse_connect_available, is_pyarrow_available
+
+if is_clickhouse_connect_available():
+    from clickhouse_connect.driver import Client
+if is_pyarrow_available():
+    import pyarrow as pa
+
+
+@pytest.fixture(scope="module")
+def table() -> pa.Table:
+    return pa.Table.from_pydict(
+        {
+            "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["a", "b", "c", "d", "e"],
+        }
+    )
+
+
+@pytest.fixture
+def client(table: pa.Table) -> Mock:
+    def query_arrow_stream(query: str) -> nullcontext:  # noqa: ARG001
+        return nullcontext(table.to_batches(max_chunksize=2))
+
+    return Mock(
+        spec=Client,
+        query_arrow=Mock(return_value=table.slice(0, 0)),
+        query_arrow_stream=Mock(side_effect=query_arrow_stream),
+    )
+
+
+def get_query(client: Mock) -> str:
+    return client.query_arrow_stream.call_args.kwargs["query"]
+
+
+#############################################
+#     Tests for ClickHouseArrowIngestor     #
+#############################################
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_repr(client: Mock) -> None:
+    assert repr(
+        ClickHouseArrowIngestor(query="select * from source.dataset", client=client)
+    ).startswith("ClickHouseArrowIngestor(")
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_equal_true(client: Mock) -> None:
+    assert ClickHouseArrowIngestor(query="select * from source.dataset", client=client).equal(
+        ClickHouseArrowIngestor(query="select * from source.dataset", client=client)
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_equal_false_different_query(client: Mock) -> None:
+    assert not ClickHouseArrowIngestor(query="select * from source.dataset", client=client).equal(
+        ClickHouseArrowIngestor(query="select col1 from source.dataset", client=client)
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_equal_false_different_schema(client: Mock) -> None:
+    assert not ClickHouseArrowIngestor(query="select * from source.dataset", client=client).equal(
+        ClickHouseArrowIngestor(
+            query="select * from source.dataset", client=client, schema={"col1": pl.Int64}
+        )
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_equal_false_different_type(client: Mock) -> None:
+    assert not ClickHouseArrowIngestor(query="select * from source.dataset", client=client).equal(
+        42
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_get_schema(client: Mock) -> None:
+    ingestor = ClickHouseArrowIngestor(query="select * from source.dataset", client=client)
+    assert ingestor.get_schema() == pl.Schema(
+        {"col1": pl.Int64, "col2": pl.String, "col3": pl.Float64}
+    )
+    assert ingestor.get_schema() == pl.Schema(
+        {"col1": pl.Int64, "col2": pl.String, "col3": pl.Float64}
+    )
+    client.query_arrow.assert_called_once_with(
+        query="SELECT * FROM (select * from source.dataset) LIMIT 0"
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_get_schema_given(client: Mock) -> None:
+    ingestor = ClickHouseArrowIngestor(
+        query="select * from source.dataset", client=client, schema={"col1": pl.Int64}
+    )
+    assert ingestor.get_schema() == pl.Schema({"col1": pl.Int64})
+    client.query_arrow.assert_not_called()
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_ingest(client: Mock) -> None:
+    frame = ClickHouseArrowIngestor(query="select * from source.dataset", client=client).ingest()
+    assert isinstance(frame, pl.LazyFrame)
+    client.query_arrow_stream.assert_not_called()
+    assert_frame_equal(
+        frame.collect(),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+    assert get_query(client) == "SELECT * FROM (select * from source.dataset)"
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_ingest_projection(client: Mock) -> None:
+    frame = ClickHouseArrowIngestor(query="select * from source.dataset", client=client).ingest()
+    assert_frame_equal(
+        frame.select("col2").collect(), pl.DataFrame({"col2": ["a", "b", "c", "d", "e"]})
+    )
+    assert get_query(client) == "SELECT `col2` FROM (select * from source.dataset)"
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_ingest_predicate(client: Mock) -> None:
+    frame = ClickHouseArrowIngestor(query="select * from source.dataset", client=client).ingest()
+    assert_frame_equal(
+        frame.filter(pl.col("col1") > 2).select("col2").collect(),
+        pl.DataFrame({"col2": ["c", "d", "e"]}),
+    )
+    query = get_query(client)
+    assert query.startswith("SELECT `col1`, `col2` FROM (select * from source.dataset)")
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_ingest_predicate_not_supported(client: Mock) -> None:
+    frame = ClickHouseArrowIngestor(query="select * from source.dataset", client=client).ingest()
+    assert_frame_equal(
+        frame.filter(pl.col("col2").str.contains("[ae]")).select("col1").collect(),
+        pl.DataFrame({"col1": [1, 5]}),
+    )
+    assert "WHERE" not in get_query(client)
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_ingest_n_rows(client: Mock) -> None:
+    frame = ClickHouseArrowIngestor(query="select * from source.dataset", client=client).ingest()
+    assert_frame_equal(
+        frame.head(3).collect(),
+        pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"], "col3": [1.2, 2.2, 3.2]}),
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_build_query(client: Mock) -> None:
+    ingestor = ClickHouseArrowIngestor(query="select * from source.dataset", client=client)
+    assert ingestor.build_query() == "SELECT * FROM (select * from source.dataset)"
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_build_query_columns(client: Mock) -> None:
+    ingestor = ClickHouseArrowIngestor(query="select * from source.dataset", client=client)
+    assert (
+        ingestor.build_query(columns=["col1", "my`col"], n_rows=5)
+        == "SELECT `col1`, `my\\`col` FROM (select * from source.dataset) LIMIT 5"
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+@pytest.mark.parametrize(
+    ("predicate", "where"),
+    [
+        (pl.col("col1") > 2, "(`col1` > 2)"),
+        (pl.col("col1") <= 2.5, "(`col1` <= 2.5)"),
+        (pl.lit(2) < pl.col("col1"), "(`col1` > 2)"),
+        (pl.col("col2") == "it's", "(`col2` = 'it\\'s')"),
+        (pl.col("col2") != "a", "(`col2` != 'a')"),
+        ((pl.col("col1") > 2) & (pl.col("col2") == "a"), "((`col1` > 2) AND (`col2` = 'a'))"),
+        ((pl.col("col1") > 2) | (pl.col("col1") < 0), "((`col1` > 2) OR (`col1` < 0))"),
+        (pl.col("col3") == True, "(`col3` = true)"),  # noqa: E712
+        (pl.col("col2").is_in(["a", "b"]), "(`col2` IN ('a', 'b'))"),
+        (pl.col("col1").is_null(), "(`col1` IS NULL)"),
+        (pl.col("col1").is_not_null(), "(`col1` IS NOT NULL)"),
+    ],
+)
+def test_clickhouse_arrow_ingestor_build_query_predicate(
+    client: Mock, predicate: pl.Expr, where: str
+) -> None:
+    ingestor = ClickHouseArrowIngestor(query="select * from source.dataset", client=client)
+    assert ingestor.build_query(predicate=predicate, n_rows=5).partition(" WHERE ") == (
+        "SELECT * FROM (select * from source.dataset)",
+        " WHERE ",
+        f"{where} LIMIT 5",
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+def test_clickhouse_arrow_ingestor_build_query_predicate_partial(client: Mock) -> None:
+    ingestor = ClickHouseArrowIngestor(query="select * from source.dataset", client=client)
+    predicate = (pl.col("col1") > 2) & pl.col("col2").str.contains("a")
+    assert (
+        ingestor.build_query(predicate=predicate, n_rows=5)
+        == "SELECT * FROM (select * from source.dataset) WHERE (`col1` > 2)"
+    )
+
+
+@clickhouse_connect_available
+@pyarrow_available
+@pytest.mark.parametrize(
+    "predicate",
+    [
+        (pl.col("col1") > 2) | pl.col("col2").str.contains("a"),
+        pl.col("col1") > pl.col("col3"),
+        pl.col("col1") > date(2024, 1, 1),
+        pl.col("col3") < float("inf"),
+        pl.col("col1").is_in([1, None]),
+        pl.col("col1").is_between(1, 3),
+        pl.col("col1").cast(pl.Int8) > 1,
+        ~(pl.col("col1") > 1),
+    ],
+)
+def test_clickhouse_arrow_ingestor_build_query_predicate_not_supported(
+    client: Mock, predicate: pl.Expr
+) -> None:
+    ingestor = ClickHouseArrowIngestor(query="select * from source.dataset", client=client)
+    assert (
+        ingestor.build_query(predicate=predicate, n_rows=5)
+        == "SELECT * FROM (select * from source.dataset)"
+    )
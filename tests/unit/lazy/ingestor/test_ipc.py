@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.exceptions import DataNotFoundError
+from grizz.lazy.ingestor import IpcFileIngestor, IpcIngestor
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture(scope="module")
+def frame_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("data").joinpath("frame.arrow")
+    pl.DataFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["a", "b", "c", "d", "e"],
+            "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+        }
+    ).write_ipc(path)
+    return path
+
+
+#################################
+#     Tests for IpcIngestor     #
+#################################
+
+
+def test_ipc_ingestor_repr(frame_path: Path) -> None:
+    assert repr(IpcIngestor(frame_path)).startswith("IpcIngestor(")
+
+
+def test_ipc_ingestor_repr_with_kwargs(frame_path: Path) -> None:
+    assert repr(IpcIngestor(frame_path, columns=["col1", "col3"])).startswith("IpcIngestor(")
+
+
+def test_ipc_ingestor_str(frame_path: Path) -> None:
+    assert str(IpcIngestor(frame_path)).startswith("IpcIngestor(")
+
+
+def test_ipc_ingestor_str_with_kwargs(frame_path: Path) -> None:
+    assert str(IpcIngestor(frame_path, columns=["col1", "col3"])).startswith("IpcIngestor(")
+
+
+def test_ipc_ingestor_equal_true(tmp_path: Path) -> None:
+    assert IpcIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcIngestor(tmp_path.joinpath("data.arrow"))
+    )
+
+
+def test_ipc_ingestor_equal_false_different_path(tmp_path: Path) -> None:
+    assert not IpcIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcIngestor(tmp_path.joinpath("data2.arrow"))
+    )
+
+
+def test_ipc_ingestor_equal_false_different_kwargs(tmp_path: Path) -> None:
+    assert not IpcIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcIngestor(tmp_path.joinpath("data.arrow"), include_header=False)
+    )
+
+
+def test_ipc_ingestor_equal_false_different_type(tmp_path: Path) -> None:
+    assert not IpcIngestor(tmp_path.joinpath("data.arrow")).equal(42)
+
+
+def test_ipc_ingestor_ingest(frame_path: Path) -> None:
+    assert_frame_equal(
+        IpcIngestor(frame_path).ingest(),
+        pl.LazyFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+
+
+def test_ipc_ingestor_ingest_with_kwargs(frame_path: Path) -> None:
+    assert_frame_equal(
+        IpcIngestor(frame_path, n_rows=3).ingest(),
+        pl.LazyFrame(
+            {
+                "col1": [1, 2, 3],
+                "col2": ["a", "b", "c"],
+                "col3": [1.2, 2.2, 3.2],
+            }
+        ),
+    )
+
+
+#####################################
+#     Tests for IpcFileIngestor     #
+#####################################
+
+
+def test_ipc_file_ingestor_repr(frame_path: Path) -> None:
+    assert repr(IpcFileIngestor(frame_path)).startswith("IpcFileIngestor(")
+
+
+def test_ipc_file_ingestor_repr_with_kwargs(frame_path: Path) -> None:
+    assert repr(IpcFileIngestor(frame_path, columns=["col1", "col3"])).startswith(
+        "IpcFileIngestor("
+    )
+
+
+def test_ipc_file_ingestor_str(frame_path: Path) -> None:
+    assert str(IpcFileIngestor(frame_path)).startswith("IpcFileIngestor(")
+
+
+def test_ipc_file_ingestor_str_with_kwargs(frame_path: Path) -> None:
+    assert str(IpcFileIngestor(frame_path, columns=["col1", "col3"])).startswith("IpcFileIngestor(")
+
+
+def test_ipc_file_ingestor_equal_true(tmp_path: Path) -> None:
+    assert IpcFileIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcFileIngestor(tmp_path.joinpath("data.arrow"))
+    )
+
+
+def test_ipc_file_ingestor_equal_false_different_path(tmp_path: Path) -> None:
+    assert not IpcFileIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcFileIngestor(tmp_path.joinpath("data2.arrow"))
+    )
+
+
+def test_ipc_file_ingestor_equal_false_different_kwargs(tmp_path: Path) -> None:
+    assert not IpcFileIngestor(tmp_path.joinpath("data.arrow")).equal(
+        IpcFileIngestor(tmp_path.joinpath("data.arrow"), include_header=False)
+    )
+
+
+def test_ipc_file_ingestor_equal_false_different_type(tmp_path: Path) -> None:
+    assert not IpcFileIngestor(tmp_path.joinpath("data.arrow")).equal(42)
+
+
+def test_ipc_file_ingestor_ingest(frame_path: Path) -> None:
+    assert_frame_equal(
+        IpcFileIngestor(frame_path).ingest(),
+        pl.LazyFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["a", "b", "c", "d", "e"],
+                "col3": [1.2, 2.2, 3.2, 4.2, 5.2],
+            }
+        ),
+    )
+
+
+def test_ipc_file_ingestor_ingest_with_kwargs(frame_path: Path) -> None:
+    assert_frame_equal(
+        IpcFileIngestor(frame_path, n_rows=3).ingest(),
+        pl.LazyFrame(
+            {
+                "col1": [1, 2, 3],
+                "col2": ["a", "b", "c"],
+                "col3": [1.2, 2.2, 3.2],
+            }
+        ),
+    )
+
+
+def test_ipc_file_ingestor_ingest_missing_path(tmp_path: Path) -> None:
+    ingestor = IpcFileIngestor(tmp_path.joinpath("data.arrow"))
+    with pytest.raises(DataNotFoundError, match=r"Data file does not exist"):
+        ingestor.ingest()
@@ -1,15 +1,22 @@
 from __future__ import annotations
 
+import logging
 from typing import TYPE_CHECKING
 
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
-from grizz.lazy.ingestor import BaseIngestor, Ingestor, JoinIngestor
+from grizz.lazy.ingestor import (
+    BaseIngestor,
+    Ingestor,
+    JoinIngestor,
+    ParquetFileIngestor,
+)
 
 if TYPE_CHECKING:
     from collections.abc import Sequence
+    from pathlib import Path
 
 
 @pytest.fixture
@@ -53,6 +60,11 @@ def test_join_ingestor_incorrect_ingestors() -> None:
         JoinIngestor([])
 
 
+def test_join_ingestor_incorrect_key_filter(ingestors: Sequence[BaseIngestor]) -> None:
+    with pytest.raises(ValueError, match=r"Incorrect key_filter: incorrect"):
+        JoinIngestor(ingestors, key_filter="incorrect")
+
+
 def test_join_ingestor_repr(ingestors: Sequence[BaseIngestor]) -> None:
     assert repr(JoinIngestor(ingestors)).startswith("JoinIngestor(")
 
@@ -83,6 +95,18 @@ def test_join_ingestor_equal_false_different_ingestors(ingestors: Sequence[BaseI
     )
 
 
+def test_join_ingestor_equal_false_different_reorder(
+    ingestors: Sequence[BaseIngestor],
+) -> None:
+    assert not JoinIngestor(ingestors).equal(JoinIngestor(ingestors, reorder=True))
+
+
+def test_join_ingestor_equal_false_different_key_filter(
+    ingestors: Sequence[BaseIngestor],
+) -> None:
+    assert not JoinIngestor(ingestors).equal(JoinIngestor(ingestors, key_filter="is_in"))
+
+
 def test_join_ingestor_equal_false_different_kwargs(ingestors: Sequence[BaseIngestor]) -> None:
     assert not JoinIngestor(ingestors).equal(JoinIngestor(ingestors, on="col"))
 
@@ -121,3 +145,130 @@ def test_join_ingestor_ingest_left(ingestors: Sequence[BaseIngestor]) -> None:
             }
         ),
     )
+
+
+@pytest.fixture
+def unbalanced_ingestors(tmp_path: Path) -> tuple[BaseIngestor, ...]:
+    frames = [
+        pl.DataFrame({"col": list(range(100)), "col1": list(range(100))}),
+        pl.DataFrame({"col": list(range(0, 100, 2)), "col2": ["a"] * 50}),
+        pl.DataFrame({"col": [4, 8, 200], "col3": [1.0, 2.0, 3.0]}),
+    ]
+    ingestors = []
+    for i, frame in enumerate(frames):
+        path = tmp_path.joinpath(f"data{i}.parquet")
+        frame.write_parquet(path)
+        ingestors.append(ParquetFileIngestor(path))
+    return tuple(ingestors)
+
+
+def test_join_ingestor_ingest_reorder(
+    unbalanced_ingestors: Sequence[BaseIngestor], caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.INFO):
+        out = JoinIngestor(unbalanced_ingestors, reorder=True, on="col").ingest()
+    assert "Joining the LazyFrames in the order [2, 1, 0]" in caplog.text
+    assert_frame_equal(
+        out.sort("col"),
+        pl.LazyFrame({"col": [4, 8], "col1": [4, 8], "col2": ["a", "a"], "col3": [1.0, 2.0]}),
+    )
+
+
+def test_join_ingestor_ingest_reorder_unknown_num_rows(
+    unbalanced_ingestors: Sequence[BaseIngestor], caplog: pytest.LogCaptureFixture
+) -> None:
+    ingestors = [*unbalanced_ingestors[:2], Ingestor(unbalanced_ingestors[2].ingest())]
+    with caplog.at_level(logging.INFO):
+        out = JoinIngestor(ingestors, reorder=True, on="col").ingest()
+    assert "The number of rows of some LazyFrames cannot be estimated" in caplog.text
+    assert "Joining the LazyFrames in the order" not in caplog.text
+    assert_frame_equal(
+        out,
+        pl.LazyFrame({"col": [4, 8], "col1": [4, 8], "col2": ["a", "a"], "col3": [1.0, 2.0]}),
+        check_row_order=False,
+    )
+
+
+def test_join_ingestor_ingest_reorder_same_output(
+    unbalanced_ingestors: Sequence[BaseIngestor],
+) -> None:
+    assert_frame_equal(
+        JoinIngestor(unbalanced_ingestors, reorder=True, on="col", how="inner").ingest(),
+        JoinIngestor(unbalanced_ingestors, on="col", how="inner").ingest(),
+        check_row_order=False,
+    )
+
+
+def test_join_ingestor_ingest_reorder_left(
+    unbalanced_ingestors: Sequence[BaseIngestor], caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.INFO):
+        out = JoinIngestor(unbalanced_ingestors, reorder=True, on="col", how="left").ingest()
+    assert "Joining the LazyFrames in the order" not in caplog.text
+    assert out.collect().shape == (100, 4)
+
+
+def test_join_ingestor_ingest_reorder_duplicate_columns(caplog: pytest.LogCaptureFixture) -> None:
+    ingestors = [
+        Ingestor(frame=pl.LazyFrame({"col": [1, 2, 3, 4], "val": [1, 2, 3, 4]})),
+        Ingestor(frame=pl.LazyFrame({"col": [1, 2, 3], "val": [5, 6, 7]})),
+        Ingestor(frame=pl.LazyFrame({"col": [1, 2], "other": [8, 9]})),
+    ]
+    with caplog.at_level(logging.INFO):
+        out = JoinIngestor(ingestors, reorder=True, on="col").ingest()
+    assert "The LazyFrames have duplicate columns" in caplog.text
+    assert_frame_equal(
+        out,
+        pl.LazyFrame({"col": [1, 2], "val": [1, 2], "val_right": [5, 6], "other": [8, 9]}),
+        check_row_order=False,
+    )
+
+
+@pytest.mark.parametrize("key_filter", ["is_in", "range"])
+def test_join_ingestor_ingest_key_filter(
+    unbalanced_ingestors: Sequence[BaseIngestor], key_filter: str
+) -> None:
+    assert_frame_equal(
+        JoinIngestor(unbalanced_ingestors, key_filter=key_filter, on="col").ingest(),
+        JoinIngestor(unbalanced_ingestors, on="col").ingest(),
+        check_row_order=False,
+    )
+
+
+def test_join_ingestor_ingest_key_filter_reorder(
+    unbalanced_ingestors: Sequence[BaseIngestor],
+) -> None:
+    out = JoinIngestor(unbalanced_ingestors, key_filter="is_in", reorder=True, on="col").ingest()
+    assert_frame_equal(
+        out.sort("col"),
+        pl.LazyFrame({"col": [4, 8], "col1": [4, 8], "col2": ["a", "a"], "col3": [1.0, 2.0]}),
+    )
+
+
+def test_join_ingestor_ingest_key_filter_parquet(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame({"col": list(range(1000)), "col1": list(range(1000))}).write_parquet(
+        path, row_group_size=100
+    )
+    ingestor = JoinIngestor(
+        [
+            ParquetFileIngestor(path),
+            Ingestor(frame=pl.LazyFrame({"col": [10, 20], "col2": ["a", "b"]})),
+        ],
+        key_filter="range",
+        on="col",
+    )
+    assert_frame_equal(
+        ingestor.ingest(),
+        pl.LazyFrame({"col": [10, 20], "col1": [10, 20], "col2": ["a", "b"]}),
+        check_row_order=False,
+    )
+
+
+def test_join_ingestor_ingest_key_filter_left(
+    unbalanced_ingestors: Sequence[BaseIngestor], caplog: pytest.LogCaptureFixture
+) -> None:
+    with caplog.at_level(logging.INFO):
+        out = JoinIngestor(unbalanced_ingestors, key_filter="is_in", on="col", how="left").ingest()
+    assert "Filtering the join keys" not in caplog.text
+    assert out.collect().shape == (100, 4)
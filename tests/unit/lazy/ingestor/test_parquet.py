@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+from datetime import date
 from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
 from grizz.exceptions import DataNotFoundError
-from grizz.lazy.ingestor import ParquetFileIngestor, ParquetIngestor
+from grizz.lazy.ingestor import (
+    ParquetDatasetIngestor,
+    ParquetDirectoryIngestor,
+    ParquetFileIngestor,
+    ParquetIngestor,
+)
+from grizz.testing.fixture import pyarrow_available
 
 if TYPE_CHECKING:
     from pathlib import Path
@@ -41,6 +49,13 @@ def test_parquet_ingestor_repr_with_kwargs(frame_path: Path) -> None:
     )
 
 
+def test_parquet_ingestor_repr_index_path(tmp_path: Path) -> None:
+    path, index_path = tmp_path.joinpath("data.parquet"), tmp_path.joinpath("index.json")
+    assert repr(ParquetIngestor(path, index_path=index_path)) == (
+        f"ParquetIngestor(source={path}, index_path={index_path})"
+    )
+
+
 def test_parquet_ingestor_str(frame_path: Path) -> None:
     assert str(ParquetIngestor(frame_path)).startswith("ParquetIngestor(")
 
@@ -67,6 +82,14 @@ def test_parquet_ingestor_equal_false_different_kwargs(tmp_path: Path) -> None:
     )
 
 
+def test_parquet_ingestor_equal_false_different_index_path(tmp_path: Path) -> None:
+    assert not ParquetIngestor(tmp_path.joinpath("data.parquet")).equal(
+        ParquetIngestor(
+            tmp_path.joinpath("data.parquet"), index_path=tmp_path.joinpath("index.json")
+        )
+    )
+
+
 def test_parquet_ingestor_equal_false_different_type(tmp_path: Path) -> None:
     assert not ParquetIngestor(tmp_path.joinpath("data.parquet")).equal(42)
 
@@ -97,6 +120,37 @@ def test_parquet_ingestor_ingest_with_kwargs(frame_path: Path) -> None:
     )
 
 
+def test_parquet_ingestor_estimate_num_rows(frame_path: Path) -> None:
+    assert ParquetIngestor(frame_path).estimate_num_rows() == 5
+
+
+def test_parquet_ingestor_estimate_num_rows_with_kwargs(frame_path: Path) -> None:
+    assert ParquetIngestor(frame_path, n_rows=3).estimate_num_rows() == 3
+
+
+@pyarrow_available
+def test_parquet_ingestor_estimate_num_rows_index(tmp_path: Path, frame_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    assert ParquetIngestor(frame_path, index_path=index_path).estimate_num_rows() == 5
+    assert index_path.is_file()
+    # The number of rows is read from the index, so the file is not scanned.
+    with patch("polars.scan_parquet", side_effect=AssertionError):
+        assert ParquetIngestor(frame_path, index_path=index_path).estimate_num_rows() == 5
+
+
+@pyarrow_available
+def test_parquet_ingestor_estimate_num_rows_index_with_kwargs(
+    tmp_path: Path, frame_path: Path
+) -> None:
+    ingestor = ParquetIngestor(frame_path, index_path=tmp_path.joinpath("index.json"), n_rows=3)
+    assert ingestor.estimate_num_rows() == 3
+
+
+def test_parquet_ingestor_estimate_num_rows_index_bytes(tmp_path: Path, frame_path: Path) -> None:
+    ingestor = ParquetIngestor(frame_path.read_bytes(), index_path=tmp_path.joinpath("index.json"))
+    assert ingestor.estimate_num_rows() == 5
+
+
 #########################################
 #     Tests for ParquetFileIngestor     #
 #########################################
@@ -174,3 +228,335 @@ def test_parquet_file_ingestor_ingest_missing_path(tmp_path: Path) -> None:
     ingestor = ParquetFileIngestor(tmp_path.joinpath("data.parquet"))
     with pytest.raises(DataNotFoundError, match=r"Data file does not exist"):
         ingestor.ingest()
+
+
+@pytest.fixture(scope="module")
+def dataset_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("dataset")
+    for day, country, values in [
+        ("2024-01-01", "FR", [1, 2]),
+        ("2024-01-01", "DE", [3]),
+        ("2024-01-02", "FR", [4]),
+        ("2024-01-03", "FR", [5, 6]),
+    ]:
+        partition = path.joinpath(f"day={day}", f"country={country}")
+        partition.mkdir(parents=True)
+        pl.DataFrame({"col1": values}).write_parquet(partition.joinpath("part-00000.parquet"))
+    return path
+
+
+############################################
+#     Tests for ParquetDatasetIngestor     #
+############################################
+
+
+def test_parquet_dataset_ingestor_column_filters_without_index_path(dataset_path: Path) -> None:
+    with pytest.raises(ValueError, match="index_path is required to use column_filters"):
+        ParquetDatasetIngestor(dataset_path, column_filters={"col1": 1})
+
+
+def test_parquet_dataset_ingestor_repr(dataset_path: Path) -> None:
+    assert repr(ParquetDatasetIngestor(dataset_path)).startswith("ParquetDatasetIngestor(")
+
+
+def test_parquet_dataset_ingestor_str(dataset_path: Path) -> None:
+    assert str(ParquetDatasetIngestor(dataset_path)).startswith("ParquetDatasetIngestor(")
+
+
+def test_parquet_dataset_ingestor_equal_true(dataset_path: Path) -> None:
+    assert ParquetDatasetIngestor(dataset_path, filters={"country": "FR"}).equal(
+        ParquetDatasetIngestor(dataset_path, filters={"country": "FR"})
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_path(
+    tmp_path: Path, dataset_path: Path
+) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(ParquetDatasetIngestor(tmp_path))
+
+
+def test_parquet_dataset_ingestor_equal_false_different_filters(dataset_path: Path) -> None:
+    assert not ParquetDatasetIngestor(dataset_path, filters={"country": "FR"}).equal(
+        ParquetDatasetIngestor(dataset_path, filters={"country": "DE"})
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_cache_path(
+    tmp_path: Path, dataset_path: Path
+) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(
+        ParquetDatasetIngestor(dataset_path, cache_path=tmp_path.joinpath("cache.json"))
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_hive_schema(dataset_path: Path) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(
+        ParquetDatasetIngestor(dataset_path, hive_schema={"day": pl.Date})
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_column_filters(
+    tmp_path: Path, dataset_path: Path
+) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    assert not ParquetDatasetIngestor(
+        dataset_path, column_filters={"col1": 1}, index_path=index_path
+    ).equal(ParquetDatasetIngestor(dataset_path, column_filters={"col1": 2}, index_path=index_path))
+
+
+def test_parquet_dataset_ingestor_equal_false_different_index_path(
+    tmp_path: Path, dataset_path: Path
+) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(
+        ParquetDatasetIngestor(dataset_path, index_path=tmp_path.joinpath("index.json"))
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_kwargs(dataset_path: Path) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(
+        ParquetDatasetIngestor(dataset_path, n_rows=1)
+    )
+
+
+def test_parquet_dataset_ingestor_equal_false_different_type(dataset_path: Path) -> None:
+    assert not ParquetDatasetIngestor(dataset_path).equal(42)
+
+
+def test_parquet_dataset_ingestor_ingest(dataset_path: Path) -> None:
+    frame = ParquetDatasetIngestor(dataset_path).ingest().collect()
+    assert_frame_equal(
+        frame.sort("col1"),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5, 6],
+                "day": ["2024-01-01"] * 3 + ["2024-01-02"] + ["2024-01-03"] * 2,
+                "country": ["FR", "FR", "DE", "FR", "FR", "FR"],
+            }
+        ),
+    )
+
+
+def test_parquet_dataset_ingestor_ingest_filters(dataset_path: Path) -> None:
+    frame = (
+        ParquetDatasetIngestor(
+            dataset_path,
+            filters={
+                "day": {"start": date(2024, 1, 1), "end": date(2024, 1, 3)},
+                "country": ["FR"],
+            },
+            hive_schema={"day": pl.Date},
+        )
+        .ingest()
+        .collect()
+    )
+    assert_frame_equal(
+        frame.sort("col1"),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 4],
+                "day": [date(2024, 1, 1), date(2024, 1, 1), date(2024, 1, 2)],
+                "country": ["FR", "FR", "FR"],
+            }
+        ),
+    )
+
+
+def test_parquet_dataset_ingestor_ingest_no_match(dataset_path: Path) -> None:
+    frame = ParquetDatasetIngestor(dataset_path, filters={"country": "IT"}).ingest().collect()
+    assert_frame_equal(frame, pl.DataFrame())
+
+
+def test_parquet_dataset_ingestor_ingest_cache_path(tmp_path: Path, dataset_path: Path) -> None:
+    cache_path = tmp_path.joinpath("cache.json")
+    ingestor = ParquetDatasetIngestor(
+        dataset_path, filters={"day": "2024-01-02"}, cache_path=cache_path
+    )
+    expected = pl.DataFrame({"col1": [4], "day": ["2024-01-02"], "country": ["FR"]})
+    assert_frame_equal(ingestor.ingest().collect(), expected)
+    assert cache_path.is_file()
+    assert_frame_equal(ingestor.ingest().collect(), expected)
+
+
+def test_parquet_dataset_ingestor_ingest_with_kwargs(dataset_path: Path) -> None:
+    frame = (
+        ParquetDatasetIngestor(dataset_path, filters={"day": "2024-01-03"}, n_rows=1)
+        .ingest()
+        .collect()
+    )
+    assert_frame_equal(frame, pl.DataFrame({"col1": [5], "day": ["2024-01-03"], "country": ["FR"]}))
+
+
+@pyarrow_available
+def test_parquet_dataset_ingestor_ingest_column_filters(tmp_path: Path, dataset_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    frame = (
+        ParquetDatasetIngestor(
+            dataset_path,
+            filters={"country": "FR"},
+            column_filters={"col1": {"start": 2, "end": 5}},
+            index_path=index_path,
+        )
+        .ingest()
+        .collect()
+    )
+    assert_frame_equal(
+        frame.sort("col1"),
+        pl.DataFrame(
+            {"col1": [2, 4], "day": ["2024-01-01", "2024-01-02"], "country": ["FR", "FR"]}
+        ),
+    )
+    assert index_path.is_file()
+
+
+@pytest.fixture(scope="module")
+def directory_path(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    path = tmp_path_factory.mktemp("exports")
+    pl.DataFrame({"col1": [1, 2], "col2": ["a", "b"]}).write_parquet(
+        path.joinpath("day-01.parquet")
+    )
+    pl.DataFrame({"col1": [3], "col2": ["c"], "col3": [3.5]}).write_parquet(
+        path.joinpath("day-02.parquet")
+    )
+    path.joinpath("2024").mkdir()
+    pl.DataFrame(
+        {"col1": [4, 5], "col3": [4.5, 5.5]}, schema={"col1": pl.Int32, "col3": pl.Float64}
+    ).write_parquet(path.joinpath("2024", "day-03.parquet"))
+    path.joinpath("notes.txt").write_text("meow")
+    return path
+
+
+##############################################
+#     Tests for ParquetDirectoryIngestor     #
+##############################################
+
+
+def test_parquet_directory_ingestor_repr(directory_path: Path) -> None:
+    assert repr(ParquetDirectoryIngestor(directory_path)) == (
+        f"ParquetDirectoryIngestor(path={directory_path}, recursive=True, how=diagonal_relaxed)"
+    )
+
+
+def test_parquet_directory_ingestor_str(directory_path: Path) -> None:
+    assert str(ParquetDirectoryIngestor(directory_path)).startswith("ParquetDirectoryIngestor(")
+
+
+def test_parquet_directory_ingestor_incorrect_how(directory_path: Path) -> None:
+    with pytest.raises(ValueError, match=r"Incorrect how: horizontal."):
+        ParquetDirectoryIngestor(directory_path, how="horizontal")
+
+
+def test_parquet_directory_ingestor_equal_true(directory_path: Path) -> None:
+    assert ParquetDirectoryIngestor(directory_path).equal(ParquetDirectoryIngestor(directory_path))
+
+
+def test_parquet_directory_ingestor_equal_false_different_path(
+    tmp_path: Path, directory_path: Path
+) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(ParquetDirectoryIngestor(tmp_path))
+
+
+def test_parquet_directory_ingestor_equal_false_different_recursive(directory_path: Path) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(
+        ParquetDirectoryIngestor(directory_path, recursive=False)
+    )
+
+
+def test_parquet_directory_ingestor_equal_false_different_how(directory_path: Path) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(
+        ParquetDirectoryIngestor(directory_path, how="diagonal")
+    )
+
+
+def test_parquet_directory_ingestor_equal_false_different_kwargs(directory_path: Path) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(
+        ParquetDirectoryIngestor(directory_path, n_rows=1)
+    )
+
+
+def test_parquet_directory_ingestor_equal_false_different_index_path(
+    tmp_path: Path, directory_path: Path
+) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(
+        ParquetDirectoryIngestor(directory_path, index_path=tmp_path.joinpath("index.json"))
+    )
+
+
+def test_parquet_directory_ingestor_equal_false_different_type(directory_path: Path) -> None:
+    assert not ParquetDirectoryIngestor(directory_path).equal(42)
+
+
+def test_parquet_directory_ingestor_ingest(directory_path: Path) -> None:
+    assert_frame_equal(
+        ParquetDirectoryIngestor(directory_path).ingest().collect(),
+        pl.DataFrame(
+            {
+                "col1": [4, 5, 1, 2, 3],
+                "col3": [4.5, 5.5, None, None, 3.5],
+                "col2": [None, None, "a", "b", "c"],
+            }
+        ),
+    )
+
+
+def test_parquet_directory_ingestor_ingest_not_recursive(directory_path: Path) -> None:
+    assert_frame_equal(
+        ParquetDirectoryIngestor(directory_path, recursive=False).ingest().collect(),
+        pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"], "col3": [None, None, 3.5]}),
+    )
+
+
+def test_parquet_directory_ingestor_ingest_diagonal(directory_path: Path) -> None:
+    assert_frame_equal(
+        ParquetDirectoryIngestor(directory_path, recursive=False, how="diagonal")
+        .ingest()
+        .collect(),
+        pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"], "col3": [None, None, 3.5]}),
+    )
+
+
+def test_parquet_directory_ingestor_ingest_vertical(tmp_path: Path) -> None:
+    pl.DataFrame({"col1": [1, 2]}).write_parquet(tmp_path.joinpath("data1.parquet"))
+    pl.DataFrame({"col1": [3]}).write_parquet(tmp_path.joinpath("data2.parquet"))
+    assert_frame_equal(
+        ParquetDirectoryIngestor(tmp_path, how="vertical").ingest().collect(),
+        pl.DataFrame({"col1": [1, 2, 3]}),
+    )
+
+
+def test_parquet_directory_ingestor_ingest_with_kwargs(directory_path: Path) -> None:
+    assert_frame_equal(
+        ParquetDirectoryIngestor(directory_path, recursive=False, n_rows=1).ingest().collect(),
+        pl.DataFrame({"col1": [1, 3], "col2": ["a", "c"], "col3": [None, 3.5]}),
+    )
+
+
+def test_parquet_directory_ingestor_ingest_empty(tmp_path: Path) -> None:
+    assert_frame_equal(ParquetDirectoryIngestor(tmp_path).ingest().collect(), pl.DataFrame())
+
+
+def test_parquet_directory_ingestor_ingest_missing(tmp_path: Path) -> None:
+    with pytest.raises(DataNotFoundError, match=r"Data directory does not exist"):
+        ParquetDirectoryIngestor(tmp_path.joinpath("missing")).ingest()
+
+
+def test_parquet_directory_ingestor_estimate_num_rows(directory_path: Path) -> None:
+    assert ParquetDirectoryIngestor(directory_path).estimate_num_rows() == 5
+
+
+def test_parquet_directory_ingestor_estimate_num_rows_not_recursive(directory_path: Path) -> None:
+    assert ParquetDirectoryIngestor(directory_path, recursive=False).estimate_num_rows() == 3
+
+
+@pyarrow_available
+def test_parquet_directory_ingestor_estimate_num_rows_index(
+    tmp_path: Path, directory_path: Path
+) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    ingestor = ParquetDirectoryIngestor(directory_path, index_path=index_path)
+    assert ingestor.estimate_num_rows() == 5
+    with patch("polars.scan_parquet", side_effect=AssertionError):
+        assert ingestor.estimate_num_rows() == 5
+
+
+def test_parquet_directory_ingestor_estimate_num_rows_empty(tmp_path: Path) -> None:
+    assert ParquetDirectoryIngestor(tmp_path).estimate_num_rows() == 0
@@ -56,3 +56,7 @@ def test_ingestor_ingest(lazyframe: pl.LazyFrame) -> None:
             }
         ),
     )
+
+
+def test_ingestor_estimate_num_rows(lazyframe: pl.LazyFrame) -> None:
+    assert Ingestor(frame=lazyframe).estimate_num_rows() is None
@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import logging
+from unittest.mock import Mock
+
+import polars as pl
+import pytest
+from coola import objects_are_equal
+from polars.testing import assert_frame_equal
+
+from grizz.lazy.transformer import EagerAdapter
+from grizz.transformer import BaseTransformer, InplaceCast, StripChars
+
+
+@pytest.fixture
+def lazyframe() -> pl.LazyFrame:
+    return pl.LazyFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["1", "2", "3", "4", "5"],
+            "col3": ["a ", " b", "  c  ", "d", "e"],
+        },
+        schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String},
+    )
+
+
+#############################################
+#     Tests for EagerAdapterTransformer     #
+#############################################
+
+
+def test_eager_adapter_transformer_repr() -> None:
+    assert repr(EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32))).startswith(
+        "EagerAdapterTransformer(\n  (transformer): InplaceCastTransformer("
+    )
+
+
+def test_eager_adapter_transformer_str() -> None:
+    assert str(EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32))).startswith(
+        "EagerAdapterTransformer(\n  (transformer): InplaceCastTransformer("
+    )
+
+
+def test_eager_adapter_transformer_incorrect_infer_schema_length() -> None:
+    with pytest.raises(ValueError, match="infer_schema_length must be greater or equal to 0"):
+        EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32), infer_schema_length=-1)
+
+
+def test_eager_adapter_transformer_equal_true() -> None:
+    assert EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32)).equal(
+        EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32))
+    )
+
+
+def test_eager_adapter_transformer_equal_false_different_transformer() -> None:
+    assert not EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32)).equal(
+        EagerAdapter(InplaceCast(columns=["col2"], dtype=pl.Float32))
+    )
+
+
+def test_eager_adapter_transformer_equal_false_different_schema() -> None:
+    assert not EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32)).equal(
+        EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32), schema={"col1": pl.Float32})
+    )
+
+
+def test_eager_adapter_transformer_equal_false_different_streamable() -> None:
+    assert not EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32)).equal(
+        EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32), streamable=True)
+    )
+
+
+def test_eager_adapter_transformer_equal_false_different_type() -> None:
+    assert not EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32)).equal(42)
+
+
+def test_eager_adapter_transformer_get_args() -> None:
+    assert objects_are_equal(
+        EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32)).get_args(),
+        {
+            "transformer": InplaceCast(columns=["col1"], dtype=pl.Float32),
+            "schema": None,
+            "infer_schema_length": 0,
+            "streamable": False,
+        },
+    )
+
+
+def test_eager_adapter_transformer_fit(
+    lazyframe: pl.LazyFrame, caplog: pytest.LogCaptureFixture
+) -> None:
+    eager = Mock(spec=BaseTransformer)
+    transformer = EagerAdapter(eager)
+    with caplog.at_level(logging.INFO):
+        transformer.fit(lazyframe)
+    assert len(caplog.messages) == 1
+    assert objects_are_equal(eager.fit.call_args.args, (lazyframe.collect(),))
+
+
+def test_eager_adapter_transformer_fit_transform(lazyframe: pl.LazyFrame) -> None:
+    transformer = EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32))
+    out = transformer.fit_transform(lazyframe)
+    assert isinstance(out, pl.LazyFrame)
+    assert_frame_equal(
+        out.collect(),
+        pl.DataFrame(
+            {
+                "col1": [1.0, 2.0, 3.0, 4.0, 5.0],
+                "col2": ["1", "2", "3", "4", "5"],
+                "col3": ["a ", " b", "  c  ", "d", "e"],
+            },
+            schema={"col1": pl.Float32, "col2": pl.String, "col3": pl.String},
+        ),
+    )
+
+
+def test_eager_adapter_transformer_transform(lazyframe: pl.LazyFrame) -> None:
+    transformer = EagerAdapter(StripChars(columns=["col3"], prefix="", suffix="_out"))
+    out = transformer.transform(lazyframe)
+    assert isinstance(out, pl.LazyFrame)
+    assert_frame_equal(
+        out.collect(),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": ["1", "2", "3", "4", "5"],
+                "col3": ["a ", " b", "  c  ", "d", "e"],
+                "col3_out": ["a", "b", "c", "d", "e"],
+            },
+            schema={
+                "col1": pl.Int64,
+                "col2": pl.String,
+                "col3": pl.String,
+                "col3_out": pl.String,
+            },
+        ),
+    )
+
+
+def test_eager_adapter_transformer_transform_downstream_select(lazyframe: pl.LazyFrame) -> None:
+    transformer = EagerAdapter(StripChars(columns=["col3"], prefix="", suffix="_out"))
+    out = transformer.transform(lazyframe).select("col3_out").filter(pl.col("col3_out") != "c")
+    assert_frame_equal(
+        out.collect(),
+        pl.DataFrame({"col3_out": ["a", "b", "d", "e"]}, schema={"col3_out": pl.String}),
+    )
+
+
+def test_eager_adapter_transformer_get_output_schema_declared(lazyframe: pl.LazyFrame) -> None:
+    transformer = EagerAdapter(
+        InplaceCast(columns=["col1"], dtype=pl.Float32),
+        schema={"col1": pl.Float32, "col2": pl.String, "col3": pl.String},
+    )
+    assert transformer.get_output_schema(lazyframe) == pl.Schema(
+        {"col1": pl.Float32, "col2": pl.String, "col3": pl.String}
+    )
+
+
+def test_eager_adapter_transformer_get_output_schema_inferred(lazyframe: pl.LazyFrame) -> None:
+    transformer = EagerAdapter(InplaceCast(columns=["col1"], dtype=pl.Float32))
+    assert transformer.get_output_schema(lazyframe) == pl.Schema(
+        {"col1": pl.Float32, "col2": pl.String, "col3": pl.String}
+    )
+
+
+def test_eager_adapter_transformer_get_output_schema_infer_schema_length(
+    lazyframe: pl.LazyFrame,
+) -> None:
+    eager = Mock(spec=BaseTransformer, transform=Mock(side_effect=lambda frame: frame))
+    transformer = EagerAdapter(eager, infer_schema_length=2)
+    assert transformer.get_output_schema(lazyframe) == lazyframe.collect_schema()
+    assert eager.transform.call_args.args[0].shape == (2, 3)
@@ -0,0 +1,142 @@
+from __future__ import annotations
+
+import logging
+
+import polars as pl
+import pytest
+from coola import objects_are_equal
+from polars.testing import assert_frame_equal
+
+from grizz.exceptions import ColumnExistsError
+from grizz.lazy.transformer import ExpressionTransformer
+from grizz.transformer import (
+    ColumnSelection,
+    CopyColumn,
+    InplaceCast,
+    InplaceStripChars,
+    SumHorizontal,
+)
+
+
+@pytest.fixture
+def lazyframe() -> pl.LazyFrame:
+    return pl.LazyFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["1", "2", "3", "4", "5"],
+            "col3": ["1", "2", "3", "4", "5"],
+            "col4": ["a ", " b", "  c  ", "d", "e"],
+        },
+        schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+    )
+
+
+###########################################
+#     Tests for ExpressionTransformer     #
+###########################################
+
+
+def test_expression_transformer_repr() -> None:
+    assert repr(ExpressionTransformer(CopyColumn(in_col="col1", out_col="out"))).startswith(
+        "ExpressionTransformer(\n  (transformer): CopyColumnTransformer("
+    )
+
+
+def test_expression_transformer_str() -> None:
+    assert str(ExpressionTransformer(CopyColumn(in_col="col1", out_col="out"))).startswith(
+        "ExpressionTransformer(\n  (transformer): CopyColumnTransformer("
+    )
+
+
+def test_expression_transformer_config() -> None:
+    assert ExpressionTransformer(
+        {"_target_": "grizz.transformer.CopyColumn", "in_col": "col1", "out_col": "out"}
+    ).equal(ExpressionTransformer(CopyColumn(in_col="col1", out_col="out")))
+
+
+def test_expression_transformer_equal_true() -> None:
+    assert ExpressionTransformer(CopyColumn(in_col="col1", out_col="out")).equal(
+        ExpressionTransformer(CopyColumn(in_col="col1", out_col="out"))
+    )
+
+
+def test_expression_transformer_equal_false_different_transformer() -> None:
+    assert not ExpressionTransformer(CopyColumn(in_col="col1", out_col="out")).equal(
+        ExpressionTransformer(CopyColumn(in_col="col2", out_col="out"))
+    )
+
+
+def test_expression_transformer_equal_false_different_type() -> None:
+    assert not ExpressionTransformer(CopyColumn(in_col="col1", out_col="out")).equal(42)
+
+
+def test_expression_transformer_get_args() -> None:
+    assert objects_are_equal(
+        ExpressionTransformer(CopyColumn(in_col="col1", out_col="out")).get_args(),
+        {"transformer": CopyColumn(in_col="col1", out_col="out")},
+    )
+
+
+def test_expression_transformer_fit(
+    lazyframe: pl.LazyFrame, caplog: pytest.LogCaptureFixture
+) -> None:
+    transformer = ExpressionTransformer(CopyColumn(in_col="col1", out_col="out"))
+    with caplog.at_level(logging.INFO):
+        transformer.fit(lazyframe)
+    assert caplog.messages[0].startswith(
+        "Skipping 'ExpressionTransformer.fit' as there are no parameters available to fit"
+    )
+
+
+def test_expression_transformer_fit_transform(lazyframe: pl.LazyFrame) -> None:
+    transformer = ExpressionTransformer(InplaceCast(columns=["col2", "col3"], dtype=pl.Int32))
+    out = transformer.fit_transform(lazyframe)
+    assert_frame_equal(
+        out.collect(),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": [1, 2, 3, 4, 5],
+                "col3": [1, 2, 3, 4, 5],
+                "col4": ["a ", " b", "  c  ", "d", "e"],
+            },
+            schema={"col1": pl.Int64, "col2": pl.Int32, "col3": pl.Int32, "col4": pl.String},
+        ),
+    )
+
+
+@pytest.mark.parametrize(
+    "eager",
+    [
+        CopyColumn(in_col="col1", out_col="out"),
+        InplaceCast(columns=["col2", "col3"], dtype=pl.Int32),
+        InplaceStripChars(columns=["col4"]),
+        SumHorizontal(columns=["col1"], out_col="out"),
+    ],
+)
+def test_expression_transformer_transform_same_as_eager(
+    lazyframe: pl.LazyFrame, eager: object
+) -> None:
+    out = ExpressionTransformer(eager).transform(lazyframe)
+    assert isinstance(out, pl.LazyFrame)
+    assert_frame_equal(out.collect(), eager.transform(lazyframe.collect()))
+
+
+def test_expression_transformer_transform_missing_policy_ignore(lazyframe: pl.LazyFrame) -> None:
+    transformer = ExpressionTransformer(
+        CopyColumn(in_col="col", out_col="out", missing_policy="ignore")
+    )
+    out = transformer.transform(lazyframe)
+    assert_frame_equal(out.collect(), lazyframe.collect())
+
+
+def test_expression_transformer_transform_exist_policy_raise(lazyframe: pl.LazyFrame) -> None:
+    transformer = ExpressionTransformer(CopyColumn(in_col="col1", out_col="col2"))
+    with pytest.raises(ColumnExistsError, match="column 'col2' already exists in the DataFrame"):
+        transformer.transform(lazyframe)
+
+
+def test_expression_transformer_transform_not_expression(lazyframe: pl.LazyFrame) -> None:
+    transformer = ExpressionTransformer(ColumnSelection(columns=["col1"]))
+    with pytest.raises(TypeError, match="cannot be represented by polars expressions"):
+        transformer.transform(lazyframe)
@@ -0,0 +1,255 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.lazy.transformer import Filter, FilterIsIn, FilterRange
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def frame() -> pl.LazyFrame:
+    return pl.LazyFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["1", "2", "3", "4", "5"],
+            "col3": ["1", "2", "3", "4", "5"],
+            "col4": ["a", "b", "c", "d", "e"],
+        },
+        schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+    )
+
+
+#######################################
+#     Tests for FilterTransformer     #
+#######################################
+
+
+def test_filter_transformer_repr() -> None:
+    assert repr(Filter(predicate="col1 > 2")) == "FilterTransformer(predicate='col1 > 2')"
+
+
+def test_filter_transformer_str() -> None:
+    assert str(Filter(predicate="col1 > 2")) == "FilterTransformer(predicate='col1 > 2')"
+
+
+def test_filter_transformer_equal_true() -> None:
+    assert Filter(predicate="col1 > 2").equal(Filter(predicate="col1 > 2"))
+
+
+def test_filter_transformer_equal_true_expr() -> None:
+    assert Filter(predicate=pl.col("col1") > 2).equal(Filter(predicate=pl.col("col1") > 2))
+
+
+def test_filter_transformer_equal_false_different_predicate() -> None:
+    assert not Filter(predicate="col1 > 2").equal(Filter(predicate="col1 > 3"))
+
+
+def test_filter_transformer_equal_false_different_type() -> None:
+    assert not Filter(predicate="col1 > 2").equal(42)
+
+
+def test_filter_transformer_fit(frame: pl.LazyFrame, caplog: pytest.LogCaptureFixture) -> None:
+    transformer = Filter(predicate="col1 > 2")
+    with caplog.at_level(logging.INFO):
+        transformer.fit(frame)
+    assert caplog.messages[0].startswith(
+        "Skipping 'FilterTransformer.fit' as there are no parameters available to fit"
+    )
+
+
+def test_filter_transformer_fit_transform(frame: pl.LazyFrame) -> None:
+    transformer = Filter(predicate="col1 > 2 AND col4 != 'e'")
+    out = transformer.fit_transform(frame)
+    assert isinstance(out, pl.LazyFrame)
+    assert_frame_equal(
+        out.collect(),
+        pl.DataFrame(
+            {"col1": [3, 4], "col2": ["3", "4"], "col3": ["3", "4"], "col4": ["c", "d"]},
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+        ),
+    )
+
+
+def test_filter_transformer_transform_expr(frame: pl.LazyFrame) -> None:
+    transformer = Filter(predicate=pl.col("col1").is_between(2, 3))
+    out = transformer.transform(frame)
+    assert_frame_equal(
+        out.collect(),
+        pl.DataFrame(
+            {"col1": [2, 3], "col2": ["2", "3"], "col3": ["2", "3"], "col4": ["b", "c"]},
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+        ),
+    )
+
+
+def test_filter_transformer_transform_scan_parquet(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame({"col1": list(range(100)), "col2": ["a", "b"] * 50}).write_parquet(
+        path, row_group_size=10
+    )
+    transformer = Filter(predicate="col1 >= 95 AND col2 = 'b'")
+    out = transformer.transform(pl.scan_parquet(path))
+    # The predicate is pushed down to the scan, so there is no filter node in the plan.
+    assert "FILTER" not in out.explain()
+    assert_frame_equal(out.collect(), pl.DataFrame({"col1": [95, 97, 99], "col2": ["b", "b", "b"]}))
+
+
+def test_filter_transformer_transform_scan_csv(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.csv")
+    pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]}).write_csv(path)
+    transformer = Filter(predicate="col2 IN ('b', 'd')")
+    out = transformer.transform(pl.scan_csv(path))
+    assert "FILTER" not in out.explain()
+    assert_frame_equal(out.collect(), pl.DataFrame({"col1": [2, 4], "col2": ["b", "d"]}))
+
+
+############################################
+#     Tests for FilterRangeTransformer     #
+############################################
+
+
+def test_filter_range_transformer_repr() -> None:
+    assert (
+        repr(FilterRange(col="col1", start=2, end=4))
+        == "FilterRangeTransformer(col='col1', start=2, end=4)"
+    )
+
+
+def test_filter_range_transformer_str() -> None:
+    assert (
+        str(FilterRange(col="col1", start=2, end=4))
+        == "FilterRangeTransformer(col='col1', start=2, end=4)"
+    )
+
+
+def test_filter_range_transformer_equal_true() -> None:
+    assert FilterRange(col="col1", start=2, end=4).equal(FilterRange(col="col1", start=2, end=4))
+
+
+def test_filter_range_transformer_equal_false_different_col() -> None:
+    assert not FilterRange(col="col1", start=2, end=4).equal(
+        FilterRange(col="col2", start=2, end=4)
+    )
+
+
+def test_filter_range_transformer_equal_false_different_start() -> None:
+    assert not FilterRange(col="col1", start=2, end=4).equal(FilterRange(col="col1", end=4))
+
+
+def test_filter_range_transformer_equal_false_different_end() -> None:
+    assert not FilterRange(col="col1", start=2, end=4).equal(FilterRange(col="col1", start=2))
+
+
+def test_filter_range_transformer_equal_false_different_type() -> None:
+    assert not FilterRange(col="col1", start=2, end=4).equal(42)
+
+
+def test_filter_range_transformer_fit(
+    frame: pl.LazyFrame, caplog: pytest.LogCaptureFixture
+) -> None:
+    transformer = FilterRange(col="col1", start=2, end=4)
+    with caplog.at_level(logging.INFO):
+        transformer.fit(frame)
+    assert caplog.messages[0].startswith(
+        "Skipping 'FilterRangeTransformer.fit' as there are no parameters available to fit"
+    )
+
+
+def test_filter_range_transformer_transform(frame: pl.LazyFrame) -> None:
+    transformer = FilterRange(col="col1", start=2, end=4)
+    out = transformer.transform(frame)
+    assert_frame_equal(
+        out.collect(),
+        pl.DataFrame(
+            {"col1": [2, 3], "col2": ["2", "3"], "col3": ["2", "3"], "col4": ["b", "c"]},
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+        ),
+    )
+
+
+def test_filter_range_transformer_transform_null() -> None:
+    transformer = FilterRange(col="col1", start=2)
+    out = transformer.transform(pl.LazyFrame({"col1": [1, None, 3]}))
+    assert_frame_equal(out.collect(), pl.DataFrame({"col1": [3]}))
+
+
+###########################################
+#     Tests for FilterIsInTransformer     #
+###########################################
+
+
+def test_filter_is_in_transformer_repr() -> None:
+    assert (
+        repr(FilterIsIn(col="col4", values=["a", "c"]))
+        == "FilterIsInTransformer(col='col4', values=('a', 'c'))"
+    )
+
+
+def test_filter_is_in_transformer_str() -> None:
+    assert (
+        str(FilterIsIn(col="col4", values=["a", "c"]))
+        == "FilterIsInTransformer(col='col4', values=('a', 'c'))"
+    )
+
+
+def test_filter_is_in_transformer_equal_true() -> None:
+    assert FilterIsIn(col="col4", values=["a", "c"]).equal(
+        FilterIsIn(col="col4", values=["a", "c"])
+    )
+
+
+def test_filter_is_in_transformer_equal_false_different_col() -> None:
+    assert not FilterIsIn(col="col4", values=["a", "c"]).equal(
+        FilterIsIn(col="col3", values=["a", "c"])
+    )
+
+
+def test_filter_is_in_transformer_equal_false_different_values() -> None:
+    assert not FilterIsIn(col="col4", values=["a", "c"]).equal(
+        FilterIsIn(col="col4", values=["a", "b"])
+    )
+
+
+def test_filter_is_in_transformer_equal_false_different_type() -> None:
+    assert not FilterIsIn(col="col4", values=["a", "c"]).equal(42)
+
+
+def test_filter_is_in_transformer_fit(
+    frame: pl.LazyFrame, caplog: pytest.LogCaptureFixture
+) -> None:
+    transformer = FilterIsIn(col="col4", values=["a", "c"])
+    with caplog.at_level(logging.INFO):
+        transformer.fit(frame)
+    assert caplog.messages[0].startswith(
+        "Skipping 'FilterIsInTransformer.fit' as there are no parameters available to fit"
+    )
+
+
+def test_filter_is_in_transformer_transform(frame: pl.LazyFrame) -> None:
+    transformer = FilterIsIn(col="col4", values=["a", "c", "e"])
+    out = transformer.transform(frame)
+    assert_frame_equal(
+        out.collect(),
+        pl.DataFrame(
+            {
+                "col1": [1, 3, 5],
+                "col2": ["1", "3", "5"],
+                "col3": ["1", "3", "5"],
+                "col4": ["a", "c", "e"],
+            },
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+        ),
+    )
+
+
+def test_filter_is_in_transformer_transform_null() -> None:
+    transformer = FilterIsIn(col="col1", values=[1, None])
+    out = transformer.transform(pl.LazyFrame({"col1": [1, None, 3]}))
+    assert_frame_equal(out.collect(), pl.DataFrame({"col1": [1, None]}))
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.lazy.transformer import (
+    DropNullRow,
+    InplaceReplace,
+    Sequential,
+    SqlTransformer,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def lazyframe() -> pl.LazyFrame:
+    return pl.LazyFrame(
+        {
+            "col1": [1, 2, None, 4, 5],
+            "col2": ["a", "b", "c", "d", "e"],
+            "col3": [1.0, 2.0, 3.0, 4.0, 5.0],
+        },
+        schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.Float64},
+    )
+
+
+###########################################
+#     Tests for SequentialTransformer     #
+###########################################
+
+
+def test_sequential_transformer_repr() -> None:
+    assert repr(
+        Sequential([DropNullRow(columns=["col1"]), InplaceReplace(col="col2", old={"a": "x"})])
+    ).startswith("SequentialTransformer(")
+
+
+def test_sequential_transformer_repr_empty() -> None:
+    assert repr(Sequential([])) == "SequentialTransformer()"
+
+
+def test_sequential_transformer_str() -> None:
+    assert str(
+        Sequential([DropNullRow(columns=["col1"]), InplaceReplace(col="col2", old={"a": "x"})])
+    ).startswith("SequentialTransformer(")
+
+
+def test_sequential_transformer_str_empty() -> None:
+    assert str(Sequential([])) == "SequentialTransformer()"
+
+
+def test_sequential_transformer_config() -> None:
+    assert Sequential(
+        [{"_target_": "grizz.lazy.transformer.DropNullRow", "columns": ["col1"]}]
+    ).equal(Sequential([DropNullRow(columns=["col1"])]))
+
+
+def test_sequential_transformer_equal_true() -> None:
+    assert Sequential([DropNullRow(columns=["col1"])]).equal(
+        Sequential([DropNullRow(columns=["col1"])])
+    )
+
+
+def test_sequential_transformer_equal_false_different_transformers() -> None:
+    assert not Sequential([DropNullRow(columns=["col1"])]).equal(
+        Sequential([DropNullRow(columns=["col2"])])
+    )
+
+
+def test_sequential_transformer_equal_false_different_type() -> None:
+    assert not Sequential([DropNullRow(columns=["col1"])]).equal(42)
+
+
+def test_sequential_transformer_fit(lazyframe: pl.LazyFrame) -> None:
+    Sequential([DropNullRow(columns=["col1"]), InplaceReplace(col="col2", old={"a": "x"})]).fit(
+        lazyframe
+    )
+
+
+def test_sequential_transformer_fit_transform(lazyframe: pl.LazyFrame) -> None:
+    transformer = Sequential(
+        [DropNullRow(columns=["col1"]), InplaceReplace(col="col2", old={"a": "x"})]
+    )
+    out = transformer.fit_transform(lazyframe)
+    assert isinstance(out, pl.LazyFrame)
+    assert_frame_equal(
+        out.collect(),
+        pl.DataFrame(
+            {"col1": [1, 2, 4, 5], "col2": ["x", "b", "d", "e"], "col3": [1.0, 2.0, 4.0, 5.0]},
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.Float64},
+        ),
+    )
+
+
+def test_sequential_transformer_transform(lazyframe: pl.LazyFrame) -> None:
+    transformer = Sequential(
+        [
+            DropNullRow(columns=["col1"]),
+            InplaceReplace(col="col2", old={"a": "x"}),
+            SqlTransformer("SELECT col1, col2 FROM self WHERE col1 > 1"),
+        ]
+    )
+    out = transformer.transform(lazyframe)
+    assert isinstance(out, pl.LazyFrame)
+    assert_frame_equal(
+        out.collect(),
+        pl.DataFrame(
+            {"col1": [2, 4, 5], "col2": ["b", "d", "e"]},
+            schema={"col1": pl.Int64, "col2": pl.String},
+        ),
+    )
+
+
+def test_sequential_transformer_transform_empty(lazyframe: pl.LazyFrame) -> None:
+    assert_frame_equal(Sequential([]).transform(lazyframe).collect(), lazyframe.collect())
+
+
+def test_sequential_transformer_explain(lazyframe: pl.LazyFrame) -> None:
+    plan = Sequential([DropNullRow(columns=["col1"])]).explain(lazyframe)
+    assert isinstance(plan, str)
+
+
+def test_sequential_transformer_explain_pushdown(tmp_path: Path, lazyframe: pl.LazyFrame) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    lazyframe.collect().write_parquet(path)
+    transformer = Sequential(
+        [SqlTransformer("SELECT col1, col2 FROM self"), DropNullRow(columns=["col1"])]
+    )
+    plan = transformer.explain(pl.scan_parquet(path))
+    # the projection and the predicate are pushed down into the scan
+    assert "PROJECT 2/3 COLUMNS" in plan
+    assert "SELECTION" in plan
+
+
+def test_sequential_transformer_profile(lazyframe: pl.LazyFrame) -> None:
+    out, timings = Sequential([DropNullRow(columns=["col1"])]).profile(lazyframe)
+    assert_frame_equal(
+        out,
+        pl.DataFrame(
+            {"col1": [1, 2, 4, 5], "col2": ["a", "b", "d", "e"], "col3": [1.0, 2.0, 4.0, 5.0]},
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.Float64},
+        ),
+    )
+    assert isinstance(timings, pl.DataFrame)
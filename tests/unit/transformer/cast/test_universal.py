@@ -567,6 +567,14 @@ def test_inplace_cast_transformer_fit_transform(dataframe: pl.DataFrame) -> None
     )
 
 
+def test_inplace_cast_transformer_to_exprs(dataframe: pl.DataFrame) -> None:
+    transformer = InplaceCast(columns=["col1", "col2"], dtype=pl.Float32)
+    assert_frame_equal(
+        dataframe.with_columns(transformer.to_exprs(dataframe.schema)),
+        transformer.transform(dataframe),
+    )
+
+
 def test_inplace_cast_transformer_transform(dataframe: pl.DataFrame) -> None:
     transformer = InplaceCast(columns=["col1", "col3"], dtype=pl.Int32)
     out = transformer.transform(dataframe)
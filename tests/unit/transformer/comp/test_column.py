@@ -2238,3 +2238,26 @@ def test_column_not_equal_missing_transformer_transform_missing_policy_warn(
             schema={"col1": pl.Int64, "col2": pl.Int64, "col3": pl.String},
         ),
     )
+
+
+@pytest.mark.parametrize(
+    "transformer_cls",
+    [
+        ColumnEqual,
+        ColumnEqualMissing,
+        ColumnGreater,
+        ColumnGreaterEqual,
+        ColumnLower,
+        ColumnLowerEqual,
+        ColumnNotEqual,
+        ColumnNotEqualMissing,
+    ],
+)
+def test_column_comparator_transformer_to_exprs(
+    dataframe: pl.DataFrame, transformer_cls: type
+) -> None:
+    transformer = transformer_cls(in1_col="col1", in2_col="col2", out_col="out")
+    assert_frame_equal(
+        dataframe.with_columns(transformer.to_exprs(dataframe.schema)),
+        transformer.transform(dataframe),
+    )
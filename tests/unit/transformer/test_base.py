@@ -9,11 +9,34 @@ import pytest
 from coola.equality import EqualityConfig
 from coola.equality.testers import EqualityTester
 from objectory import OBJECT_TARGET
+from polars.testing import assert_frame_equal
 
 from grizz.transformer import (
+    BaseTransformer,
+    ColumnSelection,
+    CopyColumn,
+    Diff,
+    DropDuplicate,
+    DropNanColumn,
+    DropNanRow,
+    DropNullColumn,
+    DropNullRow,
     FillNan,
     FillNull,
+    FilterCardinality,
+    FilterRange,
+    FirstRow,
     InplaceCast,
+    InplaceFillNan,
+    InplaceFillNull,
+    InplaceJsonDecode,
+    InplaceReplace,
+    InplaceStringToDatetime,
+    Sequential,
+    Sort,
+    SqlTransformer,
+    SumHorizontal,
+    TimeDiff,
     is_transformer_config,
     setup_transformer,
 )
@@ -48,6 +71,113 @@ def test_is_transformer_config_false() -> None:
     assert not is_transformer_config({OBJECT_TARGET: "collections.Counter"})
 
 
+#######################################
+#     Tests for transform_batches     #
+#######################################
+
+
+def test_transform_batches() -> None:
+    transformer = InplaceCast(columns=["col1"], dtype=pl.Float32)
+    frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    outs = list(transformer.transform_batches(frame.iter_slices(n_rows=2)))
+    assert len(outs) == 2
+    assert_frame_equal(
+        pl.concat(outs),
+        pl.DataFrame(
+            {"col1": [1.0, 2.0, 3.0], "col2": ["a", "b", "c"]},
+            schema={"col1": pl.Float32, "col2": pl.String},
+        ),
+    )
+
+
+def test_transform_batches_empty() -> None:
+    transformer = InplaceCast(columns=["col1"], dtype=pl.Float32)
+    assert list(transformer.transform_batches([])) == []
+
+
+@pytest.mark.parametrize(
+    "transformer",
+    [
+        Diff(in_col="col1", out_col="diff"),
+        DropDuplicate(),
+        DropNanColumn(),
+        DropNullColumn(),
+        FilterCardinality(columns=["col1"], n_min=2),
+        FirstRow(n=2),
+        Sort(columns=["col1"]),
+        SqlTransformer(query="SELECT * FROM self WHERE col1 > 1"),
+        TimeDiff(group_cols=["col2"], time_col="col1", time_diff_col="diff"),
+        InplaceFillNull(columns=["col1"], strategy="forward"),
+    ],
+)
+def test_transform_batches_not_supported(transformer: BaseTransformer) -> None:
+    frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    with pytest.raises(ValueError, match="cannot transform the DataFrame batch by batch"):
+        transformer.transform_batches(frame.iter_slices(n_rows=2))
+
+
+@pytest.mark.parametrize(
+    "transformer",
+    [
+        InplaceFillNull(columns=["a"], strategy="forward"),
+        Sequential([InplaceFillNull(columns=["a"], strategy="forward")]),
+    ],
+)
+def test_transform_batches_fill_null_strategy(transformer: BaseTransformer) -> None:
+    # The forward strategy depends on the previous batches, so the
+    # batches cannot be transformed separately.
+    frame = pl.DataFrame({"a": [1, None, None, 4, None, 6]})
+    assert transformer.transform(frame)["a"].to_list() == [1, 1, 1, 4, 4, 6]
+    with pytest.raises(ValueError, match="cannot transform the DataFrame batch by batch"):
+        list(transformer.transform_batches(frame.iter_slices(n_rows=2)))
+
+
+######################################
+#     Tests for supports_batches     #
+######################################
+
+
+@pytest.mark.parametrize(
+    "transformer",
+    [
+        ColumnSelection(columns=["col1"]),
+        CopyColumn(in_col="col1", out_col="out"),
+        DropNanRow(),
+        DropNullRow(),
+        InplaceFillNull(columns=["col1"], value=0),
+        InplaceFillNan(columns=["col1"], value=0.0),
+        FilterRange(col="col1", start=2),
+        InplaceCast(columns=["col1"], dtype=pl.Float32),
+        InplaceJsonDecode(columns=["col1"], dtype=pl.List(pl.Int64)),
+        InplaceReplace(col="col1", old={"a": "b"}),
+        InplaceStringToDatetime(columns=["col1"], format="%Y-%m-%d"),
+        SumHorizontal(columns=["col1", "col2"], out_col="out"),
+    ],
+)
+def test_supports_batches_true(transformer: BaseTransformer) -> None:
+    assert transformer.supports_batches()
+
+
+@pytest.mark.parametrize(
+    "transformer",
+    [
+        Diff(in_col="col1", out_col="diff"),
+        DropDuplicate(),
+        DropNullColumn(),
+        FirstRow(n=2),
+        Sort(columns=["col1"]),
+        InplaceFillNull(columns=["col1"], strategy="forward"),
+        InplaceFillNull(columns=["col1"], strategy="mean"),
+        InplaceFillNull(columns=["col1"], value=pl.col("col1").mean()),
+        InplaceFillNan(columns=["col1"], value=pl.col("col1").median()),
+        InplaceJsonDecode(columns=["col1"]),
+        InplaceStringToDatetime(columns=["col1"]),
+    ],
+)
+def test_supports_batches_false(transformer: BaseTransformer) -> None:
+    assert not transformer.supports_batches()
+
+
 #######################################
 #     Tests for setup_transformer     #
 #######################################
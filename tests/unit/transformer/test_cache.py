@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.transformer import Cache, FilterRange, InplaceCast, Sort
+from grizz.utils.profiling import Profiler
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def dataframe() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["1", "2", "3", "4", "5"],
+            "col3": ["a", "b", "c", "d", "e"],
+        }
+    )
+
+
+######################################
+#     Tests for CacheTransformer     #
+######################################
+
+
+def test_cache_transformer_repr(tmp_path: Path) -> None:
+    assert repr(Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)).startswith(
+        "CacheTransformer(\n  (transformer): InplaceCastTransformer("
+    )
+
+
+def test_cache_transformer_str(tmp_path: Path) -> None:
+    assert str(Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)).startswith(
+        "CacheTransformer(\n  (transformer): InplaceCastTransformer("
+    )
+
+
+def test_cache_transformer_equal_true(tmp_path: Path) -> None:
+    assert Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path).equal(
+        Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    )
+
+
+def test_cache_transformer_equal_false_different_transformer(tmp_path: Path) -> None:
+    assert not Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path).equal(
+        Cache(InplaceCast(columns=["col2"], dtype=pl.Float32), path=tmp_path)
+    )
+
+
+def test_cache_transformer_equal_false_different_path(tmp_path: Path) -> None:
+    assert not Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path).equal(
+        Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path.joinpath("cache"))
+    )
+
+
+def test_cache_transformer_equal_false_different_type(tmp_path: Path) -> None:
+    assert not Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path).equal(42)
+
+
+def test_cache_transformer_fit_transform(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    out = transformer.fit_transform(dataframe)
+    assert_frame_equal(
+        out,
+        pl.DataFrame(
+            {
+                "col1": [1.0, 2.0, 3.0, 4.0, 5.0],
+                "col2": ["1", "2", "3", "4", "5"],
+                "col3": ["a", "b", "c", "d", "e"],
+            },
+            schema={"col1": pl.Float32, "col2": pl.String, "col3": pl.String},
+        ),
+    )
+
+
+def test_cache_transformer_transform(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    out = transformer.transform(dataframe)
+    assert_frame_equal(
+        out,
+        pl.DataFrame(
+            {
+                "col1": [1.0, 2.0, 3.0, 4.0, 5.0],
+                "col2": ["1", "2", "3", "4", "5"],
+                "col3": ["a", "b", "c", "d", "e"],
+            },
+            schema={"col1": pl.Float32, "col2": pl.String, "col3": pl.String},
+        ),
+    )
+    assert len(list(tmp_path.glob("*.arrow"))) == 1
+
+
+def test_cache_transformer_transform_hit(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    expected = transformer.transform(dataframe)
+    with patch(
+        "grizz.transformer.InplaceCastTransformer.transform", side_effect=RuntimeError
+    ) as mock:
+        out = transformer.transform(dataframe)
+    mock.assert_not_called()
+    assert_frame_equal(out, expected)
+
+
+def test_cache_transformer_transform_miss_different_input(
+    tmp_path: Path, dataframe: pl.DataFrame
+) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    transformer.transform(dataframe)
+    out = transformer.transform(dataframe.head(2))
+    assert out.shape == (2, 3)
+    assert len(list(tmp_path.glob("*.arrow"))) == 2
+
+
+def test_cache_transformer_transform_miss_different_transformer(
+    tmp_path: Path, dataframe: pl.DataFrame
+) -> None:
+    Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path).transform(dataframe)
+    out = Cache(InplaceCast(columns=["col1"], dtype=pl.Float64), path=tmp_path).transform(dataframe)
+    assert out.schema["col1"] == pl.Float64
+    assert len(list(tmp_path.glob("*.arrow"))) == 2
+
+
+def test_cache_transformer_transform_max_size(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path, max_size=0)
+    transformer.transform(dataframe)
+    assert len(list(tmp_path.glob("*.arrow"))) == 0
+
+
+def test_cache_transformer_transform_profiler(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    with Profiler() as profiler:
+        transformer.transform(dataframe)
+    assert [(record.name, record.depth) for record in profiler.records] == [
+        ("CacheTransformer.transform", 0),
+        ("InplaceCastTransformer.transform", 1),
+    ]
+
+
+def test_cache_transformer_get_key(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    assert transformer.get_key(dataframe) == transformer.get_key(dataframe.clone())
+    assert transformer.get_key(dataframe) != transformer.get_key(dataframe.head(2))
+
+
+def test_cache_transformer_get_input_columns(tmp_path: Path) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    assert transformer.get_input_columns() == ("col1",)
+
+
+def test_cache_transformer_get_output_columns(tmp_path: Path) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    assert transformer.get_output_columns() == ("col1",)
+
+
+def test_cache_transformer_find_required_columns(tmp_path: Path) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    assert transformer.find_required_columns(["col3"]) == ("col3", "col1")
+
+
+def test_cache_transformer_get_row_filter(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    transformer = Cache(FilterRange(col="col1", start=3), path=tmp_path)
+    assert dataframe.filter(transformer.get_row_filter())["col1"].to_list() == [3, 4, 5]
+
+
+def test_cache_transformer_get_row_filter_none(tmp_path: Path) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    assert transformer.get_row_filter() is None
+
+
+def test_cache_transformer_supports_batches_true(tmp_path: Path) -> None:
+    transformer = Cache(InplaceCast(columns=["col1"], dtype=pl.Float32), path=tmp_path)
+    assert transformer.supports_batches()
+
+
+def test_cache_transformer_supports_batches_false(tmp_path: Path) -> None:
+    assert not Cache(Sort(columns=["col1"]), path=tmp_path).supports_batches()
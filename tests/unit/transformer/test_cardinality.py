@@ -10,6 +10,7 @@ from polars.testing import assert_frame_equal
 
 from grizz.exceptions import ColumnNotFoundError, ColumnNotFoundWarning
 from grizz.transformer import FilterCardinality
+from grizz.utils.diagnostics import diagnostics_level
 
 
 @pytest.fixture
@@ -323,3 +324,21 @@ def test_filter_cardinality_transformer_transform_missing_policy_warn(
             }
         ),
     )
+
+
+def test_filter_cardinality_transformer_transform_diagnostics_summary(
+    caplog: pytest.LogCaptureFixture, dataframe: pl.DataFrame
+) -> None:
+    transformer = FilterCardinality(columns=["col1", "col2", "col3"], n_min=2, n_max=5)
+    with caplog.at_level(logging.INFO), diagnostics_level("summary"):
+        transformer.transform(dataframe)
+    assert "Dropping 2 columns" in caplog.messages
+
+
+def test_filter_cardinality_transformer_transform_diagnostics_off(
+    caplog: pytest.LogCaptureFixture, dataframe: pl.DataFrame
+) -> None:
+    transformer = FilterCardinality(columns=["col1", "col2", "col3"], n_min=2, n_max=5)
+    with caplog.at_level(logging.INFO), diagnostics_level("off"):
+        transformer.transform(dataframe)
+    assert not any(message.startswith("Dropping") for message in caplog.messages)
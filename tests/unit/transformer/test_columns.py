@@ -2,8 +2,29 @@ from __future__ import annotations
 
 import polars as pl
 import pytest
+from polars.testing import assert_frame_equal
 
-from grizz.transformer import BaseInNTransformer
+from grizz.transformer import (
+    BaseInNTransformer,
+    BaseTransformer,
+    CategoricalCast,
+    ConcatColumns,
+    CopyColumn,
+    CopyColumns,
+    Diff,
+    DiffHorizontal,
+    DropNullRow,
+    Equal,
+    FirstRow,
+    InplaceCast,
+    InplaceFillNull,
+    InplaceReplace,
+    InplaceStripChars,
+    MaxHorizontal,
+    MeanHorizontal,
+    StripChars,
+    SumHorizontal,
+)
 
 
 @pytest.fixture
@@ -85,3 +106,156 @@ def test_base_columns_transformer_find_missing_columns(dataframe: pl.DataFrame)
 def test_base_columns_transformer_find_missing_columns_none(dataframe: pl.DataFrame) -> None:
     transformer = MyColumnsTransformer()
     assert transformer.find_missing_columns(dataframe) == ()
+
+
+def test_base_columns_transformer_to_exprs_none(dataframe: pl.DataFrame) -> None:
+    assert MyColumnsTransformer().to_exprs(dataframe.schema) is None
+
+
+############################################
+#     Tests for to_exprs in subclasses     #
+############################################
+
+
+@pytest.mark.parametrize(
+    "transformer",
+    [
+        CategoricalCast(in_col="col3", out_col="out"),
+        ConcatColumns(columns=["col3", "col4"], out_col="out"),
+        CopyColumns(columns=["col1", "col2"], prefix="", suffix="_out"),
+        Diff(in_col="col1", out_col="out"),
+        Equal(columns=["col1"], target=3, prefix="", suffix="_out"),
+        InplaceCast(columns=["col1"], dtype=pl.Float32),
+        InplaceFillNull(columns=["col1"], value=0),
+        InplaceReplace(col="col2", old={"1": "-1"}),
+        InplaceStripChars(columns=["col3"]),
+        MaxHorizontal(columns=["col1"], out_col="out"),
+        MeanHorizontal(columns=["col1"], out_col="out"),
+        StripChars(columns=None, prefix="", suffix="_out"),
+        SumHorizontal(columns=[], out_col="out"),
+    ],
+)
+def test_to_exprs_same_as_transform(dataframe: pl.DataFrame, transformer: BaseTransformer) -> None:
+    assert_frame_equal(
+        dataframe.with_columns(transformer.to_exprs(dataframe.schema)),
+        transformer.transform(dataframe),
+    )
+
+
+########################################################
+#     Tests for the required columns in subclasses     #
+########################################################
+
+
+def test_in1_out1_get_input_columns() -> None:
+    assert CopyColumn(in_col="col1", out_col="out").get_input_columns() == ("col1",)
+
+
+def test_in1_out1_get_output_columns() -> None:
+    assert CopyColumn(in_col="col1", out_col="out").get_output_columns() == ("out",)
+
+
+def test_in1_out1_find_required_columns() -> None:
+    assert CopyColumn(in_col="col1", out_col="out").find_required_columns(["col2", "out"]) == (
+        "col2",
+        "col1",
+    )
+
+
+def test_in1_out1_find_required_columns_all() -> None:
+    assert CopyColumn(in_col="col1", out_col="out").find_required_columns() is None
+
+
+def test_in1_out1_find_required_columns_inplace() -> None:
+    assert CategoricalCast(in_col="col1", out_col="col1").find_required_columns(["col1"]) == (
+        "col1",
+    )
+
+
+def test_in2_out1_get_input_columns() -> None:
+    transformer = DiffHorizontal(in1_col="col1", in2_col="col2", out_col="diff")
+    assert transformer.get_input_columns() == ("col1", "col2")
+
+
+def test_in2_out1_get_output_columns() -> None:
+    transformer = DiffHorizontal(in1_col="col1", in2_col="col2", out_col="diff")
+    assert transformer.get_output_columns() == ("diff",)
+
+
+def test_in2_out1_find_required_columns() -> None:
+    transformer = DiffHorizontal(in1_col="col1", in2_col="col2", out_col="diff")
+    assert transformer.find_required_columns(["diff", "col3"]) == ("col3", "col1", "col2")
+
+
+def test_in_n_get_input_columns() -> None:
+    transformer = DropNullRow(columns=["col1", "col2", "col3"], exclude_columns=["col2"])
+    assert transformer.get_input_columns() == ("col1", "col3")
+
+
+def test_in_n_get_input_columns_none() -> None:
+    assert DropNullRow().get_input_columns() is None
+
+
+def test_in_n_get_output_columns() -> None:
+    assert DropNullRow(columns=["col1"]).get_output_columns() == ()
+
+
+def test_in_n_find_required_columns() -> None:
+    assert DropNullRow(columns=["col1", "col2"]).find_required_columns(["col2", "col3"]) == (
+        "col2",
+        "col3",
+        "col1",
+    )
+
+
+def test_in_n_find_required_columns_all_input_columns() -> None:
+    assert DropNullRow().find_required_columns(["col1"]) is None
+
+
+def test_in_n_out_1_get_output_columns() -> None:
+    assert SumHorizontal(columns=["col1", "col2"], out_col="out").get_output_columns() == ("out",)
+
+
+def test_in_n_out_1_find_required_columns() -> None:
+    assert SumHorizontal(columns=["col1", "col2"], out_col="out").find_required_columns(
+        ["out"]
+    ) == ("col1", "col2")
+
+
+def test_in_n_out_n_get_output_columns() -> None:
+    assert StripChars(columns=["col1", "col2"], prefix="", suffix="_out").get_output_columns() == (
+        "col1_out",
+        "col2_out",
+    )
+
+
+def test_in_n_out_n_get_output_columns_none() -> None:
+    assert StripChars(columns=None, prefix="", suffix="_out").get_output_columns() is None
+
+
+def test_in_n_out_n_find_required_columns() -> None:
+    assert StripChars(columns=["col1", "col2"], prefix="", suffix="_out").find_required_columns(
+        ["col1_out", "col3"]
+    ) == ("col3", "col1", "col2")
+
+
+def test_in_n_out_n_find_required_columns_inplace() -> None:
+    assert InplaceCast(columns=["col1"], dtype=pl.Float32).find_required_columns(
+        ["col1", "col2"]
+    ) == ("col2", "col1")
+
+
+def test_base_transformer_get_input_columns_default() -> None:
+    assert FirstRow(n=3).get_input_columns() is None
+
+
+def test_base_transformer_get_output_columns_default() -> None:
+    assert FirstRow(n=3).get_output_columns() is None
+
+
+def test_base_transformer_find_required_columns_default() -> None:
+    assert FirstRow(n=3).find_required_columns(["col1"]) is None
+
+
+def test_base_transformer_get_row_filter_default() -> None:
+    assert FirstRow(n=3).get_row_filter() is None
@@ -173,6 +173,27 @@ def test_copy_column_transformer_transform(dataframe: pl.DataFrame) -> None:
     )
 
 
+def test_copy_column_transformer_to_exprs(dataframe: pl.DataFrame) -> None:
+    transformer = CopyColumn(in_col="col1", out_col="out")
+    assert_frame_equal(
+        dataframe.with_columns(transformer.to_exprs(dataframe.schema)),
+        transformer.transform(dataframe),
+    )
+
+
+def test_copy_column_transformer_to_exprs_missing_policy_ignore(
+    dataframe: pl.DataFrame,
+) -> None:
+    transformer = CopyColumn(in_col="col", out_col="out", missing_policy="ignore")
+    assert transformer.to_exprs(dataframe.schema) == []
+
+
+def test_copy_column_transformer_to_exprs_exist_policy_raise(dataframe: pl.DataFrame) -> None:
+    transformer = CopyColumn(in_col="col1", out_col="col2")
+    with pytest.raises(ColumnExistsError, match="column 'col2' already exists in the DataFrame"):
+        transformer.to_exprs(dataframe.schema)
+
+
 def test_copy_column_transformer_transform_empty() -> None:
     transformer = CopyColumn(in_col="col1", out_col="out")
     out = transformer.transform(
@@ -468,6 +489,14 @@ def test_copy_columns_transformer_transform(dataframe: pl.DataFrame) -> None:
     )
 
 
+def test_copy_columns_transformer_to_exprs(dataframe: pl.DataFrame) -> None:
+    transformer = CopyColumns(columns=["col1", "col3"], prefix="", suffix="_out")
+    assert_frame_equal(
+        dataframe.with_columns(transformer.to_exprs(dataframe.schema)),
+        transformer.transform(dataframe),
+    )
+
+
 def test_copy_columns_transformer_transform_empty() -> None:
     transformer = CopyColumns(columns=["col1", "col2"], prefix="p_", suffix="_s")
     out = transformer.transform(
@@ -165,6 +165,14 @@ def test_abs_diff_horizontal_transformer_fit_missing_policy_warn_in2(
         transformer.fit(dataframe)
 
 
+def test_abs_diff_horizontal_transformer_to_exprs(dataframe: pl.DataFrame) -> None:
+    transformer = AbsDiffHorizontal(in1_col="col1", in2_col="col2", out_col="diff")
+    assert_frame_equal(
+        dataframe.with_columns(transformer.to_exprs(dataframe.schema)),
+        transformer.transform(dataframe),
+    )
+
+
 def test_abs_diff_horizontal_transformer_fit_transform(dataframe: pl.DataFrame) -> None:
     transformer = AbsDiffHorizontal(in1_col="col1", in2_col="col2", out_col="diff")
     out = transformer.fit_transform(dataframe)
@@ -525,6 +533,14 @@ def test_diff_horizontal_transformer_fit_missing_policy_warn_in2(
         transformer.fit(dataframe)
 
 
+def test_diff_horizontal_transformer_to_exprs(dataframe: pl.DataFrame) -> None:
+    transformer = DiffHorizontal(in1_col="col1", in2_col="col2", out_col="diff")
+    assert_frame_equal(
+        dataframe.with_columns(transformer.to_exprs(dataframe.schema)),
+        transformer.transform(dataframe),
+    )
+
+
 def test_diff_horizontal_transformer_fit_transform(dataframe: pl.DataFrame) -> None:
     transformer = DiffHorizontal(in1_col="col1", in2_col="col2", out_col="diff")
     out = transformer.fit_transform(dataframe)
@@ -0,0 +1,340 @@
+from __future__ import annotations
+
+import logging
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.transformer import Filter, FilterIsIn, FilterRange
+
+
+@pytest.fixture
+def dataframe() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["1", "2", "3", "4", "5"],
+            "col3": ["1", "2", "3", "4", "5"],
+            "col4": ["a", "b", "c", "d", "e"],
+        },
+        schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+    )
+
+
+#######################################
+#     Tests for FilterTransformer     #
+#######################################
+
+
+def test_filter_transformer_repr() -> None:
+    assert repr(Filter(predicate="col1 > 2")) == "FilterTransformer(predicate='col1 > 2')"
+
+
+def test_filter_transformer_str() -> None:
+    assert str(Filter(predicate="col1 > 2")) == "FilterTransformer(predicate='col1 > 2')"
+
+
+def test_filter_transformer_equal_true() -> None:
+    assert Filter(predicate="col1 > 2").equal(Filter(predicate="col1 > 2"))
+
+
+def test_filter_transformer_equal_true_expr() -> None:
+    assert Filter(predicate=pl.col("col1") > 2).equal(Filter(predicate=pl.col("col1") > 2))
+
+
+def test_filter_transformer_equal_false_different_predicate() -> None:
+    assert not Filter(predicate="col1 > 2").equal(Filter(predicate="col1 > 3"))
+
+
+def test_filter_transformer_equal_false_different_type() -> None:
+    assert not Filter(predicate="col1 > 2").equal(42)
+
+
+def test_filter_transformer_fit(dataframe: pl.DataFrame, caplog: pytest.LogCaptureFixture) -> None:
+    transformer = Filter(predicate="col1 > 2")
+    with caplog.at_level(logging.INFO):
+        transformer.fit(dataframe)
+    assert caplog.messages[0].startswith(
+        "Skipping 'FilterTransformer.fit' as there are no parameters available to fit"
+    )
+
+
+def test_filter_transformer_fit_transform(dataframe: pl.DataFrame) -> None:
+    transformer = Filter(predicate="col1 > 2 AND col4 != 'e'")
+    out = transformer.fit_transform(dataframe)
+    assert_frame_equal(
+        out,
+        pl.DataFrame(
+            {"col1": [3, 4], "col2": ["3", "4"], "col3": ["3", "4"], "col4": ["c", "d"]},
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+        ),
+    )
+
+
+def test_filter_transformer_transform_sql(dataframe: pl.DataFrame) -> None:
+    transformer = Filter(predicate="col4 IN ('a', 'c')")
+    out = transformer.transform(dataframe)
+    assert_frame_equal(
+        out,
+        pl.DataFrame(
+            {"col1": [1, 3], "col2": ["1", "3"], "col3": ["1", "3"], "col4": ["a", "c"]},
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+        ),
+    )
+
+
+def test_filter_transformer_transform_expr(dataframe: pl.DataFrame) -> None:
+    transformer = Filter(predicate=pl.col("col1").is_between(2, 3))
+    out = transformer.transform(dataframe)
+    assert_frame_equal(
+        out,
+        pl.DataFrame(
+            {"col1": [2, 3], "col2": ["2", "3"], "col3": ["2", "3"], "col4": ["b", "c"]},
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+        ),
+    )
+
+
+def test_filter_transformer_transform_empty_row() -> None:
+    transformer = Filter(predicate="col1 > 2")
+    out = transformer.transform(
+        pl.DataFrame({"col1": [], "col2": []}, schema={"col1": pl.Int64, "col2": pl.String})
+    )
+    assert_frame_equal(
+        out, pl.DataFrame({"col1": [], "col2": []}, schema={"col1": pl.Int64, "col2": pl.String})
+    )
+
+
+def test_filter_transformer_get_input_columns() -> None:
+    columns = Filter(predicate="col1 > 2 AND col4 != col1").get_input_columns()
+    assert sorted(columns) == ["col1", "col4"]
+
+
+def test_filter_transformer_get_output_columns() -> None:
+    assert Filter(predicate="col1 > 2").get_output_columns() == ()
+
+
+def test_filter_transformer_find_required_columns() -> None:
+    assert Filter(predicate="col4 = 'a'").find_required_columns(["col1", "col2"]) == (
+        "col1",
+        "col2",
+        "col4",
+    )
+
+
+def test_filter_transformer_get_row_filter(dataframe: pl.DataFrame) -> None:
+    predicate = Filter(predicate="col1 > 2").get_row_filter()
+    assert dataframe.filter(predicate)["col1"].to_list() == [3, 4, 5]
+
+
+@pytest.mark.parametrize(
+    "predicate",
+    [
+        "col1 > 2 AND col4 != 'e'",
+        "col4 IN ('a', 'b') OR col1 IS NULL",
+        "col1 BETWEEN 2 AND 4",
+        "NOT (col1 > 2)",
+        pl.col("col2") != pl.col("col3"),
+        pl.col("col1").is_between(2, 4, closed="left") & pl.col("col4").is_not_null(),
+        ~pl.col("col4").is_in(["a", "b"]),
+        pl.lit(True),
+    ],
+)
+def test_filter_transformer_get_row_filter_row_by_row(
+    dataframe: pl.DataFrame, predicate: pl.Expr | str
+) -> None:
+    transformer = Filter(predicate=predicate)
+    row_filter = transformer.get_row_filter()
+    assert row_filter is not None
+    assert_frame_equal(dataframe.filter(row_filter), transformer.transform(dataframe))
+
+
+@pytest.mark.parametrize(
+    "predicate",
+    [
+        "col1 > AVG(col1)",
+        "col1 > 1 AND col1 < MAX(col1)",
+        pl.col("col1") > pl.col("col1").mean(),
+        pl.col("col1").is_first_distinct(),
+        pl.col("col1").rank() <= 2,
+        pl.col("col1").over("col4") > 1,
+        pl.col("col1") == pl.lit(pl.Series([1, 2, 3, 4, 5])),
+        pl.lit(pl.Series([True, False, True, False, True])),
+    ],
+)
+def test_filter_transformer_get_row_filter_not_row_by_row(predicate: pl.Expr | str) -> None:
+    assert Filter(predicate=predicate).get_row_filter() is None
+
+
+############################################
+#     Tests for FilterRangeTransformer     #
+############################################
+
+
+def test_filter_range_transformer_repr() -> None:
+    assert (
+        repr(FilterRange(col="col1", start=2, end=4))
+        == "FilterRangeTransformer(col='col1', start=2, end=4)"
+    )
+
+
+def test_filter_range_transformer_str() -> None:
+    assert (
+        str(FilterRange(col="col1", start=2, end=4))
+        == "FilterRangeTransformer(col='col1', start=2, end=4)"
+    )
+
+
+def test_filter_range_transformer_equal_true() -> None:
+    assert FilterRange(col="col1", start=2, end=4).equal(FilterRange(col="col1", start=2, end=4))
+
+
+def test_filter_range_transformer_equal_false_different_col() -> None:
+    assert not FilterRange(col="col1", start=2, end=4).equal(
+        FilterRange(col="col2", start=2, end=4)
+    )
+
+
+def test_filter_range_transformer_equal_false_different_start() -> None:
+    assert not FilterRange(col="col1", start=2, end=4).equal(FilterRange(col="col1", end=4))
+
+
+def test_filter_range_transformer_equal_false_different_end() -> None:
+    assert not FilterRange(col="col1", start=2, end=4).equal(FilterRange(col="col1", start=2))
+
+
+def test_filter_range_transformer_equal_false_different_type() -> None:
+    assert not FilterRange(col="col1", start=2, end=4).equal(42)
+
+
+def test_filter_range_transformer_fit(
+    dataframe: pl.DataFrame, caplog: pytest.LogCaptureFixture
+) -> None:
+    transformer = FilterRange(col="col1", start=2, end=4)
+    with caplog.at_level(logging.INFO):
+        transformer.fit(dataframe)
+    assert caplog.messages[0].startswith(
+        "Skipping 'FilterRangeTransformer.fit' as there are no parameters available to fit"
+    )
+
+
+def test_filter_range_transformer_transform(dataframe: pl.DataFrame) -> None:
+    transformer = FilterRange(col="col1", start=2, end=4)
+    out = transformer.transform(dataframe)
+    assert_frame_equal(
+        out,
+        pl.DataFrame(
+            {"col1": [2, 3], "col2": ["2", "3"], "col3": ["2", "3"], "col4": ["b", "c"]},
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+        ),
+    )
+
+
+def test_filter_range_transformer_transform_start(dataframe: pl.DataFrame) -> None:
+    transformer = FilterRange(col="col1", start=4)
+    out = transformer.transform(dataframe)
+    assert out["col1"].to_list() == [4, 5]
+
+
+def test_filter_range_transformer_transform_end(dataframe: pl.DataFrame) -> None:
+    transformer = FilterRange(col="col4", end="c")
+    out = transformer.transform(dataframe)
+    assert out["col4"].to_list() == ["a", "b"]
+
+
+def test_filter_range_transformer_transform_null() -> None:
+    transformer = FilterRange(col="col1")
+    out = transformer.transform(pl.DataFrame({"col1": [1, None, 3]}))
+    assert_frame_equal(out, pl.DataFrame({"col1": [1, 3]}))
+
+
+def test_filter_range_transformer_get_input_columns() -> None:
+    assert FilterRange(col="col1", start=2, end=4).get_input_columns() == ("col1",)
+
+
+def test_filter_range_transformer_get_output_columns() -> None:
+    assert FilterRange(col="col1", start=2, end=4).get_output_columns() == ()
+
+
+###########################################
+#     Tests for FilterIsInTransformer     #
+###########################################
+
+
+def test_filter_is_in_transformer_repr() -> None:
+    assert (
+        repr(FilterIsIn(col="col4", values=["a", "c"]))
+        == "FilterIsInTransformer(col='col4', values=('a', 'c'))"
+    )
+
+
+def test_filter_is_in_transformer_str() -> None:
+    assert (
+        str(FilterIsIn(col="col4", values=["a", "c"]))
+        == "FilterIsInTransformer(col='col4', values=('a', 'c'))"
+    )
+
+
+def test_filter_is_in_transformer_equal_true() -> None:
+    assert FilterIsIn(col="col4", values=["a", "c"]).equal(
+        FilterIsIn(col="col4", values=["a", "c"])
+    )
+
+
+def test_filter_is_in_transformer_equal_false_different_col() -> None:
+    assert not FilterIsIn(col="col4", values=["a", "c"]).equal(
+        FilterIsIn(col="col3", values=["a", "c"])
+    )
+
+
+def test_filter_is_in_transformer_equal_false_different_values() -> None:
+    assert not FilterIsIn(col="col4", values=["a", "c"]).equal(
+        FilterIsIn(col="col4", values=["a", "b"])
+    )
+
+
+def test_filter_is_in_transformer_equal_false_different_type() -> None:
+    assert not FilterIsIn(col="col4", values=["a", "c"]).equal(42)
+
+
+def test_filter_is_in_transformer_fit(
+    dataframe: pl.DataFrame, caplog: pytest.LogCaptureFixture
+) -> None:
+    transformer = FilterIsIn(col="col4", values=["a", "c"])
+    with caplog.at_level(logging.INFO):
+        transformer.fit(dataframe)
+    assert caplog.messages[0].startswith(
+        "Skipping 'FilterIsInTransformer.fit' as there are no parameters available to fit"
+    )
+
+
+def test_filter_is_in_transformer_transform(dataframe: pl.DataFrame) -> None:
+    transformer = FilterIsIn(col="col4", values=["a", "c", "e"])
+    out = transformer.transform(dataframe)
+    assert_frame_equal(
+        out,
+        pl.DataFrame(
+            {
+                "col1": [1, 3, 5],
+                "col2": ["1", "3", "5"],
+                "col3": ["1", "3", "5"],
+                "col4": ["a", "c", "e"],
+            },
+            schema={"col1": pl.Int64, "col2": pl.String, "col3": pl.String, "col4": pl.String},
+        ),
+    )
+
+
+def test_filter_is_in_transformer_transform_null() -> None:
+    transformer = FilterIsIn(col="col1", values=[1, None])
+    out = transformer.transform(pl.DataFrame({"col1": [1, None, 3]}))
+    assert_frame_equal(out, pl.DataFrame({"col1": [1, None]}))
+
+
+def test_filter_is_in_transformer_get_input_columns() -> None:
+    assert FilterIsIn(col="col4", values=["a", "c"]).get_input_columns() == ("col4",)
+
+
+def test_filter_is_in_transformer_get_output_columns() -> None:
+    assert FilterIsIn(col="col4", values=["a", "c"]).get_output_columns() == ()
@@ -223,3 +223,28 @@ def test_column_selection_transformer_transform_missing_policy_warn(
         out,
         pl.DataFrame({"col1": ["2020-1-1", "2020-1-2", "2020-1-31", "2020-12-31", None]}),
     )
+
+
+def test_column_selection_transformer_get_output_columns() -> None:
+    assert ColumnSelection(columns=["col1", "col2"]).get_output_columns() == ("col1", "col2")
+
+
+def test_column_selection_transformer_find_required_columns() -> None:
+    assert ColumnSelection(columns=["col1", "col2"]).find_required_columns() == ("col1", "col2")
+
+
+def test_column_selection_transformer_find_required_columns_subset() -> None:
+    assert ColumnSelection(columns=["col1", "col2"]).find_required_columns(["col1"]) == (
+        "col1",
+        "col2",
+    )
+
+
+def test_column_selection_transformer_find_required_columns_exclude_columns() -> None:
+    assert ColumnSelection(
+        columns=["col1", "col2", "col3"], exclude_columns=["col2"]
+    ).find_required_columns() == ("col1", "col3")
+
+
+def test_column_selection_transformer_find_required_columns_all() -> None:
+    assert ColumnSelection(columns=None, exclude_columns=["col2"]).find_required_columns() is None
@@ -1,12 +1,33 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING
+from unittest.mock import patch
 
 import polars as pl
 import pytest
 from polars.testing import assert_frame_equal
 
-from grizz.transformer import InplaceCast, Sequential
+from grizz.exceptions import ColumnExistsError
+from grizz.testing.fixture import sklearn_available
+from grizz.transformer import (
+    ColumnEqual,
+    ColumnSelection,
+    CopyColumn,
+    DiffHorizontal,
+    DropNullRow,
+    Filter,
+    FilterIsIn,
+    FilterRange,
+    Function,
+    InplaceCast,
+    InplaceStandardScaler,
+    Sequential,
+    Sort,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
 
 
 @pytest.fixture
@@ -87,6 +108,29 @@ def test_sequential_transformer_equal_false_different_transformers() -> None:
     )
 
 
+def test_sequential_transformer_equal_false_different_fuse() -> None:
+    assert not Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)]).equal(
+        Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)], fuse=True)
+    )
+
+
+def test_sequential_transformer_equal_false_different_diagnostics() -> None:
+    assert not Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)]).equal(
+        Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)], diagnostics="off")
+    )
+
+
+def test_sequential_transformer_equal_false_different_cache(tmp_path: Path) -> None:
+    assert not Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)]).equal(
+        Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)], cache=tmp_path)
+    )
+
+
+def test_sequential_transformer_incorrect_diagnostics() -> None:
+    with pytest.raises(ValueError, match="Incorrect diagnostics level: incorrect"):
+        Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)], diagnostics="incorrect")
+
+
 def test_sequential_transformer_equal_false_different_type() -> None:
     assert not Sequential(
         [
@@ -198,3 +242,363 @@ def test_sequential_transformer_transform_2(dataframe: pl.DataFrame) -> None:
             schema={"col1": pl.Float32, "col2": pl.Int64, "col3": pl.String},
         ),
     )
+
+
+@pytest.mark.parametrize("fuse", [True, False])
+def test_sequential_transformer_transform_fuse(dataframe: pl.DataFrame, fuse: bool) -> None:
+    transformer = Sequential(
+        [
+            InplaceCast(columns=["col2"], dtype=pl.Int64),
+            CopyColumn(in_col="col1", out_col="col4"),
+            DiffHorizontal(in1_col="col4", in2_col="col2", out_col="diff"),
+            DropNullRow(),
+            ColumnEqual(in1_col="col1", in2_col="col2", out_col="equal"),
+        ],
+        fuse=fuse,
+    )
+    out = transformer.transform(dataframe)
+    assert_frame_equal(
+        out,
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5],
+                "col2": [1, 2, 3, 4, 5],
+                "col3": ["a ", " b", "  c  ", "d", "e"],
+                "col4": [1, 2, 3, 4, 5],
+                "diff": [0, 0, 0, 0, 0],
+                "equal": [True, True, True, True, True],
+            },
+            schema={
+                "col1": pl.Int64,
+                "col2": pl.Int64,
+                "col3": pl.String,
+                "col4": pl.Int64,
+                "diff": pl.Int64,
+                "equal": pl.Boolean,
+            },
+        ),
+    )
+
+
+def test_sequential_transformer_fit_transform_fuse(dataframe: pl.DataFrame) -> None:
+    transformer = Sequential(
+        [
+            InplaceCast(columns=["col1"], dtype=pl.Float32),
+            InplaceCast(columns=["col2"], dtype=pl.Int64),
+        ],
+        fuse=True,
+    )
+    out = transformer.fit_transform(dataframe)
+    assert_frame_equal(
+        out,
+        pl.DataFrame(
+            {
+                "col1": [1.0, 2.0, 3.0, 4.0, 5.0],
+                "col2": [1, 2, 3, 4, 5],
+                "col3": ["a ", " b", "  c  ", "d", "e"],
+            },
+            schema={"col1": pl.Float32, "col2": pl.Int64, "col3": pl.String},
+        ),
+    )
+
+
+def test_sequential_transformer_transform_fuse_exist_policy_raise(
+    dataframe: pl.DataFrame,
+) -> None:
+    transformer = Sequential(
+        [CopyColumn(in_col="col1", out_col="out"), CopyColumn(in_col="col2", out_col="out")],
+        fuse=True,
+    )
+    with pytest.raises(ColumnExistsError, match="column 'out' already exists in the DataFrame"):
+        transformer.transform(dataframe)
+
+
+@pytest.mark.parametrize("fuse", [True, False])
+def test_sequential_transformer_transform_batches(dataframe: pl.DataFrame, fuse: bool) -> None:
+    transformer = Sequential(
+        [
+            InplaceCast(columns=["col1"], dtype=pl.Float32),
+            DropNullRow(columns=["col2"]),
+            CopyColumn(in_col="col2", out_col="out"),
+        ],
+        fuse=fuse,
+    )
+    outs = list(transformer.transform_batches(dataframe.iter_slices(n_rows=2)))
+    assert len(outs) == 3
+    assert_frame_equal(pl.concat(outs), transformer.transform(dataframe))
+
+
+def test_sequential_transformer_transform_batches_lazy(dataframe: pl.DataFrame) -> None:
+    transformer = Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)])
+    frames = iter([dataframe.slice(0, 2), dataframe.slice(2, 3)])
+    outs = transformer.transform_batches(frames)
+    assert_frame_equal(
+        next(outs),
+        pl.DataFrame(
+            {"col1": [1.0, 2.0], "col2": ["1", "2"], "col3": ["a ", " b"]},
+            schema={"col1": pl.Float32, "col2": pl.String, "col3": pl.String},
+        ),
+    )
+    # the second batch is not consumed before it is requested
+    assert len(list(frames)) == 1
+
+
+def test_sequential_transformer_transform_batches_empty() -> None:
+    transformer = Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)])
+    assert list(transformer.transform_batches([])) == []
+
+
+@pytest.mark.parametrize("fuse", [True, False])
+def test_sequential_transformer_transform_batches_not_supported(
+    dataframe: pl.DataFrame, fuse: bool
+) -> None:
+    transformer = Sequential(
+        [InplaceCast(columns=["col1"], dtype=pl.Float32), Sort(columns=["col1"])], fuse=fuse
+    )
+    with pytest.raises(ValueError, match="cannot transform the DataFrame batch by batch"):
+        transformer.transform_batches(dataframe.iter_slices(n_rows=2))
+
+
+def test_sequential_transformer_supports_batches_true() -> None:
+    assert Sequential(
+        [InplaceCast(columns=["col1"], dtype=pl.Float32), DropNullRow(columns=["col2"])]
+    ).supports_batches()
+
+
+def test_sequential_transformer_supports_batches_false() -> None:
+    assert not Sequential(
+        [InplaceCast(columns=["col1"], dtype=pl.Float32), Sort(columns=["col1"])]
+    ).supports_batches()
+
+
+def test_sequential_transformer_supports_batches_empty() -> None:
+    assert Sequential([]).supports_batches()
+
+
+@sklearn_available
+def test_sequential_transformer_transform_batches_fitted(dataframe: pl.DataFrame) -> None:
+    transformer = Sequential(
+        [
+            InplaceCast(columns=["col1"], dtype=pl.Float64),
+            InplaceStandardScaler(columns=["col1"]),
+        ]
+    )
+    transformer.fit_transform(dataframe)
+    outs = list(transformer.transform_batches(dataframe.iter_slices(n_rows=2)))
+    assert_frame_equal(pl.concat(outs), transformer.transform(dataframe))
+
+
+def test_sequential_transformer_transform_diagnostics_off(
+    dataframe: pl.DataFrame, caplog: pytest.LogCaptureFixture
+) -> None:
+    transformer = Sequential([DropNullRow(columns=["col1"])], diagnostics="off")
+    with caplog.at_level(logging.INFO):
+        transformer.transform(dataframe)
+    assert not any(message.startswith("DataFrame") for message in caplog.messages)
+
+
+def test_sequential_transformer_transform_diagnostics_summary(
+    dataframe: pl.DataFrame, caplog: pytest.LogCaptureFixture
+) -> None:
+    transformer = Sequential(
+        [InplaceCast(columns=["col1"], dtype=pl.Float32)], diagnostics="summary"
+    )
+    with caplog.at_level(logging.INFO):
+        transformer.transform(dataframe)
+    assert "DataFrame shape did not changed" in caplog.messages
+
+
+def test_sequential_transformer_transform_cache(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    transformer = Sequential(
+        [
+            InplaceCast(columns=["col1"], dtype=pl.Float32),
+            CopyColumn(in_col="col2", out_col="out"),
+        ],
+        cache=tmp_path,
+    )
+    out = transformer.transform(dataframe)
+    assert_frame_equal(out, Sequential(transformer._transformers).transform(dataframe))
+    assert len(list(tmp_path.glob("*.arrow"))) == 2
+
+
+def test_sequential_transformer_transform_cache_hit(
+    tmp_path: Path, dataframe: pl.DataFrame
+) -> None:
+    transformer = Sequential(
+        [
+            InplaceCast(columns=["col1"], dtype=pl.Float32),
+            CopyColumn(in_col="col2", out_col="out"),
+        ],
+        cache=tmp_path,
+    )
+    expected = transformer.transform(dataframe)
+    with patch(
+        "grizz.transformer.CopyColumnTransformer.transform", side_effect=RuntimeError
+    ) as mock:
+        out = transformer.transform(dataframe)
+    mock.assert_not_called()
+    assert_frame_equal(out, expected)
+
+
+def test_sequential_transformer_transform_cache_prefix(
+    tmp_path: Path, dataframe: pl.DataFrame
+) -> None:
+    Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)], cache=tmp_path).transform(
+        dataframe
+    )
+    transformer = Sequential(
+        [
+            InplaceCast(columns=["col1"], dtype=pl.Float32),
+            CopyColumn(in_col="col2", out_col="out"),
+        ],
+        cache=tmp_path,
+    )
+    with patch("grizz.transformer.InplaceCastTransformer.transform") as mock:
+        out = transformer.transform(dataframe)
+    mock.assert_not_called()
+    assert_frame_equal(
+        out,
+        pl.DataFrame(
+            {
+                "col1": [1.0, 2.0, 3.0, 4.0, 5.0],
+                "col2": ["1", "2", "3", "4", "5"],
+                "col3": ["a ", " b", "  c  ", "d", "e"],
+                "out": ["1", "2", "3", "4", "5"],
+            },
+            schema={"col1": pl.Float32, "col2": pl.String, "col3": pl.String, "out": pl.String},
+        ),
+    )
+    assert len(list(tmp_path.glob("*.arrow"))) == 2
+
+
+def test_sequential_transformer_transform_cache_different_input(
+    tmp_path: Path, dataframe: pl.DataFrame
+) -> None:
+    transformer = Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)], cache=tmp_path)
+    transformer.transform(dataframe)
+    out = transformer.transform(dataframe.head(2))
+    assert out.shape == (2, 3)
+    assert len(list(tmp_path.glob("*.arrow"))) == 2
+
+
+def test_sequential_transformer_fit_transform_cache(
+    tmp_path: Path, dataframe: pl.DataFrame
+) -> None:
+    transformer = Sequential([InplaceCast(columns=["col1"], dtype=pl.Float32)], cache=tmp_path)
+    expected = transformer.fit_transform(dataframe)
+    with patch("grizz.transformer.InplaceCastTransformer.transform") as mock:
+        out = transformer.transform(dataframe)
+    mock.assert_not_called()
+    assert_frame_equal(out, expected)
+
+
+def test_sequential_transformer_find_required_columns() -> None:
+    transformer = Sequential(
+        [
+            InplaceCast(columns=["col1"], dtype=pl.Float32),
+            CopyColumn(in_col="col2", out_col="col5"),
+            ColumnSelection(columns=["col1", "col5"]),
+        ]
+    )
+    assert transformer.find_required_columns() == ("col2", "col1")
+
+
+def test_sequential_transformer_find_required_columns_without_selection() -> None:
+    transformer = Sequential(
+        [InplaceCast(columns=["col1"], dtype=pl.Float32), CopyColumn(in_col="col2", out_col="col5")]
+    )
+    assert transformer.find_required_columns() is None
+
+
+def test_sequential_transformer_find_required_columns_output_columns() -> None:
+    transformer = Sequential(
+        [InplaceCast(columns=["col1"], dtype=pl.Float32), CopyColumn(in_col="col2", out_col="col5")]
+    )
+    assert transformer.find_required_columns(["col5", "col3"]) == ("col3", "col2", "col1")
+
+
+def test_sequential_transformer_find_required_columns_unknown() -> None:
+    transformer = Sequential(
+        [
+            Function(func=lambda frame: frame),
+            ColumnSelection(columns=["col1"]),
+        ]
+    )
+    assert transformer.find_required_columns() is None
+
+
+def test_sequential_transformer_find_required_columns_empty() -> None:
+    assert Sequential([]).find_required_columns(["col1"]) == ("col1",)
+
+
+def test_sequential_transformer_find_required_columns_transform(dataframe: pl.DataFrame) -> None:
+    transformer = Sequential(
+        [
+            InplaceCast(columns=["col1"], dtype=pl.Float32),
+            CopyColumn(in_col="col2", out_col="col5"),
+            ColumnSelection(columns=["col1", "col5"]),
+        ]
+    )
+    columns = transformer.find_required_columns()
+    assert_frame_equal(
+        transformer.transform(dataframe.select(columns)), transformer.transform(dataframe)
+    )
+
+
+def test_sequential_transformer_get_row_filter(dataframe: pl.DataFrame) -> None:
+    transformer = Sequential(
+        [
+            FilterRange(col="col1", start=2),
+            FilterIsIn(col="col2", values=["1", "2", "3"]),
+            InplaceCast(columns=["col1"], dtype=pl.Float32),
+            FilterRange(col="col1", end=3),
+        ]
+    )
+    assert dataframe.filter(transformer.get_row_filter())["col1"].to_list() == [2, 3]
+
+
+def test_sequential_transformer_get_row_filter_first_transformer() -> None:
+    transformer = Sequential(
+        [InplaceCast(columns=["col1"], dtype=pl.Float32), FilterRange(col="col1", end=3)]
+    )
+    assert transformer.get_row_filter() is None
+
+
+def test_sequential_transformer_get_row_filter_not_row_by_row(dataframe: pl.DataFrame) -> None:
+    transformer = Sequential(
+        [
+            FilterRange(col="col1", start=2),
+            Filter(predicate=pl.col("col1") > pl.col("col1").mean()),
+            FilterRange(col="col1", end=5),
+        ]
+    )
+    assert dataframe.filter(transformer.get_row_filter())["col1"].to_list() == [2, 3, 4, 5]
+
+
+def test_sequential_transformer_get_row_filter_nested(dataframe: pl.DataFrame) -> None:
+    transformer = Sequential(
+        [
+            Sequential(
+                [FilterRange(col="col1", end=4), InplaceCast(columns=["col1"], dtype=pl.Float32)]
+            ),
+            FilterRange(col="col1", start=2),
+        ]
+    )
+    assert dataframe.filter(transformer.get_row_filter())["col1"].to_list() == [1, 2, 3]
+
+
+def test_sequential_transformer_get_row_filter_empty() -> None:
+    assert Sequential([]).get_row_filter() is None
+
+
+def test_sequential_transformer_get_row_filter_transform(dataframe: pl.DataFrame) -> None:
+    transformer = Sequential(
+        [
+            FilterIsIn(col="col2", values=["1", "3", "5"]),
+            InplaceCast(columns=["col1"], dtype=pl.Float32),
+        ]
+    )
+    assert_frame_equal(
+        transformer.transform(dataframe.filter(transformer.get_row_filter())),
+        transformer.transform(dataframe),
+    )
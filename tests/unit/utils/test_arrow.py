@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.testing.fixture import pyarrow_available
+from grizz.utils.arrow import get_file_format, write_frames
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def frames() -> list[pl.DataFrame]:
+    return [
+        pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}),
+        pl.DataFrame({"col1": [4, 5], "col2": ["d", "e"]}),
+    ]
+
+
+#####################################
+#     Tests for get_file_format     #
+#####################################
+
+
+@pytest.mark.parametrize(
+    ("filename", "file_format"),
+    [
+        ("data.parquet", "parquet"),
+        ("data.pq", "parquet"),
+        ("data.arrow", "ipc"),
+        ("data.feather", "ipc"),
+        ("data.IPC", "ipc"),
+    ],
+)
+def test_get_file_format(filename: str, file_format: str) -> None:
+    assert get_file_format(f"/path/to/{filename}") == file_format
+
+
+def test_get_file_format_incorrect() -> None:
+    with pytest.raises(ValueError, match=r"Incorrect file extension: '.csv'"):
+        get_file_format("/path/to/data.csv")
+
+
+##################################
+#     Tests for write_frames     #
+##################################
+
+
+@pyarrow_available
+def test_write_frames_parquet(tmp_path: Path, frames: list[pl.DataFrame]) -> None:
+    path = tmp_path.joinpath("folder/data.parquet")
+    assert write_frames(iter(frames), path) == 5
+    assert_frame_equal(
+        pl.read_parquet(path),
+        pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]}),
+    )
+
+
+@pyarrow_available
+def test_write_frames_ipc(tmp_path: Path, frames: list[pl.DataFrame]) -> None:
+    path = tmp_path.joinpath("folder/data.arrow")
+    assert write_frames(iter(frames), path) == 5
+    assert_frame_equal(
+        pl.read_ipc(path),
+        pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]}),
+    )
+
+
+@pyarrow_available
+def test_write_frames_file_format(tmp_path: Path, frames: list[pl.DataFrame]) -> None:
+    path = tmp_path.joinpath("data.bin")
+    assert write_frames(frames, path, file_format="ipc") == 5
+    assert pl.read_ipc(path).shape == (5, 2)
+
+
+@pyarrow_available
+def test_write_frames_with_kwargs(tmp_path: Path, frames: list[pl.DataFrame]) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    assert write_frames(frames, path, compression="gzip") == 5
+    assert pl.read_parquet(path).shape == (5, 2)
+
+
+@pyarrow_available
+def test_write_frames_empty(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    assert write_frames([], path) == 0
+    assert pl.read_parquet(path).shape == (0, 0)
+
+
+@pyarrow_available
+def test_write_frames_incorrect_file_format(tmp_path: Path, frames: list[pl.DataFrame]) -> None:
+    with pytest.raises(ValueError, match=r"Incorrect file format: 'csv'"):
+        write_frames(frames, tmp_path.joinpath("data.csv"), file_format="csv")
+
+
+@pyarrow_available
+def test_write_frames_different_schemas(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    frames = [pl.DataFrame({"col1": [1, 2, 3]}), pl.DataFrame({"col2": [4, 5]})]
+    with pytest.raises(ValueError, match=r"The schema of the DataFrame is different"):
+        write_frames(frames, path)
+    assert list(tmp_path.iterdir()) == []
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import os
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.utils.cache import DiskFrameCache
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def dataframe() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "col1": [1, 2, 3, 4, 5],
+            "col2": ["1", "2", "3", "4", "5"],
+            "col3": ["a", "b", "c", "d", "e"],
+        }
+    )
+
+
+####################################
+#     Tests for DiskFrameCache     #
+####################################
+
+
+def test_disk_frame_cache_repr(tmp_path: Path) -> None:
+    assert repr(DiskFrameCache(tmp_path)).startswith("DiskFrameCache(path=")
+
+
+def test_disk_frame_cache_incorrect_max_size(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="max_size must be greater or equal to 0"):
+        DiskFrameCache(tmp_path, max_size=-1)
+
+
+def test_disk_frame_cache_path(tmp_path: Path) -> None:
+    assert DiskFrameCache(tmp_path).path == tmp_path
+
+
+def test_disk_frame_cache_equal_true(tmp_path: Path) -> None:
+    assert DiskFrameCache(tmp_path, max_size=100).equal(DiskFrameCache(tmp_path, max_size=100))
+
+
+def test_disk_frame_cache_equal_false_different_path(tmp_path: Path) -> None:
+    assert not DiskFrameCache(tmp_path).equal(DiskFrameCache(tmp_path.joinpath("cache")))
+
+
+def test_disk_frame_cache_equal_false_different_max_size(tmp_path: Path) -> None:
+    assert not DiskFrameCache(tmp_path).equal(DiskFrameCache(tmp_path, max_size=100))
+
+
+def test_disk_frame_cache_equal_false_different_type(tmp_path: Path) -> None:
+    assert not DiskFrameCache(tmp_path).equal(42)
+
+
+def test_disk_frame_cache_get_missing(tmp_path: Path) -> None:
+    assert DiskFrameCache(tmp_path).get("abc") is None
+
+
+def test_disk_frame_cache_get_evicted_after_read(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    cache = DiskFrameCache(tmp_path)
+    cache.set("abc", dataframe)
+    # Another process evicts the entry after it is read.
+    with patch("grizz.utils.cache.os.utime", side_effect=FileNotFoundError):
+        assert_frame_equal(cache.get("abc"), dataframe)
+
+
+def test_disk_frame_cache_set_get(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    cache = DiskFrameCache(tmp_path.joinpath("cache"))
+    cache.set("abc", dataframe)
+    assert cache.contains("abc")
+    assert_frame_equal(cache.get("abc"), dataframe)
+
+
+def test_disk_frame_cache_set_no_tmp_file(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    cache = DiskFrameCache(tmp_path)
+    cache.set("abc", dataframe)
+    assert [path.name for path in tmp_path.iterdir()] == ["abc.arrow"]
+
+
+def test_disk_frame_cache_contains_false(tmp_path: Path) -> None:
+    assert not DiskFrameCache(tmp_path).contains("abc")
+
+
+def test_disk_frame_cache_clear(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    cache = DiskFrameCache(tmp_path)
+    cache.set("abc", dataframe)
+    cache.set("def", dataframe)
+    cache.clear()
+    assert not cache.contains("abc")
+    assert not cache.contains("def")
+
+
+def test_disk_frame_cache_clear_missing_dir(tmp_path: Path) -> None:
+    DiskFrameCache(tmp_path.joinpath("cache")).clear()
+
+
+def test_disk_frame_cache_evict(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    cache = DiskFrameCache(tmp_path)
+    cache.set("abc", dataframe)
+    cache.set("def", dataframe)
+    size = tmp_path.joinpath("abc.arrow").stat().st_size
+    os.utime(tmp_path.joinpath("abc.arrow"), (0, 0))
+    cache = DiskFrameCache(tmp_path, max_size=size)
+    cache.evict()
+    assert not cache.contains("abc")
+    assert cache.contains("def")
+
+
+def test_disk_frame_cache_evict_lru(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    cache = DiskFrameCache(tmp_path)
+    cache.set("abc", dataframe)
+    cache.set("def", dataframe)
+    size = tmp_path.joinpath("abc.arrow").stat().st_size
+    os.utime(tmp_path.joinpath("abc.arrow"), (0, 0))
+    os.utime(tmp_path.joinpath("def.arrow"), (1, 1))
+    cache.get("abc")  # abc becomes the most recently used
+    cache = DiskFrameCache(tmp_path, max_size=size)
+    cache.evict()
+    assert cache.contains("abc")
+    assert not cache.contains("def")
+
+
+def test_disk_frame_cache_set_evict(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    cache = DiskFrameCache(tmp_path, max_size=0)
+    cache.set("abc", dataframe)
+    assert not cache.contains("abc")
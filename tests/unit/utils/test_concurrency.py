@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import threading
+from contextvars import ContextVar
+
+import pytest
+
+from grizz.utils.concurrency import map_in_threads
+
+_VALUE: ContextVar[int] = ContextVar("value", default=0)
+
+
+####################################
+#     Tests for map_in_threads     #
+####################################
+
+
+@pytest.mark.parametrize("max_workers", [0, 1, 2, 8])
+def test_map_in_threads(max_workers: int) -> None:
+    assert list(map_in_threads(lambda x: x * 2, range(10), max_workers=max_workers)) == [
+        0,
+        2,
+        4,
+        6,
+        8,
+        10,
+        12,
+        14,
+        16,
+        18,
+    ]
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_map_in_threads_empty(max_workers: int) -> None:
+    assert list(map_in_threads(lambda x: x, [], max_workers=max_workers)) == []
+
+
+def test_map_in_threads_sequential_current_thread() -> None:
+    thread_ids = list(map_in_threads(lambda _: threading.get_ident(), range(3)))
+    assert thread_ids == [threading.get_ident()] * 3
+
+
+def test_map_in_threads_lazy() -> None:
+    items = iter(range(10))
+    out = map_in_threads(lambda x: x, items, max_workers=2)
+    assert next(out) == 0
+    # Only a few items are read before the first result is returned.
+    assert len(list(items)) >= 7
+
+
+def test_map_in_threads_context() -> None:
+    token = _VALUE.set(42)
+    try:
+        assert list(map_in_threads(lambda _: _VALUE.get(), range(4), max_workers=2)) == [42] * 4
+    finally:
+        _VALUE.reset(token)
+
+
+def fail_on_two(x: int) -> int:
+    if x == 2:
+        msg = "error"
+        raise RuntimeError(msg)
+    return x
+
+
+@pytest.mark.parametrize("max_workers", [1, 2])
+def test_map_in_threads_exception(max_workers: int) -> None:
+    with pytest.raises(RuntimeError, match="error"):
+        list(map_in_threads(fail_on_two, range(5), max_workers=max_workers))
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import pytest
+
+from grizz.utils.diagnostics import (
+    check_diagnostics_level,
+    diagnostics_level,
+    get_diagnostics_level,
+    is_diagnostics_enabled,
+    set_diagnostics_level,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Generator
+
+
+@pytest.fixture(autouse=True)
+def _reset_diagnostics_level() -> Generator[None, None, None]:
+    yield
+    set_diagnostics_level("full")
+
+
+#############################################
+#     Tests for check_diagnostics_level     #
+#############################################
+
+
+@pytest.mark.parametrize("level", ["off", "summary", "full"])
+def test_check_diagnostics_level_valid(level: str) -> None:
+    check_diagnostics_level(level)
+
+
+def test_check_diagnostics_level_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect diagnostics level: incorrect"):
+        check_diagnostics_level("incorrect")
+
+
+###########################################
+#     Tests for get_diagnostics_level     #
+###########################################
+
+
+def test_get_diagnostics_level_default() -> None:
+    assert get_diagnostics_level() == "full"
+
+
+@pytest.mark.parametrize("level", ["off", "summary", "full"])
+def test_set_diagnostics_level(level: str) -> None:
+    set_diagnostics_level(level)
+    assert get_diagnostics_level() == level
+
+
+def test_set_diagnostics_level_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect diagnostics level: incorrect"):
+        set_diagnostics_level("incorrect")
+
+
+#######################################
+#     Tests for diagnostics_level     #
+#######################################
+
+
+@pytest.mark.parametrize("level", ["off", "summary", "full"])
+def test_diagnostics_level(level: str) -> None:
+    set_diagnostics_level("summary")
+    with diagnostics_level(level):
+        assert get_diagnostics_level() == level
+    assert get_diagnostics_level() == "summary"
+
+
+def test_diagnostics_level_none() -> None:
+    set_diagnostics_level("summary")
+    with diagnostics_level(None):
+        assert get_diagnostics_level() == "summary"
+
+
+def test_diagnostics_level_nested() -> None:
+    with diagnostics_level("off"):
+        with diagnostics_level("summary"):
+            assert get_diagnostics_level() == "summary"
+        assert get_diagnostics_level() == "off"
+    assert get_diagnostics_level() == "full"
+
+
+def raise_with_diagnostics_level(level: str) -> None:
+    with diagnostics_level(level):
+        msg = "error"
+        raise RuntimeError(msg)
+
+
+def test_diagnostics_level_exception() -> None:
+    with pytest.raises(RuntimeError, match="error"):
+        raise_with_diagnostics_level("off")
+    assert get_diagnostics_level() == "full"
+
+
+def test_diagnostics_level_incorrect() -> None:
+    with pytest.raises(ValueError, match="Incorrect diagnostics level: incorrect"):  # noqa: SIM117
+        with diagnostics_level("incorrect"):
+            pass
+
+
+############################################
+#     Tests for is_diagnostics_enabled     #
+############################################
+
+
+@pytest.mark.parametrize(
+    ("current", "level", "expected"),
+    [
+        ("off", "summary", False),
+        ("off", "full", False),
+        ("summary", "summary", True),
+        ("summary", "full", False),
+        ("full", "summary", True),
+        ("full", "full", True),
+    ],
+)
+def test_is_diagnostics_enabled(current: str, level: str, expected: bool) -> None:
+    with diagnostics_level(current):
+        assert is_diagnostics_enabled(level) == expected
+
+
+def test_is_diagnostics_enabled_logger_info() -> None:
+    logger = logging.getLogger("grizz.test.diagnostics.info")
+    logger.setLevel(logging.INFO)
+    assert is_diagnostics_enabled(logger=logger)
+
+
+def test_is_diagnostics_enabled_logger_warning() -> None:
+    logger = logging.getLogger("grizz.test.diagnostics.warning")
+    logger.setLevel(logging.WARNING)
+    assert not is_diagnostics_enabled(logger=logger)
@@ -259,6 +259,23 @@ def test_str_dataframe_diff_shape() -> None:
     )
 
 
+def test_str_dataframe_diff_shape_without_estimated_size() -> None:
+    frame1 = pl.DataFrame({"col1": [1, 2, 3, 4, 5], "col2": ["a", "b", "c", "d", "e"]})
+    frame2 = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    assert str_dataframe_diff(orig=frame1, final=frame2, estimated_size=False) == (
+        "DataFrame shape: (5, 2) -> (3, 2) | 2/5 (40.0000 %) rows have been removed"
+    )
+
+
+def test_str_dataframe_diff_type_without_estimated_size() -> None:
+    frame1 = pl.DataFrame({"col1": [1.0, 2.0, 3.0]}, schema={"col1": pl.Float64})
+    frame2 = pl.DataFrame({"col1": [1.0, 2.0, 3.0]}, schema={"col1": pl.Float32})
+    assert (
+        str_dataframe_diff(orig=frame1, final=frame2, estimated_size=False)
+        == "DataFrame shape did not changed"
+    )
+
+
 ##############################################
 #     Tests for str_boolean_series_stats     #
 ##############################################
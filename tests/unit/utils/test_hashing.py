@@ -1,8 +1,22 @@
 from __future__ import annotations
 
+import json
+import threading
+from typing import TYPE_CHECKING
+
+import polars as pl
 import pytest
 
-from grizz.utils.hashing import str_to_sha256
+from grizz.transformer import InplaceCast
+from grizz.utils.hashing import (
+    DataFrameHasher,
+    hash_dataframe,
+    hash_object,
+    str_to_sha256,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 ###################################
 #     Tests for str_to_sha256     #
@@ -14,3 +28,243 @@ def test_str_to_sha256(value: str) -> None:
     out = str_to_sha256(value)
     assert isinstance(out, str)
     assert out != value
+
+
+#####################################
+#     Tests for DataFrameHasher     #
+#####################################
+
+
+def test_dataframe_hasher_repr() -> None:
+    assert repr(DataFrameHasher()) == "DataFrameHasher(num_rows=0)"
+
+
+def test_dataframe_hasher_update() -> None:
+    hasher = DataFrameHasher()
+    hasher.update(pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}))
+    assert hasher.num_rows == 3
+    assert len(hasher.hexdigest()) == 64
+
+
+@pytest.mark.parametrize("n_rows", [1, 2, 3, 5, 10])
+def test_dataframe_hasher_update_chunks(n_rows: int) -> None:
+    frame = pl.DataFrame({"col1": list(range(10)), "col2": [str(i) for i in range(10)]})
+    hasher = DataFrameHasher()
+    for chunk in frame.iter_slices(n_rows=n_rows):
+        hasher.update(chunk)
+    assert hasher.num_rows == 10
+    assert hasher.hexdigest() == hash_dataframe(frame)
+
+
+def test_dataframe_hasher_update_lazyframe() -> None:
+    frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    hasher = DataFrameHasher()
+    hasher.update(frame.lazy())
+    assert hasher.hexdigest() == hash_dataframe(frame)
+
+
+def test_dataframe_hasher_update_empty_chunk() -> None:
+    frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    hasher = DataFrameHasher()
+    hasher.update(frame)
+    hasher.update(frame.clear())
+    assert hasher.hexdigest() == hash_dataframe(frame)
+
+
+def test_dataframe_hasher_update_different_schema() -> None:
+    hasher = DataFrameHasher()
+    hasher.update(pl.DataFrame({"col1": [1, 2, 3]}))
+    with pytest.raises(ValueError, match="The schema of the DataFrame is different"):
+        hasher.update(pl.DataFrame({"col2": [1, 2, 3]}))
+
+
+def test_dataframe_hasher_update_order() -> None:
+    hasher1 = DataFrameHasher()
+    hasher1.update(pl.DataFrame({"col1": [1, 2]}))
+    hasher1.update(pl.DataFrame({"col1": [3, 4]}))
+    hasher2 = DataFrameHasher()
+    hasher2.update(pl.DataFrame({"col1": [3, 4]}))
+    hasher2.update(pl.DataFrame({"col1": [1, 2]}))
+    assert hasher1.hexdigest() != hasher2.hexdigest()
+
+
+def test_dataframe_hasher_state_dict() -> None:
+    hasher = DataFrameHasher()
+    hasher.update(pl.DataFrame({"col1": [1, 2, 3]}))
+    state = hasher.state_dict()
+    assert state["num_rows"] == 3
+    assert state["schema"] == [["col1", "Int64"]]
+    assert json.loads(json.dumps(state)) == state
+
+
+def test_dataframe_hasher_state_dict_empty() -> None:
+    assert DataFrameHasher().state_dict() == {
+        "schema": None,
+        "num_rows": 0,
+        "total": 0,
+        "weighted": 0,
+    }
+
+
+def test_dataframe_hasher_load_state_dict_incremental() -> None:
+    frame = pl.DataFrame({"col1": list(range(10)), "col2": [str(i) for i in range(10)]})
+    hasher = DataFrameHasher()
+    hasher.update(frame.head(6))
+    state = json.loads(json.dumps(hasher.state_dict()))
+
+    hasher = DataFrameHasher()
+    hasher.load_state_dict(state)
+    hasher.update(frame.tail(4))
+    assert hasher.num_rows == 10
+    assert hasher.hexdigest() == hash_dataframe(frame)
+
+
+####################################
+#     Tests for hash_dataframe     #
+####################################
+
+
+def test_hash_dataframe() -> None:
+    out = hash_dataframe(pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}))
+    assert isinstance(out, str)
+    assert len(out) == 64
+
+
+def test_hash_dataframe_same() -> None:
+    assert hash_dataframe(
+        pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    ) == hash_dataframe(pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]}))
+
+
+def test_hash_dataframe_different_values() -> None:
+    assert hash_dataframe(
+        pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    ) != hash_dataframe(pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "d"]}))
+
+
+def test_hash_dataframe_different_order() -> None:
+    assert hash_dataframe(
+        pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    ) != hash_dataframe(pl.DataFrame({"col1": [3, 2, 1], "col2": ["c", "b", "a"]}))
+
+
+def test_hash_dataframe_different_dtype() -> None:
+    assert hash_dataframe(
+        pl.DataFrame({"col1": [1, 2, 3]}, schema={"col1": pl.Int64})
+    ) != hash_dataframe(pl.DataFrame({"col1": [1, 2, 3]}, schema={"col1": pl.Int32}))
+
+
+def test_hash_dataframe_different_column_names() -> None:
+    assert hash_dataframe(pl.DataFrame({"col1": [1, 2, 3]})) != hash_dataframe(
+        pl.DataFrame({"col2": [1, 2, 3]})
+    )
+
+
+def test_hash_dataframe_empty() -> None:
+    assert hash_dataframe(pl.DataFrame()) == hash_dataframe(pl.DataFrame())
+    assert hash_dataframe(pl.DataFrame()) != hash_dataframe(
+        pl.DataFrame({"col1": []}, schema={"col1": pl.Int64})
+    )
+
+
+#################################
+#     Tests for hash_object     #
+#################################
+
+
+def test_hash_object_same() -> None:
+    assert hash_object(InplaceCast(columns=["col1"], dtype=pl.Float32)) == hash_object(
+        InplaceCast(columns=["col1"], dtype=pl.Float32)
+    )
+
+
+def test_hash_object_different() -> None:
+    assert hash_object(InplaceCast(columns=["col1"], dtype=pl.Float32)) != hash_object(
+        InplaceCast(columns=["col1"], dtype=pl.Float64)
+    )
+
+
+def test_hash_object_fitted_state() -> None:
+    transformer = InplaceCast(columns=["col1"], dtype=pl.Float32)
+    fitted = InplaceCast(columns=["col1"], dtype=pl.Float32)
+    fitted._state = {"mean": 1.5}
+    assert hash_object(transformer) != hash_object(fitted)
+
+
+def test_hash_object_dict_order() -> None:
+    assert hash_object({"a": 1, "b": [1, 2]}) == hash_object({"b": [1, 2], "a": 1})
+
+
+def test_hash_object_set() -> None:
+    assert hash_object({"a", "b", "c"}) == hash_object({"c", "b", "a"})
+
+
+def test_hash_object_list_tuple() -> None:
+    assert hash_object([1, 2]) != hash_object((1, 2))
+
+
+def test_hash_object_expr() -> None:
+    assert hash_object(pl.col("col1").is_in([1, 2])) == hash_object(pl.col("col1").is_in([1, 2]))
+    assert hash_object(pl.col("col1").is_in([1, 2])) != hash_object(pl.col("col1").is_in([1, 3]))
+
+
+def test_hash_object_function() -> None:
+    assert hash_object(lambda x: x + 1) == hash_object(lambda x: x + 1)
+    assert hash_object(lambda x: x + 1) != hash_object(lambda x: x + 2)
+
+
+def test_hash_object_function_closure() -> None:
+    def make_func(value: int) -> Callable:
+        return lambda x: x + value
+
+    assert hash_object(make_func(1)) == hash_object(make_func(1))
+    assert hash_object(make_func(1)) != hash_object(make_func(2))
+
+
+def test_hash_object_unsupported() -> None:
+    with pytest.raises(TypeError, match="Cannot compute a stable representation"):
+        hash_object(threading.Lock())
+
+
+def test_hash_dataframe_lazyframe() -> None:
+    frame = pl.DataFrame({"col1": [1, 2, 3], "col2": ["a", "b", "c"]})
+    assert hash_dataframe(frame.lazy()) == hash_dataframe(frame)
+
+
+def test_hash_dataframe_nested() -> None:
+    frame = pl.DataFrame({"col1": [[1, 2], [3]], "col2": [{"a": 1}, {"a": 2}]})
+    assert hash_dataframe(frame) == hash_dataframe(frame.clone())
+    assert hash_dataframe(frame) != hash_dataframe(frame.reverse())
+
+
+def test_hash_dataframe_sample_size() -> None:
+    frame = pl.DataFrame({"col1": list(range(100))})
+    out = hash_dataframe(frame, sample_size=10)
+    assert out == hash_dataframe(frame.lazy(), sample_size=10)
+    assert out != hash_dataframe(frame)
+    # row 1 is not in the sample
+    changed = frame.with_columns(
+        pl.when(pl.int_range(pl.len()) == 1).then(-1).otherwise(pl.col("col1")).alias("col1")
+    )
+    assert out == hash_dataframe(changed, sample_size=10)
+    # row 0 is in the sample
+    changed = frame.with_columns(
+        pl.when(pl.int_range(pl.len()) == 0).then(-1).otherwise(pl.col("col1")).alias("col1")
+    )
+    assert out != hash_dataframe(changed, sample_size=10)
+
+
+def test_hash_dataframe_sample_size_different_num_rows() -> None:
+    frame = pl.DataFrame({"col1": list(range(100))})
+    assert hash_dataframe(frame, sample_size=10) != hash_dataframe(frame.head(99), sample_size=10)
+
+
+def test_hash_dataframe_sample_size_larger() -> None:
+    frame = pl.DataFrame({"col1": [1, 2, 3]})
+    assert hash_dataframe(frame, sample_size=10) == hash_dataframe(frame, sample_size=100)
+
+
+@pytest.mark.parametrize("sample_size", [0, -1])
+def test_hash_dataframe_incorrect_sample_size(sample_size: int) -> None:
+    with pytest.raises(ValueError, match="sample_size must be greater than 0"):
+        hash_dataframe(pl.DataFrame({"col1": [1, 2, 3]}), sample_size=sample_size)
@@ -0,0 +1,406 @@
+from __future__ import annotations
+
+import json
+import os
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING, Any
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+from polars.testing import assert_frame_equal
+
+from grizz.testing.fixture import pyarrow_available
+from grizz.utils.hive import (
+    _list_directory,
+    find_partition_files,
+    get_partition_dir,
+    make_column_filter,
+    make_partition_filter,
+    match_partition_value,
+    parse_partition_dir,
+    scan_partitioned_parquet,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def dataset_path(tmp_path: Path) -> Path:
+    path = tmp_path.joinpath("dataset")
+    for day, country, values in [
+        ("2024-01-01", "FR", [1, 2]),
+        ("2024-01-01", "DE", [3]),
+        ("2024-01-02", "FR", [4]),
+        ("2024-01-03", "FR", [5, 6]),
+    ]:
+        partition = path.joinpath(f"day={day}", f"country={country}")
+        partition.mkdir(parents=True)
+        pl.DataFrame({"col1": values}).write_parquet(partition.joinpath("part-00000.parquet"))
+    return path
+
+
+def list_files(files: list[Path], path: Path) -> list[str]:
+    return [file.relative_to(path).as_posix() for file in files]
+
+
+#######################################
+#     Tests for get_partition_dir     #
+#######################################
+
+
+def test_get_partition_dir() -> None:
+    assert get_partition_dir({"col1": "a"}) == "col1=a"
+
+
+def test_get_partition_dir_multiple_keys() -> None:
+    assert get_partition_dir({"col1": "a", "col2": 1, "col3": 1.5}) == "col1=a/col2=1/col3=1.5"
+
+
+def test_get_partition_dir_null() -> None:
+    assert get_partition_dir({"col1": None}) == "col1=__HIVE_DEFAULT_PARTITION__"
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("a/b", "col1=a%2Fb"),
+        ("a=b", "col1=a%3Db"),
+        ("a b", "col1=a%20b"),
+        (date(2024, 1, 1), "col1=2024-01-01"),
+        (
+            datetime(2024, 1, 1, 12, 30, tzinfo=timezone.utc),
+            "col1=2024-01-01%2012%3A30%3A00%2B00%3A00",
+        ),
+    ],
+)
+def test_get_partition_dir_escape(value: object, expected: str) -> None:
+    assert get_partition_dir({"col1": value}) == expected
+
+
+###########################################
+#     Tests for make_partition_filter     #
+###########################################
+
+
+def test_make_partition_filter() -> None:
+    frame = pl.DataFrame({"col1": ["a", "b", "a", None], "col2": [1, 1, 2, 1]})
+    assert_frame_equal(
+        frame.filter(make_partition_filter({"col1": "a"})),
+        pl.DataFrame({"col1": ["a", "a"], "col2": [1, 2]}),
+    )
+
+
+def test_make_partition_filter_multiple_keys() -> None:
+    frame = pl.DataFrame({"col1": ["a", "b", "a", None], "col2": [1, 1, 2, 1]})
+    assert_frame_equal(
+        frame.filter(make_partition_filter({"col1": "a", "col2": 2})),
+        pl.DataFrame({"col1": ["a"], "col2": [2]}),
+    )
+
+
+def test_make_partition_filter_null() -> None:
+    frame = pl.DataFrame({"col1": ["a", "b", "a", None], "col2": [1, 1, 2, 1]})
+    assert_frame_equal(
+        frame.filter(make_partition_filter({"col1": None})),
+        pl.DataFrame({"col1": [None], "col2": [1]}, schema={"col1": pl.String, "col2": pl.Int64}),
+    )
+
+
+########################################
+#     Tests for make_column_filter     #
+########################################
+
+
+@pytest.mark.parametrize(
+    ("column_filter", "expected"),
+    [
+        ({"start": 2, "end": 4}, [2, 3]),
+        ({"start": 3}, [3, 4]),
+        ({"end": 2}, [1]),
+        ({}, [1, 2, 3, 4]),
+        ([1, 4], [1, 4]),
+        ((1, None), [1, None]),
+        ({2, 3}, [2, 3]),
+        (3, [3]),
+        (None, [None]),
+    ],
+)
+def test_make_column_filter(column_filter: Any, expected: list) -> None:
+    frame = pl.DataFrame({"col1": [1, 2, 3, 4, None]})
+    assert frame.filter(make_column_filter("col1", column_filter))["col1"].to_list() == expected
+
+
+#########################################
+#     Tests for parse_partition_dir     #
+#########################################
+
+
+def test_parse_partition_dir() -> None:
+    assert parse_partition_dir("col1=a") == {"col1": "a"}
+
+
+def test_parse_partition_dir_multiple_keys() -> None:
+    assert parse_partition_dir("col1=a/col2=1") == {"col1": "a", "col2": "1"}
+
+
+def test_parse_partition_dir_null() -> None:
+    assert parse_partition_dir("col1=__HIVE_DEFAULT_PARTITION__") == {"col1": None}
+
+
+def test_parse_partition_dir_ignore() -> None:
+    assert parse_partition_dir("data/col1=a/other") == {"col1": "a"}
+
+
+@pytest.mark.parametrize(
+    "keys",
+    [
+        {"col1": "a/b", "col2": "a=b"},
+        {"col1": "2024-01-01 12:30:00", "col2": None},
+    ],
+)
+def test_parse_partition_dir_round_trip(keys: dict) -> None:
+    assert parse_partition_dir(get_partition_dir(keys)) == keys
+
+
+###########################################
+#     Tests for match_partition_value     #
+###########################################
+
+
+@pytest.mark.parametrize(
+    ("value", "partition_filter"),
+    [
+        ("a", "a"),
+        ("a", ["b", "a"]),
+        ("a", {"a", "c"}),
+        ("12", 12),
+        ("12", [3, 12]),
+        ("1.5", 1.5),
+        ("true", True),
+        ("True", True),
+        ("2024-01-05", date(2024, 1, 5)),
+        ("2024-01-05 12:00:00+00:00", datetime(2024, 1, 5, 12, tzinfo=timezone.utc)),
+        (None, None),
+        (None, ["a", None]),
+        ("2024-01-05", {"start": date(2024, 1, 1), "end": date(2024, 2, 1)}),
+        ("2024-01-01", {"start": date(2024, 1, 1)}),
+        ("12", {"end": 13}),
+        ("b", {"start": "a", "end": "c"}),
+    ],
+)
+def test_match_partition_value_true(value: str | None, partition_filter: Any) -> None:
+    assert match_partition_value(value, partition_filter)
+
+
+@pytest.mark.parametrize(
+    ("value", "partition_filter"),
+    [
+        ("a", "b"),
+        ("a", ["b", "c"]),
+        ("12", 13),
+        ("12", "012"),
+        ("abc", 12),
+        ("false", True),
+        ("2024-01-05", date(2024, 1, 6)),
+        ("2024-13-05", date(2024, 1, 6)),
+        (None, "a"),
+        ("a", None),
+        (None, {"start": "a"}),
+        ("2024-02-01", {"start": date(2024, 1, 1), "end": date(2024, 2, 1)}),
+        ("2023-12-31", {"start": date(2024, 1, 1)}),
+        ("9", {"start": 10}),
+        ("abc", {"start": 10}),
+    ],
+)
+def test_match_partition_value_false(value: str | None, partition_filter: Any) -> None:
+    assert not match_partition_value(value, partition_filter)
+
+
+##########################################
+#     Tests for find_partition_files     #
+##########################################
+
+
+def test_find_partition_files(dataset_path: Path) -> None:
+    assert list_files(find_partition_files(dataset_path), dataset_path) == [
+        "day=2024-01-01/country=DE/part-00000.parquet",
+        "day=2024-01-01/country=FR/part-00000.parquet",
+        "day=2024-01-02/country=FR/part-00000.parquet",
+        "day=2024-01-03/country=FR/part-00000.parquet",
+    ]
+
+
+def test_find_partition_files_filters(dataset_path: Path) -> None:
+    files = find_partition_files(
+        dataset_path,
+        filters={"day": {"start": date(2024, 1, 2)}, "country": "FR", "other": "abc"},
+    )
+    assert list_files(files, dataset_path) == [
+        "day=2024-01-02/country=FR/part-00000.parquet",
+        "day=2024-01-03/country=FR/part-00000.parquet",
+    ]
+
+
+def test_find_partition_files_prune(dataset_path: Path) -> None:
+    with patch("grizz.utils.hive._list_directory", wraps=_list_directory) as list_directory:
+        find_partition_files(dataset_path, filters={"day": "2024-01-02"})
+    assert list_files([call.args[0] for call in list_directory.call_args_list], dataset_path) == [
+        ".",
+        "day=2024-01-02",
+        "day=2024-01-02/country=FR",
+    ]
+
+
+def test_find_partition_files_ignore_hidden(dataset_path: Path) -> None:
+    dataset_path.joinpath("_SUCCESS").touch()
+    dataset_path.joinpath("_tmp").mkdir()
+    dataset_path.joinpath("_tmp", "data.parquet").touch()
+    dataset_path.joinpath("day=2024-01-02", ".part-00001.parquet.tmp").touch()
+    assert len(find_partition_files(dataset_path)) == 4
+
+
+def test_find_partition_files_suffix(dataset_path: Path) -> None:
+    dataset_path.joinpath("day=2024-01-02", "country=FR", "part-00001.arrow").touch()
+    files = find_partition_files(dataset_path, filters={"day": "2024-01-02"}, suffix=".arrow")
+    assert list_files(files, dataset_path) == ["day=2024-01-02/country=FR/part-00001.arrow"]
+
+
+def test_find_partition_files_empty(tmp_path: Path) -> None:
+    assert find_partition_files(tmp_path) == []
+
+
+def test_find_partition_files_cache(tmp_path: Path, dataset_path: Path) -> None:
+    cache_path = tmp_path.joinpath("cache.json")
+    files = find_partition_files(dataset_path, cache_path=cache_path)
+    assert cache_path.is_file()
+    with patch("grizz.utils.hive._list_directory", wraps=_list_directory) as list_directory:
+        assert find_partition_files(dataset_path, cache_path=cache_path) == files
+    list_directory.assert_not_called()
+
+
+def test_find_partition_files_cache_new_partition(tmp_path: Path, dataset_path: Path) -> None:
+    cache_path = tmp_path.joinpath("cache.json")
+    find_partition_files(dataset_path, filters={"country": "FR"}, cache_path=cache_path)
+    partition = dataset_path.joinpath("day=2024-01-04", "country=FR")
+    partition.mkdir(parents=True)
+    pl.DataFrame({"col1": [7]}).write_parquet(partition.joinpath("part-00000.parquet"))
+    files = find_partition_files(dataset_path, filters={"country": "FR"}, cache_path=cache_path)
+    assert list_files(files, dataset_path) == [
+        "day=2024-01-01/country=FR/part-00000.parquet",
+        "day=2024-01-02/country=FR/part-00000.parquet",
+        "day=2024-01-03/country=FR/part-00000.parquet",
+        "day=2024-01-04/country=FR/part-00000.parquet",
+    ]
+
+
+def test_find_partition_files_cache_new_partition_same_mtime(
+    tmp_path: Path, dataset_path: Path
+) -> None:
+    cache_path = tmp_path.joinpath("cache.json")
+    find_partition_files(dataset_path, cache_path=cache_path)
+    stat = dataset_path.stat()
+    partition = dataset_path.joinpath("day=2024-01-04")
+    partition.mkdir()
+    pl.DataFrame({"col1": [7]}).write_parquet(partition.joinpath("part-00000.parquet"))
+    # Simulate a coarse modification time that did not change.
+    os.utime(dataset_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    files = find_partition_files(dataset_path, cache_path=cache_path)
+    assert "day=2024-01-04/part-00000.parquet" in list_files(files, dataset_path)
+
+
+def test_find_partition_files_cache_other_dataset(tmp_path: Path, dataset_path: Path) -> None:
+    cache_path = tmp_path.joinpath("cache.json")
+    cache_path.write_text(json.dumps({"path": "/other/dataset", "listings": {".": {}}}))
+    assert len(find_partition_files(dataset_path, cache_path=cache_path)) == 4
+    assert json.loads(cache_path.read_text())["path"] == str(dataset_path)
+
+
+def test_find_partition_files_cache_corrupted(tmp_path: Path, dataset_path: Path) -> None:
+    cache_path = tmp_path.joinpath("cache.json")
+    cache_path.write_text("{abc")
+    assert len(find_partition_files(dataset_path, cache_path=cache_path)) == 4
+
+
+##############################################
+#     Tests for scan_partitioned_parquet     #
+##############################################
+
+
+def test_scan_partitioned_parquet(dataset_path: Path) -> None:
+    assert_frame_equal(
+        scan_partitioned_parquet(dataset_path).collect().sort("col1"),
+        pl.DataFrame(
+            {
+                "col1": [1, 2, 3, 4, 5, 6],
+                "day": ["2024-01-01"] * 3 + ["2024-01-02"] + ["2024-01-03"] * 2,
+                "country": ["FR", "FR", "DE", "FR", "FR", "FR"],
+            }
+        ),
+    )
+
+
+def test_scan_partitioned_parquet_filters(dataset_path: Path) -> None:
+    assert_frame_equal(
+        scan_partitioned_parquet(
+            dataset_path,
+            filters={"day": {"end": date(2024, 1, 2)}, "country": ["DE"]},
+            hive_schema={"day": pl.Date},
+        ).collect(),
+        pl.DataFrame({"col1": [3], "day": [date(2024, 1, 1)], "country": ["DE"]}),
+    )
+
+
+def test_scan_partitioned_parquet_no_match(dataset_path: Path) -> None:
+    assert_frame_equal(
+        scan_partitioned_parquet(dataset_path, filters={"country": "IT"}).collect(),
+        pl.DataFrame(),
+    )
+
+
+@pyarrow_available
+def test_scan_partitioned_parquet_column_filters(tmp_path: Path, dataset_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    assert_frame_equal(
+        scan_partitioned_parquet(
+            dataset_path, column_filters={"col1": {"start": 2, "end": 5}}, index_path=index_path
+        )
+        .collect()
+        .sort("col1"),
+        pl.DataFrame(
+            {
+                "col1": [2, 3, 4],
+                "day": ["2024-01-01", "2024-01-01", "2024-01-02"],
+                "country": ["FR", "DE", "FR"],
+            }
+        ),
+    )
+    assert index_path.is_file()
+
+
+@pyarrow_available
+def test_scan_partitioned_parquet_column_filters_prune(tmp_path: Path, dataset_path: Path) -> None:
+    with patch("grizz.utils.hive.pl.scan_parquet", wraps=pl.scan_parquet) as scan_mock:
+        frame = scan_partitioned_parquet(
+            dataset_path, column_filters={"col1": [5]}, index_path=tmp_path.joinpath("index.json")
+        ).collect()
+    assert_frame_equal(frame, pl.DataFrame({"col1": [5], "day": ["2024-01-03"], "country": ["FR"]}))
+    assert scan_mock.call_count == 1
+
+
+@pyarrow_available
+def test_scan_partitioned_parquet_column_filters_no_match(
+    tmp_path: Path, dataset_path: Path
+) -> None:
+    assert_frame_equal(
+        scan_partitioned_parquet(
+            dataset_path, column_filters={"col1": 10}, index_path=tmp_path.joinpath("index.json")
+        ).collect(),
+        pl.DataFrame(),
+    )
+
+
+def test_scan_partitioned_parquet_column_filters_without_index(dataset_path: Path) -> None:
+    with pytest.raises(ValueError, match="index_path is required to use column_filters"):
+        scan_partitioned_parquet(dataset_path, column_filters={"col1": 1})
@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import errno
+import logging
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import pytest
+
+from grizz.utils.lock import FileLock
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+##############################
+#     Tests for FileLock     #
+##############################
+
+
+def test_file_lock_repr(tmp_path: Path) -> None:
+    assert repr(FileLock(tmp_path.joinpath("data.lock"))).startswith("FileLock(")
+
+
+def test_file_lock_acquire(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("folder/data.lock")
+    lock = FileLock(path)
+    assert not lock.is_locked
+    assert lock.acquire()
+    assert lock.is_locked
+    assert path.is_file()
+    lock.release()
+    assert not lock.is_locked
+
+
+def test_file_lock_acquire_twice(tmp_path: Path) -> None:
+    lock = FileLock(tmp_path.joinpath("data.lock"))
+    with lock, pytest.raises(RuntimeError, match=r"is already acquired"):
+        lock.acquire()
+
+
+def test_file_lock_acquire_non_blocking(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.lock")
+    with FileLock(path):
+        lock = FileLock(path)
+        assert not lock.acquire(blocking=False)
+        assert not lock.is_locked
+    assert lock.acquire(blocking=False)
+    lock.release()
+
+
+def test_file_lock_acquire_timeout(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.lock")
+    with FileLock(path), pytest.raises(TimeoutError, match=r"Could not acquire the lock"):
+        FileLock(path, timeout=0.1, poll_interval=0.01).acquire()
+
+
+def test_file_lock_context_manager(tmp_path: Path) -> None:
+    lock = FileLock(tmp_path.joinpath("data.lock"))
+    with lock as out:
+        assert out is lock
+        assert lock.is_locked
+    assert not lock.is_locked
+
+
+def raise_with_lock(lock: FileLock) -> None:
+    with lock:
+        msg = "error"
+        raise RuntimeError(msg)
+
+
+def test_file_lock_context_manager_exception(tmp_path: Path) -> None:
+    lock = FileLock(tmp_path.joinpath("data.lock"))
+    with pytest.raises(RuntimeError, match=r"error"):
+        raise_with_lock(lock)
+    assert not lock.is_locked
+
+
+def test_file_lock_acquire_no_waiting_log(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    lock = FileLock(tmp_path.joinpath("data.lock"))
+    with caplog.at_level(logging.INFO):
+        lock.acquire()
+    lock.release()
+    assert not any(message.startswith("Waiting") for message in caplog.messages)
+
+
+def test_file_lock_acquire_waiting_log(tmp_path: Path, caplog: pytest.LogCaptureFixture) -> None:
+    path = tmp_path.joinpath("data.lock")
+    lock = FileLock(path, timeout=0.05, poll_interval=0.01)
+    with (
+        FileLock(path),
+        caplog.at_level(logging.INFO),
+        pytest.raises(TimeoutError, match=r"Could not acquire the lock"),
+    ):
+        lock.acquire()
+    assert [message for message in caplog.messages if message.startswith("Waiting")] == [
+        f"Waiting for the lock {path}..."
+    ]
+
+
+def test_file_lock_acquire_os_error(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.lock")
+    lock = FileLock(path)
+    with (
+        patch("grizz.utils.lock.fcntl.flock", side_effect=OSError(errno.ENOLCK, "No locks")),
+        pytest.raises(OSError, match=r"No locks"),
+    ):
+        lock.acquire()
+    assert not lock.is_locked
+
+
+def test_file_lock_release_not_locked(tmp_path: Path) -> None:
+    lock = FileLock(tmp_path.joinpath("data.lock"))
+    lock.release()
+    assert not lock.is_locked
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+import os
+from datetime import date, datetime, timezone
+from typing import TYPE_CHECKING
+from unittest.mock import patch
+
+import polars as pl
+import pytest
+
+from grizz.testing.fixture import pyarrow_available
+from grizz.utils.parquet import ParquetIndex, _read_metadata
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def data_path(tmp_path: Path) -> Path:
+    path = tmp_path.joinpath("data")
+    path.mkdir()
+    for i in range(3):
+        pl.DataFrame({"col1": [10 * i, 10 * i + 5], "col2": ["a", None]}).write_parquet(
+            path.joinpath(f"part-{i}.parquet")
+        )
+    return path
+
+
+##################################
+#     Tests for ParquetIndex     #
+##################################
+
+
+@pyarrow_available
+def test_parquet_index_repr(tmp_path: Path) -> None:
+    assert repr(ParquetIndex(tmp_path.joinpath("index.json"))).startswith("ParquetIndex(")
+
+
+@pyarrow_available
+def test_parquet_index_path(tmp_path: Path) -> None:
+    assert ParquetIndex(tmp_path.joinpath("index.json")).path == tmp_path.joinpath("index.json")
+
+
+@pyarrow_available
+def test_parquet_index_get(tmp_path: Path, data_path: Path) -> None:
+    metadata = ParquetIndex(tmp_path.joinpath("index.json")).get(
+        data_path.joinpath("part-1.parquet")
+    )
+    assert metadata["num_rows"] == 2
+    assert list(metadata["schema"]) == ["col1", "col2"]
+    assert metadata["columns"] == {
+        "col1": {"min": 10, "max": 15, "null_count": 0},
+        "col2": {"min": "a", "max": "a", "null_count": 1},
+    }
+    assert len(metadata["row_groups"]) == 1
+    assert metadata["row_groups"][0]["num_rows"] == 2
+    assert metadata["row_groups"][0]["offset"] == 0
+
+
+@pyarrow_available
+def test_parquet_index_get_row_groups(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame({"col1": list(range(10))}).write_parquet(path, row_group_size=4)
+    metadata = ParquetIndex(tmp_path.joinpath("index.json")).get(path)
+    assert [row_group["num_rows"] for row_group in metadata["row_groups"]] == [4, 4, 2]
+    assert [row_group["offset"] for row_group in metadata["row_groups"]] == [0, 4, 8]
+    assert metadata["row_groups"][1]["columns"]["col1"] == {"min": 4, "max": 7, "null_count": 0}
+    assert metadata["columns"]["col1"] == {"min": 0, "max": 9, "null_count": 0}
+
+
+@pyarrow_available
+def test_parquet_index_get_reuse(tmp_path: Path, data_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    path = data_path.joinpath("part-0.parquet")
+    index = ParquetIndex(index_path)
+    metadata = index.get(path)
+    index.save()
+    with patch("grizz.utils.parquet._read_metadata", wraps=_read_metadata) as read_mock:
+        assert ParquetIndex(index_path).get(path) == metadata
+        read_mock.assert_not_called()
+
+
+@pyarrow_available
+def test_parquet_index_get_modified_file(tmp_path: Path, data_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    path = data_path.joinpath("part-0.parquet")
+    index = ParquetIndex(index_path)
+    index.get(path)
+    index.save()
+    pl.DataFrame({"col1": [1, 2, 3], "col2": ["x", "y", "z"]}).write_parquet(path)
+    os.utime(path, ns=(0, 0))
+    assert ParquetIndex(index_path).get(path)["num_rows"] == 3
+
+
+@pyarrow_available
+def test_parquet_index_get_missing_file(tmp_path: Path) -> None:
+    with pytest.raises(FileNotFoundError):
+        ParquetIndex(tmp_path.joinpath("index.json")).get(tmp_path.joinpath("data.parquet"))
+
+
+@pyarrow_available
+def test_parquet_index_index(tmp_path: Path, data_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    metadata = ParquetIndex(index_path).index(data_path)
+    assert list(metadata) == [data_path.joinpath(f"part-{i}.parquet") for i in range(3)]
+    assert index_path.is_file()
+    assert repr(ParquetIndex(index_path)).endswith("num_files=3)")
+
+
+@pyarrow_available
+def test_parquet_index_index_max_workers(tmp_path: Path, data_path: Path) -> None:
+    metadata = ParquetIndex(tmp_path.joinpath("index.json")).index(data_path, max_workers=2)
+    assert [meta["columns"]["col1"]["min"] for meta in metadata.values()] == [0, 10, 20]
+
+
+@pyarrow_available
+def test_parquet_index_index_removed_file(tmp_path: Path, data_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    ParquetIndex(index_path).index(data_path)
+    data_path.joinpath("part-2.parquet").unlink()
+    assert len(ParquetIndex(index_path).index(data_path)) == 2
+    assert repr(ParquetIndex(index_path)).endswith("num_files=2)")
+
+
+@pyarrow_available
+def test_parquet_index_get_many(tmp_path: Path, data_path: Path) -> None:
+    paths = [data_path.joinpath(f"part-{i}.parquet") for i in (2, 0)]
+    metadata = ParquetIndex(tmp_path.joinpath("index.json")).get_many(paths, max_workers=2)
+    assert [meta["columns"]["col1"]["min"] for meta in metadata] == [20, 0]
+
+
+@pyarrow_available
+def test_parquet_index_get_num_rows(tmp_path: Path, data_path: Path) -> None:
+    index = ParquetIndex(tmp_path.joinpath("index.json"))
+    assert index.get_num_rows(sorted(data_path.iterdir())) == 6
+
+
+@pyarrow_available
+@pytest.mark.parametrize(
+    ("filters", "expected"),
+    [
+        ({}, [0, 1, 2]),
+        ({"col1": {"start": 12}}, [1, 2]),
+        ({"col1": {"end": 10}}, [0]),
+        ({"col1": {"start": 6, "end": 10}}, []),
+        ({"col1": [3, 22]}, [0, 2]),
+        ({"col1": 15}, [1]),
+        ({"col2": None}, [0, 1, 2]),
+        ({"col2": "b"}, []),
+        ({"col3": 1}, [0, 1, 2]),
+    ],
+)
+def test_parquet_index_prune(
+    tmp_path: Path, data_path: Path, filters: dict, expected: list[int]
+) -> None:
+    paths = [data_path.joinpath(f"part-{i}.parquet") for i in range(3)]
+    assert ParquetIndex(tmp_path.joinpath("index.json")).prune(paths, filters) == [
+        paths[i] for i in expected
+    ]
+
+
+@pyarrow_available
+def test_parquet_index_prune_no_statistics(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame({"col1": [1, 2, 3]}).write_parquet(path, statistics=False)
+    assert ParquetIndex(tmp_path.joinpath("index.json")).prune([path], {"col1": 10}) == [path]
+
+
+@pyarrow_available
+def test_parquet_index_save_temporal(tmp_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame(
+        {
+            "date": [date(2024, 1, 1), date(2024, 1, 3)],
+            "datetime": [
+                datetime(2024, 1, 1, 12, tzinfo=timezone.utc),
+                datetime(2024, 1, 2, 12, tzinfo=timezone.utc),
+            ],
+        }
+    ).write_parquet(path)
+    index = ParquetIndex(index_path)
+    index.get(path)
+    index.save()
+    columns = ParquetIndex(index_path).get(path)["columns"]
+    assert columns["date"]["min"] == date(2024, 1, 1)
+    assert columns["date"]["max"] == date(2024, 1, 3)
+    assert columns["datetime"]["min"] == datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+    assert ParquetIndex(index_path).prune([path], {"date": {"start": date(2024, 1, 4)}}) == []
+
+
+@pyarrow_available
+def test_parquet_index_get_temporal(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame({"date": [date(2024, 1, 1), date(2024, 1, 3)]}).write_parquet(path)
+    stats = ParquetIndex(tmp_path.joinpath("index.json")).get(path)["columns"]["date"]
+    assert stats == {"min": date(2024, 1, 1), "max": date(2024, 1, 3), "null_count": 0}
+
+
+@pyarrow_available
+def test_parquet_index_get_temporal_row_groups(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.parquet")
+    pl.DataFrame({"date": [date(2024, 1, 3), date(2024, 1, 1), date(2024, 1, 2)]}).write_parquet(
+        path, row_group_size=1
+    )
+    metadata = ParquetIndex(tmp_path.joinpath("index.json")).get(path)
+    assert len(metadata["row_groups"]) == 3
+    assert metadata["columns"]["date"]["min"] == date(2024, 1, 1)
+    assert metadata["columns"]["date"]["max"] == date(2024, 1, 3)
+
+
+@pyarrow_available
+def test_parquet_index_prune_temporal(tmp_path: Path) -> None:
+    paths = [tmp_path.joinpath(f"d{i}.parquet") for i in range(3)]
+    for i, path in enumerate(paths):
+        pl.DataFrame({"d": [date(2024, 1, 10 * i + 1), date(2024, 1, 10 * i + 5)]}).write_parquet(
+            path, row_group_size=1
+        )
+    index = ParquetIndex(tmp_path.joinpath("index.json"))
+    assert index.prune(paths, {"d": {"start": date(2024, 1, 20)}}) == [paths[2]]
+    index.save()
+    reloaded = ParquetIndex(tmp_path.joinpath("index.json"))
+    assert reloaded.prune(paths, {"d": {"start": date(2024, 1, 20)}}) == [paths[2]]
+
+
+@pyarrow_available
+def test_parquet_index_save_not_modified(tmp_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    ParquetIndex(index_path).save()
+    assert not index_path.exists()
+
+
+@pyarrow_available
+def test_parquet_index_corrupted(tmp_path: Path, data_path: Path) -> None:
+    index_path = tmp_path.joinpath("index.json")
+    index_path.write_text("{not json")
+    index = ParquetIndex(index_path)
+    assert index.get_num_rows([data_path.joinpath("part-0.parquet")]) == 2
+    index.save()
+    assert repr(ParquetIndex(index_path)).endswith("num_files=1)")
@@ -9,6 +9,7 @@ import pytest
 from iden.io import save_text
 
 from grizz.utils.path import (
+    atomic_path,
     find_files,
     find_parquet_files,
     human_file_size,
@@ -147,3 +148,85 @@ def test_find_parquet_files_file(parquet_path: Path) -> None:
 def test_find_parquet_files_empty(tmp_path: Path) -> None:
     save_text("text", tmp_path.joinpath("file.txt"))
     assert find_parquet_files(tmp_path) == []
+
+
+#################################
+#     Tests for atomic_path     #
+#################################
+
+
+def test_atomic_path(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("folder/data.txt")
+    with atomic_path(path) as tmp:
+        assert tmp.parent == path.parent
+        assert tmp != path
+        tmp.write_text("abc")
+        assert not path.exists()
+    assert path.read_text() == "abc"
+    assert list(path.parent.iterdir()) == [path]
+
+
+def test_atomic_path_replace(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    path.write_text("abc")
+    with atomic_path(path) as tmp:
+        tmp.write_text("xyz")
+        assert path.read_text() == "abc"
+    assert path.read_text() == "xyz"
+
+
+def test_atomic_path_directory(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data")
+    path.mkdir()
+    path.joinpath("old.txt").write_text("abc")
+    with atomic_path(path) as tmp:
+        tmp.mkdir()
+        tmp.joinpath("new.txt").write_text("xyz")
+    assert [p.name for p in path.iterdir()] == ["new.txt"]
+
+
+def test_atomic_path_directory_no_leftover(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data")
+    path.mkdir()
+    path.joinpath("old.txt").write_text("abc")
+    with atomic_path(path) as tmp:
+        tmp.mkdir()
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_atomic_path_directory_rename_error(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data")
+    path.mkdir()
+    path.joinpath("old.txt").write_text("abc")
+    replace = Path.replace
+
+    def fake_replace(self: Path, target: Path) -> Path:
+        if self.name.endswith(".tmp"):
+            msg = "rename error"
+            raise OSError(msg)
+        return replace(self, target)
+
+    with (
+        patch.object(Path, "replace", fake_replace),
+        pytest.raises(OSError, match=r"rename error"),
+        atomic_path(path) as tmp,
+    ):
+        tmp.mkdir()
+    assert [p.name for p in path.iterdir()] == ["old.txt"]
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def write_and_raise(path: Path) -> None:
+    with atomic_path(path) as tmp:
+        tmp.write_text("xyz")
+        msg = "error"
+        raise RuntimeError(msg)
+
+
+def test_atomic_path_exception(tmp_path: Path) -> None:
+    path = tmp_path.joinpath("data.txt")
+    path.write_text("abc")
+    with pytest.raises(RuntimeError, match=r"error"):
+        write_and_raise(path)
+    assert path.read_text() == "abc"
+    assert list(tmp_path.iterdir()) == [path]
@@ -0,0 +1,273 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+import polars as pl
+import pytest
+
+from grizz.ingestor import Ingestor, TransformIngestor
+from grizz.transformer import CopyColumn, DropNullRow, InplaceCast, Sequential
+from grizz.utils.profiling import Profiler, ProfileRecord, profile_block
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def dataframe() -> pl.DataFrame:
+    return pl.DataFrame(
+        {
+            "col1": [1, 2, None, 4, 5],
+            "col2": ["1", "2", "3", "4", "5"],
+            "col3": ["a", "b", "c", "d", "e"],
+        }
+    )
+
+
+###################################
+#     Tests for ProfileRecord     #
+###################################
+
+
+def test_profile_record_repr() -> None:
+    assert repr(ProfileRecord(index=0, name="step", category="transform")) == (
+        "ProfileRecord(index=0, name='step', category='transform', parent=None, depth=0)"
+    )
+
+
+def test_profile_record_set_input(dataframe: pl.DataFrame) -> None:
+    record = ProfileRecord(index=0, name="step", category="transform")
+    record.set_input(dataframe)
+    assert record.rows_in == 5
+    assert record.columns_in == 3
+    assert record.bytes_in == dataframe.estimated_size()
+
+
+def test_profile_record_set_input_lazyframe(dataframe: pl.DataFrame) -> None:
+    record = ProfileRecord(index=0, name="step", category="transform")
+    record.set_input(dataframe.lazy())
+    assert record.rows_in is None
+    assert record.columns_in is None
+    assert record.bytes_in is None
+
+
+def test_profile_record_set_output(dataframe: pl.DataFrame) -> None:
+    record = ProfileRecord(index=0, name="step", category="transform")
+    record.set_output(dataframe)
+    assert record.rows_out == 5
+    assert record.columns_out == 3
+    assert record.bytes_out == dataframe.estimated_size()
+
+
+def test_profile_record_to_dict() -> None:
+    out = ProfileRecord(index=1, name="step", category="fit", parent=0, depth=1).to_dict()
+    assert out["index"] == 1
+    assert out["name"] == "step"
+    assert out["category"] == "fit"
+    assert out["parent"] == 0
+    assert out["depth"] == 1
+    assert out["duration"] is None
+
+
+##############################
+#     Tests for Profiler     #
+##############################
+
+
+def test_profiler_repr() -> None:
+    assert repr(Profiler()) == "Profiler(num_records=0)"
+
+
+def test_profiler_inactive(dataframe: pl.DataFrame) -> None:
+    profiler = Profiler()
+    InplaceCast(columns=["col1"], dtype=pl.Float32).transform(dataframe)
+    assert profiler.records == ()
+
+
+def test_profiler_transformer(dataframe: pl.DataFrame) -> None:
+    with Profiler() as profiler:
+        DropNullRow(columns=["col1"]).transform(dataframe)
+    assert len(profiler.records) == 1
+    record = profiler.records[0]
+    assert record.name == "DropNullRowTransformer.transform"
+    assert record.category == "transform"
+    assert record.parent is None
+    assert record.depth == 0
+    assert record.duration >= 0.0
+    assert (record.rows_in, record.columns_in) == (5, 3)
+    assert (record.rows_out, record.columns_out) == (4, 3)
+
+
+def test_profiler_transformer_fit(dataframe: pl.DataFrame) -> None:
+    with Profiler() as profiler:
+        DropNullRow(columns=["col1"]).fit(dataframe)
+    assert [(record.name, record.category) for record in profiler.records] == [
+        ("DropNullRowTransformer.fit", "fit")
+    ]
+
+
+def test_profiler_sequential(dataframe: pl.DataFrame) -> None:
+    transformer = Sequential(
+        [DropNullRow(columns=["col1"]), CopyColumn(in_col="col2", out_col="out")]
+    )
+    with Profiler() as profiler:
+        transformer.transform(dataframe)
+    assert [(record.name, record.parent, record.depth) for record in profiler.records] == [
+        ("SequentialTransformer.transform", None, 0),
+        ("DropNullRowTransformer.transform", 0, 1),
+        ("CopyColumnTransformer.transform", 0, 1),
+    ]
+    assert profiler.records[0].rows_out == 4
+    assert profiler.records[0].columns_out == 4
+
+
+def test_profiler_sequential_fuse(dataframe: pl.DataFrame) -> None:
+    transformer = Sequential(
+        [
+            DropNullRow(columns=["col1"]),
+            CopyColumn(in_col="col2", out_col="out"),
+            InplaceCast(columns=["col1"], dtype=pl.Float32),
+        ],
+        fuse=True,
+    )
+    with Profiler() as profiler:
+        transformer.transform(dataframe)
+    assert [(record.name, record.depth) for record in profiler.records] == [
+        ("SequentialTransformer.transform", 0),
+        ("DropNullRowTransformer.transform", 1),
+        ("Fused 2 transformers", 1),
+    ]
+
+
+def test_profiler_transform_ingestor(dataframe: pl.DataFrame) -> None:
+    ingestor = TransformIngestor(
+        ingestor=Ingestor(dataframe),
+        transformer=Sequential([DropNullRow(columns=["col1"])]),
+    )
+    with Profiler() as profiler:
+        ingestor.ingest()
+    assert [(record.name, record.depth) for record in profiler.records] == [
+        ("TransformIngestor.ingest", 0),
+        ("Ingestor.ingest", 1),
+        ("SequentialTransformer.transform", 1),
+        ("DropNullRowTransformer.transform", 2),
+    ]
+    assert profiler.records[0].rows_out == 4
+
+
+def test_profiler_nested_profilers(dataframe: pl.DataFrame) -> None:
+    transformer = DropNullRow(columns=["col1"])
+    with Profiler() as profiler1:
+        transformer.transform(dataframe)
+        with Profiler() as profiler2:
+            transformer.transform(dataframe)
+        transformer.transform(dataframe)
+    assert len(profiler1.records) == 2
+    assert len(profiler2.records) == 1
+
+
+def test_profiler_to_dict(dataframe: pl.DataFrame) -> None:
+    with Profiler() as profiler:
+        DropNullRow(columns=["col1"]).transform(dataframe)
+    out = profiler.to_dict()
+    assert len(out) == 1
+    assert out[0]["name"] == "DropNullRowTransformer.transform"
+    assert out[0]["rows_out"] == 4
+
+
+def test_profiler_to_frame(dataframe: pl.DataFrame) -> None:
+    with Profiler() as profiler:
+        Sequential([DropNullRow(columns=["col1"])]).transform(dataframe)
+    frame = profiler.to_frame()
+    assert frame.shape == (2, 14)
+    assert frame["name"].to_list() == [
+        "SequentialTransformer.transform",
+        "DropNullRowTransformer.transform",
+    ]
+
+
+def test_profiler_to_frame_empty() -> None:
+    assert Profiler().to_frame().shape == (0, 14)
+
+
+def test_profiler_to_json(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    path = tmp_path.joinpath("profile/report.json")
+    with Profiler() as profiler:
+        DropNullRow(columns=["col1"]).transform(dataframe)
+    content = profiler.to_json(path)
+    assert json.loads(content) == profiler.to_dict()
+    assert json.loads(path.read_text()) == profiler.to_dict()
+
+
+def test_profiler_to_chrome_trace(tmp_path: Path, dataframe: pl.DataFrame) -> None:
+    path = tmp_path.joinpath("profile/trace.json")
+    with Profiler() as profiler:
+        Sequential([DropNullRow(columns=["col1"])]).transform(dataframe)
+    trace = profiler.to_chrome_trace(path)
+    events = trace["traceEvents"]
+    assert [event["name"] for event in events] == [
+        "SequentialTransformer.transform",
+        "DropNullRowTransformer.transform",
+    ]
+    assert all(event["ph"] == "X" for event in events)
+    assert events[0]["ts"] <= events[1]["ts"]
+    assert events[0]["dur"] >= events[1]["dur"]
+    assert events[1]["args"]["rows_out"] == 4
+    assert json.loads(path.read_text()) == trace
+
+
+###################################
+#     Tests for profile_block     #
+###################################
+
+
+def test_profile_block_inactive() -> None:
+    with profile_block("step", category="transform") as record:
+        pass
+    assert record is None
+
+
+def test_profile_block(dataframe: pl.DataFrame) -> None:
+    with (
+        Profiler() as profiler,
+        profile_block("outer", category="transform", frame=dataframe) as record,
+    ):
+        with profile_block("inner", category="transform"):
+            pass
+        record.set_output(dataframe.head(2))
+    assert [(record.name, record.parent) for record in profiler.records] == [
+        ("outer", None),
+        ("inner", 0),
+    ]
+    assert profiler.records[0].rows_in == 5
+    assert profiler.records[0].rows_out == 2
+
+
+def raise_in_profile_block() -> None:
+    with profile_block("step", category="fit"):
+        msg = "error"
+        raise RuntimeError(msg)
+
+
+def test_profile_block_exception() -> None:
+    with Profiler() as profiler:
+        with pytest.raises(RuntimeError, match="error"):
+            raise_in_profile_block()
+        with profile_block("next", category="fit"):
+            pass
+    assert profiler.records[0].duration is not None
+    assert profiler.records[1].parent is None
+
+
+def test_profile_block_nested_profilers() -> None:
+    with Profiler() as outer, profile_block("outer", category="transform"):
+        with Profiler() as inner, profile_block("inner", category="transform"):
+            pass
+        with profile_block("next", category="transform"):
+            pass
+    assert [(record.name, record.parent) for record in inner.records] == [("inner", None)]
+    assert [(record.name, record.parent, record.depth) for record in outer.records] == [
+        ("outer", None, 0),
+        ("next", 0, 1),
+    ]